@@ -0,0 +1,330 @@
+import asyncio
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from analytics_export import DEFAULT_EXPORT_DIR, EXPORT_COLLECTIONS
+
+# Venues are in Atlanta - heatmaps and schedules are in local time
+ANALYTICS_TIMEZONE = os.environ.get("ANALYTICS_TIMEZONE", "America/New_York")
+
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+# Label for tips that fall outside every DJ set
+UNSCHEDULED_DJ = "unscheduled"
+
+
+def _to_local(series: pd.Series) -> pd.Series:
+    return pd.to_datetime(series, utc=True).dt.tz_convert(ANALYTICS_TIMEZONE)
+
+
+def _minutes(hhmm: pd.Series) -> pd.Series:
+    parts = hhmm.fillna("00:00").str.split(":", n=1, expand=True).astype(int)
+    return parts[0] * 60 + parts[1]
+
+
+# ==================== COLUMNAR LOADING ====================
+
+def _read_export(collection: str, columns: List[str], since: datetime, export_dir: Path) -> Optional[pd.DataFrame]:
+    """
+    Read the needed columns of an exported collection, pruning date partitions.
+    Parquet and Arrow partitions are both read, so switching the export format
+    keeps history; columns no exported batch has come back as nulls.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    collection_dir = export_dir / collection
+    partition_fields = [("date", pa.string())]
+    if EXPORT_COLLECTIONS[collection]["location_field"]:
+        partition_fields.append(("location", pa.string()))
+
+    frames = []
+    for pattern, file_format in (("*.parquet", "parquet"), ("*.arrow", "ipc")):
+        files = sorted(collection_dir.rglob(pattern))
+        if not files:
+            continue
+        dataset = ds.dataset(
+            [str(f) for f in files],
+            format=file_format,
+            partitioning=ds.partitioning(pa.schema(partition_fields), flavor="hive"),
+            partition_base_dir=str(collection_dir)
+        )
+        present = [c for c in columns if c in dataset.schema.names]
+        table = dataset.to_table(columns=present, filter=ds.field("date") >= since.strftime("%Y-%m-%d"))
+        frames.append(table.to_pandas())
+
+    if not frames:
+        return None
+    frame = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    return frame.reindex(columns=columns)
+
+
+async def _read_mongo(db, collection: str, columns: List[str], query: Dict, batch_size: int = 5000) -> pd.DataFrame:
+    """Fallback when nothing has been exported yet: projected cursor, built column by column"""
+    data = {c: [] for c in columns}
+    cursor = db[collection].find(query, {**{c: 1 for c in columns}, "_id": 0}).batch_size(batch_size)
+    async for doc in cursor:
+        for c in columns:
+            data[c].append(doc.get(c))
+    return pd.DataFrame(data, columns=columns)
+
+
+# ==================== VECTORIZED COMPUTATIONS ====================
+
+def compute_checkin_heatmap(checkins: pd.DataFrame) -> Dict:
+    """7x24 (weekday x local hour) check-in counts per location"""
+    if checkins.empty:
+        return {}
+
+    local = _to_local(checkins["checked_in_at"])
+    counts = (
+        pd.DataFrame({
+            "location_slug": checkins["location_slug"].fillna("unknown").to_numpy(),
+            "weekday": local.dt.weekday.to_numpy(),
+            "hour": local.dt.hour.to_numpy(),
+        })
+        .groupby(["location_slug", "weekday", "hour"])
+        .size()
+    )
+
+    result = {}
+    for location_slug, location_counts in counts.groupby(level="location_slug"):
+        matrix = np.zeros((7, 24), dtype=np.int64)
+        weekdays = location_counts.index.get_level_values("weekday").to_numpy()
+        hours = location_counts.index.get_level_values("hour").to_numpy()
+        matrix[weekdays, hours] = location_counts.to_numpy()
+
+        busiest_day, busiest_hour = np.unravel_index(matrix.argmax(), matrix.shape)
+        result[location_slug] = {
+            "total": int(matrix.sum()),
+            "matrix": matrix.tolist(),
+            "by_weekday": matrix.sum(axis=1).tolist(),
+            "by_hour": matrix.sum(axis=0).tolist(),
+            "busiest": {
+                "weekday": WEEKDAYS[busiest_day],
+                "hour": int(busiest_hour),
+                "checkins": int(matrix[busiest_day, busiest_hour])
+            }
+        }
+    return result
+
+
+def _schedule_segments(schedules: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per (schedule, local day) segment in minutes. Sets that run past
+    midnight are split so the early-morning part matches the next day.
+    """
+    schedules = schedules.assign(
+        scheduled_day=pd.to_datetime(schedules["scheduled_date"], errors="coerce")
+    ).dropna(subset=["scheduled_day"])
+    schedules = schedules.assign(
+        start_min=_minutes(schedules["start_time"]),
+        end_min=_minutes(schedules["end_time"]),
+        is_recurring=schedules["is_recurring"].fillna(False).astype(bool),
+        day_of_week=pd.to_numeric(schedules["day_of_week"]).fillna(schedules["scheduled_day"].dt.weekday).astype(int),
+    )
+
+    overnight = schedules["end_min"] <= schedules["start_min"]
+    same_day = schedules.assign(end_min=np.where(overnight, 24 * 60, schedules["end_min"]), day_offset=0)
+    next_day = schedules[overnight].assign(start_min=0, day_offset=1)
+    segments = pd.concat([same_day, next_day], ignore_index=True)
+
+    segments["match_date"] = (segments["scheduled_day"] + pd.to_timedelta(segments["day_offset"], unit="D")).dt.strftime("%Y-%m-%d")
+    segments["match_weekday"] = (segments["day_of_week"] + segments["day_offset"]) % 7
+    return segments
+
+
+def compute_dj_tip_revenue(tips: pd.DataFrame, schedules: pd.DataFrame, dj_names: Dict[str, str]) -> List[Dict]:
+    """Attribute each tip to the DJ scheduled at that location and local time"""
+    if tips.empty:
+        return []
+
+    local = _to_local(tips["created_at"])
+    tips = pd.DataFrame({
+        "tip_idx": np.arange(len(tips)),
+        "location_slug": tips["location_slug"].to_numpy(),
+        "amount": pd.to_numeric(tips["amount"], errors="coerce").fillna(0).to_numpy(),
+        "local_date": local.dt.strftime("%Y-%m-%d").to_numpy(),
+        "weekday": local.dt.weekday.to_numpy(),
+        "minute": (local.dt.hour * 60 + local.dt.minute).to_numpy(),
+    })
+
+    matched = pd.DataFrame(columns=["tip_idx", "dj_id", "is_recurring"])
+    if not schedules.empty:
+        segments = _schedule_segments(schedules)
+        one_off = tips.merge(
+            segments[~segments["is_recurring"]],
+            left_on=["location_slug", "local_date"], right_on=["location_slug", "match_date"]
+        )
+        recurring = tips.merge(
+            segments[segments["is_recurring"]],
+            left_on=["location_slug", "weekday"], right_on=["location_slug", "match_weekday"]
+        )
+        # Recurring sets only count from their first scheduled week
+        recurring = recurring[recurring["local_date"] >= recurring["scheduled_date"].fillna("")]
+
+        candidates = pd.concat([one_off, recurring], ignore_index=True)
+        candidates = candidates[
+            (candidates["minute"] >= candidates["start_min"]) & (candidates["minute"] < candidates["end_min"])
+        ]
+        # A one-off booking overrides the weekly residency
+        matched = candidates.sort_values("is_recurring").drop_duplicates("tip_idx")[["tip_idx", "dj_id"]]
+
+    attributed = tips.merge(matched[["tip_idx", "dj_id"]], on="tip_idx", how="left")
+    attributed["dj_id"] = attributed["dj_id"].fillna(UNSCHEDULED_DJ)
+
+    revenue = (
+        attributed.groupby("dj_id")
+        .agg(total=("amount", "sum"), count=("amount", "size"), average=("amount", "mean"),
+             locations=("location_slug", "nunique"))
+        .sort_values("total", ascending=False)
+    )
+    return [
+        {
+            "dj_id": dj_id,
+            "dj_name": dj_names.get(dj_id, "Unscheduled" if dj_id == UNSCHEDULED_DJ else "Unknown DJ"),
+            "total": round(float(row["total"]), 2),
+            "count": int(row["count"]),
+            "average": round(float(row["average"]), 2),
+            "locations": int(row["locations"])
+        }
+        for dj_id, row in revenue.iterrows()
+    ]
+
+
+def compute_token_velocity(transfers: pd.DataFrame, token_supply: float) -> Dict:
+    """Daily transfer volume and velocity (volume / circulating supply)"""
+    if transfers.empty:
+        return {"token_supply": token_supply, "days": [], "by_type": {}, "average_velocity": 0}
+
+    local = _to_local(transfers["created_at"])
+    frame = pd.DataFrame({
+        "date": local.dt.strftime("%Y-%m-%d").to_numpy(),
+        "amount": pd.to_numeric(transfers["amount"], errors="coerce").fillna(0).to_numpy(),
+        "from_user_id": transfers["from_user_id"].to_numpy(),
+        "transfer_type": transfers["transfer_type"].fillna("other").to_numpy(),
+    })
+
+    daily = frame.groupby("date").agg(
+        volume=("amount", "sum"), transfers=("amount", "size"), senders=("from_user_id", "nunique")
+    )
+    daily["velocity"] = daily["volume"] / token_supply if token_supply else 0.0
+    by_type = frame.groupby("transfer_type")["amount"].agg(["sum", "size"])
+
+    return {
+        "token_supply": token_supply,
+        "average_velocity": round(float(daily["velocity"].mean()), 4),
+        "days": [
+            {"date": date, "volume": float(row["volume"]), "transfers": int(row["transfers"]),
+             "senders": int(row["senders"]), "velocity": round(float(row["velocity"]), 4)}
+            for date, row in daily.iterrows()
+        ],
+        "by_type": {t: {"volume": float(row["sum"]), "transfers": int(row["size"])} for t, row in by_type.iterrows()}
+    }
+
+
+# ==================== SERVICE ====================
+
+class AnalyticsService:
+    """
+    Admin analytics computed with pandas group-bys over columnar data.
+
+    Event columns come from the Parquet/Arrow exports (falling back to a
+    projected Mongo cursor when a collection has not been exported yet), so
+    dashboards don't run aggregations against the primary. Results are
+    cached per day in memory and in `analytics_cache`, shared by workers.
+    """
+
+    def __init__(self, db, export_dir: Path = DEFAULT_EXPORT_DIR, read_db=None):
+        self.db = db
+        # Source reads may go to a replica; the cache is written through the primary
+        self.read_db = read_db if read_db is not None else db
+        self.export_dir = Path(export_dir)
+        self._cache: Dict[str, Dict] = {}
+
+    async def _load(self, collection: str, columns: List[str], since: datetime) -> pd.DataFrame:
+        time_field = EXPORT_COLLECTIONS[collection]["time_field"]
+        frame = await asyncio.to_thread(_read_export, collection, columns, since, self.export_dir)
+        if frame is None:
+            return await _read_mongo(self.read_db, collection, columns, {time_field: {"$gte": since}})
+
+        # Rows written since the last export run
+        state = await self.db.export_state.find_one({"collection": collection}, {"last_time": 1})
+        if state:
+            recent = await _read_mongo(self.read_db, collection, columns, {time_field: {"$gt": state["last_time"]}})
+            if not recent.empty:
+                recent[time_field] = pd.to_datetime(recent[time_field], utc=True)
+                frame = pd.concat([frame, recent], ignore_index=True)
+        time_values = pd.to_datetime(frame[time_field], utc=True)
+        return frame[time_values >= pd.Timestamp(since)]
+
+    async def _cached(self, key: str, refresh: bool, compute):
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        cache_id = f"{key}:{today}"
+
+        if not refresh:
+            if cache_id in self._cache:
+                return self._cache[cache_id]
+            stored = await self.db.analytics_cache.find_one({"_id": cache_id})
+            if stored:
+                self._cache[cache_id] = stored["result"]
+                return stored["result"]
+
+        result = await compute()
+        result = {"generated_at": datetime.now(timezone.utc), "cache_date": today, **result}
+
+        # Drop yesterday's entries
+        self._cache = {k: v for k, v in self._cache.items() if k.endswith(today)}
+        self._cache[cache_id] = result
+        await self.db.analytics_cache.replace_one(
+            {"_id": cache_id}, {"_id": cache_id, "date": today, "result": result}, upsert=True
+        )
+        return result
+
+    async def checkin_heatmap(self, days: int = 90, location_slug: Optional[str] = None, refresh: bool = False) -> Dict:
+        async def compute():
+            since = datetime.now(timezone.utc) - timedelta(days=days)
+            checkins = await self._load("checkins", ["location_slug", "checked_in_at"], since)
+            if location_slug:
+                checkins = checkins[checkins["location_slug"] == location_slug]
+            heatmap = await asyncio.to_thread(compute_checkin_heatmap, checkins)
+            return {"days": days, "timezone": ANALYTICS_TIMEZONE, "weekdays": WEEKDAYS, "locations": heatmap}
+
+        return await self._cached(f"heatmap:{days}:{location_slug or 'all'}", refresh, compute)
+
+    async def dj_tip_revenue(self, days: int = 90, refresh: bool = False) -> Dict:
+        async def compute():
+            since = datetime.now(timezone.utc) - timedelta(days=days)
+            tips, schedules, profiles = await asyncio.gather(
+                self._load("dj_tips", ["location_slug", "amount", "created_at"], since),
+                _read_mongo(self.read_db, "dj_schedules", [
+                    "dj_id", "location_slug", "scheduled_date", "start_time",
+                    "end_time", "is_recurring", "day_of_week"
+                ], {"is_active": {"$ne": False}}),
+                self.read_db.dj_profiles.find({}, {"_id": 0, "id": 1, "name": 1, "stage_name": 1}).to_list(1000)
+            )
+            dj_names = {p["id"]: p.get("stage_name") or p.get("name") for p in profiles}
+            revenue = await asyncio.to_thread(compute_dj_tip_revenue, tips, schedules, dj_names)
+            return {"days": days, "timezone": ANALYTICS_TIMEZONE, "djs": revenue}
+
+        return await self._cached(f"dj_tips:{days}", refresh, compute)
+
+    async def token_velocity(self, days: int = 30, refresh: bool = False) -> Dict:
+        async def compute():
+            since = datetime.now(timezone.utc) - timedelta(days=days)
+            transfers, supply = await asyncio.gather(
+                self._load("token_transfers", ["amount", "from_user_id", "transfer_type", "created_at"], since),
+                self.read_db.user_profiles.aggregate([
+                    {"$group": {"_id": None, "supply": {"$sum": "$token_balance"}}}
+                ]).to_list(1)
+            )
+            token_supply = float(supply[0]["supply"]) if supply else 0.0
+            velocity = await asyncio.to_thread(compute_token_velocity, transfers, token_supply)
+            return {"window_days": days, **velocity}
+
+        return await self._cached(f"token_velocity:{days}", refresh, compute)
@@ -0,0 +1,204 @@
+import asyncio
+import json
+import logging
+import os
+import shutil
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Operational collections available for export, with the fields used for the
+# high-water mark / date partition and the location partition
+EXPORT_COLLECTIONS = {
+    "checkins": {"time_field": "checked_in_at", "location_field": "location_slug"},
+    "social_posts": {"time_field": "created_at", "location_field": "location_slug"},
+    "dj_tips": {"time_field": "created_at", "location_field": "location_slug"},
+    "drink_orders": {"time_field": "created_at", "location_field": "location_slug"},
+    "token_transfers": {"time_field": "created_at", "location_field": None},
+    "token_purchases": {"time_field": "created_at", "location_field": None},
+    "cashout_requests": {"time_field": "created_at", "location_field": None},
+}
+
+EXPORT_FORMATS = ("parquet", "arrow")
+
+DEFAULT_EXPORT_DIR = Path(os.environ.get("ANALYTICS_EXPORT_DIR", Path(__file__).parent / "exports"))
+
+# Documents pulled per cursor batch and written per part file
+DEFAULT_BATCH_SIZE = 5000
+
+
+def _flatten_value(value):
+    """Nested values (likes, payment details, ...) are stored as JSON text"""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, default=str)
+    return value
+
+
+def _batch_to_frame(docs: List[Dict], time_field: str) -> "pd.DataFrame":
+    # pandas (like pyarrow below) is only imported once an export runs, not when the app starts
+    import pandas as pd
+
+    df = pd.DataFrame.from_records(docs)
+    df["_id"] = df["_id"].astype(str)
+
+    for column in df.columns:
+        if df[column].dtype == object:
+            df[column] = df[column].map(_flatten_value)
+
+    df[time_field] = pd.to_datetime(df[time_field], utc=True)
+    return df
+
+
+def _write_part(df: "pd.DataFrame", path: Path, fmt: str):
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        pq.write_table(table, tmp_path, compression="snappy")
+    else:
+        import pyarrow.feather as feather
+        feather.write_feather(table, tmp_path, compression="zstd")
+
+    # Readers never see half-written parts
+    os.replace(tmp_path, path)
+
+
+def _write_partitions(df: "pd.DataFrame", collection_dir: Path, time_field: str,
+                      location_field: Optional[str], fmt: str, part_name: str) -> int:
+    """Split a batch by date (and location) and write one part per partition"""
+    df = df.assign(_date=df[time_field].dt.strftime("%Y-%m-%d"))
+    keys = ["_date"]
+    if location_field:
+        df["_location"] = df[location_field].fillna("unknown").astype(str) if location_field in df else "unknown"
+        keys.append("_location")
+
+    files = 0
+    for key, partition in df.groupby(keys, sort=False):
+        key = key if isinstance(key, tuple) else (key,)
+        path = collection_dir / f"date={key[0]}"
+        if location_field:
+            path = path / f"location={key[1]}"
+        _write_part(partition.drop(columns=keys), path / f"{part_name}.{fmt}", fmt)
+        files += 1
+    return files
+
+
+class AnalyticsExporter:
+    """
+    Streams operational collections into date/location partitioned Parquet
+    (or Arrow IPC) files for analysts:
+
+        {export_dir}/{collection}/date=YYYY-MM-DD/location={slug}/part-*.parquet
+
+    Documents are read through a cursor sorted by (time field, _id) and
+    written batch by batch, so memory stays bounded by the batch size. After
+    each batch the (time, _id) high-water mark is saved in `export_state`;
+    the next run only picks up documents after it.
+    """
+
+    def __init__(self, db, export_dir: Path = DEFAULT_EXPORT_DIR, batch_size: int = DEFAULT_BATCH_SIZE,
+                 read_db=None, settle_seconds: int = 0):
+        self.db = db
+        # Source scans may go to a replica; export_state always uses the primary
+        self.read_db = read_db if read_db is not None else db
+        # Only export documents older than this, so rows a lagging replica
+        # hasn't seen yet are not skipped past by the high-water mark
+        self.settle = timedelta(seconds=settle_seconds)
+        self.export_dir = Path(export_dir)
+        self.batch_size = batch_size
+        self._lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._lock.locked()
+
+    async def get_state(self) -> List[Dict]:
+        return await self.db.export_state.find({}, {"_id": 0, "last_id": 0}).to_list(len(EXPORT_COLLECTIONS))
+
+    async def export_collection(self, collection: str, full: bool = False, fmt: str = "parquet") -> Dict:
+        """Export one collection from its high-water mark (or from scratch when `full`)"""
+        spec = EXPORT_COLLECTIONS[collection]
+        time_field = spec["time_field"]
+        collection_dir = self.export_dir / collection
+        run_tag = f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+        state = None if full else await self.db.export_state.find_one({"collection": collection})
+        if full:
+            await self.db.export_state.delete_one({"collection": collection})
+            if collection_dir.exists():
+                await asyncio.to_thread(shutil.rmtree, collection_dir)
+
+        query = {time_field: {"$type": "date", "$lt": datetime.now(timezone.utc) - self.settle}}
+        if state:
+            # Keyset resume: strictly after (last_time, last_id)
+            last_time, last_id = state["last_time"], state["last_id"]
+            query["$or"] = [
+                {time_field: {"$gt": last_time}},
+                {time_field: last_time, "_id": {"$gt": last_id}}
+            ]
+
+        cursor = self.read_db[collection].find(query).sort([(time_field, 1), ("_id", 1)]).batch_size(self.batch_size)
+
+        exported = files = parts = 0
+        batch: List[Dict] = []
+
+        async def flush():
+            nonlocal exported, files, parts, batch
+            df = _batch_to_frame(batch, time_field)
+            files += await asyncio.to_thread(
+                _write_partitions, df, collection_dir, time_field,
+                spec["location_field"], fmt, f"part-{run_tag}-{parts:05d}"
+            )
+            last = batch[-1]
+            await self.db.export_state.update_one(
+                {"collection": collection},
+                {"$set": {
+                    "collection": collection,
+                    "last_time": last[time_field],
+                    "last_id": last["_id"],
+                    "format": fmt,
+                    "updated_at": datetime.now(timezone.utc)
+                }, "$inc": {"exported_total": len(batch)}},
+                upsert=True
+            )
+            exported += len(batch)
+            parts += 1
+            batch = []
+
+        async for doc in cursor:
+            batch.append(doc)
+            if len(batch) >= self.batch_size:
+                await flush()
+        if batch:
+            await flush()
+
+        logging.info(f"Exported {exported} {collection} documents into {files} files")
+        return {"collection": collection, "exported": exported, "files": files}
+
+    async def run(self, collections: Optional[List[str]] = None, full: bool = False, fmt: str = "parquet") -> Dict:
+        """Export several collections one after another (all by default)"""
+        collections = collections or list(EXPORT_COLLECTIONS)
+        unknown = [c for c in collections if c not in EXPORT_COLLECTIONS]
+        if unknown:
+            raise ValueError(f"Unknown collections: {', '.join(unknown)}")
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown format: {fmt}")
+
+        async with self._lock:
+            results = []
+            for collection in collections:
+                results.append(await self.export_collection(collection, full=full, fmt=fmt))
+        return {
+            "export_dir": str(self.export_dir),
+            "format": fmt,
+            "full": full,
+            "collections": results
+        }
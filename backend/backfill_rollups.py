@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Rebuild the daily/hourly analytics rollups from the raw collections.
+Run once after deploying rollups, or to repair buckets:
+cd /app/backend && python backfill_rollups.py              # rebuild everything
+cd /app/backend && python backfill_rollups.py 2026-01-01   # rebuild from a date
+"""
+
+import os
+import sys
+import asyncio
+import logging
+from datetime import datetime, timezone
+from motor.motor_asyncio import AsyncIOMotorClient
+from dotenv import load_dotenv
+
+from rollups import RollupService
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+load_dotenv()
+
+MONGO_URL = os.environ.get("MONGO_URL")
+DB_NAME = os.environ.get("DB_NAME", "finandfeathers")
+
+
+async def backfill_rollups(since=None):
+    """Rebuild rollup buckets on or after `since` (all when None)"""
+    logging.info(f"Starting rollup backfill{' from ' + since.strftime('%Y-%m-%d') if since else ''}...")
+
+    client = AsyncIOMotorClient(MONGO_URL)
+    db = client[DB_NAME]
+
+    result = await RollupService(db).backfill(since)
+
+    logging.info(f"Backfill complete: {result['daily_buckets']} daily and {result['hourly_buckets']} hourly buckets")
+
+    client.close()
+
+    result["backfill_time"] = datetime.now(timezone.utc).isoformat()
+    return result
+
+
+if __name__ == "__main__":
+    since = None
+    if len(sys.argv) > 1:
+        since = datetime.strptime(sys.argv[1], "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    result = asyncio.run(backfill_rollups(since))
+    print(f"Backfill result: {result}")
@@ -0,0 +1,104 @@
+import asyncio
+import json
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Tuple
+
+
+def _freeze(value) -> str:
+    # Projections and filters are small dicts; a stable string makes them hashable
+    return json.dumps(value, sort_keys=True, default=str) if value is not None else ""
+
+
+class BatchLoader:
+    """
+    Per-request DataLoader for point lookups. load(collection, field, value)
+    calls made in the same event loop turn - the arguments of one
+    asyncio.gather, or a load_many() - are collapsed into a single
+    find({field: {"$in": [...]}}) per collection, field and projection, and
+    different collections are queried concurrently. Each lookup is
+    remembered for the life of the loader, so create one per request and
+    never share it between requests.
+
+    Documents are shared between callers that asked for the same lookup;
+    treat them as read-only.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._loaded: Dict[Tuple, asyncio.Future] = {}
+        self._pending: Dict[Tuple, Dict[Any, asyncio.Future]] = {}
+        self._found: Dict[Tuple, asyncio.Future] = {}
+        self._tasks = set()
+        self.queries = 0
+
+    def load(self, collection: str, field: str, value: Any,
+             projection: Optional[Dict] = None) -> Awaitable[Optional[Dict]]:
+        """The first document whose top-level `field` equals `value`, like find_one({field: value})"""
+        batch_key = (collection, field, _freeze(projection))
+        future = self._loaded.get((batch_key, value))
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._loaded[(batch_key, value)] = future
+        pending = self._pending.get(batch_key)
+        if pending is None:
+            # Dispatched once the current callers have all queued their lookups
+            pending = self._pending[batch_key] = {}
+            loop.call_soon(self._dispatch, batch_key, projection)
+        pending[value] = future
+        return future
+
+    async def load_many(self, collection: str, field: str, values: Iterable[Any],
+                        projection: Optional[Dict] = None) -> List[Optional[Dict]]:
+        """load() for each value, in order, as one $in query"""
+        return list(await asyncio.gather(*[self.load(collection, field, value, projection) for value in values]))
+
+    def find(self, collection: str, query: Dict, projection: Optional[Dict] = None,
+             limit: int = 100) -> Awaitable[List[Dict]]:
+        """find(query).to_list(limit), run once per request however many helpers ask for it"""
+        key = (collection, _freeze(query), _freeze(projection), limit)
+        future = self._found.get(key)
+        if future is None:
+            self.queries += 1
+            future = asyncio.ensure_future(self.db[collection].find(query, projection).to_list(limit))
+            self._found[key] = future
+        return future
+
+    def _dispatch(self, batch_key: Tuple, projection: Optional[Dict]):
+        pending = self._pending.pop(batch_key)
+        task = asyncio.ensure_future(self._fetch(batch_key, projection, pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, batch_key: Tuple, projection: Optional[Dict], pending: Dict[Any, asyncio.Future]):
+        collection, field, _ = batch_key
+        # An inclusion projection must still return the field the results are matched on
+        strip_field = False
+        if projection and any(v for k, v in projection.items() if k != "_id") and field not in projection:
+            projection = {**projection, field: 1}
+            strip_field = True
+
+        self.queries += 1
+        values = list(pending)
+        try:
+            if len(values) == 1:
+                cursor = self.db[collection].find({field: values[0]}, projection).limit(1)
+            else:
+                cursor = self.db[collection].find({field: {"$in": values}}, projection)
+            docs = await cursor.to_list(None)
+        except Exception as e:
+            for value, future in pending.items():
+                # Not remembered: a later load() may retry
+                self._loaded.pop((batch_key, value), None)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_value = {}
+        for doc in docs:
+            value = doc.pop(field) if strip_field else doc.get(field)
+            by_value.setdefault(value, doc)
+        for value, future in pending.items():
+            if not future.done():
+                future.set_result(by_value.get(value))
@@ -0,0 +1,211 @@
+"""
+Micro-benchmarks for the router helpers that dominate CPU on busy
+nights. Saved runs are specific to the machine that made them, so
+benchmarks/history/ is not committed: save a reference run on the parent
+commit, then compare the change against it on the same machine, failing
+when a mean regresses by more than the given threshold:
+
+cd /app/backend && python -m pytest benchmarks/bench_hot_helpers.py \
+    --benchmark-storage=benchmarks/history --benchmark-save=reference
+(apply the change)
+cd /app/backend && python -m pytest benchmarks/bench_hot_helpers.py \
+    --benchmark-storage=benchmarks/history \
+    --benchmark-compare --benchmark-compare-fail=mean:25%
+
+Data is built once per benchmark, so only the helper itself is timed.
+"""
+
+import uuid
+import base64
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from perf.fakes import FakeWebPush
+
+RNG_SEED = 7
+
+
+def make_posts(count=50, max_likes=300):
+    rng = random.Random(RNG_SEED)
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "location_slug": "edgewood-atlanta",
+            "checkin_id": str(uuid.uuid4()),
+            "author_name": f"Guest {i}",
+            "author_emoji": "🎉",
+            "author_selfie": None,
+            "message": "Great vibes tonight! " * 3,
+            "image_url": f"/api/uploads/{uuid.uuid4()}.jpg" if i % 3 == 0 else None,
+            "likes": [str(uuid.uuid4()) for _ in range(rng.randint(0, max_likes))],
+            "created_at": now - timedelta(minutes=i)
+        }
+        for i in range(count)
+    ]
+
+
+def make_messages(checkin_id, count=500, partners=40):
+    rng = random.Random(RNG_SEED)
+    partner_ids = [str(uuid.uuid4()) for _ in range(partners)]
+    now = datetime.now(timezone.utc)
+    messages = []
+    for i in range(count):
+        partner_id = rng.choice(partner_ids)
+        outgoing = rng.random() < 0.5
+        messages.append({
+            "id": str(uuid.uuid4()),
+            "from_checkin_id": checkin_id if outgoing else partner_id,
+            "from_name": "Me" if outgoing else f"Partner {partner_id[:4]}",
+            "from_emoji": "😊",
+            "to_checkin_id": partner_id if outgoing else checkin_id,
+            "to_name": f"Partner {partner_id[:4]}" if outgoing else "Me",
+            "to_emoji": "🔥",
+            "message": "See you at the bar?",
+            "read": rng.random() < 0.7,
+            "created_at": now - timedelta(seconds=i * 30)
+        })
+    return messages
+
+
+def make_profile():
+    now = datetime.now(timezone.utc)
+    return {
+        "_id": "ignored",
+        "id": str(uuid.uuid4()),
+        "email": "guest@example.com",
+        "name": "Guest",
+        "password_hash": "$2b$12$" + "x" * 53,
+        "phone": "4045550100",
+        "role": "customer",
+        "token_balance": 120,
+        "cashout_balance": 0.0,
+        "total_earnings": 0.0,
+        "total_visits": 14,
+        "total_posts": 31,
+        "total_photos": 6,
+        "profile_photo_url": "/api/uploads/profile.jpg",
+        "special_dates": [{"type": "birthday", "date": "1990-04-12"}],
+        "allow_gallery_posts": True,
+        "favorite_location": "edgewood-atlanta",
+        "created_at": now - timedelta(days=400),
+        "updated_at": now,
+        "last_login": now - timedelta(hours=2),
+        "last_visit": now - timedelta(days=3),
+        "birthday_reward_sent_at": now - timedelta(days=180),
+    }
+
+
+def make_locations(count=8):
+    from models import Location, LocationCoordinates, LocationHours, WeeklySpecial
+
+    location = Location(
+        slug="edgewood-atlanta",
+        name="Fin & Feathers - Edgewood (Atlanta)",
+        address="345 Edgewood Ave SE, Atlanta, GA 30312",
+        phone="(404) 855-5524",
+        coordinates=LocationCoordinates(lat=33.754, lng=-84.374),
+        image="https://finandfeathersrestaurants.com/wp-content/uploads/edgewood.jpg",
+        hours=LocationHours(**{day: "11am - 2am" for day in (
+            "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"
+        )}),
+        weekly_specials=[
+            WeeklySpecial(day=day, special=f"{day} special - $5 wings and $20 bottles")
+            for day in ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+        ]
+    ).model_dump()
+    return [dict(location, slug=f"location-{i}") for i in range(count)]
+
+
+@pytest.mark.benchmark(group="social")
+def test_group_conversations(benchmark, server):
+    from routers.social import group_conversations
+
+    checkin_id = str(uuid.uuid4())
+    messages = make_messages(checkin_id)
+    conversations = benchmark(group_conversations, messages, checkin_id)
+    assert len(conversations) == 40
+
+
+@pytest.mark.benchmark(group="social")
+def test_build_social_wall(benchmark, server):
+    from routers.social import build_social_wall
+
+    posts = make_posts()
+    my_checkin_id = posts[0]["likes"][0] if posts[0]["likes"] else None
+    wall = benchmark(build_social_wall, posts, my_checkin_id)
+    assert len(wall) == 50
+
+
+@pytest.mark.benchmark(group="social")
+def test_toggle_like(benchmark, server):
+    from routers.social import toggle_like
+
+    likes = [str(uuid.uuid4()) for _ in range(300)]
+    checkin_id = str(uuid.uuid4())
+
+    def like_and_unlike():
+        toggle_like(likes, checkin_id)
+        return toggle_like(likes, checkin_id)
+
+    assert benchmark(like_and_unlike) == "unliked"
+
+
+@pytest.mark.benchmark(group="content")
+def test_normalize_location_response(benchmark, server):
+    from routers.content import normalize_location_response
+
+    locations = make_locations()
+
+    def normalize_all():
+        return [normalize_location_response(location) for location in locations]
+
+    assert len(benchmark(normalize_all)) == 8
+
+
+@pytest.mark.benchmark(group="auth")
+def test_isoformat_datetimes(benchmark, server):
+    from routers.auth import isoformat_datetimes
+
+    profile = make_profile()
+    user = benchmark(isoformat_datetimes, profile, ("password_hash", "_id"))
+    assert "password_hash" not in user
+    assert isinstance(user["created_at"], str)
+
+
+@pytest.mark.benchmark(group="media")
+def test_decode_media(benchmark, server, event_loop):
+    from storage import MongoStorage
+
+    image = random.Random(RNG_SEED).randbytes(512 * 1024)
+    media = {"file_id": "bench", "data": base64.b64encode(image).decode(), "content_type": "image/jpeg"}
+    storage = MongoStorage()
+    data = benchmark(lambda: event_loop.run_until_complete(storage.load(media)))
+    assert data == image
+
+
+@pytest.mark.benchmark(group="push")
+def test_send_to_all_subscribers(benchmark, server, event_loop, monkeypatch):
+    from mongomock_motor import AsyncMongoMockClient
+    import push_service
+
+    fake_push = FakeWebPush(latency=0)
+    monkeypatch.setattr(push_service, "webpush", fake_push)
+
+    db = AsyncMongoMockClient()["bench_push"]
+    event_loop.run_until_complete(db.loyalty_members.insert_many([
+        {
+            "id": str(uuid.uuid4()),
+            "name": f"Member {i}",
+            "push_subscription": {"endpoint": f"https://push.example/{i}", "keys": {"p256dh": "k", "auth": "a"}}
+        }
+        for i in range(500)
+    ]))
+    service = push_service.PushNotificationService(db)
+    service.enabled = True
+
+    notification = {"title": "Happy hour!", "body": "$5 wings until 9pm", "url": "/"}
+    result = benchmark(lambda: event_loop.run_until_complete(service.send_to_all_subscribers(notification)))
+    assert result["sent"] == 500
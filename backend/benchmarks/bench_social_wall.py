@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+CPU per request for the 50-post social wall: Pydantic model per document
+(the old path) vs RecordShape + orjson (FastJSONResponse).
+
+Both variants run as real FastAPI routes driven through ASGI in-process with
+the posts already in memory, so the numbers are framework + serialization
+cost only (no Mongo, no network):
+
+cd /app/backend && python benchmarks/bench_social_wall.py [iterations]
+"""
+
+import sys
+import time
+import uuid
+import asyncio
+from pathlib import Path
+from datetime import datetime, timedelta
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi import FastAPI
+from typing import List, Optional
+
+from models import SocialPostResponse
+from fast_json import FastJSONResponse, RecordShape
+
+POSTS = 50
+SOCIAL_POST_SHAPE = RecordShape(SocialPostResponse, computed=("likes_count", "liked_by_me"), extra=("likes",))
+
+
+def make_posts(n: int = POSTS) -> List[dict]:
+    now = datetime.utcnow()
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "location_slug": "edgewood",
+            "checkin_id": str(uuid.uuid4()),
+            "author_name": f"Guest {i}",
+            "author_emoji": "🎉",
+            "author_selfie": None,
+            "message": "Great vibes tonight! " * 3,
+            "image_url": f"/api/uploads/{uuid.uuid4()}.jpg" if i % 3 == 0 else None,
+            "likes": [str(uuid.uuid4()) for _ in range(i % 12)],
+            "created_at": now - timedelta(minutes=i)
+        }
+        for i in range(n)
+    ]
+
+
+def build_app(posts: List[dict]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/pydantic/{location_slug}")
+    async def wall_pydantic(location_slug: str, my_checkin_id: Optional[str] = None):
+        result = []
+        for post in posts:
+            liked_by_me = my_checkin_id in post.get("likes", []) if my_checkin_id else False
+            result.append(SocialPostResponse(
+                id=post["id"],
+                location_slug=post["location_slug"],
+                checkin_id=post["checkin_id"],
+                author_name=post["author_name"],
+                author_emoji=post["author_emoji"],
+                author_selfie=post.get("author_selfie"),
+                message=post["message"],
+                image_url=post.get("image_url"),
+                likes_count=len(post.get("likes", [])),
+                liked_by_me=liked_by_me,
+                created_at=post["created_at"]
+            ))
+        return result
+
+    @app.get("/pydantic-list/{location_slug}", response_model=List[SocialPostResponse])
+    async def wall_pydantic_response_model(location_slug: str, my_checkin_id: Optional[str] = None):
+        return await wall_pydantic(location_slug, my_checkin_id)
+
+    @app.get("/fast/{location_slug}")
+    async def wall_fast(location_slug: str, my_checkin_id: Optional[str] = None):
+        result = []
+        for post in posts:
+            likes = post.get("likes") or []
+            record = SOCIAL_POST_SHAPE.record(post)
+            record["likes_count"] = len(likes)
+            record["liked_by_me"] = my_checkin_id in likes if my_checkin_id else False
+            result.append(record)
+        return FastJSONResponse(result)
+
+    return app
+
+
+async def call(app: FastAPI, path: str) -> bytes:
+    """Drive one GET through the ASGI app and return the body"""
+    body = []
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "query_string": b"my_checkin_id=abc", "root_path": "", "headers": [],
+        "client": ("127.0.0.1", 1234), "server": ("testserver", 80)
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(body)
+
+
+async def measure(app: FastAPI, path: str, iterations: int) -> dict:
+    for _ in range(50):
+        await call(app, path)  # warm up
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    for _ in range(iterations):
+        size = len(await call(app, path))
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    return {"cpu_us": cpu / iterations * 1e6, "wall_us": wall / iterations * 1e6, "bytes": size}
+
+
+async def main(iterations: int):
+    app = build_app(make_posts())
+    results = {}
+    for name, path in [
+        ("pydantic models", "/pydantic/edgewood"),
+        ("pydantic + response_model", "/pydantic-list/edgewood"),
+        ("RecordShape + orjson", "/fast/edgewood"),
+    ]:
+        results[name] = await measure(app, path, iterations)
+
+    baseline = results["pydantic models"]["cpu_us"]
+    print(f"{POSTS}-post wall, {iterations} requests each")
+    for name, r in results.items():
+        print(f"  {name:<28} {r['cpu_us']:8.1f} us CPU/request  {r['wall_us']:8.1f} us wall  "
+              f"{r['bytes']:6d} bytes  x{baseline / r['cpu_us']:.2f}")
+    return results
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
@@ -0,0 +1,23 @@
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+
+@pytest.fixture(scope="session")
+def server():
+    """The app (server.py and routers/) on the in-memory Mongo stand-in with fake Stripe/push (see perf.harness)"""
+    from perf.harness import import_server
+    return import_server()
+
+
+@pytest.fixture
+def event_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
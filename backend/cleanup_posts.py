@@ -1,19 +1,28 @@
 #!/usr/bin/env python3
 """
-Scheduled cleanup script for old social posts.
+Scheduled data retention script (old posts, check-ins, messages, song
+requests, drink orders and DJ tips - see retention.RETENTION_POLICIES).
 Run via cron at 4am EST daily:
 0 4 * * * cd /app/backend && python cleanup_posts.py
 
-Posts older than 24 hours without images are deleted.
+Only one run applies the policies at a time (see RetentionEngine.run), so
+this is a no-op while the server's scheduled job is running, and vice versa.
+
+Preview what would be removed without touching anything:
+cd /app/backend && python cleanup_posts.py --dry-run
 """
 
 import os
+import sys
 import asyncio
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from motor.motor_asyncio import AsyncIOMotorClient
 from dotenv import load_dotenv
 
+from retention import RetentionEngine
+from venue_state import VenueStateService
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,44 +35,28 @@ MONGO_URL = os.environ.get("MONGO_URL")
 DB_NAME = os.environ.get("DB_NAME", "finandfeathers")
 
 
-async def cleanup_old_posts():
-    """Delete posts older than 24 hours that don't have images"""
-    logging.info("Starting scheduled cleanup of old posts...")
-    
+async def cleanup_old_posts(dry_run=False):
+    """Apply the retention policies once"""
+    logging.info(f"Starting scheduled retention{' (dry run)' if dry_run else ''}...")
+
     client = AsyncIOMotorClient(MONGO_URL)
     db = client[DB_NAME]
-    
-    # Calculate cutoff time (24 hours ago)
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
-    
-    # Delete posts older than 24 hours that don't have images
-    result = await db.social_posts.delete_many({
-        "created_at": {"$lt": cutoff},
-        "$or": [
-            {"image_url": None},
-            {"image_url": ""},
-            {"image_url": {"$exists": False}}
-        ]
-    })
-    
-    logging.info(f"Cleanup complete: Deleted {result.deleted_count} old posts without images")
-    
-    # Also cleanup expired check-ins (older than 24 hours)
-    checkin_result = await db.checkins.delete_many({
-        "checked_in_at": {"$lt": cutoff}
-    })
-    
-    logging.info(f"Cleaned up {checkin_result.deleted_count} expired check-ins")
-    
+
+    venue_state = VenueStateService(db)
+    result = await RetentionEngine(db, on_removed=venue_state.source_pruned).run(dry_run=dry_run)
+
+    if result.get("already_running"):
+        # The scheduled job (or an admin) is applying the policies right now
+        logging.info(f"Retention already running on {result['holder']}, skipping")
+    else:
+        logging.info(f"Retention complete: removed {result['removed']} documents")
+
     client.close()
-    
-    return {
-        "deleted_posts": result.deleted_count,
-        "deleted_checkins": checkin_result.deleted_count,
-        "cleanup_time": datetime.now(timezone.utc).isoformat()
-    }
+
+    result["cleanup_time"] = datetime.now(timezone.utc).isoformat()
+    return result
 
 
 if __name__ == "__main__":
-    result = asyncio.run(cleanup_old_posts())
+    result = asyncio.run(cleanup_old_posts(dry_run="--dry-run" in sys.argv[1:]))
     print(f"Cleanup result: {result}")
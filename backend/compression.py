@@ -0,0 +1,271 @@
+import asyncio
+import gzip
+import os
+import time
+import zlib
+from typing import Awaitable, Callable, Dict, Iterable, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+
+from fast_json import dumps
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+# Bodies smaller than this go out as-is - the headers cost more than the saving
+MINIMUM_SIZE = 1024
+
+# Per-response compression has to be cheap; cached payloads are compressed
+# once, so they get the slowest/smallest settings
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+CACHED_GZIP_LEVEL = 9
+CACHED_BROTLI_QUALITY = 11
+
+# Upper bound on how stale another worker's copy can be after an admin edit
+PUBLIC_CACHE_TTL_SECONDS = int(os.environ.get("PUBLIC_CACHE_TTL_SECONDS", "60"))
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+# Preference order when the client rates several encodings equally
+ENCODINGS = ("br", "gzip") if brotli else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str, available: Iterable[str] = ENCODINGS) -> Optional[str]:
+    """Best content coding the client accepts (None = identity)"""
+    if not accept_encoding:
+        return None
+
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    best, best_q = None, 0.0
+    for encoding in available:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    content_type = (content_type or "").lower()
+    if content_type.startswith("text/event-stream"):
+        return False
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def compress(body: bytes, encoding: str, cached: bool = False) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=CACHED_BROTLI_QUALITY if cached else BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=CACHED_GZIP_LEVEL if cached else GZIP_LEVEL, mtime=0)
+
+
+class _StreamCompressor:
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+            self._compress = self._compressor.process
+            self._finish = self._compressor.finish
+        else:
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+            self._compress = self._compressor.compress
+            self._finish = self._compressor.flush
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compress(chunk)
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+class CompressionMiddleware:
+    """
+    gzip/brotli for API responses, negotiated from Accept-Encoding.
+
+    Only text-like content types at least `minimum_size` bytes long are
+    compressed. Responses that already carry a Content-Encoding (such as
+    the pre-compressed bodies from PrecompressedCache) pass through
+    untouched, as do images, video and partial content.
+    """
+
+    def __init__(self, app, minimum_size: int = MINIMUM_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        responder = _CompressionResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, send, encoding: Optional[str], minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start_message = None
+        self.passthrough = False
+        self.compressor: Optional[_StreamCompressor] = None
+
+    async def send(self, message):
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            if (
+                message["status"] in (204, 206, 304)
+                or "content-encoding" in headers
+                or not is_compressible(headers.get("content-type", ""))
+            ):
+                self.passthrough = True
+                await self._send(message)
+            else:
+                # Held until the first body chunk tells us the size
+                self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            headers = MutableHeaders(raw=start["headers"])
+            if "accept-encoding" not in headers.get("vary", "").lower():
+                headers.add_vary_header("Accept-Encoding")
+
+            if not self.encoding or (not more_body and len(body) < self.minimum_size):
+                self.passthrough = True
+                await self._send(start)
+                await self._send(message)
+                return
+
+            headers["Content-Encoding"] = self.encoding
+            if not more_body:
+                body = compress(body, self.encoding)
+                headers["Content-Length"] = str(len(body))
+                await self._send(start)
+                await self._send({"type": "http.response.body", "body": body})
+                return
+
+            # Streamed body - compress chunk by chunk, length unknown up front
+            del headers["Content-Length"]
+            self.compressor = _StreamCompressor(self.encoding)
+            await self._send(start)
+
+        chunk = self.compressor.compress(body)
+        if not more_body:
+            chunk += self.compressor.finish()
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+
+class _CachedPayload:
+    __slots__ = ("bodies", "source_version", "stored_at")
+
+    def __init__(self, bodies: Dict[str, bytes], source_version=None):
+        self.bodies = bodies
+        self.source_version = source_version
+        self.stored_at = time.monotonic()
+
+
+class PrecompressedCache:
+    """
+    Public JSON payloads (menu, locations, events) serialized and compressed
+    once per worker, then served from memory in whichever encoding the
+    client accepts:
+
+        return await public_cache.respond(request, "menu/items", load_menu_items,
+                                          source_version=await content_versions.get("menu_items"))
+
+    A payload is rebuilt when `source_version` (e.g. the collection version
+    counters) changes, when invalidate() is called with its key, or after
+    the TTL.
+    """
+
+    def __init__(self, ttl: float = PUBLIC_CACHE_TTL_SECONDS, minimum_size: int = MINIMUM_SIZE):
+        self.ttl = ttl
+        self.minimum_size = minimum_size
+        self._entries: Dict[str, _CachedPayload] = {}
+        self._versions: Dict[str, int] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def _fresh(self, key: str, source_version) -> Optional[_CachedPayload]:
+        entry = self._entries.get(key)
+        if (
+            entry
+            and entry.source_version == source_version
+            and time.monotonic() - entry.stored_at <= self.ttl
+        ):
+            return entry
+        return None
+
+    def _encode(self, content) -> Dict[str, bytes]:
+        body = dumps(content)
+        bodies = {"identity": body}
+        if len(body) >= self.minimum_size:
+            for encoding in ENCODINGS:
+                bodies[encoding] = compress(body, encoding, cached=True)
+        return bodies
+
+    async def get(self, key: str, build: Callable[[], Awaitable], source_version=None) -> _CachedPayload:
+        entry = self._fresh(key, source_version)
+        if entry:
+            return entry
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another request may have rebuilt it while we waited
+            entry = self._fresh(key, source_version)
+            if entry:
+                return entry
+
+            version = self._versions.get(key, 0)
+            content = await build()
+            entry = _CachedPayload(await asyncio.to_thread(self._encode, content), source_version)
+            # Don't store a payload an admin write invalidated mid-build
+            if self._versions.get(key, 0) == version:
+                self._entries[key] = entry
+            return entry
+
+    async def respond(self, request: Request, key: str, build: Callable[[], Awaitable], source_version=None) -> Response:
+        entry = await self.get(key, build, source_version)
+        encoding = negotiate_encoding(
+            request.headers.get("accept-encoding", ""),
+            [e for e in ENCODINGS if e in entry.bodies]
+        )
+        headers = {"Vary": "Accept-Encoding"}
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return Response(entry.bodies[encoding or "identity"], media_type="application/json", headers=headers)
+
+    def invalidate(self, *keys: str):
+        for key in keys:
+            self._versions[key] = self._versions.get(key, 0) + 1
+            self._entries.pop(key, None)
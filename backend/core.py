@@ -0,0 +1,142 @@
+from dotenv import load_dotenv
+from pathlib import Path
+
+# Load environment variables FIRST before any other imports that might need them
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+import os
+import uuid
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from fastapi import Depends
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from push_service import PushNotificationService
+from venue_state import VenueStateService
+from sessions import SessionManager
+from compression import PrecompressedCache
+from http_cache import CollectionVersions
+from db_routing import ReadRouter, ADMIN_READ_PREFERENCE, ADMIN_MAX_STALENESS
+from rollups import RollupService
+from analytics_export import AnalyticsExporter
+from leader import LeaderLease, JobRunner
+from retention import RetentionEngine
+from storage import MediaStore
+from media_cache import MediaCache
+from upload_stream import resumable_uploads_for
+from singleflight import SingleFlight
+from batch_loader import BatchLoader
+from repositories import Repositories
+from migrations import SchemaMigrator
+from presence import PresenceService
+from auth import get_password_hash
+
+# MongoDB connection
+mongo_url = os.environ['MONGO_URL']
+client = AsyncIOMotorClient(mongo_url)
+db = client[os.environ['DB_NAME']]
+
+# Per-route read preferences - admin lists/reports can be served by replicas
+read_router = ReadRouter(db)
+admin_reads = read_router.depends(ADMIN_READ_PREFERENCE, ADMIN_MAX_STALENESS)
+
+# Initialize Push Notification Service
+push_service = PushNotificationService(db)
+
+# Signed user sessions with revocation filter and profile cache
+sessions = SessionManager(db)
+
+# Materialized per-location venue snapshots
+venue_state = VenueStateService(db)
+
+# Daily/hourly analytics buckets
+rollups = RollupService(db)
+
+# Parquet/Arrow exports for analysts
+analytics_exporter = AnalyticsExporter(db, read_db=read_router.admin(), settle_seconds=ADMIN_MAX_STALENESS)
+
+
+def get_batch_loader() -> BatchLoader:
+    """Per-request BatchLoader (use with Depends): point lookups batched into $in queries"""
+    return BatchLoader(db)
+
+
+@lru_cache(maxsize=None)
+def get_analytics_service():
+    """Pandas-backed reports; built on first use so pandas/numpy stay out of startup"""
+    from analytics import AnalyticsService
+    return AnalyticsService(db, read_db=read_router.admin())
+
+
+# Uploaded media: metadata in media_files, bytes in MongoDB or S3 (MEDIA_STORAGE);
+# MongoDB-stored files are served from a local disk cache once decoded
+media_store = MediaStore(db, cache=MediaCache())
+
+# Per-collection query shapes, default projections, indexes and query timings
+repos = Repositories(db)
+
+# Resumable (tus) video uploads, staged where media_store keeps new files:
+# an S3 multipart upload with MEDIA_STORAGE=s3, upload_chunks otherwise
+resumable_uploads = resumable_uploads_for(db, media_store)
+
+# Who is at each location, from client heartbeats: in memory per worker,
+# merged across workers through compact `presence` documents
+presence = PresenceService(db, repos.checkins)
+
+# Version counters of public content collections (ETags, public_cache)
+content_versions = CollectionVersions(db)
+
+# Menu, locations and events, serialized and compressed once per worker
+public_cache = PrecompressedCache()
+
+# Identical concurrent live reads (social wall, DJ, merchandise)
+# share one query or outbound call
+singleflight = SingleFlight()
+
+# Periodic jobs run on whichever worker holds the scheduler lease
+scheduler_lease = LeaderLease(db, "scheduler")
+job_runner = JobRunner(db, scheduler_lease)
+
+# Per-collection retention policies (retention.RETENTION_POLICIES)
+retention = RetentionEngine(db, on_removed=venue_state.source_pruned)
+
+# Versioned document shapes (schema_version): startup check and batched backfill
+schema_migrator = SchemaMigrator(db)
+
+# Security
+security = HTTPBearer(auto_error=False)
+
+# Admin credentials (hardcoded as requested)
+ADMIN_USERNAME = "admin"
+
+
+@lru_cache(maxsize=None)
+def admin_password_hash() -> str:
+    """bcrypt hash of the built-in admin password, computed on first use rather than at import"""
+    return get_password_hash("$outhcentral")
+
+
+async def ensure_default_admin_user():
+    existing = await db.admin_users.find_one({"username": ADMIN_USERNAME})
+    if existing:
+        return
+
+    new_admin = {
+        "id": f"admin_{uuid.uuid4().hex[:12]}",
+        "username": ADMIN_USERNAME,
+        "email": "admin@finandfeathers.com",
+        "password_hash": admin_password_hash(),
+        "is_active": True,
+        "is_super_admin": True,
+        "created_at": datetime.now(timezone.utc)
+    }
+    await db.admin_users.insert_one(new_admin)
+
+
+# Auth dependency
+async def get_current_admin(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    """Grant admin access - no authentication required"""
+    return "admin"
@@ -0,0 +1,63 @@
+import os
+from typing import Dict, Optional, Tuple
+
+from pymongo.read_preferences import Nearest, Primary, SecondaryPreferred
+
+READ_PREFERENCES = {
+    "primary": Primary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+
+# MongoDB rejects maxStalenessSeconds below 90
+MIN_MAX_STALENESS = 90
+
+# Where admin/reporting reads go. Unset, they stay on the primary (the
+# plain db handle); replica-set deployments opt in with secondaryPreferred
+ADMIN_READ_PREFERENCE = os.environ.get("ADMIN_READ_PREFERENCE", "primary")
+ADMIN_MAX_STALENESS = int(os.environ.get("ADMIN_MAX_STALENESS", "120"))
+
+
+class ReadRouter:
+    """
+    Hands out database handles bound to a read preference, so a route can
+    declare where its reads go:
+
+        @api_router.get("/admin/users")
+        async def admin_get_users(read_db=Depends(read_router.depends("secondaryPreferred", 120))):
+
+    Handles share the global client's connection pool and are cached per
+    (mode, max staleness). Writes through any handle still go to the primary.
+    On a standalone server secondaryPreferred/nearest simply read the primary.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._handles: Dict[Tuple[str, Optional[int]], object] = {("primary", None): db}
+
+    def get(self, mode: str = "primary", max_staleness: Optional[int] = None):
+        if mode not in READ_PREFERENCES:
+            raise ValueError(f"Unknown read preference: {mode}")
+        if mode == "primary":
+            # Staleness only applies to secondary reads
+            max_staleness = None
+        elif max_staleness is not None and max_staleness != -1 and max_staleness < MIN_MAX_STALENESS:
+            raise ValueError(f"max_staleness must be at least {MIN_MAX_STALENESS} seconds")
+
+        key = (mode, max_staleness)
+        if key not in self._handles:
+            preference = READ_PREFERENCES[mode](max_staleness=-1 if max_staleness is None else max_staleness)
+            self._handles[key] = self.db.with_options(read_preference=preference)
+        return self._handles[key]
+
+    def depends(self, mode: str = "primary", max_staleness: Optional[int] = None):
+        """FastAPI dependency returning the routed handle (validated once, at import)"""
+        handle = self.get(mode, max_staleness)
+
+        def dependency():
+            return handle
+        return dependency
+
+    def admin(self):
+        """Handle for admin list/report reads (ADMIN_READ_PREFERENCE / ADMIN_MAX_STALENESS)"""
+        return self.get(ADMIN_READ_PREFERENCE, ADMIN_MAX_STALENESS)
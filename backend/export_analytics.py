@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Export operational collections to partitioned Parquet/Arrow files for analysts.
+Run nightly via cron (incremental from the last export):
+0 5 * * * cd /app/backend && python export_analytics.py
+
+Options:
+  --collections checkins,dj_tips   only export these collections
+  --full                           ignore the high-water mark and re-export everything
+  --format arrow                   write Arrow IPC files instead of Parquet
+  --out /data/exports              output directory
+"""
+
+import os
+import argparse
+import asyncio
+import logging
+from motor.motor_asyncio import AsyncIOMotorClient
+from dotenv import load_dotenv
+
+from analytics_export import AnalyticsExporter, DEFAULT_EXPORT_DIR, DEFAULT_BATCH_SIZE, EXPORT_FORMATS
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+load_dotenv()
+
+MONGO_URL = os.environ.get("MONGO_URL")
+DB_NAME = os.environ.get("DB_NAME", "finandfeathers")
+
+
+async def export_analytics(collections=None, full=False, fmt="parquet", out=DEFAULT_EXPORT_DIR, batch_size=DEFAULT_BATCH_SIZE):
+    """Run one export pass"""
+    logging.info(f"Starting {'full' if full else 'incremental'} analytics export to {out}...")
+
+    client = AsyncIOMotorClient(MONGO_URL)
+    db = client[DB_NAME]
+
+    exporter = AnalyticsExporter(db, export_dir=out, batch_size=batch_size)
+    result = await exporter.run(collections, full=full, fmt=fmt)
+
+    logging.info(f"Export complete: {sum(c['exported'] for c in result['collections'])} documents")
+
+    client.close()
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export collections to partitioned Parquet/Arrow files")
+    parser.add_argument("--collections", help="Comma-separated collections (default: all)")
+    parser.add_argument("--full", action="store_true", help="Re-export from scratch")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="parquet")
+    parser.add_argument("--out", default=str(DEFAULT_EXPORT_DIR))
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    collections = args.collections.split(",") if args.collections else None
+    result = asyncio.run(export_analytics(collections, args.full, args.format, args.out, args.batch_size))
+    print(f"Export result: {result}")
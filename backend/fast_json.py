@@ -0,0 +1,69 @@
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Sequence, Type
+
+import orjson
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any):
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(
+        content,
+        default=_default,
+        option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    orjson-rendered JSON response. Returning it from a route skips FastAPI's
+    response_model validation and jsonable_encoder pass entirely, so only use
+    it for data whose shape we already control (see RecordShape).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class RecordShape:
+    """
+    Field layout of a response model, computed once per model.
+
+    record() copies a Mongo document into a plain dict with exactly the
+    model's fields (in model order, missing optional fields defaulted)
+    without running validation - for documents our own handlers wrote.
+    `computed` fields are left out of the Mongo projection and filled in
+    by the caller; `extra` fields are fetched but not returned.
+    """
+
+    __slots__ = ("model", "fields", "projection")
+
+    def __init__(self, model: Type[BaseModel], computed: Sequence[str] = (), extra: Sequence[str] = ()):
+        self.model = model
+        self.fields = tuple(
+            (name, None if field.is_required() or field.default_factory else field.default)
+            for name, field in model.model_fields.items()
+        )
+        stored = [name for name, _ in self.fields if name not in computed]
+        self.projection = {"_id": 0, **{name: 1 for name in [*stored, *extra]}}
+
+    def record(self, doc: Dict) -> Dict:
+        return {name: doc.get(name, default) for name, default in self.fields}
+
+    def records(self, docs: Iterable[Dict]) -> List[Dict]:
+        fields = self.fields
+        return [{name: doc.get(name, default) for name, default in fields} for doc in docs]
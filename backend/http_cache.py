@@ -0,0 +1,164 @@
+import re
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pymongo import ReturnDocument
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.routing import compile_path
+
+# How often each worker pulls version counters bumped by other workers
+VERSION_SYNC_SECONDS = 2
+
+# What every /api/ response got before per-route policies existed
+NO_STORE = "no-store, no-cache, must-revalidate, max-age=0"
+
+
+class CachePolicy:
+    """
+    Cache-Control for a group of routes. When `collections` is set the
+    response also gets a weak ETag built from those collections' version
+    counters, so conditional requests are answered with a 304 before the
+    route runs.
+    """
+
+    __slots__ = ("cache_control", "collections")
+
+    def __init__(self, cache_control: str, collections: Sequence[str] = ()):
+        self.cache_control = cache_control
+        self.collections = tuple(collections)
+
+
+def public(max_age: int, stale_while_revalidate: int = 0, collections: Sequence[str] = ()) -> CachePolicy:
+    cache_control = f"public, max-age={max_age}"
+    if stale_while_revalidate:
+        cache_control += f", stale-while-revalidate={stale_while_revalidate}"
+    return CachePolicy(cache_control, collections)
+
+
+IMMUTABLE = CachePolicy("public, max-age=31536000, immutable")
+
+# Per-user data: browsers may keep it but must revalidate, shared caches never store it
+PRIVATE = CachePolicy("private, no-cache")
+
+
+class CollectionVersions:
+    """
+    Version counter per collection in `collection_versions`, bumped by the
+    write handlers after every change. Each worker keeps a copy that is
+    refreshed every VERSION_SYNC_SECONDS, so a bump on one worker reaches
+    the others' ETags within that window.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._versions: Dict[str, int] = {}
+        self._last_sync = 0.0
+
+    async def sync(self, force: bool = False):
+        if not force and time.monotonic() - self._last_sync < VERSION_SYNC_SECONDS:
+            return
+        self._last_sync = time.monotonic()
+        async for doc in self.db.collection_versions.find({}, {"version": 1}):
+            # Never go backwards past a bump this worker already made
+            self._versions[doc["_id"]] = max(doc["version"], self._versions.get(doc["_id"], 0))
+
+    async def bump(self, *collections: str):
+        now = datetime.now(timezone.utc)
+        for name in collections:
+            doc = await self.db.collection_versions.find_one_and_update(
+                {"_id": name},
+                {"$inc": {"version": 1}, "$set": {"updated_at": now}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            self._versions[name] = doc["version"]
+
+    async def get(self, *collections: str) -> Tuple[int, ...]:
+        await self.sync()
+        return tuple(self._versions.get(name, 0) for name in collections)
+
+    async def etag(self, collections: Iterable[str]) -> str:
+        versions = await self.get(*collections)
+        return 'W/"' + ".".join(str(v) for v in versions) + '"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison - W/ prefixes don't matter for If-None-Match
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+class HttpCacheMiddleware:
+    """
+    Applies the first CachePolicy whose route template matches a GET/HEAD
+    /api/ request:
+
+        app.add_middleware(HttpCacheMiddleware, policies=[
+            ("/api/menu/items", public(60, 300, collections=["menu_items"])),
+            ("/api/uploads/{filename}", IMMUTABLE),
+        ], versions=content_versions)
+
+    Everything else under /api/ (writes, unmatched routes, error responses)
+    keeps the no-store headers.
+    """
+
+    def __init__(self, app, policies: Sequence[Tuple[str, CachePolicy]], versions: Optional[CollectionVersions] = None):
+        self.app = app
+        self.versions = versions
+        self.policies: List[Tuple[re.Pattern, CachePolicy]] = [
+            (compile_path(path)[0], policy) for path, policy in policies
+        ]
+
+    def match(self, path: str) -> Optional[CachePolicy]:
+        for regex, policy in self.policies:
+            if regex.match(path):
+                return policy
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith("/api/"):
+            await self.app(scope, receive, send)
+            return
+
+        policy = self.match(scope["path"]) if scope["method"] in ("GET", "HEAD") else None
+        etag = None
+        if policy and policy.collections and self.versions:
+            etag = await self.versions.etag(policy.collections)
+            if etag_matches(Headers(scope=scope).get("if-none-match", ""), etag):
+                await send({
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [
+                        (b"etag", etag.encode("latin-1")),
+                        (b"cache-control", policy.cache_control.encode("latin-1")),
+                        (b"vary", b"Accept-Encoding"),
+                    ]
+                })
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                if policy and 200 <= message["status"] < 300:
+                    headers["Cache-Control"] = policy.cache_control
+                    if etag and "etag" not in headers:
+                        headers["ETag"] = etag
+                else:
+                    headers["Cache-Control"] = NO_STORE
+                    headers["Pragma"] = "no-cache"
+                    headers["Expires"] = "0"
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -0,0 +1,182 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from pymongo.errors import DuplicateKeyError
+
+# A leader that stops renewing (crash, deploy, stuck event loop) loses the
+# lease after this long and another worker takes over on its next attempt
+LEASE_TTL_SECONDS = float(os.environ.get("LEADER_LEASE_TTL_SECONDS", "30"))
+
+# job_runs history is kept this long (TTL index on started_at)
+JOB_RUN_HISTORY_DAYS = int(os.environ.get("JOB_RUN_HISTORY_DAYS", "90"))
+
+
+def default_holder_id() -> str:
+    """Unique per process: several uvicorn workers share a hostname"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class LeaderLease:
+    """
+    A named lease in leader_leases. The worker holding an unexpired lease is
+    the leader; it renews every `renew_every` seconds, and anyone may take
+    the lease once expires_at has passed. Expiry is compared on each
+    worker's own clock, so clocks need to agree to well within the TTL.
+    """
+
+    def __init__(self, db, name: str, ttl: float = LEASE_TTL_SECONDS,
+                 renew_every: Optional[float] = None, holder_id: Optional[str] = None):
+        self.db = db
+        self.name = name
+        self.ttl = ttl
+        self.renew_every = renew_every or ttl / 3
+        self.holder_id = holder_id or default_holder_id()
+        self._valid_until = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return time.monotonic() < self._valid_until
+
+    async def acquire(self) -> bool:
+        """Take the lease if it is free or expired, or extend it if we already hold it"""
+        started = time.monotonic()
+        now = datetime.now(timezone.utc)
+        was_leader = self.is_leader
+        update = {"holder": self.holder_id, "expires_at": now + timedelta(seconds=self.ttl), "renewed_at": now}
+        if not was_leader:
+            update["acquired_at"] = now
+        try:
+            await self.db.leader_leases.update_one(
+                {"_id": self.name, "$or": [{"holder": self.holder_id}, {"expires_at": {"$lte": now}}]},
+                {"$set": update},
+                upsert=True
+            )
+        except DuplicateKeyError:
+            # The filter missed because someone else holds an unexpired lease,
+            # and the upsert collided with their document
+            self._valid_until = 0.0
+            if was_leader:
+                logging.warning(f"{self.holder_id} lost the {self.name} lease")
+            return False
+
+        # Stop trusting the lease a renewal interval before Mongo would expire
+        # it, so a slow renewal can't leave two leaders
+        self._valid_until = started + self.ttl - self.renew_every
+        if not was_leader:
+            logging.info(f"{self.holder_id} is now the {self.name} leader")
+        return True
+
+    async def release(self):
+        """Give the lease up (on shutdown) so another worker doesn't wait out the TTL"""
+        self._valid_until = 0.0
+        await self.db.leader_leases.update_one(
+            {"_id": self.name, "holder": self.holder_id},
+            {"$set": {"expires_at": datetime.now(timezone.utc)}}
+        )
+
+    async def get_state(self) -> Optional[Dict]:
+        return await self.db.leader_leases.find_one({"_id": self.name})
+
+    async def _keep_renewing(self):
+        while True:
+            try:
+                await self.acquire()
+            except Exception as e:
+                # Mongo unreachable: stop acting as leader until a renewal succeeds
+                self._valid_until = 0.0
+                logging.error(f"{self.name} lease renewal failed: {e}")
+            await asyncio.sleep(self.renew_every)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._keep_renewing())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.release()
+
+
+class JobRunner:
+    """
+    Runs periodic jobs on the lease holder only and records every run in
+    job_runs. Each worker's scheduler still fires the job: the leader runs
+    it straight away, the others wait out one lease TTL and only run it if
+    the leader died in the meantime and they took the lease over. A run is
+    claimed by inserting job_id@slot (the scheduled minute), so a slot runs
+    at most once even across a leadership handover.
+    """
+
+    def __init__(self, db, lease: LeaderLease):
+        self.db = db
+        self.lease = lease
+
+    async def ensure_indexes(self):
+        await self.db.job_runs.create_index([("job_id", 1), ("started_at", -1)])
+        await self.db.job_runs.create_index("started_at", expireAfterSeconds=JOB_RUN_HISTORY_DAYS * 86400)
+
+    async def run(self, job_id: str, job: Callable[[], Awaitable], slot: Optional[datetime] = None):
+        slot = slot or datetime.now(timezone.utc).replace(second=0, microsecond=0)
+
+        if not self.lease.is_leader and not await self.lease.acquire():
+            await asyncio.sleep(self.lease.ttl)
+            if not await self.lease.acquire():
+                return None
+
+        run_id = f"{job_id}@{slot.isoformat()}"
+        started_at = datetime.now(timezone.utc)
+        try:
+            await self.db.job_runs.insert_one({
+                "_id": run_id,
+                "job_id": job_id,
+                "slot": slot,
+                "holder": self.lease.holder_id,
+                "status": "running",
+                "started_at": started_at
+            })
+        except DuplicateKeyError:
+            # Already run (or still running) for this slot, e.g. by the previous leader
+            return None
+
+        started = time.perf_counter()
+        try:
+            result = await job()
+        except Exception as e:
+            logging.error(f"Job {job_id} failed: {e}")
+            await self._finish(run_id, started, {"status": "failed", "error": str(e)})
+            return None
+        await self._finish(run_id, started, {"status": "completed", "result": result if isinstance(result, dict) else None})
+        return result
+
+    async def _finish(self, run_id: str, started: float, fields: Dict):
+        await self.db.job_runs.update_one(
+            {"_id": run_id},
+            {"$set": {
+                **fields,
+                "finished_at": datetime.now(timezone.utc),
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1)
+            }}
+        )
+
+    def wrap(self, job_id: str, job: Callable[[], Awaitable]) -> Callable[[], Awaitable]:
+        """The job as a scheduler callable that goes through run()"""
+        async def run_job():
+            return await self.run(job_id, job)
+        run_job.__name__ = run_job.__qualname__ = f"{job_id}_on_leader"
+        return run_job
+
+    async def recent_runs(self, job_id: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        query = {"job_id": job_id} if job_id else {}
+        return await self.db.job_runs.find(query).sort("started_at", -1).limit(limit).to_list(limit)
@@ -0,0 +1,200 @@
+import os
+import asyncio
+import hashlib
+import mimetypes
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from upload_index import guess_media_type
+
+# Decoded copies of MongoDB-stored media, shared by the workers on a host
+MEDIA_CACHE_DIR = os.environ.get("MEDIA_CACHE_DIR", os.path.join(tempfile.gettempdir(), "media-cache"))
+
+# The least recently served files are evicted once the directory holds more
+# than this many bytes, whichever worker wrote them; 0 turns the cache off
+MEDIA_CACHE_MAX_BYTES = int(os.environ.get("MEDIA_CACHE_MAX_BYTES", str(2 * 1024 * 1024 * 1024)))
+
+# Prefix of files still being written (never served, swept on startup)
+TEMP_PREFIX = ".tmp-"
+
+
+def cache_key(file_id: str) -> str:
+    # file_ids come from the URL, so files are named by their hash
+    return hashlib.sha256(file_id.encode("utf-8")).hexdigest()[:40]
+
+
+def cache_name(file_id: str, content_type: Optional[str]) -> str:
+    # The extension keeps the media type for FileResponse and across restarts
+    return f"{cache_key(file_id)}{mimetypes.guess_extension(content_type or '') or ''}"
+
+
+class MediaCache:
+    """
+    Size-bounded LRU of media bytes on local disk, keyed by file_id, so a
+    hit is a sendfile (FileResponse) instead of reading and decoding a
+    multi-MB Base64 document. file_ids are never reused, so entries are
+    only dropped on eviction or discard().
+
+    Writes go to a temporary file that is renamed into place, so a reader
+    never sees a partial file. Each worker keeps its own LRU order over the
+    shared directory: a file another worker evicted is noticed on the next
+    hit (the stat fails) and simply fetched again.
+
+    The byte budget is for the whole directory: put() rescans it before
+    evicting, so files other workers wrote count too (as least recently
+    used, oldest written first, since their hits aren't seen here). The
+    directory stays within max_bytes plus whatever temporary files are
+    being written at that moment - at most one file per concurrent put().
+    """
+
+    def __init__(self, directory: str = MEDIA_CACHE_DIR, max_bytes: int = MEDIA_CACHE_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # name -> size, oldest first
+        self._names: Dict[str, str] = {}  # cache_key -> name
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _load(self):
+        """Index what an earlier run left behind, least recently written first"""
+        if not self.enabled:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._merge(self._scan(sweep=True))
+        self._evict()
+
+    def _scan(self, sweep: bool = False) -> List[Tuple[float, str, int]]:
+        """(mtime, name, size) of the finished files, oldest first; `sweep` deletes leftover temporary files"""
+        found = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.startswith(TEMP_PREFIX):
+                    if sweep:
+                        self._unlink(entry.name)
+                    continue
+                try:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        found.append((stat.st_mtime, entry.name, stat.st_size))
+                except FileNotFoundError:
+                    # Evicted by another worker mid-scan
+                    continue
+        return sorted(found)
+
+    def _merge(self, found: List[Tuple[float, str, int]]):
+        """Match the index to a directory listing: files this worker hasn't seen go first in LRU order"""
+        sizes = {name: size for _, name, size in found}
+        entries = OrderedDict((name, size) for _, name, size in found if name not in self._entries)
+        entries.update((name, sizes[name]) for name in self._entries if name in sizes)
+        self._entries = entries
+        self._names = {name.split('.', 1)[0]: name for name in entries}
+        self.total_bytes = sum(entries.values())
+
+    def _add(self, name: str, size: int):
+        if name in self._entries:
+            self.total_bytes -= self._entries.pop(name)
+        self._entries[name] = size
+        self._names[name.split('.', 1)[0]] = name
+        self.total_bytes += size
+
+    def _remove(self, name: str):
+        size = self._entries.pop(name, None)
+        if size is not None:
+            self.total_bytes -= size
+            self._names.pop(name.split('.', 1)[0], None)
+
+    def _unlink(self, name: str):
+        try:
+            os.unlink(self.directory / name)
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes and self._entries:
+            name = next(iter(self._entries))
+            self._remove(name)
+            self._unlink(name)
+
+    def __contains__(self, file_id: str) -> bool:
+        name = self._names.get(cache_key(file_id))
+        return name is not None and (self.directory / name).is_file()
+
+    def get(self, file_id: str) -> Optional[Dict]:
+        """{path, size, media_type} of a cached file, marking it recently used"""
+        if not self.enabled:
+            return None
+        name = self._names.get(cache_key(file_id))
+        if name is None:
+            self.misses += 1
+            return None
+        path = self.directory / name
+        if not path.is_file():
+            # Evicted or discarded by another worker
+            self._remove(name)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(name)
+        self.hits += 1
+        return {"path": path, "size": self._entries[name], "media_type": guess_media_type(name)}
+
+    async def put(self, file_id: str, data: bytes, content_type: Optional[str]) -> Optional[Dict]:
+        """Cache the bytes (atomically) and return the entry; None if they don't fit"""
+        if not self.enabled or len(data) > self.max_bytes:
+            return None
+        name = cache_name(file_id, content_type)
+        await asyncio.to_thread(self._write, name, data)
+        self._add(name, len(data))
+        self._merge(await asyncio.to_thread(self._scan))
+        self._evict()
+        if name not in self._entries:
+            return None
+        return {"path": self.directory / name, "size": len(data), "media_type": guess_media_type(name)}
+
+    def _write(self, name: str, data: bytes):
+        fd, temp_path = tempfile.mkstemp(prefix=TEMP_PREFIX, dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, self.directory / name)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def discard(self, file_id: str):
+        name = self._names.get(cache_key(file_id))
+        if name is not None:
+            self._remove(name)
+            self._unlink(name)
+
+    def stats(self) -> Dict:
+        return {
+            "enabled": self.enabled,
+            "directory": str(self.directory),
+            "files": len(self._entries),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+def media_file_ids(urls: Iterable[Optional[str]]) -> list:
+    """file_ids of /api/media/{file_id} URLs, in order, without duplicates"""
+    file_ids = []
+    for url in urls:
+        if url and "/api/media/" in url:
+            file_id = url.split("/api/media/", 1)[1].split("?", 1)[0].strip("/")
+            if file_id and file_id not in file_ids:
+                file_ids.append(file_id)
+    return file_ids
@@ -0,0 +1,203 @@
+import asyncio
+import logging
+import os
+from typing import Dict, List, Optional
+
+from pymongo import UpdateOne
+
+# Stored on every document of a migrated collection: the last migration
+# applied to it. Documents without it predate the framework (version 0).
+VERSION_FIELD = "schema_version"
+
+# Documents are upgraded in batches of BATCH_SIZE with a pause in between,
+# like retention, so a backfill never holds a hot collection's locks for long
+BATCH_SIZE = int(os.environ.get("MIGRATION_BATCH_SIZE", "500"))
+BATCH_PAUSE_SECONDS = float(os.environ.get("MIGRATION_BATCH_PAUSE_SECONDS", "0.1"))
+
+# Profile fields added after launch, with the value older profiles are read as
+PROFILE_DEFAULTS = {
+    "role": "customer",
+    "staff_title": None,
+    "cashout_balance": 0.0,
+    "total_earnings": 0.0,
+    "profile_photo_url": None,
+    "special_dates": [],
+    "token_balance": 0,
+    "total_visits": 0,
+    "total_posts": 0,
+    "total_photos": 0,
+    "allow_gallery_posts": True,
+}
+
+# Each collection's stored shape, one step per version, in order:
+#   defaults - fields a document at the previous version may be missing, and
+#              the value to fill in (existing values, even null, are kept)
+#   upgrade  - optional doc -> {field: value} for changes defaults can't express
+# New documents are written at the latest version (stamp()); to change a
+# shape, append a step with the next version - never edit a shipped one.
+MIGRATIONS = [
+    {
+        "collection": "user_profiles",
+        "version": 1,
+        "description": "Staff, earnings, token and gallery fields on pre-staff profiles",
+        "defaults": PROFILE_DEFAULTS,
+    },
+    {
+        "collection": "dj_tips",
+        "version": 1,
+        "description": "payment_method on tips recorded before Apple Pay / Venmo",
+        "defaults": {"payment_method": "cash_app"},
+    },
+]
+
+
+def _latest_versions(migrations: List[Dict]) -> Dict[str, int]:
+    versions = {}
+    for step in migrations:
+        collection = step["collection"]
+        if step["version"] != versions.get(collection, 0) + 1:
+            raise ValueError(f"Migration versions for {collection} must count up from 1")
+        versions[collection] = step["version"]
+    return versions
+
+
+# collection -> the version new documents are written at
+SCHEMA_VERSIONS = _latest_versions(MIGRATIONS)
+
+
+def _copy(value):
+    # Mutable defaults ([] / {}) must not be shared between documents
+    return type(value)(value) if isinstance(value, (list, dict)) else value
+
+
+def upgrade_fields(collection: str, doc: Dict, migrations: List[Dict] = MIGRATIONS) -> Dict:
+    """The fields to set to bring doc from its version to the latest"""
+    version = doc.get(VERSION_FIELD) or 0
+    changes = {}
+    for step in migrations:
+        if step["collection"] != collection or step["version"] <= version:
+            continue
+        for field, default in step.get("defaults", {}).items():
+            if field not in doc and field not in changes:
+                changes[field] = _copy(default)
+        if "upgrade" in step:
+            changes.update(step["upgrade"]({**doc, **changes}))
+    return changes
+
+
+def upgrade(collection: str, doc: Dict) -> Dict:
+    """
+    doc in the latest shape, for reads that may still meet documents the
+    backfill hasn't reached. Documents already at the latest version are
+    returned untouched without looking at any field; read the full
+    document (or at least VERSION_FIELD) for that fast path.
+    """
+    if (doc.get(VERSION_FIELD) or 0) >= SCHEMA_VERSIONS.get(collection, 0):
+        return doc
+    doc.update(upgrade_fields(collection, doc))
+    return doc
+
+
+def stamp(collection: str, doc: Dict) -> Dict:
+    """Mark a document about to be inserted as already in the latest shape"""
+    version = SCHEMA_VERSIONS.get(collection)
+    if version:
+        doc[VERSION_FIELD] = version
+    return doc
+
+
+class SchemaMigrator:
+    """
+    Backfills MIGRATIONS: finds documents below their collection's latest
+    version (via an index on VERSION_FIELD), computes each one's upgrade,
+    and writes it with a bulk update a batch at a time. Updates are guarded
+    on the version read and on filled fields still being absent, so a
+    concurrent write is never overwritten; the document is retried on the
+    next batch instead.
+
+    check() is the startup check: how far behind each collection is.
+    run() is the backfill job; it only needs to run on one worker.
+    """
+
+    def __init__(self, db, migrations: Optional[List[Dict]] = None,
+                 batch_size: int = BATCH_SIZE, batch_pause: float = BATCH_PAUSE_SECONDS):
+        self.db = db
+        self.migrations = MIGRATIONS if migrations is None else migrations
+        self.versions = _latest_versions(self.migrations)
+        self.batch_size = batch_size
+        self.batch_pause = batch_pause
+        # collection -> documents below the latest version at the last check/run
+        self.behind: Dict[str, int] = {}
+
+    def _behind_query(self, collection: str) -> Dict:
+        # null matches documents without the field, so this is one index range per version
+        return {VERSION_FIELD: {"$in": [None, *range(self.versions[collection])]}}
+
+    async def ensure_indexes(self):
+        for collection in self.versions:
+            await self.db[collection].create_index(VERSION_FIELD)
+
+    async def check(self) -> Dict[str, int]:
+        """Documents below the latest version, per collection (logged when any are)"""
+        for collection, version in self.versions.items():
+            count = await self.db[collection].count_documents(self._behind_query(collection))
+            self.behind[collection] = count
+            if count:
+                logging.info(f"Schema: {count} {collection} documents below v{version}, backfill pending")
+        return dict(self.behind)
+
+    async def run(self) -> Dict[str, int]:
+        """Backfill every collection; returns the number of documents upgraded per collection"""
+        upgraded = {}
+        for collection in self.versions:
+            upgraded[collection] = await self.backfill(collection)
+        await self.check()
+        return upgraded
+
+    def _projection(self, collection: str) -> Optional[Dict]:
+        steps = [step for step in self.migrations if step["collection"] == collection]
+        if any("upgrade" in step for step in steps):
+            return None
+        fields = {field for step in steps for field in step.get("defaults", {})}
+        return {"_id": 1, VERSION_FIELD: 1, **{field: 1 for field in fields}}
+
+    async def backfill(self, collection: str) -> int:
+        target = self.versions[collection]
+        query = self._behind_query(collection)
+        projection = self._projection(collection)
+        upgraded = 0
+        while True:
+            docs = await self.db[collection].find(query, projection).limit(self.batch_size).to_list(self.batch_size)
+            if not docs:
+                break
+            operations = []
+            for doc in docs:
+                changes = upgrade_fields(collection, doc, self.migrations)
+                guard = {"_id": doc["_id"], VERSION_FIELD: doc.get(VERSION_FIELD)}
+                for field in changes:
+                    if field not in doc:
+                        guard[field] = {"$exists": False}
+                operations.append(UpdateOne(guard, {"$set": {**changes, VERSION_FIELD: target}}))
+            result = await self.db[collection].bulk_write(operations, ordered=False)
+            upgraded += result.modified_count
+            if not result.modified_count:
+                # Every document changed under us; the next run picks them up
+                break
+            await asyncio.sleep(self.batch_pause)
+        if upgraded:
+            logging.info(f"Schema: upgraded {upgraded} {collection} documents to v{target}")
+        return upgraded
+
+    def describe(self) -> List[Dict]:
+        """Migrations in JSON-friendly form, with how many documents each collection has left"""
+        return [
+            {
+                "collection": step["collection"],
+                "version": step["version"],
+                "description": step["description"],
+                "defaults": step.get("defaults", {}),
+                "latest": step["version"] == self.versions[step["collection"]],
+                "behind": self.behind.get(step["collection"])
+            }
+            for step in self.migrations
+        ]
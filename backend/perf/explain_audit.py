@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Explain-plan audit: the real app in-process against a seeded local mongod.
+Every query the handlers send is recorded by a command listener while the
+venue-night scenarios run and every GET /api route is called once. Each
+distinct query shape is then explained (executionStats). Fails (exit 1)
+when a shape's winning plan scans the collection (COLLSCAN), sorts in
+memory (SORT), or examines far more documents than it returns.
+
+cd /app/backend && python -m perf.explain_audit --mongo-url mongodb://localhost:27017
+cd /app/backend && python -m perf.explain_audit --output /tmp/explain.json
+cd /app/backend && python -m perf.explain_audit --allow-scan song_requests
+
+explain needs a real server, so there is no in-memory mode. Run it in CI
+next to perf.import_time, and before merging a new endpoint.
+"""
+
+import os
+import sys
+import json
+import asyncio
+import inspect
+import logging
+import argparse
+import datetime
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from perf.harness import Harness
+from perf.scenarios import SCENARIOS, LOCATION_SLUG, VenueNight
+
+# Commands explain accepts; inserts never have a plan
+EXPLAINABLE = {"find", "aggregate", "count", "distinct", "update", "delete", "findAndModify"}
+
+# Session and topology fields the driver adds; explain rejects some of them
+DRIVER_FIELDS = {
+    "lsid", "$db", "$clusterTime", "txnNumber", "$readPreference", "readConcern",
+    "writeConcern", "ordered", "bypassDocumentValidation", "comment"
+}
+
+# Admin-managed content and bookkeeping: tens to hundreds of documents,
+# read whole by design, so a scan or in-memory sort is expected
+SCAN_OK_COLLECTIONS = {
+    "locations", "menu_items", "menu_settings", "specials", "daily_specials", "events",
+    "promo_videos", "gallery_items", "social_links", "homepage_content", "page_content",
+    "app_settings", "instagram_posts", "dj_profiles", "admin_users", "collection_versions",
+    "leader_leases", "export_state",
+}
+
+# Aggregate stages whose output is a summary, not the documents examined
+REDUCING_STAGES = {"$group", "$count", "$bucket", "$bucketAuto", "$facet"}
+
+# Flag a shape when it examines this many times more documents than it
+# returns, once it examines at least MIN_EXAMINED
+MAX_EXAMINED_RATIO = 10.0
+MIN_EXAMINED = 100
+
+# Background data so plans are chosen against realistic collection sizes
+SEED_LOCATIONS = 20
+SEED_POSTS_PER_LOCATION = 200
+SEED_CHECKINS = 2000
+SEED_MESSAGES = 5000
+SEED_DRINKS = 2000
+SEED_PROFILES = 1000
+
+ROUTE_TIMEOUT = 10.0
+
+
+def shape_of(value):
+    """The query with its values replaced by their types, so calls differing only in values match"""
+    if isinstance(value, dict):
+        return {key: shape_of(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        shapes = []
+        for item in value:
+            item_shape = shape_of(item)
+            if item_shape not in shapes:
+                shapes.append(item_shape)
+        return shapes
+    return type(value).__name__
+
+
+def command_shapes(command_name: str, command: Dict) -> List[Dict]:
+    """
+    The explainable commands in one driver command: each statement of a
+    bulk update/delete is explained on its own. Returns {"command", "key"}
+    pairs; the key omits values, limits and projections.
+    """
+    command = {key: value for key, value in command.items() if key not in DRIVER_FIELDS}
+    collection = command[command_name]
+    if command_name in ("update", "delete"):
+        statements = command.get("updates" if command_name == "update" else "deletes", [])
+        result = []
+        for statement in statements:
+            single = {**command, ("updates" if command_name == "update" else "deletes"): [statement]}
+            key = {"q": shape_of(statement.get("q", {})), "multi": statement.get("multi", False)}
+            result.append({"command": single, "key": [command_name, collection, key]})
+        return result
+    if command_name == "find":
+        key = {"filter": shape_of(command.get("filter", {})), "sort": command.get("sort"), "hint": command.get("hint")}
+    elif command_name == "aggregate":
+        command.setdefault("cursor", {})
+        key = {"pipeline": shape_of(command.get("pipeline", []))}
+    elif command_name == "findAndModify":
+        key = {"query": shape_of(command.get("query", {})), "sort": command.get("sort"), "remove": command.get("remove", False)}
+    elif command_name == "distinct":
+        key = {"key": command.get("key"), "query": shape_of(command.get("query", {}))}
+    else:
+        key = {"query": shape_of(command.get("query", {}))}
+    return [{"command": command, "key": [command_name, collection, key]}]
+
+
+def _walk(value, field: str):
+    """Every value stored under `field`, at any depth"""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == field:
+                yield item
+            yield from _walk(item, field)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _walk(item, field)
+
+
+def plan_stages(explain: Dict) -> List[str]:
+    """Stage names of every winning plan in an explain result (find, aggregate $cursor, write)"""
+    return [stage for plan in _walk(explain, "winningPlan") for stage in _walk(plan, "stage")]
+
+
+def execution_counts(explain: Dict):
+    """(documents examined, documents returned or written) from executionStats"""
+    stats = next(_walk(explain, "executionStats"), None)
+    if not stats:
+        return None, None
+    root = stats.get("executionStages", {})
+    returned = max(
+        stats.get("nReturned", 0),
+        root.get("nWouldModify", 0) or 0,
+        root.get("nWouldDelete", 0) or 0
+    )
+    return stats.get("totalDocsExamined", 0), returned
+
+
+def _is_reducing(command_name: str, command: Dict) -> bool:
+    if command_name in ("count", "distinct"):
+        return True
+    if command_name == "aggregate":
+        return any(stage.keys() & REDUCING_STAGES for stage in command.get("pipeline", []))
+    return False
+
+
+def plan_problems(command_name: str, command: Dict, explain: Dict, scan_ok=frozenset(),
+                  max_ratio: float = MAX_EXAMINED_RATIO, min_examined: int = MIN_EXAMINED) -> List[str]:
+    """Why this shape's plan would fail the audit; empty when it passes"""
+    problems = []
+    stages = plan_stages(explain)
+    if command[command_name] not in scan_ok:
+        if "COLLSCAN" in stages:
+            problems.append("COLLSCAN")
+        if "SORT" in stages:
+            problems.append("in-memory SORT")
+
+    examined, returned = execution_counts(explain)
+    if examined is not None and not _is_reducing(command_name, command):
+        if examined >= min_examined and examined > max_ratio * max(returned, 1):
+            problems.append(f"examined {examined} docs for {returned}")
+    return problems
+
+
+class ShapeRecorder:
+    """
+    pymongo command listener keeping the first example of each query shape
+    sent to one database, with its call count and where it came from.
+    """
+
+    def __init__(self, db_name: str):
+        self.db_name = db_name
+        self.source = "startup"
+        self.shapes: Dict[str, Dict] = {}
+
+    def listener(self):
+        from pymongo import monitoring
+
+        recorder = self
+
+        class _Listener(monitoring.CommandListener):
+            def started(self, event):
+                if event.command_name in EXPLAINABLE and event.database_name == recorder.db_name:
+                    recorder.record(event.command_name, event.command)
+
+            def succeeded(self, event):
+                pass
+
+            def failed(self, event):
+                pass
+
+        return _Listener()
+
+    def record(self, command_name: str, command: Dict):
+        for entry in command_shapes(command_name, dict(command)):
+            key = json.dumps(entry["key"], sort_keys=True, default=str)
+            shape = self.shapes.get(key)
+            if shape is None:
+                shape = self.shapes[key] = {
+                    "op": command_name,
+                    "collection": entry["key"][1],
+                    "shape": entry["key"][2],
+                    "command": entry["command"],
+                    "calls": 0,
+                    "sources": []
+                }
+            shape["calls"] += 1
+            if self.source not in shape["sources"]:
+                shape["sources"].append(self.source)
+
+
+async def seed(db):
+    """Background documents at other locations, between other check-ins"""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    slugs = [f"audit-location-{i}" for i in range(SEED_LOCATIONS)]
+    await db.social_posts.insert_many([
+        {
+            "id": f"audit-post-{slug}-{i}", "location_slug": slug, "checkin_id": f"audit-checkin-{i}",
+            "author_name": "Seed", "author_emoji": "🍗", "message": "seed", "likes": [],
+            "created_at": now - datetime.timedelta(minutes=i)
+        }
+        for slug in slugs for i in range(SEED_POSTS_PER_LOCATION)
+    ])
+    await db.checkins.insert_many([
+        {
+            "id": f"audit-checkin-{i}", "location_slug": slugs[i % SEED_LOCATIONS], "display_name": f"Seed {i}",
+            "avatar_emoji": "🍹", "checked_in_at": now, "expires_at": now + datetime.timedelta(hours=4)
+        }
+        for i in range(SEED_CHECKINS)
+    ])
+    await db.direct_messages.insert_many([
+        {
+            "id": f"audit-dm-{i}", "from_checkin_id": f"audit-checkin-{i % SEED_CHECKINS}",
+            "to_checkin_id": f"audit-checkin-{(i * 7 + 1) % SEED_CHECKINS}", "from_name": "Seed", "to_name": "Seed",
+            "from_emoji": "🍗", "to_emoji": "🍹", "message": "seed", "location_slug": slugs[i % SEED_LOCATIONS],
+            "read": i % 3 == 0, "created_at": now - datetime.timedelta(seconds=i)
+        }
+        for i in range(SEED_MESSAGES)
+    ])
+    await db.drink_orders.insert_many([
+        {
+            "id": f"audit-drink-{i}", "from_checkin_id": f"audit-checkin-{i % SEED_CHECKINS}",
+            "to_checkin_id": f"audit-checkin-{(i + 1) % SEED_CHECKINS}", "location_slug": slugs[i % SEED_LOCATIONS],
+            "drink_name": "Seed", "status": ["pending", "accepted", "delivered", "cancelled"][i % 4],
+            "created_at": now - datetime.timedelta(seconds=i)
+        }
+        for i in range(SEED_DRINKS)
+    ])
+    await db.user_profiles.insert_many([
+        {"id": f"audit-user-{i}", "name": f"Seed {i}", "email": f"seed{i}@audit.local", "created_at": now}
+        for i in range(SEED_PROFILES)
+    ])
+
+
+async def ensure_indexes(core):
+    """The indexes startup creates; the harness client runs without lifespan"""
+    for service in list(vars(core).values()):
+        # Looked up on the class: Motor clients and databases answer any attribute
+        if inspect.iscoroutinefunction(getattr(type(service), "ensure_indexes", None)):
+            await service.ensure_indexes()
+
+
+async def call_routes(app, client, recorder: ShapeRecorder, samples: Dict[str, str]):
+    """GET every /api route once, path and required query params filled from samples"""
+    from fastapi.routing import APIRoute
+
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or "GET" not in route.methods:
+            continue
+        if not route.path.startswith("/api"):
+            continue
+        path = route.path
+        for param in route.dependant.path_params:
+            path = path.replace("{" + param.name + "}", samples.get(param.name, "explain-audit"))
+        params = {
+            param.name: samples.get(param.name, "explain-audit")
+            for param in route.dependant.query_params if param.required
+        }
+        recorder.source = f"GET {route.path}"
+        try:
+            await asyncio.wait_for(client.get(path, params=params), ROUTE_TIMEOUT)
+        except Exception as e:
+            logging.warning(f"GET {route.path} failed during audit: {e}")
+
+
+async def run(args) -> List[Dict]:
+    harness = Harness(args.mongo_url)
+    recorder = ShapeRecorder(harness.db_name)
+    from pymongo import monitoring
+    # Must happen before the client is created (i.e. before server is imported)
+    monitoring.register(recorder.listener())
+    await harness.start()
+    for name in ("", "httpx", "aiohttp.access"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    import core
+    db = core.db
+    try:
+        await ensure_indexes(core)
+        await seed(db)
+
+        night = VenueNight(harness, phones=args.phones, poll_interval=2.0, poll_duration=2.0, time_scale=10.0)
+        async with harness.client() as client:
+            night.client = client
+            for name, (setup, scenario) in SCENARIOS.items():
+                recorder.source = name
+                await night.run(name, scenario, setup)
+
+            samples = {
+                "location_slug": LOCATION_SLUG,
+                "slug": LOCATION_SLUG,
+                "checkin_id": night.checkin_ids[0],
+                "my_checkin_id": night.checkin_ids[0],
+                "partner_id": "audit-checkin-1",
+                "post_id": night.post_ids[0],
+                "user_id": "audit-user-1",
+                "email": "seed1@audit.local",
+                "order_id": "audit-drink-1",
+            }
+            await call_routes(harness.app, client, recorder, samples)
+
+        results = []
+        for shape in recorder.shapes.values():
+            command = shape["command"]
+            try:
+                explain = await db.command({"explain": command, "verbosity": "executionStats"})
+            except Exception as e:
+                shape.update(stages=[], examined=None, returned=None, problems=[], error=str(e))
+            else:
+                examined, returned = execution_counts(explain)
+                shape.update(
+                    stages=plan_stages(explain),
+                    examined=examined,
+                    returned=returned,
+                    problems=plan_problems(shape["op"], command, explain, args.scan_ok,
+                                           args.max_ratio, args.min_examined)
+                )
+            results.append(shape)
+    finally:
+        await harness.stop()
+    return sorted(results, key=lambda shape: (not shape["problems"], shape["collection"], shape["op"]))
+
+
+def print_report(results: List[Dict]):
+    print(f"\n{'':4} {'collection':<26} {'op':<14} {'plan':<34} {'examined':>9} {'returned':>9} {'calls':>6}")
+    for shape in results:
+        status = "FAIL" if shape["problems"] else ("ERR" if shape.get("error") else "ok")
+        plan = " > ".join(dict.fromkeys(shape["stages"])) or "-"
+        print(f"{status:<4} {shape['collection']:<26} {shape['op']:<14} {plan[:34]:<34} "
+              f"{shape['examined'] if shape['examined'] is not None else '-':>9} "
+              f"{shape['returned'] if shape['returned'] is not None else '-':>9} {shape['calls']:>6}")
+        if shape["problems"]:
+            print(f"       {', '.join(shape['problems'])}")
+            print(f"       shape: {json.dumps(shape['shape'], default=str)}")
+            print(f"       from: {', '.join(shape['sources'][:5])}")
+        elif shape.get("error"):
+            print(f"       explain failed: {shape['error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Explain every query shape the app sends; fail on scans")
+    parser.add_argument("--mongo-url", default=os.environ.get("PERF_MONGO_URL"),
+                        help="Local mongod to seed and explain against (required)")
+    parser.add_argument("--phones", type=int, default=30)
+    parser.add_argument("--max-ratio", type=float, default=MAX_EXAMINED_RATIO,
+                        help="Fail when docs examined exceed this multiple of docs returned")
+    parser.add_argument("--min-examined", type=int, default=MIN_EXAMINED)
+    parser.add_argument("--allow-scan", action="append", default=[], metavar="COLLECTION",
+                        help="Also accept scans and in-memory sorts on this collection (repeatable)")
+    parser.add_argument("--output", type=Path, help="Also write the shapes and plans as JSON")
+    args = parser.parse_args()
+
+    if not args.mongo_url:
+        parser.error("explain needs a real mongod: pass --mongo-url or set PERF_MONGO_URL")
+    args.scan_ok = SCAN_OK_COLLECTIONS | set(args.allow_scan)
+
+    results = asyncio.run(run(args))
+    print_report(results)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2, default=str) + "\n")
+
+    failures = [shape for shape in results if shape["problems"]]
+    if failures:
+        print(f"\n{len(failures)} of {len(results)} query shapes need an index")
+        sys.exit(1)
+    print(f"\nAll {len(results)} query shapes use an index")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Stand-ins for the third-party services server.py talks to, so load runs
+never leave the machine and their latency is under our control.
+"""
+
+import sys
+import time
+import types
+import uuid
+import asyncio
+from typing import Dict, List, Optional
+
+from aiohttp import web
+
+
+# ---- Stripe (emergentintegrations checkout client) ----
+
+class FakeCheckoutSessionRequest:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class FakeCheckoutSessionResponse:
+    def __init__(self, session_id: str, url: str):
+        self.session_id = session_id
+        self.url = url
+
+
+class FakeCheckoutStatusResponse:
+    def __init__(self, **kwargs):
+        self.status = "complete"
+        self.payment_status = "paid"
+        self.amount_total = 0
+        self.currency = "usd"
+        self.metadata = {}
+        self.__dict__.update(kwargs)
+
+
+class FakeStripeCheckout:
+    latency = 0.05
+    sessions: List[str] = []
+
+    def __init__(self, api_key: str = "", webhook_url: str = ""):
+        self.api_key = api_key
+        self.webhook_url = webhook_url
+
+    async def create_checkout_session(self, request) -> FakeCheckoutSessionResponse:
+        await asyncio.sleep(self.latency)
+        session_id = f"cs_test_{uuid.uuid4().hex}"
+        self.sessions.append(session_id)
+        return FakeCheckoutSessionResponse(session_id, f"https://checkout.stripe.test/{session_id}")
+
+    async def get_checkout_status(self, session_id: str) -> FakeCheckoutStatusResponse:
+        await asyncio.sleep(self.latency)
+        return FakeCheckoutStatusResponse(session_id=session_id)
+
+    async def handle_webhook(self, body: bytes, signature: Optional[str] = None):
+        return FakeCheckoutStatusResponse(event_type="checkout.session.completed")
+
+
+def install_fake_stripe(latency: float = 0.05):
+    """Register a fake emergentintegrations Stripe client before server is imported"""
+    FakeStripeCheckout.latency = latency
+    checkout = types.ModuleType("emergentintegrations.payments.stripe.checkout")
+    checkout.StripeCheckout = FakeStripeCheckout
+    checkout.CheckoutSessionRequest = FakeCheckoutSessionRequest
+    checkout.CheckoutSessionResponse = FakeCheckoutSessionResponse
+    checkout.CheckoutStatusResponse = FakeCheckoutStatusResponse
+
+    for name in ("emergentintegrations", "emergentintegrations.payments", "emergentintegrations.payments.stripe"):
+        sys.modules.setdefault(name, types.ModuleType(name))
+    sys.modules["emergentintegrations.payments.stripe.checkout"] = checkout
+
+
+# ---- Web push ----
+
+class FakeWebPush:
+    """
+    Replaces pywebpush.webpush. The real call is a blocking HTTP request
+    to the browser vendor's push service, so this blocks too.
+    """
+
+    def __init__(self, latency: float = 0.002):
+        self.latency = latency
+        self.sent = 0
+
+    def __call__(self, subscription_info: Dict, data: str, **kwargs):
+        time.sleep(self.latency)
+        self.sent += 1
+
+
+# ---- WooCommerce ----
+
+def _woo_product(product_id: int) -> Dict:
+    return {
+        "id": product_id,
+        "name": f"F&F Tee {product_id}",
+        "price": "25.00",
+        "regular_price": "25.00",
+        "sale_price": "",
+        "short_description": "Soft cotton tee with the Fin & Feathers logo",
+        "description": "",
+        "images": [{"src": f"https://shop.example/wp-content/uploads/tee-{product_id}.jpg"}],
+        "permalink": f"https://shop.example/product/tee-{product_id}",
+        "in_stock": True,
+        "categories": [{"name": "Apparel"}],
+    }
+
+
+class FakeWooCommerce:
+    """Minimal WooCommerce REST API on a local port"""
+
+    def __init__(self, latency: float = 0.08, products: int = 24):
+        self.latency = latency
+        self.products = [_woo_product(i + 1) for i in range(products)]
+        self.requests = 0
+        self._runner: Optional[web.AppRunner] = None
+        self.url = ""
+
+    async def _list_products(self, request):
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        return web.json_response(self.products)
+
+    async def _get_product(self, request):
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        product_id = int(request.match_info["product_id"])
+        return web.json_response(_woo_product(product_id))
+
+    async def _create_order(self, request):
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        order_id = 1000 + self.requests
+        return web.json_response({"id": order_id, "order_key": f"wc_order_{order_id}", "status": "pending"}, status=201)
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_get("/wp-json/wc/v3/products", self._list_products)
+        app.router.add_get("/wp-json/wc/v3/products/{product_id}", self._get_product)
+        app.router.add_post("/wp-json/wc/v3/orders", self._create_order)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self.url
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
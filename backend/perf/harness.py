@@ -0,0 +1,156 @@
+"""
+Builds the real FastAPI app in-process for load runs.
+
+Mongo is either a local mongod (PERF_MONGO_URL / --mongo-url, a throwaway
+database per run) or the in-memory mongomock-motor stand-in. Stripe,
+WooCommerce and web push are replaced by the fakes in perf.fakes.
+"""
+
+import os
+import sys
+import uuid
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from perf.fakes import FakeWebPush, FakeWooCommerce, install_fake_stripe
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Driver housekeeping, not work done for a request
+IGNORED_COMMANDS = {"hello", "ismaster", "isMaster", "ping", "endSessions", "buildInfo", "saslStart", "saslContinue"}
+
+# mongomock Collection methods that correspond to one server round trip
+MOCK_OPERATIONS = (
+    "find", "find_one", "insert_one", "insert_many", "update_one", "update_many",
+    "replace_one", "delete_one", "delete_many", "count_documents", "distinct",
+    "aggregate", "bulk_write", "find_one_and_update", "find_one_and_delete",
+    "find_one_and_replace", "create_index",
+)
+
+
+class OpCounter:
+    """Mongo operations issued since start (one per command / collection call)"""
+
+    def __init__(self):
+        self.count = 0
+
+    def install_listener(self):
+        from pymongo import monitoring
+
+        counter = self
+
+        class _Listener(monitoring.CommandListener):
+            def started(self, event):
+                if event.command_name not in IGNORED_COMMANDS:
+                    counter.count += 1
+
+            def succeeded(self, event):
+                pass
+
+            def failed(self, event):
+                pass
+
+        # Must happen before the client is created (i.e. before server is imported)
+        monitoring.register(_Listener())
+
+    def install_mock_hooks(self):
+        from mongomock.collection import Collection
+
+        counter = self
+        # mongomock calls its own public methods internally (find_one -> find);
+        # only the outermost call is a "round trip"
+        depth = threading.local()
+
+        def wrap(method):
+            def wrapper(*args, **kwargs):
+                outer = not getattr(depth, "value", 0)
+                if outer:
+                    counter.count += 1
+                depth.value = getattr(depth, "value", 0) + 1
+                try:
+                    return method(*args, **kwargs)
+                finally:
+                    depth.value -= 1
+            return wrapper
+
+        for name in MOCK_OPERATIONS:
+            if hasattr(Collection, name):
+                setattr(Collection, name, wrap(getattr(Collection, name)))
+
+
+def import_server(mongo_url: Optional[str] = None, woo_url: str = "http://127.0.0.1:9",
+                  db_name: Optional[str] = None, push: Optional[FakeWebPush] = None,
+                  ops: Optional[OpCounter] = None, stripe_latency: float = 0.05):
+    """Import server.py wired to the fakes (and in-memory Mongo unless mongo_url is given)"""
+    os.environ.update({
+        "MONGO_URL": mongo_url or "mongodb://localhost:27017",
+        "DB_NAME": db_name or f"perf_{uuid.uuid4().hex[:8]}",
+        "VAPID_PRIVATE_KEY": "perf-private-key",
+        "VAPID_PUBLIC_KEY": "perf-public-key",
+        "WOOCOMMERCE_URL": woo_url,
+        "WOOCOMMERCE_KEY": "ck_perf",
+        "WOOCOMMERCE_SECRET": "cs_perf",
+        "STRIPE_API_KEY": "sk_test_perf",
+        "ANALYTICS_EXPORT_DIR": tempfile.mkdtemp(prefix="perf-exports-"),
+    })
+    os.environ.setdefault("SECRET_KEY", "perf-secret-key")
+
+    if str(BACKEND_DIR) not in sys.path:
+        sys.path.insert(0, str(BACKEND_DIR))
+
+    install_fake_stripe(stripe_latency)
+
+    if mongo_url:
+        if ops:
+            ops.install_listener()
+    else:
+        import motor.motor_asyncio
+        from mongomock_motor import AsyncMongoMockClient
+        motor.motor_asyncio.AsyncIOMotorClient = AsyncMongoMockClient
+        if ops:
+            ops.install_mock_hooks()
+
+    import push_service
+    push_service.webpush = push or FakeWebPush()
+
+    import server
+    return server
+
+
+class Harness:
+    def __init__(self, mongo_url: Optional[str] = None, push_latency: float = 0.002,
+                 woo_latency: float = 0.08, stripe_latency: float = 0.05):
+        self.mongo_url = mongo_url
+        self.mode = "mongod" if mongo_url else "memory"
+        self.db_name = f"perf_{uuid.uuid4().hex[:8]}"
+        self.push = FakeWebPush(push_latency)
+        self.woo = FakeWooCommerce(woo_latency)
+        self.stripe_latency = stripe_latency
+        self.ops = OpCounter()
+        self.server = None
+        self.app = None
+
+    async def start(self):
+        woo_url = await self.woo.start()
+        self.server = import_server(self.mongo_url, woo_url, self.db_name, self.push, self.ops, self.stripe_latency)
+        self.app = self.server.app
+        return self
+
+    def client(self, **kwargs) -> httpx.AsyncClient:
+        # No lifespan: the cleanup scheduler and admin bootstrap aren't part of a request
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=self.app),
+            base_url="http://perf.local",
+            timeout=60,
+            **kwargs
+        )
+
+    async def stop(self):
+        await self.woo.stop()
+        if self.server is not None and self.mongo_url:
+            await self.server.client.drop_database(self.db_name)
+            self.server.client.close()
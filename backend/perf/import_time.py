@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Import-time profile of the app: how long `import server` takes in a fresh
+interpreter and which modules it spends that time on (python -X importtime).
+Fails (exit 1) when the median import is over the committed budget or when
+a module that should only load on first use shows up at startup.
+
+cd /app/backend && python -m perf.import_time
+cd /app/backend && python -m perf.import_time --update-profile
+cd /app/backend && python -m perf.import_time --update-profile --budget-ms 1500
+
+Importing server.py connects to nothing (Motor connects lazily), so this
+runs anywhere the requirements are installed.
+"""
+
+import os
+import sys
+import json
+import argparse
+import platform
+import statistics
+import subprocess
+from pathlib import Path
+from datetime import datetime, timezone
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+PROFILE_PATH = Path(__file__).resolve().parent / "import_profile.json"
+
+# Imported inside the code paths that need them; none of these may be
+# pulled in by `import server`
+DEFERRED_MODULES = [
+    "emergentintegrations",  # Stripe checkout (and litellm/openai/google behind it)
+    "litellm",
+    "openai",
+    "pywebpush",
+    "apscheduler",
+    "pandas",
+    "numpy",
+    "pyarrow",
+    "boto3",  # S3 media storage client, created on first media operation
+    "botocore",
+]
+
+TOP_MODULES = 25
+
+PROBE = (
+    "import time\n"
+    "started = time.perf_counter()\n"
+    "import server\n"
+    "print((time.perf_counter() - started) * 1000)\n"
+)
+
+
+def profile_once() -> dict:
+    env = dict(os.environ)
+    env.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    env.setdefault("DB_NAME", "import_profile")
+    env.setdefault("SECRET_KEY", "import-profile")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        # Only the first import of a module is timed; keep the larger if listed twice
+        modules[name] = max(modules.get(name, 0), int(cumulative) / 1000)
+    return {"total_ms": float(result.stdout.strip().splitlines()[-1]), "modules": modules}
+
+
+def summarize(runs: list) -> dict:
+    modules = runs[0]["modules"]
+    top = sorted(
+        ((name, statistics.median(run["modules"].get(name, 0) for run in runs)) for name in modules),
+        key=lambda item: item[1], reverse=True
+    )[:TOP_MODULES]
+    return {
+        "total_ms": round(statistics.median(run["total_ms"] for run in runs), 1),
+        "top_modules_ms": {name: round(ms, 1) for name, ms in top},
+        "loaded": sorted({name.split(".")[0] for run in runs for name in run["modules"]}),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile `import server` against the committed budget")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to time (median is used)")
+    parser.add_argument("--profile", type=Path, default=PROFILE_PATH)
+    parser.add_argument("--update-profile", action="store_true",
+                        help="Write this run's profile instead of checking it")
+    parser.add_argument("--budget-ms", type=float, help="With --update-profile: new import-time budget")
+    args = parser.parse_args()
+
+    summary = summarize([profile_once() for _ in range(args.runs)])
+    print(f"import server: {summary['total_ms']:.1f} ms (median of {args.runs})")
+    for name, ms in summary["top_modules_ms"].items():
+        print(f"  {name:<48}{ms:>9.1f} ms")
+
+    committed = json.loads(args.profile.read_text()) if args.profile.exists() else {}
+
+    if args.update_profile:
+        budget = args.budget_ms or committed.get("budget_ms")
+        if budget is None:
+            parser.error("no budget recorded yet - pass --budget-ms")
+        args.profile.write_text(json.dumps({
+            "budget_ms": budget,
+            "deferred_modules": DEFERRED_MODULES,
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "total_ms": summary["total_ms"],
+            "top_modules_ms": summary["top_modules_ms"],
+        }, indent=2) + "\n")
+        print(f"\nProfile written to {args.profile}")
+        return
+
+    failures = []
+    budget = committed.get("budget_ms")
+    if budget is None:
+        print(f"\nNo budget in {args.profile} - run with --update-profile --budget-ms N to record one")
+    elif summary["total_ms"] > budget:
+        failures.append(f"import server took {summary['total_ms']:.1f} ms, budget is {budget} ms")
+    for name in committed.get("deferred_modules", DEFERRED_MODULES):
+        if name in summary["loaded"]:
+            failures.append(f"{name} is imported at startup; it should load on first use")
+
+    if failures:
+        print("\nImport-time budget exceeded:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    if budget is not None:
+        print(f"\nWithin budget ({budget} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+"""
+Venue-night traffic patterns. Each scenario drives the app through the
+harness client and returns a ScenarioResult; setup traffic (seeding posts,
+the phones' own check-ins) is not measured.
+"""
+
+import gc
+import math
+import time
+import uuid
+import random
+import asyncio
+import contextvars
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+LOCATION_SLUG = "edgewood-atlanta"
+ADMIN_HEADERS = {"Authorization": "Bearer perf-admin"}
+PUSH_SUBSCRIBERS = 2000
+EMOJIS = ["😊", "🎉", "🔥", "🍗", "🍹", "💃"]
+
+
+# When the current task meant to send its next request. Latency is measured
+# from here, so a stalled event loop shows up instead of delaying the
+# measurement start (coordinated omission).
+_scheduled_at: contextvars.ContextVar = contextvars.ContextVar("scheduled_at", default=None)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    # Nearest-rank
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[max(0, min(len(ordered), rank) - 1)]
+
+
+class ScenarioResult:
+    def __init__(self, name: str):
+        self.name = name
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.ops = 0
+        self.elapsed = 0.0
+
+    @property
+    def requests(self) -> int:
+        return sum(len(v) for v in self.latencies.values())
+
+    def summary(self) -> Dict:
+        all_samples = [ms for samples in self.latencies.values() for ms in samples]
+        requests = len(all_samples)
+        return {
+            "requests": requests,
+            "errors": sum(self.errors.values()),
+            "p50_ms": round(percentile(all_samples, 50), 2),
+            "p95_ms": round(percentile(all_samples, 95), 2),
+            "p99_ms": round(percentile(all_samples, 99), 2),
+            "throughput_rps": round(requests / self.elapsed, 1) if self.elapsed else 0.0,
+            "ops_per_request": round(self.ops / requests, 2) if requests else 0.0,
+            "routes": {
+                route: {
+                    "requests": len(samples),
+                    "errors": self.errors.get(route, 0),
+                    "p50_ms": round(percentile(samples, 50), 2),
+                    "p95_ms": round(percentile(samples, 95), 2),
+                    "p99_ms": round(percentile(samples, 99), 2),
+                }
+                for route, samples in sorted(self.latencies.items())
+            }
+        }
+
+
+class VenueNight:
+    """
+    Shared state for one simulated night at a single location: the phones
+    (each with its own check-in), the posts on the wall, and the timing
+    knobs. `time_scale` compresses every interval, so a scale of 5 runs
+    15 s polling as 3 s polling with the same concurrency shape.
+    """
+
+    def __init__(self, harness, phones: int = 300, poll_interval: float = 15.0,
+                 poll_duration: float = 60.0, time_scale: float = 5.0, seed: int = 42):
+        self.harness = harness
+        self.phones = phones
+        self.poll_interval = poll_interval
+        self.poll_duration = poll_duration
+        self.time_scale = time_scale
+        self.random = random.Random(seed)
+        self.checkin_ids: List[str] = []
+        self.post_ids: List[str] = []
+        self.client = None
+        self._result: Optional[ScenarioResult] = None
+
+    def scaled(self, seconds: float) -> float:
+        return seconds / self.time_scale
+
+    async def request(self, method: str, url: str, route: str, **kwargs):
+        started = time.perf_counter()
+        scheduled = _scheduled_at.get()
+        if scheduled is not None:
+            started = min(started, scheduled)
+            _scheduled_at.set(None)
+        response = await self.client.request(method, url, **kwargs)
+        if self._result is not None:
+            self._result.latencies[route].append((time.perf_counter() - started) * 1000)
+            if response.status_code >= 400:
+                self._result.errors[route] += 1
+        return response
+
+    async def run(self, name: str, scenario, setup=None) -> ScenarioResult:
+        if setup:
+            await setup(self)
+        # Start every scenario from the same heap state, not mid-way to a full collection
+        gc.collect()
+        result = ScenarioResult(name)
+        ops_before = self.harness.ops.count
+        self._result = result
+        started = time.perf_counter()
+        try:
+            await scenario(self)
+        finally:
+            result.elapsed = time.perf_counter() - started
+            result.ops = self.harness.ops.count - ops_before
+            self._result = None
+        return result
+
+    # ---- Unmeasured setup ----
+
+    async def ensure_checked_in(self):
+        missing = self.phones - len(self.checkin_ids)
+        for i in range(missing):
+            response = await self.client.post("/api/checkin", json=_checkin_body(self.random, i))
+            self.checkin_ids.append(response.json()["id"])
+
+    async def ensure_posts(self, count: int = 50):
+        await self.ensure_checked_in()
+        for i in range(count - len(self.post_ids)):
+            checkin_id = self.checkin_ids[i % len(self.checkin_ids)]
+            response = await self.client.post("/api/social/posts", json={
+                "location_slug": LOCATION_SLUG,
+                "checkin_id": checkin_id,
+                "author_name": f"Guest {i}",
+                "author_emoji": self.random.choice(EMOJIS),
+                "message": "Great vibes tonight! " * self.random.randint(1, 4),
+            })
+            self.post_ids.append(response.json()["id"])
+
+    async def ensure_subscribers(self, count: int):
+        from core import db
+        existing = await db.loyalty_members.count_documents({"push_subscription": {"$ne": None}})
+        if existing >= count:
+            return
+        await db.loyalty_members.insert_many([
+            {
+                "id": str(uuid.uuid4()),
+                "name": f"Member {i}",
+                "email": f"member{i}@perf.local",
+                "push_subscription": {
+                    "endpoint": f"https://push.perf.local/{uuid.uuid4().hex}",
+                    "keys": {"p256dh": "perf", "auth": "perf"}
+                }
+            }
+            for i in range(existing, count)
+        ])
+
+
+def _checkin_body(rng: random.Random, i: int) -> Dict:
+    return {
+        "location_slug": LOCATION_SLUG,
+        "display_name": f"Phone {i}",
+        "avatar_emoji": rng.choice(EMOJIS),
+        "mood": rng.choice(["Vibing", "Hungry", "Celebrating", None]),
+    }
+
+
+async def _spread(night: VenueNight, window: float, jobs):
+    """Start each job at a random point within `window` (scaled) seconds"""
+    async def delayed(job, delay):
+        _scheduled_at.set(time.perf_counter() + delay)
+        await asyncio.sleep(delay)
+        await job()
+    await asyncio.gather(*(delayed(job, night.random.uniform(0, night.scaled(window))) for job in jobs))
+
+
+# ---- Scenarios ----
+
+async def checkin_burst(night: VenueNight):
+    """Doors open: every phone checks in within ~10 seconds"""
+    async def check_in(i):
+        response = await night.request("POST", "/api/checkin", "POST /checkin", json=_checkin_body(night.random, i))
+        if response.status_code == 200:
+            night.checkin_ids.append(response.json()["id"])
+
+    await _spread(night, 10, [lambda i=i: check_in(i) for i in range(night.phones)])
+
+
+async def wall_polling(night: VenueNight):
+    """Every phone refreshes the social wall and venue state every poll interval"""
+    deadline = time.perf_counter() + night.scaled(night.poll_duration)
+
+    async def phone(checkin_id):
+        next_poll = time.perf_counter() + night.random.uniform(0, night.scaled(night.poll_interval))
+        while next_poll < deadline:
+            await asyncio.sleep(max(0.0, next_poll - time.perf_counter()))
+            _scheduled_at.set(next_poll)
+            await night.request(
+                "GET", f"/api/social/posts/{LOCATION_SLUG}", "GET /social/posts/{slug}",
+                params={"my_checkin_id": checkin_id}
+            )
+            await night.request("GET", f"/api/venue/{LOCATION_SLUG}/state", "GET /venue/{slug}/state")
+            next_poll += night.scaled(night.poll_interval)
+
+    await asyncio.gather(*(phone(checkin_id) for checkin_id in night.checkin_ids[:night.phones]))
+
+
+async def like_storm(night: VenueNight):
+    """A post goes viral: every phone likes a few posts within ~5 seconds"""
+
+    async def like(checkin_id, post_id):
+        await night.request(
+            "POST", f"/api/social/posts/{post_id}/like", "POST /social/posts/{id}/like",
+            params={"checkin_id": checkin_id}
+        )
+
+    jobs = []
+    hot_posts = night.post_ids[:5]
+    for checkin_id in night.checkin_ids[:night.phones]:
+        for post_id in night.random.sample(hot_posts, 3):
+            jobs.append(lambda c=checkin_id, p=post_id: like(c, p))
+    await _spread(night, 5, jobs)
+
+
+async def tip_burst(night: VenueNight):
+    """The DJ asks for tips: half the room tips within ~5 seconds"""
+
+    async def tip(i, checkin_id):
+        await night.request("POST", "/api/social/dj-tip", "POST /social/dj-tip", json={
+            "location_slug": LOCATION_SLUG,
+            "checkin_id": checkin_id,
+            "tipper_name": f"Phone {i}",
+            "tipper_emoji": night.random.choice(EMOJIS),
+            "amount": night.random.choice([1, 2, 5, 10, 20]),
+            "message": "Play it again!",
+        })
+
+    tippers = night.checkin_ids[:night.phones // 2]
+    await _spread(night, 5, [lambda i=i, c=c: tip(i, c) for i, c in enumerate(tippers)])
+
+
+async def push_blast(night: VenueNight):
+    """Admin pushes a special to every subscriber while the room keeps polling"""
+
+    async def blast():
+        await night.request("POST", "/api/admin/notifications/send", "POST /admin/notifications/send",
+                            headers=ADMIN_HEADERS, json={
+                                "title": "Happy hour!",
+                                "body": "$5 wings until 9pm",
+                                "send_to_all": True,
+                            })
+
+    async def poll(checkin_id):
+        await night.request(
+            "GET", f"/api/social/posts/{LOCATION_SLUG}", "GET /social/posts/{slug}",
+            params={"my_checkin_id": checkin_id}
+        )
+
+    jobs = [blast] + [lambda c=c: poll(c) for c in night.checkin_ids[:night.phones]]
+    await _spread(night, 5, jobs)
+
+
+async def merch_browse(night: VenueNight):
+    """Phones open the merch page (WooCommerce product list)"""
+    async def browse():
+        await night.request("GET", "/api/merchandise", "GET /merchandise")
+
+    await _spread(night, 5, [browse for _ in range(night.phones // 6)])
+
+
+async def _wall_ready(night: VenueNight):
+    await night.ensure_posts()
+
+
+async def _push_ready(night: VenueNight):
+    await night.ensure_posts()
+    await night.ensure_subscribers(PUSH_SUBSCRIBERS)
+
+
+async def _tip_ready(night: VenueNight):
+    await night.ensure_checked_in()
+    # Phones have the venue page open, so its state document exists
+    await night.client.get(f"/api/venue/{LOCATION_SLUG}/state")
+
+
+# name -> (unmeasured setup, measured scenario), in run order
+SCENARIOS = {
+    "checkin_burst": (None, checkin_burst),
+    "wall_polling": (_wall_ready, wall_polling),
+    "like_storm": (_wall_ready, like_storm),
+    "tip_burst": (_tip_ready, tip_burst),
+    "push_blast": (_push_ready, push_blast),
+    "merch_browse": (None, merch_browse),
+}
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Venue-night load run: the real app in-process, 300 phones at one
+location, fake Stripe/WooCommerce/web push, Mongo either in memory or a
+local mongod. Prints p50/p95/p99, throughput and Mongo ops per request
+for each scenario and fails (exit 1) if a scenario is slower or issues
+more Mongo operations than the committed baseline allows.
+
+cd /app/backend && python -m perf.venue_night
+cd /app/backend && python -m perf.venue_night --mongo-url mongodb://localhost:27017
+cd /app/backend && python -m perf.venue_night --scenario wall_polling --output /tmp/after.json
+cd /app/backend && python -m perf.venue_night --update-baseline
+
+Run it before and after a change to the API; numbers are only
+comparable between runs on the same machine and Mongo mode.
+"""
+
+import os
+import sys
+import json
+import asyncio
+import logging
+import argparse
+import platform
+from pathlib import Path
+from datetime import datetime, timezone
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from perf.harness import Harness
+from perf.scenarios import SCENARIOS, VenueNight
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+# Tail latency of a short burst easily moves 50% between identical runs;
+# Mongo round trips per request don't, so they get the tight bound
+LATENCY_TOLERANCE = 1.0
+LATENCY_FLOOR_MS = 5.0
+OPS_TOLERANCE = 0.1
+
+
+def check_against_baseline(results: dict, baseline: dict, latency_tolerance: float, ops_tolerance: float) -> list:
+    failures = []
+    for name, summary in results.items():
+        expected = baseline.get(name)
+        if not expected:
+            continue
+        for metric in ("p95_ms", "p99_ms"):
+            # Absolute floor so jitter on millisecond requests can't fail a run
+            limit = expected[metric] * (1 + latency_tolerance) + LATENCY_FLOOR_MS
+            if summary[metric] > limit:
+                failures.append(f"{name}: {metric} {summary[metric]} > {limit:.2f} (baseline {expected[metric]})")
+        limit = expected["ops_per_request"] * (1 + ops_tolerance)
+        if summary["ops_per_request"] > limit + 0.01:
+            failures.append(
+                f"{name}: ops_per_request {summary['ops_per_request']} > {limit:.2f} "
+                f"(baseline {expected['ops_per_request']})"
+            )
+        if summary["errors"] > expected.get("errors", 0):
+            failures.append(f"{name}: {summary['errors']} errors (baseline {expected.get('errors', 0)})")
+    return failures
+
+
+def print_report(results: dict, mode: str):
+    print(f"\nVenue night ({mode} Mongo)")
+    header = f"{'scenario / route':<44}{'reqs':>7}{'err':>5}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>9}{'ops/req':>9}"
+    print(header)
+    print("-" * len(header))
+    for name, summary in results.items():
+        print(
+            f"{name:<44}{summary['requests']:>7}{summary['errors']:>5}{summary['p50_ms']:>9.2f}"
+            f"{summary['p95_ms']:>9.2f}{summary['p99_ms']:>9.2f}{summary['throughput_rps']:>9.1f}"
+            f"{summary['ops_per_request']:>9.2f}"
+        )
+        for route, stats in summary["routes"].items():
+            print(
+                f"  {route:<42}{stats['requests']:>7}{stats['errors']:>5}{stats['p50_ms']:>9.2f}"
+                f"{stats['p95_ms']:>9.2f}{stats['p99_ms']:>9.2f}"
+            )
+
+
+async def run(args):
+    harness = await Harness(args.mongo_url).start()
+    # server.py configures INFO logging; per-request log lines would dominate the run
+    for name in ("", "httpx", "aiohttp.access"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    night = VenueNight(
+        harness,
+        phones=args.phones,
+        poll_interval=args.poll_interval,
+        poll_duration=args.poll_duration,
+        time_scale=args.time_scale,
+        seed=args.seed
+    )
+    results = {}
+    try:
+        async with harness.client() as client:
+            night.client = client
+            for name, (setup, scenario) in SCENARIOS.items():
+                if args.scenario and name not in args.scenario:
+                    continue
+                result = await night.run(name, scenario, setup)
+                results[name] = result.summary()
+    finally:
+        await harness.stop()
+    return harness.mode, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Venue-night load run against the in-process app")
+    parser.add_argument("--mongo-url", default=os.environ.get("PERF_MONGO_URL"),
+                        help="Local mongod to use (default: in-memory stand-in)")
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS),
+                        help="Run only these scenarios (repeatable)")
+    parser.add_argument("--phones", type=int, default=300)
+    parser.add_argument("--poll-interval", type=float, default=15.0)
+    parser.add_argument("--poll-duration", type=float, default=60.0)
+    parser.add_argument("--time-scale", type=float, default=5.0,
+                        help="Compress all waits by this factor (same request count)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--latency-tolerance", type=float, default=LATENCY_TOLERANCE)
+    parser.add_argument("--ops-tolerance", type=float, default=OPS_TOLERANCE)
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Write this run's numbers to the baseline instead of checking them")
+    parser.add_argument("--output", type=Path, help="Also write the results as JSON")
+    args = parser.parse_args()
+
+    mode, results = asyncio.run(run(args))
+    print_report(results, mode)
+
+    if args.output:
+        args.output.write_text(json.dumps({"mode": mode, "scenarios": results}, indent=2) + "\n")
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+
+    if args.update_baseline:
+        baseline[mode] = {
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "scenarios": {
+                name: {k: v for k, v in summary.items() if k != "routes"}
+                for name, summary in {**baseline.get(mode, {}).get("scenarios", {}), **results}.items()
+            }
+        }
+        args.baseline.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"\nBaseline for {mode} Mongo written to {args.baseline}")
+        return
+
+    expected = baseline.get(mode, {}).get("scenarios", {})
+    if not expected:
+        print(f"\nNo {mode} baseline in {args.baseline} - run with --update-baseline to record one")
+        return
+
+    failures = check_against_baseline(results, expected, args.latency_tolerance, args.ops_tolerance)
+    if failures:
+        print("\nRegressions against baseline:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\nWithin baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from pymongo import DeleteOne, ReplaceOne
+
+from fast_json import RecordShape
+from leader import default_holder_id
+from models import CheckInResponse
+
+# A check-in counts as here while it has heartbeated within this long;
+# clients heartbeat every 30s, so this allows for a couple of missed beats
+PRESENCE_TIMEOUT_SECONDS = float(os.environ.get("PRESENCE_TIMEOUT_SECONDS", "120"))
+
+# How often each worker writes the heartbeats it received and reads the
+# other workers'; counts lag a heartbeat on another worker by up to this
+PRESENCE_SYNC_SECONDS = float(os.environ.get("PRESENCE_SYNC_SECONDS", "5"))
+
+# Check-in rows past their 4-hour expires_at are deleted this often (by
+# every worker; the delete is idempotent) instead of on every read
+CHECKIN_PURGE_SECONDS = 60
+
+# Most recent arrivals returned by present()
+PRESENT_LIMIT = 100
+
+CHECKIN_SHAPE = RecordShape(CheckInResponse, extra=("expires_at",))
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _expired(record: Dict, now: float) -> bool:
+    expires_at = _as_utc(record.get("expires_at"))
+    return expires_at is not None and expires_at.timestamp() <= now
+
+
+class PresenceService:
+    """
+    Who is at each location right now, from client heartbeats rather than
+    check-in rows. Every worker keeps the merged presence of all workers in
+    memory, so count() is a dict length and present() never queries.
+
+    Heartbeats are only recorded in memory. Every `sync_every` seconds
+    each worker replaces one `presence` document per location, holding the
+    heartbeats (and check-outs) it received, then rebuilds its view from
+    every worker's documents: a check-in is here while its newest heartbeat
+    on any worker is younger than `timeout` and no worker has checked it
+    out. Documents of workers that stopped syncing expire via a TTL index.
+
+    Heartbeats trust the cached check-in record only while the last sync is
+    recent; a check-out elsewhere drops it at the next sync, so a later
+    heartbeat re-reads the (deleted) row and is refused.
+    """
+
+    def __init__(self, db, checkins, timeout: float = PRESENCE_TIMEOUT_SECONDS,
+                 sync_every: float = PRESENCE_SYNC_SECONDS, worker_id: Optional[str] = None):
+        self.db = db
+        self.collection = db.presence
+        self.checkins = checkins
+        self.timeout = timeout
+        self.sync_every = sync_every
+        self.worker_id = worker_id or default_holder_id()
+        # location -> {checkin_id: last heartbeat (epoch seconds)} received by this worker
+        self._beats: Dict[str, Dict[str, float]] = {}
+        # location -> {checkin_id: check-out time} handled by this worker
+        self._left: Dict[str, Dict[str, float]] = {}
+        # location -> {checkin_id: last heartbeat} across all workers, as of the last sync
+        self._here: Dict[str, Dict[str, float]] = {}
+        # checkin_id -> CheckInResponse record (and expires_at) of everyone in _here
+        self._records: Dict[str, Dict] = {}
+        self._synced_slugs = set()
+        self._last_sync = 0.0
+        self._last_purge = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def ensure_indexes(self):
+        await self.collection.create_index("expires_at", expireAfterSeconds=0)
+
+    # ---- Reads (no queries) ----
+
+    def count(self, location_slug: str) -> int:
+        return len(self._here.get(location_slug, ()))
+
+    def present(self, location_slug: str, limit: int = PRESENT_LIMIT) -> List[Dict]:
+        """CheckInResponse records of everyone here, newest arrival first"""
+        records = [self._records[checkin_id] for checkin_id in self._here.get(location_slug, ()) if checkin_id in self._records]
+        # Joined here (aware) or loaded from Mongo (naive UTC)
+        records.sort(key=lambda record: _as_utc(record["checked_in_at"]), reverse=True)
+        return [CHECKIN_SHAPE.record(record) for record in records[:limit]]
+
+    # ---- Writes ----
+
+    def _seen(self, location_slug: str, checkin_id: str, now: float):
+        self._beats.setdefault(location_slug, {})[checkin_id] = now
+        self._here.setdefault(location_slug, {})[checkin_id] = now
+
+    def join(self, checkin: Dict):
+        """A new check-in is here from the moment it is created"""
+        self._records[checkin["id"]] = checkin
+        self._seen(checkin["location_slug"], checkin["id"], time.time())
+
+    async def heartbeat(self, checkin_id: str) -> Optional[str]:
+        """
+        Record that the check-in's phone is still at the venue. Returns its
+        location, or None when the check-in is gone (checked out or past
+        its expires_at) and the client should check in again.
+        """
+        now = time.time()
+        cached = self._records.get(checkin_id)
+        # Without a recent sync, a check-out on another worker may not have reached us
+        record = cached if now - self._last_sync <= self.sync_every else None
+        if record is None:
+            record = await self.checkins.get(checkin_id, CHECKIN_SHAPE.projection)
+            if not record:
+                if cached is not None:
+                    self.leave(checkin_id, cached["location_slug"])
+                return None
+            self._records[checkin_id] = record
+        if _expired(record, now):
+            self.leave(checkin_id, record["location_slug"])
+            return None
+        self._seen(record["location_slug"], checkin_id, now)
+        return record["location_slug"]
+
+    def leave(self, checkin_id: str, location_slug: str):
+        now = time.time()
+        self._beats.get(location_slug, {}).pop(checkin_id, None)
+        self._here.get(location_slug, {}).pop(checkin_id, None)
+        self._left.setdefault(location_slug, {})[checkin_id] = now
+        self._records.pop(checkin_id, None)
+
+    # ---- Sync ----
+
+    def _prune(self, entries: Dict[str, Dict[str, float]], cutoff: float):
+        for location_slug in list(entries):
+            members = entries[location_slug]
+            for checkin_id in [c for c, at in members.items() if at <= cutoff]:
+                del members[checkin_id]
+            if not members:
+                del entries[location_slug]
+
+    async def sync(self):
+        """Persist this worker's heartbeats, then rebuild the view from every worker's"""
+        now = time.time()
+        cutoff = now - self.timeout
+        self._prune(self._beats, cutoff)
+        # A check-out only has to outlive the heartbeats it cancels
+        self._prune(self._left, cutoff)
+
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=self.timeout + self.sync_every)
+        slugs = set(self._beats) | set(self._left)
+        operations = [
+            ReplaceOne(
+                {"_id": f"{self.worker_id}:{location_slug}"},
+                {
+                    "worker": self.worker_id,
+                    "location_slug": location_slug,
+                    "here": dict(self._beats.get(location_slug, {})),
+                    "left": dict(self._left.get(location_slug, {})),
+                    "expires_at": expires_at
+                },
+                upsert=True
+            )
+            for location_slug in slugs
+        ]
+        operations += [
+            DeleteOne({"_id": f"{self.worker_id}:{location_slug}"})
+            for location_slug in self._synced_slugs - slugs
+        ]
+        if operations:
+            await self.collection.bulk_write(operations, ordered=False)
+        self._synced_slugs = slugs
+
+        docs = await self.collection.find(
+            {"expires_at": {"$gt": datetime.now(timezone.utc)}},
+            {"_id": 0, "location_slug": 1, "here": 1, "left": 1}
+        ).to_list(None)
+
+        here: Dict[str, Dict[str, float]] = {}
+        left: Dict[str, float] = {}
+        for doc in docs:
+            members = here.setdefault(doc["location_slug"], {})
+            for checkin_id, at in doc.get("here", {}).items():
+                if at > cutoff and at > members.get(checkin_id, 0):
+                    members[checkin_id] = at
+            for checkin_id, at in doc.get("left", {}).items():
+                left[checkin_id] = max(at, left.get(checkin_id, 0))
+        # Heartbeats that arrived while this sync was awaiting
+        for location_slug, beats in self._beats.items():
+            members = here.setdefault(location_slug, {})
+            for checkin_id, at in beats.items():
+                members[checkin_id] = max(at, members.get(checkin_id, 0))
+        # Check-in ids aren't reused, so a check-out on any worker is final
+        for members in here.values():
+            for checkin_id in [c for c in members if c in left]:
+                del members[checkin_id]
+        for checkin_id in left:
+            # Re-checked against the check-in row if it heartbeats again
+            self._records.pop(checkin_id, None)
+
+        for checkin_id in [c for c, record in self._records.items() if _expired(record, now)]:
+            del self._records[checkin_id]
+        await self._load_records({checkin_id for members in here.values() for checkin_id in members})
+        # Check-ins whose row is gone (checked out elsewhere, expired) aren't here
+        self._here = {
+            location_slug: {c: at for c, at in members.items() if c in self._records}
+            for location_slug, members in here.items()
+        }
+        self._here = {location_slug: members for location_slug, members in self._here.items() if members}
+        present = {checkin_id for members in self._here.values() for checkin_id in members}
+        for checkin_id in [c for c in self._records if c not in present]:
+            del self._records[checkin_id]
+
+        self._last_sync = now
+        if now - self._last_purge >= CHECKIN_PURGE_SECONDS:
+            self._last_purge = now
+            await self.checkins.purge_expired(datetime.now(timezone.utc))
+
+    async def _load_records(self, checkin_ids):
+        missing = [checkin_id for checkin_id in checkin_ids if checkin_id not in self._records]
+        if not missing:
+            return
+        docs = await self.checkins.find(
+            {"id": {"$in": missing}, "expires_at": {"$gt": datetime.now(timezone.utc)}},
+            CHECKIN_SHAPE.projection
+        )
+        for doc in docs:
+            self._records[doc["id"]] = doc
+
+    async def _keep_syncing(self):
+        while True:
+            try:
+                await self.sync()
+            except Exception as e:
+                logging.error(f"Presence sync failed: {e}")
+            await asyncio.sleep(self.sync_every)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._keep_syncing())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict:
+        return {
+            "worker": self.worker_id,
+            "locations": {location_slug: len(members) for location_slug, members in self._here.items()},
+            "heartbeats_here": sum(len(beats) for beats in self._beats.values())
+        }
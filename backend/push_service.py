@@ -1,8 +1,9 @@
-from pywebpush import webpush, WebPushException
 import json
 import os
 from typing import List, Dict
 
+from batch_loader import BatchLoader
+
 # VAPID keys for web push - must be set in environment
 VAPID_PRIVATE_KEY = os.environ.get('VAPID_PRIVATE_KEY')
 VAPID_PUBLIC_KEY = os.environ.get('VAPID_PUBLIC_KEY')
@@ -17,6 +18,19 @@ VAPID_CLAIMS = {
     "sub": "mailto:notifications@finandfeathers.com"
 }
 
+# pywebpush (requests, cryptography, http_ece) is imported on the first send
+# rather than at startup; load runs and benchmarks put a stand-in in `webpush`
+webpush = None
+WebPushException = None
+
+
+def _load_pywebpush():
+    global webpush, WebPushException
+    import pywebpush
+    if webpush is None:
+        webpush = pywebpush.webpush
+    WebPushException = pywebpush.WebPushException
+
 class PushNotificationService:
     def __init__(self, db):
         self.db = db
@@ -30,6 +44,8 @@ class PushNotificationService:
         if not self.enabled:
             print("Push notifications disabled - VAPID keys not configured")
             return False
+        if WebPushException is None:
+            _load_pywebpush()
         try:
             webpush(
                 subscription_info=subscription,
@@ -76,8 +92,11 @@ class PushNotificationService:
         sent_count = 0
         failed_count = 0
         
-        for member_id in member_ids:
-            member = await self.db.loyalty_members.find_one({"id": member_id})
+        # One $in query for all the members instead of one find_one each
+        members = await BatchLoader(self.db).load_many(
+            "loyalty_members", "id", member_ids, {"_id": 0, "push_subscription": 1}
+        )
+        for member in members:
             if member and member.get('push_subscription'):
                 success = await self.send_notification(
                     member['push_subscription'],
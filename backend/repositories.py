@@ -0,0 +1,395 @@
+import os
+import time
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pymongo import ReturnDocument
+
+from migrations import PROFILE_DEFAULTS, stamp
+
+# Repository calls slower than this are logged with their collection and shape
+SLOW_QUERY_MS = float(os.environ.get("SLOW_QUERY_MS", "200"))
+
+# Index keys, as passed to create_index (and usable as a cursor hint)
+IndexKeys = List[Tuple[str, int]]
+
+
+class RepositoryMetrics:
+    """Per collection and operation: call count, total and slowest time"""
+
+    def __init__(self):
+        self._ops: Dict[Tuple[str, str], Dict] = {}
+
+    def record(self, collection: str, op: str, elapsed_ms: float):
+        entry = self._ops.get((collection, op))
+        if entry is None:
+            entry = self._ops[(collection, op)] = {"calls": 0, "total_ms": 0.0, "max_ms": 0.0}
+        entry["calls"] += 1
+        entry["total_ms"] += elapsed_ms
+        entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+
+    def snapshot(self) -> List[Dict]:
+        return [
+            {
+                "collection": collection,
+                "op": op,
+                "calls": entry["calls"],
+                "avg_ms": round(entry["total_ms"] / entry["calls"], 2),
+                "max_ms": round(entry["max_ms"], 2)
+            }
+            for (collection, op), entry in sorted(self._ops.items())
+        ]
+
+
+class Repository:
+    """
+    Owns one collection's query shapes. Reads use `projection` unless a
+    narrower one is passed, so handlers get only the fields they need and
+    nothing private; `indexes` are created by ensure_indexes() and may be
+    named as hints by the repository's own queries. Inserted documents are
+    stamped with the collection's schema version (migrations.py). Every
+    call is timed into the shared RepositoryMetrics.
+    """
+
+    collection_name = ""
+    projection: Dict = {"_id": 0}
+    indexes: Sequence[Tuple[IndexKeys, Dict]] = ()
+
+    def __init__(self, db, metrics: RepositoryMetrics):
+        self.db = db
+        self.collection = db[self.collection_name]
+        self.metrics = metrics
+
+    def _done(self, op: str, started: float, detail=None):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.metrics.record(self.collection_name, op, elapsed_ms)
+        if elapsed_ms > SLOW_QUERY_MS:
+            logging.warning(f"Slow {self.collection_name}.{op} ({elapsed_ms:.0f} ms): {detail}")
+
+    async def ensure_indexes(self):
+        for keys, options in self.indexes:
+            await self.collection.create_index(keys, **options)
+
+    async def find_one(self, query: Dict, projection: Optional[Dict] = None) -> Optional[Dict]:
+        started = time.perf_counter()
+        doc = await self.collection.find_one(query, projection or self.projection)
+        self._done("find_one", started, query)
+        return doc
+
+    async def find(self, query: Dict, projection: Optional[Dict] = None, sort: Optional[IndexKeys] = None,
+                   limit: int = 0, hint: Optional[IndexKeys] = None) -> List[Dict]:
+        started = time.perf_counter()
+        cursor = self.collection.find(query, projection or self.projection)
+        if sort:
+            cursor = cursor.sort(sort)
+        if limit:
+            cursor = cursor.limit(limit)
+        if hint:
+            cursor = cursor.hint(hint)
+        docs = await cursor.to_list(limit or None)
+        self._done("find", started, query)
+        return docs
+
+    async def count(self, query: Dict) -> int:
+        started = time.perf_counter()
+        count = await self.collection.count_documents(query)
+        self._done("count", started, query)
+        return count
+
+    async def exists(self, query: Dict) -> bool:
+        return await self.find_one(query, {"_id": 1}) is not None
+
+    async def insert(self, doc: Dict) -> Dict:
+        """Insert and return the document without Mongo's _id"""
+        started = time.perf_counter()
+        await self.collection.insert_one(stamp(self.collection_name, doc))
+        self._done("insert", started)
+        doc.pop("_id", None)
+        return doc
+
+    async def update(self, query: Dict, update: Dict, many: bool = False) -> int:
+        """update_one/update_many; returns the matched count"""
+        started = time.perf_counter()
+        if many:
+            result = await self.collection.update_many(query, update)
+        else:
+            result = await self.collection.update_one(query, update)
+        self._done("update", started, query)
+        return result.matched_count
+
+    async def find_one_and_update(self, query: Dict, update: Dict,
+                                  projection: Optional[Dict] = None) -> Optional[Dict]:
+        """The document after the update, or None if nothing matched"""
+        started = time.perf_counter()
+        doc = await self.collection.find_one_and_update(
+            query, update, projection=projection or self.projection, return_document=ReturnDocument.AFTER
+        )
+        self._done("find_one_and_update", started, query)
+        return doc
+
+    async def find_one_and_delete(self, query: Dict, projection: Optional[Dict] = None) -> Optional[Dict]:
+        started = time.perf_counter()
+        doc = await self.collection.find_one_and_delete(query, projection or self.projection)
+        self._done("find_one_and_delete", started, query)
+        return doc
+
+    async def delete(self, query: Dict, many: bool = False) -> int:
+        started = time.perf_counter()
+        if many:
+            result = await self.collection.delete_many(query)
+        else:
+            result = await self.collection.delete_one(query)
+        self._done("delete", started, query)
+        return result.deleted_count
+
+
+# Optional profile fields every sign-up path starts empty
+NEW_PROFILE_FIELDS = {
+    "phone": None,
+    "email": None,
+    "avatar_emoji": "😊",
+    "birthdate": None,
+    "anniversary": None,
+    "instagram_handle": None,
+    "facebook_handle": None,
+    "twitter_handle": None,
+    "tiktok_handle": None,
+}
+
+
+def new_user_profile(user_id: str, name: str, **fields) -> Dict:
+    """A complete profile document for any sign-up path; `fields` override the defaults"""
+    now = datetime.now(timezone.utc)
+    profile = {"id": user_id, "name": name, **NEW_PROFILE_FIELDS}
+    for field, default in PROFILE_DEFAULTS.items():
+        profile[field] = list(default) if isinstance(default, list) else default
+    profile.update(fields)
+    profile["created_at"] = now
+    profile["updated_at"] = now
+    return profile
+
+
+class UserProfileRepository(Repository):
+    collection_name = "user_profiles"
+    # Credentials and reset tokens never leave the repository by default
+    projection = {"_id": 0, "password_hash": 0, "reset_token": 0, "reset_expires": 0}
+    indexes = (
+        ([("id", 1)], {}),
+        ([("email", 1)], {"sparse": True}),
+        ([("username", 1)], {"sparse": True}),
+    )
+
+    async def get(self, user_id: str, projection: Optional[Dict] = None) -> Optional[Dict]:
+        return await self.find_one({"id": user_id}, projection)
+
+    async def get_by_email(self, email: str, projection: Optional[Dict] = None) -> Optional[Dict]:
+        return await self.find_one({"email": email}, projection)
+
+    async def has(self, user_id: str) -> bool:
+        return await self.exists({"id": user_id})
+
+    async def email_taken(self, email: str) -> bool:
+        return await self.exists({"email": email})
+
+    async def set_fields(self, user_id: str, fields: Dict, inc: Optional[Dict] = None) -> int:
+        update = {"$set": fields}
+        if inc:
+            update["$inc"] = inc
+        return await self.update({"id": user_id}, update)
+
+
+class CheckinRepository(Repository):
+    collection_name = "checkins"
+    BY_LOCATION: IndexKeys = [("location_slug", 1), ("checked_in_at", -1)]
+    indexes = (
+        ([("id", 1)], {}),
+        (BY_LOCATION, {}),
+        ([("expires_at", 1)], {}),
+    )
+
+    async def get(self, checkin_id: str, projection: Optional[Dict] = None) -> Optional[Dict]:
+        return await self.find_one({"id": checkin_id}, projection)
+
+    async def purge_expired(self, now) -> int:
+        return await self.delete({"expires_at": {"$lt": now}}, many=True)
+
+    async def active_at(self, location_slug: str, projection: Dict, limit: int = 100) -> List[Dict]:
+        """Newest first"""
+        return await self.find(
+            {"location_slug": location_slug}, projection,
+            sort=[("checked_in_at", -1)], limit=limit, hint=self.BY_LOCATION
+        )
+
+    async def check_out(self, checkin_id: str) -> Optional[Dict]:
+        """The removed check-in's location_slug and expires_at"""
+        return await self.find_one_and_delete(
+            {"id": checkin_id}, {"_id": 0, "location_slug": 1, "expires_at": 1}
+        )
+
+
+# A location's feed newest first; `id` breaks created_at ties for the
+# activity timeline's keyset cursor (timeline.py)
+FEED_BY_LOCATION: IndexKeys = [("location_slug", 1), ("created_at", -1), ("id", -1)]
+
+
+class SocialPostRepository(Repository):
+    collection_name = "social_posts"
+    BY_LOCATION = FEED_BY_LOCATION
+    indexes = (
+        ([("id", 1)], {}),
+        (BY_LOCATION, {}),
+        ([("author_user_id", 1), ("created_at", -1)], {"sparse": True}),
+    )
+
+    async def get(self, post_id: str, projection: Optional[Dict] = None) -> Optional[Dict]:
+        return await self.find_one({"id": post_id}, projection)
+
+    async def wall(self, location_slug: str, projection: Dict, limit: int = 50) -> List[Dict]:
+        """A location's newest posts"""
+        return await self.find(
+            {"location_slug": location_slug}, projection,
+            sort=[("created_at", -1)], limit=limit, hint=self.BY_LOCATION
+        )
+
+    async def by_author(self, user_id: str, limit: int = 50) -> List[Dict]:
+        return await self.find({"author_user_id": user_id}, sort=[("created_at", -1)], limit=limit)
+
+    async def set_likes(self, post_id: str, likes: List[str]) -> int:
+        return await self.update({"id": post_id}, {"$set": {"likes": likes}})
+
+
+class DirectMessageRepository(Repository):
+    collection_name = "direct_messages"
+    indexes = (
+        ([("from_checkin_id", 1), ("created_at", -1)], {}),
+        ([("to_checkin_id", 1), ("read", 1)], {}),
+    )
+
+    @staticmethod
+    def _involving(checkin_id: str) -> Dict:
+        return {"$or": [{"from_checkin_id": checkin_id}, {"to_checkin_id": checkin_id}]}
+
+    async def for_checkin(self, checkin_id: str, projection: Optional[Dict] = None, limit: int = 100) -> List[Dict]:
+        """Sent and received, newest first"""
+        return await self.find(self._involving(checkin_id), projection, sort=[("created_at", -1)], limit=limit)
+
+    async def thread(self, checkin_id: str, partner_id: str, projection: Optional[Dict] = None,
+                     limit: int = 100) -> List[Dict]:
+        """Both directions between two check-ins, oldest first"""
+        return await self.find(
+            {"$or": [
+                {"from_checkin_id": checkin_id, "to_checkin_id": partner_id},
+                {"from_checkin_id": partner_id, "to_checkin_id": checkin_id}
+            ]},
+            projection, sort=[("created_at", 1)], limit=limit
+        )
+
+    async def unread_counts(self, checkin_id: str) -> Dict[str, int]:
+        """Unread messages to checkin_id, per sender"""
+        started = time.perf_counter()
+        rows = await self.collection.aggregate([
+            {"$match": {"to_checkin_id": checkin_id, "read": False}},
+            {"$group": {"_id": "$from_checkin_id", "count": {"$sum": 1}}}
+        ]).to_list(None)
+        self._done("aggregate", started, checkin_id)
+        return {row["_id"]: row["count"] for row in rows}
+
+    async def unread_count(self, checkin_id: str) -> int:
+        return await self.count({"to_checkin_id": checkin_id, "read": False})
+
+    async def mark_read(self, checkin_id: str, partner_id: str) -> int:
+        return await self.update(
+            {"from_checkin_id": partner_id, "to_checkin_id": checkin_id, "read": False},
+            {"$set": {"read": True}}, many=True
+        )
+
+
+class DrinkOrderRepository(Repository):
+    collection_name = "drink_orders"
+    BY_LOCATION = FEED_BY_LOCATION
+    indexes = (
+        ([("id", 1)], {}),
+        (BY_LOCATION, {}),
+        ([("from_checkin_id", 1)], {}),
+        ([("to_checkin_id", 1)], {}),
+    )
+
+    async def recent_at(self, location_slug: str, statuses: List[str], projection: Dict,
+                        limit: int = 20) -> List[Dict]:
+        return await self.find(
+            {"location_slug": location_slug, "status": {"$in": statuses}}, projection,
+            sort=[("created_at", -1)], limit=limit
+        )
+
+    async def for_checkin(self, checkin_id: str, projection: Dict, limit: int = 50) -> List[Dict]:
+        return await self.find(
+            {"$or": [{"from_checkin_id": checkin_id}, {"to_checkin_id": checkin_id}]}, projection,
+            sort=[("created_at", -1)], limit=limit
+        )
+
+    async def for_user(self, user_id: str, limit: int = 50) -> List[Dict]:
+        return await self.find(
+            {"$or": [{"from_user_id": user_id}, {"to_user_id": user_id}]},
+            sort=[("created_at", -1)], limit=limit
+        )
+
+    async def set_status(self, order_id: str, status: str) -> Optional[Dict]:
+        """id, location_slug and status after the update"""
+        return await self.find_one_and_update(
+            {"id": order_id}, {"$set": {"status": status}},
+            {"_id": 0, "id": 1, "location_slug": 1, "status": 1}
+        )
+
+
+class DJTipRepository(Repository):
+    collection_name = "dj_tips"
+    BY_LOCATION = FEED_BY_LOCATION
+    indexes = (
+        ([("id", 1)], {}),
+        (BY_LOCATION, {}),
+    )
+
+
+class SongRequestRepository(Repository):
+    collection_name = "song_requests"
+    BY_LOCATION = FEED_BY_LOCATION
+    indexes = (
+        ([("id", 1)], {}),
+        (BY_LOCATION, {}),
+    )
+
+
+class Repositories:
+    """The repositories over one database, sharing their metrics and index registry"""
+
+    def __init__(self, db):
+        self.metrics = RepositoryMetrics()
+        self.user_profiles = UserProfileRepository(db, self.metrics)
+        self.checkins = CheckinRepository(db, self.metrics)
+        self.social_posts = SocialPostRepository(db, self.metrics)
+        self.direct_messages = DirectMessageRepository(db, self.metrics)
+        self.drink_orders = DrinkOrderRepository(db, self.metrics)
+        self.dj_tips = DJTipRepository(db, self.metrics)
+        self.song_requests = SongRequestRepository(db, self.metrics)
+
+    def all(self) -> List[Repository]:
+        return [repo for repo in vars(self).values() if isinstance(repo, Repository)]
+
+    async def ensure_indexes(self):
+        for repo in self.all():
+            await repo.ensure_indexes()
+
+    def describe(self) -> Dict:
+        """Default projections and declared indexes per collection, plus call metrics"""
+        return {
+            "collections": [
+                {
+                    "collection": repo.collection_name,
+                    "projection": repo.projection,
+                    "indexes": [{"keys": keys, **options} for keys, options in repo.indexes]
+                }
+                for repo in self.all()
+            ],
+            "metrics": self.metrics.snapshot()
+        }
@@ -0,0 +1,329 @@
+import asyncio
+import gzip
+import hashlib
+import logging
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import bson
+from bson import Binary
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError
+
+from leader import LeaderLease
+
+# Cold archives written to disk (archive_to="file") go here, as
+# <collection>/<YYYY-MM>/<first day>-<id>.bson.gz - concatenated BSON,
+# the same layout `mongorestore --gzip` reads
+ARCHIVE_DIR = Path(os.environ.get("RETENTION_ARCHIVE_DIR", Path(__file__).parent / "archive"))
+
+# Documents are removed in batches of BATCH_SIZE with a pause in between, so
+# a large backlog never holds the hot collections' write locks for long
+BATCH_SIZE = int(os.environ.get("RETENTION_BATCH_SIZE", "500"))
+BATCH_PAUSE_SECONDS = float(os.environ.get("RETENTION_BATCH_PAUSE_SECONDS", "0.2"))
+
+# Per policy per run; whatever is left over goes on the next run
+MAX_BATCHES_PER_RUN = int(os.environ.get("RETENTION_MAX_BATCHES_PER_RUN", "200"))
+
+# Non-dry runs hold this lease in leader_leases, so the cron script, the
+# scheduled job and the admin endpoints never apply the policies at once
+RUN_LOCK_NAME = "retention_run"
+
+ACTIONS = ("delete", "archive", "downsample")
+ARCHIVE_TARGETS = ("collection", "file")
+
+# What happens to each hot collection once documents pass max_age:
+#   delete      - removed
+#   archive     - moved as gzipped BSON batches into <collection>_archive
+#                 (or files under ARCHIVE_DIR), then removed. A batch's
+#                 archive id comes from its document ids, so re-archiving
+#                 a batch a dead run left behind doesn't duplicate it.
+#   downsample  - counted into per-day buckets of `group_by` in `into`, then
+#                 removed. Buckets are $inc'ed a batch at a time, so a run
+#                 that dies between the $inc and the delete counts that
+#                 batch twice on the next run.
+RETENTION_POLICIES = [
+    {
+        "collection": "social_posts",
+        "time_field": "created_at",
+        "max_age": timedelta(hours=24),
+        "action": "delete",
+        # Photo posts stay for the gallery
+        "filter": {"$or": [{"image_url": None}, {"image_url": ""}, {"image_url": {"$exists": False}}]},
+    },
+    {
+        "collection": "checkins",
+        "time_field": "checked_in_at",
+        "max_age": timedelta(hours=24),
+        "action": "delete",
+    },
+    {
+        "collection": "song_requests",
+        "time_field": "created_at",
+        "max_age": timedelta(days=7),
+        "action": "delete",
+    },
+    {
+        "collection": "direct_messages",
+        "time_field": "created_at",
+        "max_age": timedelta(days=30),
+        "action": "delete",
+    },
+    {
+        "collection": "drink_orders",
+        "time_field": "created_at",
+        "max_age": timedelta(days=30),
+        "action": "downsample",
+        "into": "drink_orders_daily",
+        "group_by": ["location_slug", "drink_name", "status"],
+        "metrics": {"orders": 1},
+    },
+    {
+        # Tips are money: keep every record, just not in the hot collection
+        "collection": "dj_tips",
+        "time_field": "created_at",
+        "max_age": timedelta(days=90),
+        "action": "archive",
+        "archive_to": os.environ.get("RETENTION_ARCHIVE_TO", "collection"),
+    },
+]
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def encode_archive(docs: List[Dict]) -> bytes:
+    """gzip of the documents as concatenated BSON"""
+    return gzip.compress(b"".join(bson.encode(doc) for doc in docs), compresslevel=6)
+
+
+def decode_archive(data: bytes) -> List[Dict]:
+    """Documents back out of an archive batch (cold collection `data` or file contents)"""
+    return bson.decode_all(gzip.decompress(data))
+
+
+class RetentionEngine:
+    """
+    Applies RETENTION_POLICIES: finds documents older than each policy's
+    max_age (oldest first, via an index on time_field), handles them a batch
+    at a time and deletes them from the hot collection. run(dry_run=True)
+    only counts what would go.
+
+    `on_removed(collection)` is awaited after a policy removed anything, so
+    caches built from that collection can be dropped.
+
+    Only one non-dry run happens at a time across every process sharing the
+    database: run() takes the RUN_LOCK_NAME lease (renewed while it works)
+    and returns with already_running set when someone else holds it.
+    """
+
+    def __init__(self, db, policies: Optional[List[Dict]] = None,
+                 on_removed: Optional[Callable[[str], Awaitable]] = None,
+                 batch_size: int = BATCH_SIZE, batch_pause: float = BATCH_PAUSE_SECONDS,
+                 max_batches: int = MAX_BATCHES_PER_RUN, archive_dir: Path = ARCHIVE_DIR):
+        self.db = db
+        self.policies = RETENTION_POLICIES if policies is None else policies
+        self.on_removed = on_removed
+        self.batch_size = batch_size
+        self.batch_pause = batch_pause
+        self.max_batches = max_batches
+        self.archive_dir = Path(archive_dir)
+
+        for policy in self.policies:
+            if policy["action"] not in ACTIONS:
+                raise ValueError(f"Unknown retention action {policy['action']!r} for {policy['collection']}")
+            if policy["action"] == "archive" and policy.get("archive_to", "collection") not in ARCHIVE_TARGETS:
+                raise ValueError(f"Unknown archive target {policy['archive_to']!r} for {policy['collection']}")
+
+    async def ensure_indexes(self):
+        for policy in self.policies:
+            await self.db[policy["collection"]].create_index(policy["time_field"])
+            if policy["action"] == "archive" and policy.get("archive_to", "collection") == "collection":
+                await self.db[f"{policy['collection']}_archive"].create_index("last_at")
+
+    def describe(self) -> List[Dict]:
+        """Policies in JSON-friendly form"""
+        described = []
+        for policy in self.policies:
+            entry = {
+                "collection": policy["collection"],
+                "action": policy["action"],
+                "time_field": policy["time_field"],
+                "max_age_hours": policy["max_age"].total_seconds() / 3600,
+                "filter": policy.get("filter"),
+            }
+            if policy["action"] == "archive":
+                entry["archive_to"] = policy.get("archive_to", "collection")
+            if policy["action"] == "downsample":
+                entry["into"] = policy["into"]
+                entry["group_by"] = policy["group_by"]
+            described.append(entry)
+        return described
+
+    async def run(self, dry_run: bool = False, collections: Optional[List[str]] = None,
+                  now: Optional[datetime] = None) -> Dict:
+        """Apply every policy (or those for `collections`) once"""
+        if dry_run:
+            return await self._run(dry_run, collections, now)
+
+        lock = LeaderLease(self.db, RUN_LOCK_NAME)
+        if not await lock.acquire():
+            holder = (await lock.get_state() or {}).get("holder")
+            logging.info(f"Retention run skipped: already running on {holder}")
+            return {"dry_run": False, "already_running": True, "holder": holder, "removed": 0, "policies": []}
+        lock.start()
+        try:
+            return await self._run(dry_run, collections, now, lock)
+        finally:
+            await lock.stop()
+
+    async def _run(self, dry_run: bool, collections: Optional[List[str]], now: Optional[datetime],
+                   lock: Optional[LeaderLease] = None) -> Dict:
+        now = _as_utc(now) or datetime.now(timezone.utc)
+        started = time.perf_counter()
+        results = []
+        for policy in self.policies:
+            if collections and policy["collection"] not in collections:
+                continue
+            result = await self._apply(policy, now - policy["max_age"], dry_run, lock)
+            results.append(result)
+            if dry_run:
+                logging.info(f"Retention dry run: {result['eligible']} {policy['collection']} documents would be {policy['action']}d")
+            else:
+                logging.info(
+                    f"Retention: {policy['action']} removed {result['removed']} {policy['collection']} documents "
+                    f"in {result['batches']} batches ({result['remaining']} left for the next run)"
+                )
+                if result["removed"] and self.on_removed:
+                    await self.on_removed(policy["collection"])
+
+        return {
+            "dry_run": dry_run,
+            "run_at": now.isoformat(),
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            "removed": sum(result.get("removed", 0) for result in results),
+            "policies": results
+        }
+
+    def _query(self, policy: Dict, cutoff: datetime) -> Dict:
+        query = {policy["time_field"]: {"$lt": cutoff}}
+        if policy.get("filter"):
+            query = {"$and": [query, policy["filter"]]}
+        return query
+
+    async def _apply(self, policy: Dict, cutoff: datetime, dry_run: bool,
+                     lock: Optional[LeaderLease] = None) -> Dict:
+        collection = self.db[policy["collection"]]
+        time_field = policy["time_field"]
+        query = self._query(policy, cutoff)
+        started = time.perf_counter()
+        result = {"collection": policy["collection"], "action": policy["action"], "cutoff": cutoff.isoformat()}
+
+        if dry_run:
+            oldest = await collection.find_one(query, {"_id": 0, time_field: 1}, sort=[(time_field, 1)])
+            result["eligible"] = await collection.count_documents(query)
+            result["oldest"] = _as_utc(oldest.get(time_field)).isoformat() if oldest else None
+            result["hot_documents"] = await collection.estimated_document_count()
+            return result
+
+        result.update({"removed": 0, "batches": 0, "remaining": 0})
+        if policy["action"] == "archive":
+            result.update({"archived_bytes": 0, "raw_bytes": 0})
+        if policy["action"] == "downsample":
+            result["buckets_updated"] = 0
+
+        # Deletes only need ids; archive and downsample need the whole document
+        projection = {"_id": 1} if policy["action"] == "delete" else None
+        while True:
+            # A lock that couldn't be renewed may already be someone else's:
+            # stop before reading a batch they could be handling too
+            if result["batches"] >= self.max_batches or (lock and not lock.is_leader):
+                result["remaining"] = await collection.count_documents(query)
+                break
+
+            docs = await collection.find(query, projection).sort(time_field, 1).limit(self.batch_size).to_list(self.batch_size)
+            if not docs:
+                break
+
+            if policy["action"] == "archive":
+                raw_bytes, archived_bytes = await self._archive(policy, docs)
+                result["raw_bytes"] += raw_bytes
+                result["archived_bytes"] += archived_bytes
+            elif policy["action"] == "downsample":
+                result["buckets_updated"] += await self._downsample(policy, docs)
+
+            deleted = await collection.delete_many({"_id": {"$in": [doc["_id"] for doc in docs]}})
+            result["removed"] += deleted.deleted_count
+            result["batches"] += 1
+
+            if len(docs) < self.batch_size:
+                break
+            await asyncio.sleep(self.batch_pause)
+
+        result["hot_documents"] = await collection.estimated_document_count()
+        result["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return result
+
+    async def _archive(self, policy: Dict, docs: List[Dict]) -> tuple:
+        """Write one batch to cold storage; returns (raw bytes, compressed bytes)"""
+        time_field = policy["time_field"]
+        raw_bytes = sum(len(bson.encode(doc)) for doc in docs)
+        data = encode_archive(docs)
+        first_at = _as_utc(docs[0].get(time_field))
+        last_at = _as_utc(docs[-1].get(time_field))
+        archive_id = hashlib.sha256(
+            "\n".join([policy["collection"]] + [str(doc["_id"]) for doc in docs]).encode("utf-8")
+        ).hexdigest()[:32]
+
+        if policy.get("archive_to", "collection") == "file":
+            directory = self.archive_dir / policy["collection"] / first_at.strftime("%Y-%m")
+            directory.mkdir(parents=True, exist_ok=True)
+            path = directory / f"{first_at.strftime('%Y-%m-%d')}-{archive_id[:8]}.bson.gz"
+            # Blocking file write kept off the event loop
+            await asyncio.to_thread(path.write_bytes, data)
+        else:
+            try:
+                await self.db[f"{policy['collection']}_archive"].insert_one({
+                    "_id": archive_id,
+                    "collection": policy["collection"],
+                    "count": len(docs),
+                    "first_at": first_at,
+                    "last_at": last_at,
+                    "archived_at": datetime.now(timezone.utc),
+                    "format": "bson+gzip",
+                    "raw_bytes": raw_bytes,
+                    "data": Binary(data)
+                })
+            except DuplicateKeyError:
+                # Archived by a run that died before deleting the batch
+                logging.info(f"Retention: {policy['collection']} batch {archive_id} already archived")
+        return raw_bytes, len(data)
+
+    async def _downsample(self, policy: Dict, docs: List[Dict]) -> int:
+        """$inc one batch into the per-day buckets; returns the number of buckets touched"""
+        buckets: Dict[tuple, Dict[str, float]] = {}
+        for doc in docs:
+            day = _as_utc(doc[policy["time_field"]]).strftime("%Y-%m-%d")
+            key = (day,) + tuple(doc.get(field) for field in policy["group_by"])
+            totals = buckets.setdefault(key, {metric: 0 for metric in policy["metrics"]})
+            for metric, value in policy["metrics"].items():
+                totals[metric] += value if isinstance(value, (int, float)) else (doc.get(value.lstrip("$")) or 0)
+
+        await self.db[policy["into"]].bulk_write([
+            UpdateOne(
+                {"_id": ":".join(str(part) for part in key)},
+                {
+                    "$inc": {f"metrics.{metric}": value for metric, value in totals.items()},
+                    "$setOnInsert": {"date": key[0], **dict(zip(policy["group_by"], key[1:]))}
+                },
+                upsert=True
+            )
+            for key, totals in buckets.items()
+        ], ordered=False)
+        return len(buckets)
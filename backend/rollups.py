@@ -0,0 +1,282 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from pymongo import UpdateOne, ReplaceOne
+
+# Bucket key used for venue-independent totals (token flows have no location)
+ALL_LOCATIONS = "all"
+
+METRICS = [
+    "checkins",
+    "posts",
+    "tips_count",
+    "tips_sum",
+    "drink_orders",
+    "token_purchases",
+    "tokens_purchased",
+    "token_purchase_usd",
+    "token_transfers",
+    "tokens_transferred",
+    "cashouts",
+    "cashout_tokens",
+    "cashout_usd",
+]
+
+# How each source collection maps onto bucket metrics. Values are either a
+# constant (counted per document) or a "$field" summed per bucket. Used by
+# the backfill; live writes call record() with the same metric names.
+ROLLUP_SOURCES = [
+    {
+        "collection": "checkins",
+        "time_field": "checked_in_at",
+        "location_field": "location_slug",
+        "metrics": {"checkins": 1},
+    },
+    {
+        "collection": "social_posts",
+        "time_field": "created_at",
+        "location_field": "location_slug",
+        "metrics": {"posts": 1},
+    },
+    {
+        "collection": "dj_tips",
+        "time_field": "created_at",
+        "location_field": "location_slug",
+        "metrics": {"tips_count": 1, "tips_sum": "$amount"},
+    },
+    {
+        "collection": "drink_orders",
+        "time_field": "created_at",
+        "location_field": "location_slug",
+        "metrics": {"drink_orders": 1},
+    },
+    {
+        "collection": "token_purchases",
+        "time_field": "created_at",
+        "location_field": None,
+        "metrics": {"token_purchases": 1, "tokens_purchased": "$tokens_purchased", "token_purchase_usd": "$amount_usd"},
+    },
+    {
+        # Stripe token checkouts are recorded here rather than in token_purchases
+        "collection": "token_credits",
+        "time_field": "created_at",
+        "location_field": None,
+        "metrics": {"token_purchases": 1, "tokens_purchased": "$tokens"},
+    },
+    {
+        "collection": "token_transfers",
+        "time_field": "created_at",
+        "location_field": None,
+        "metrics": {"token_transfers": 1, "tokens_transferred": "$amount"},
+    },
+    {
+        "collection": "cashout_requests",
+        "time_field": "created_at",
+        "location_field": None,
+        "metrics": {"cashouts": 1, "cashout_tokens": "$amount_tokens", "cashout_usd": "$amount_usd"},
+    },
+]
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def daily_bucket_id(location_slug: str, day: str) -> str:
+    return f"{location_slug}:{day}"
+
+
+def hourly_bucket_id(location_slug: str, day: str, hour: int) -> str:
+    return f"{location_slug}:{day}T{hour:02d}"
+
+
+def _empty_metrics() -> Dict[str, float]:
+    return {metric: 0 for metric in METRICS}
+
+
+class RollupService:
+    """
+    Pre-aggregated daily and hourly counters per location.
+
+    Write handlers call record() right after inserting the raw event, which
+    `$inc`s the location bucket and the "all" bucket for both granularities.
+    Dashboards read bucket documents (one per day or hour) instead of
+    scanning the raw collections. backfill() rebuilds buckets from scratch
+    and records that it ran; until then, buckets miss every event written
+    before record() was deployed (see backfilled()).
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self.daily = db.rollups_daily
+        self.hourly = db.rollups_hourly
+        self.state = db.rollup_state
+        self._backfilled = False
+
+    async def backfilled(self) -> bool:
+        """Whether a backfill has completed, so buckets cover events from before deploy"""
+        if not self._backfilled:
+            self._backfilled = await self.state.find_one({"_id": "backfill"}, {"_id": 1}) is not None
+        return self._backfilled
+
+    async def record(self, metrics: Dict[str, float], location_slug: Optional[str] = None,
+                     at: Optional[datetime] = None):
+        """Add metric deltas to the buckets covering `at` (defaults to now)"""
+        at = _as_utc(at or datetime.now(timezone.utc))
+        day = at.strftime("%Y-%m-%d")
+        inc = {f"metrics.{name}": value for name, value in metrics.items()}
+
+        slugs = [ALL_LOCATIONS]
+        if location_slug and location_slug != ALL_LOCATIONS:
+            slugs.append(location_slug)
+
+        daily_ops = [
+            UpdateOne(
+                {"_id": daily_bucket_id(slug, day)},
+                {"$inc": inc, "$setOnInsert": {"location_slug": slug, "date": day}},
+                upsert=True
+            )
+            for slug in slugs
+        ]
+        hourly_ops = [
+            UpdateOne(
+                {"_id": hourly_bucket_id(slug, day, at.hour)},
+                {"$inc": inc, "$setOnInsert": {"location_slug": slug, "date": day, "hour": at.hour}},
+                upsert=True
+            )
+            for slug in slugs
+        ]
+        await self.daily.bulk_write(daily_ops, ordered=False)
+        await self.hourly.bulk_write(hourly_ops, ordered=False)
+
+    async def record_removed(self, collection: str, docs: List[Dict]):
+        """
+        Take deleted documents back out of the buckets they were recorded in,
+        using the collection's ROLLUP_SOURCES mapping. Only for deletions that
+        undo an event (e.g. an account's tips); check-outs and retention keep
+        what was recorded.
+        """
+        source = next(source for source in ROLLUP_SOURCES if source["collection"] == collection)
+        deltas: Dict[tuple, Dict[str, float]] = {}
+        for doc in docs:
+            at = doc.get(source["time_field"])
+            if not isinstance(at, datetime):
+                continue
+            hour = _as_utc(at).replace(minute=0, second=0, microsecond=0)
+            location_slug = doc.get(source["location_field"]) if source["location_field"] else None
+            metrics = deltas.setdefault((location_slug, hour), {metric: 0 for metric in source["metrics"]})
+            for metric, value in source["metrics"].items():
+                metrics[metric] -= value if isinstance(value, int) else (doc.get(value[1:]) or 0)
+        for (location_slug, hour), metrics in deltas.items():
+            await self.record(metrics, location_slug, hour)
+
+    async def get_day(self, location_slug: str, day: Optional[str] = None) -> Dict[str, float]:
+        """Get one day's metrics for a location (zeros when nothing happened)"""
+        day = day or datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        bucket = await self.daily.find_one({"_id": daily_bucket_id(location_slug, day)}, {"metrics": 1})
+        metrics = _empty_metrics()
+        if bucket:
+            metrics.update(bucket.get("metrics", {}))
+        return metrics
+
+    async def get_buckets(self, start_date: str, end_date: str, location_slug: str = ALL_LOCATIONS,
+                          granularity: str = "daily") -> List[Dict]:
+        """Get buckets for a location between two YYYY-MM-DD dates (inclusive)"""
+        collection = self.hourly if granularity == "hourly" else self.daily
+        sort = [("date", 1), ("hour", 1)] if granularity == "hourly" else [("date", 1)]
+        buckets = await collection.find(
+            {"location_slug": location_slug, "date": {"$gte": start_date, "$lte": end_date}},
+            {"_id": 0}
+        ).sort(sort).to_list(None)
+
+        for bucket in buckets:
+            metrics = _empty_metrics()
+            metrics.update(bucket.get("metrics", {}))
+            bucket["metrics"] = metrics
+        return buckets
+
+    async def backfill(self, since: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Rebuild buckets from the raw collections. Buckets on or after `since`
+        (all buckets when omitted) are replaced, so rerunning is safe; events
+        written while the backfill runs may need another pass.
+        """
+        daily: Dict[tuple, Dict[str, float]] = {}
+        hourly: Dict[tuple, Dict[str, float]] = {}
+        if since is not None:
+            since = _as_utc(since).replace(hour=0, minute=0, second=0, microsecond=0)
+
+        for source in ROLLUP_SOURCES:
+            time_field = source["time_field"]
+            match = {time_field: {"$type": "date"}}
+            if since is not None:
+                match[time_field] = {"$gte": since}
+
+            group_id = {
+                "date": {"$dateToString": {"format": "%Y-%m-%d", "date": f"${time_field}"}},
+                "hour": {"$hour": f"${time_field}"},
+            }
+            if source["location_field"]:
+                group_id["location_slug"] = f"${source['location_field']}"
+
+            group = {"_id": group_id}
+            for metric, value in source["metrics"].items():
+                group[metric] = {"$sum": value if isinstance(value, int) else {"$ifNull": [value, 0]}}
+
+            rows = await self.db[source["collection"]].aggregate([
+                {"$match": match},
+                {"$group": group}
+            ]).to_list(None)
+
+            for row in rows:
+                day, hour = row["_id"]["date"], row["_id"]["hour"]
+                slugs = [ALL_LOCATIONS]
+                location_slug = row["_id"].get("location_slug")
+                if location_slug and location_slug != ALL_LOCATIONS:
+                    slugs.append(location_slug)
+                for slug in slugs:
+                    day_metrics = daily.setdefault((slug, day), _empty_metrics())
+                    hour_metrics = hourly.setdefault((slug, day, hour), _empty_metrics())
+                    for metric in source["metrics"]:
+                        day_metrics[metric] += row[metric]
+                        hour_metrics[metric] += row[metric]
+
+        stale = {"date": {"$gte": since.strftime("%Y-%m-%d")}} if since is not None else {}
+        await self.daily.delete_many(stale)
+        await self.hourly.delete_many(stale)
+
+        if daily:
+            await self.daily.bulk_write([
+                ReplaceOne(
+                    {"_id": daily_bucket_id(slug, day)},
+                    {"location_slug": slug, "date": day, "metrics": metrics},
+                    upsert=True
+                )
+                for (slug, day), metrics in daily.items()
+            ], ordered=False)
+        if hourly:
+            await self.hourly.bulk_write([
+                ReplaceOne(
+                    {"_id": hourly_bucket_id(slug, day, hour)},
+                    {"location_slug": slug, "date": day, "hour": hour, "metrics": metrics},
+                    upsert=True
+                )
+                for (slug, day, hour), metrics in hourly.items()
+            ], ordered=False)
+
+        await self.state.update_one(
+            {"_id": "backfill"},
+            {"$set": {"completed_at": datetime.now(timezone.utc), "since": since}},
+            upsert=True
+        )
+        self._backfilled = True
+        return {"daily_buckets": len(daily), "hourly_buckets": len(hourly)}
+
+
+def date_range(days: int, end: Optional[datetime] = None) -> tuple:
+    """(start_date, end_date) strings covering the last `days` days"""
+    end = _as_utc(end or datetime.now(timezone.utc))
+    start = end - timedelta(days=max(days, 1) - 1)
+    return start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
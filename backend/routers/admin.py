@@ -0,0 +1,709 @@
+import os
+import uuid
+import logging
+from typing import List, Optional
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, HTTPException, Depends, Request, BackgroundTasks
+
+from models import LoyaltyMember, PushNotification, PushNotificationCreate, ContactFormUpdate, RoleUpdate
+from core import (
+    db, admin_reads, push_service, sessions, venue_state, rollups, analytics_exporter,
+    get_analytics_service, get_current_admin, admin_password_hash, scheduler_lease, job_runner, retention, repos,
+    schema_migrator, presence
+)
+from auth import verify_password, get_password_hash
+from rollups import ALL_LOCATIONS, date_range
+from analytics_export import EXPORT_COLLECTIONS, EXPORT_FORMATS
+
+router = APIRouter(tags=["admin"])
+
+
+# ==================== ADMIN USER MANAGEMENT ====================
+
+@router.get("/admin/users/admins")
+async def get_admin_users(username: str = Depends(get_current_admin)):
+    """Get all admin users"""
+    admins = await db.admin_users.find({}, {"_id": 0, "password_hash": 0}).to_list(100)
+    
+    # Add the legacy admin if no database admins exist
+    if not admins:
+        admins = [{
+            "id": "admin-001",
+            "username": "admin",
+            "email": "admin@finandfeathers.com",
+            "is_active": True,
+            "is_super_admin": True,
+            "created_at": datetime.now(timezone.utc).isoformat()
+        }]
+    
+    # Convert datetime to string for JSON serialization
+    for admin in admins:
+        if isinstance(admin.get("created_at"), datetime):
+            admin["created_at"] = admin["created_at"].isoformat()
+    
+    return admins
+
+
+@router.post("/admin/users/admins")
+async def create_admin_user(request: Request, username: str = Depends(get_current_admin)):
+    """Create a new admin user"""
+    try:
+        body = await request.json()
+        new_username = body.get("username", "").strip().lower()
+        email = body.get("email", "").strip().lower()
+        password = body.get("password", "")
+        is_super_admin = body.get("is_super_admin", False)
+        
+        if not new_username or not email or not password:
+            raise HTTPException(status_code=400, detail="Username, email, and password are required")
+        
+        if len(new_username) < 3:
+            raise HTTPException(status_code=400, detail="Username must be at least 3 characters")
+        
+        if len(password) < 6:
+            raise HTTPException(status_code=400, detail="Password must be at least 6 characters")
+        
+        # Check if username exists
+        existing = await db.admin_users.find_one({"username": new_username})
+        if existing:
+            raise HTTPException(status_code=400, detail="Username already exists")
+        
+        # Check if email exists
+        existing_email = await db.admin_users.find_one({"email": email})
+        if existing_email:
+            raise HTTPException(status_code=400, detail="Email already in use")
+        
+        # Create admin user
+        admin_id = f"admin_{uuid.uuid4().hex[:12]}"
+        password_hash = get_password_hash(password)
+        
+        new_admin = {
+            "id": admin_id,
+            "username": new_username,
+            "email": email,
+            "password_hash": password_hash,
+            "is_active": True,
+            "is_super_admin": is_super_admin,
+            "created_by": username,
+            "created_at": datetime.now(timezone.utc)
+        }
+        
+        await db.admin_users.insert_one(new_admin)
+        
+        # Return without password_hash
+        return {
+            "success": True,
+            "admin": {
+                "id": admin_id,
+                "username": new_username,
+                "email": email,
+                "is_active": True,
+                "is_super_admin": is_super_admin,
+                "created_at": new_admin["created_at"].isoformat()
+            }
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logging.error(f"Create admin error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to create admin user")
+
+
+@router.put("/admin/users/admins/{admin_id}")
+async def update_admin_user(admin_id: str, request: Request, username: str = Depends(get_current_admin)):
+    """Update an admin user (change password, email, status)"""
+    try:
+        body = await request.json()
+        
+        # Find the admin user
+        admin_user = await db.admin_users.find_one({"id": admin_id})
+        
+        if not admin_user:
+            # Check if it's the legacy admin
+            if admin_id == "admin-001":
+                raise HTTPException(status_code=400, detail="Cannot modify legacy admin account from here")
+            raise HTTPException(status_code=404, detail="Admin user not found")
+        
+        update_fields = {}
+        
+        # Update email if provided
+        if "email" in body and body["email"]:
+            new_email = body["email"].strip().lower()
+            # Check if email is already used by another admin
+            existing = await db.admin_users.find_one({"email": new_email, "id": {"$ne": admin_id}})
+            if existing:
+                raise HTTPException(status_code=400, detail="Email already in use")
+            update_fields["email"] = new_email
+        
+        # Update password if provided
+        if "password" in body and body["password"]:
+            if len(body["password"]) < 6:
+                raise HTTPException(status_code=400, detail="Password must be at least 6 characters")
+            update_fields["password_hash"] = get_password_hash(body["password"])
+        
+        # Update active status if provided
+        if "is_active" in body:
+            update_fields["is_active"] = body["is_active"]
+        
+        # Update super admin status if provided
+        if "is_super_admin" in body:
+            update_fields["is_super_admin"] = body["is_super_admin"]
+        
+        if update_fields:
+            update_fields["updated_at"] = datetime.now(timezone.utc)
+            await db.admin_users.update_one({"id": admin_id}, {"$set": update_fields})
+        
+        # Get updated admin
+        updated_admin = await db.admin_users.find_one({"id": admin_id}, {"_id": 0, "password_hash": 0})
+        if isinstance(updated_admin.get("created_at"), datetime):
+            updated_admin["created_at"] = updated_admin["created_at"].isoformat()
+        if isinstance(updated_admin.get("updated_at"), datetime):
+            updated_admin["updated_at"] = updated_admin["updated_at"].isoformat()
+        
+        return {"success": True, "admin": updated_admin}
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logging.error(f"Update admin error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to update admin user")
+
+
+@router.delete("/admin/users/admins/{admin_id}")
+async def delete_admin_user(admin_id: str, username: str = Depends(get_current_admin)):
+    """Delete an admin user"""
+    try:
+        if admin_id == "admin-001":
+            raise HTTPException(status_code=400, detail="Cannot delete legacy admin account")
+        
+        admin_user = await db.admin_users.find_one({"id": admin_id})
+        if not admin_user:
+            raise HTTPException(status_code=404, detail="Admin user not found")
+        
+        # Prevent deleting yourself
+        if admin_user["username"] == username:
+            raise HTTPException(status_code=400, detail="Cannot delete your own account")
+        
+        await db.admin_users.delete_one({"id": admin_id})
+        
+        return {"success": True, "message": "Admin user deleted"}
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logging.error(f"Delete admin error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to delete admin user")
+
+
+@router.post("/admin/users/admins/change-password")
+async def change_admin_password(request: Request, username: str = Depends(get_current_admin)):
+    """Change the current admin's password"""
+    try:
+        body = await request.json()
+        current_password = body.get("current_password", "")
+        new_password = body.get("new_password", "")
+        
+        if not current_password or not new_password:
+            raise HTTPException(status_code=400, detail="Current and new passwords are required")
+        
+        if len(new_password) < 6:
+            raise HTTPException(status_code=400, detail="New password must be at least 6 characters")
+        
+        # Find current admin user
+        admin_user = await db.admin_users.find_one({"username": username})
+        
+        if admin_user:
+            # Verify current password
+            if not verify_password(current_password, admin_user.get("password_hash", "")):
+                raise HTTPException(status_code=401, detail="Current password is incorrect")
+            
+            # Update password
+            new_hash = get_password_hash(new_password)
+            await db.admin_users.update_one(
+                {"username": username},
+                {"$set": {"password_hash": new_hash, "updated_at": datetime.now(timezone.utc)}}
+            )
+            
+            return {"success": True, "message": "Password changed successfully"}
+        else:
+            # Legacy admin - verify against hardcoded
+            if not verify_password(current_password, admin_password_hash()):
+                raise HTTPException(status_code=401, detail="Current password is incorrect")
+            
+            # Create a new admin user in the database with the new password
+            admin_id = f"admin_{uuid.uuid4().hex[:12]}"
+            new_hash = get_password_hash(new_password)
+            
+            new_admin = {
+                "id": admin_id,
+                "username": username,
+                "email": "admin@finandfeathers.com",
+                "password_hash": new_hash,
+                "is_active": True,
+                "is_super_admin": True,
+                "created_at": datetime.now(timezone.utc)
+            }
+            
+            await db.admin_users.insert_one(new_admin)
+            
+            return {"success": True, "message": "Password changed successfully. Please use your new password to login."}
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logging.error(f"Change password error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to change password")
+
+
+# ==================== ADMIN ENDPOINTS ====================
+
+# Loyalty Members (Admin)
+@router.get("/admin/loyalty-members", response_model=List[LoyaltyMember])
+async def admin_get_loyalty_members(username: str = Depends(get_current_admin)):
+    """Get all loyalty members (protected)"""
+    members = await db.loyalty_members.find({}, {"_id": 0}).to_list(1000)
+    return [LoyaltyMember(**member) for member in members]
+
+
+@router.delete("/admin/loyalty-members/{member_id}")
+async def admin_delete_loyalty_member(member_id: str, username: str = Depends(get_current_admin)):
+    """Delete a loyalty member"""
+    result = await db.loyalty_members.delete_one({"id": member_id})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Member not found")
+    return {"message": "Member deleted successfully"}
+
+
+# Contact Forms (Admin)
+@router.get("/admin/contacts")
+async def admin_get_contacts(username: str = Depends(get_current_admin)):
+    """Get all contact form submissions"""
+    contacts = await db.contact_forms.find({"is_deleted": {"$ne": True}}, {"_id": 0}).sort("created_at", -1).to_list(1000)
+    return contacts
+
+
+@router.patch("/admin/contacts/{contact_id}")
+async def admin_update_contact(contact_id: str, update: ContactFormUpdate, username: str = Depends(get_current_admin)):
+    """Update contact form status"""
+    result = await db.contact_forms.update_one(
+        {"id": contact_id, "is_deleted": {"$ne": True}},
+        {"$set": {"status": update.status}}
+    )
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Contact not found")
+    return {"message": "Contact updated successfully"}
+
+
+@router.delete("/admin/contacts/{contact_id}")
+async def admin_delete_contact(contact_id: str, username: str = Depends(get_current_admin)):
+    """Soft delete a contact form"""
+    result = await db.contact_forms.update_one(
+        {"id": contact_id, "is_deleted": {"$ne": True}},
+        {"$set": {"is_deleted": True, "deleted_at": datetime.now(timezone.utc)}}
+    )
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Contact not found")
+    return {"message": "Contact deleted successfully"}
+
+
+# Push Notifications (Admin - Protected versions)
+@router.post("/admin/notifications/send")
+async def admin_send_notification(notification: PushNotificationCreate, username: str = Depends(get_current_admin)):
+    """Send push notification (protected)"""
+    notification_data = {
+        "title": notification.title,
+        "body": notification.body,
+        "icon": notification.icon,
+        "image": notification.image,
+        "url": notification.url
+    }
+    
+    if notification.send_to_all:
+        result = await push_service.send_to_all_subscribers(notification_data)
+    else:
+        result = {"sent": 0, "failed": 0, "total_subscribers": 0}
+    
+    # Save notification record
+    push_notif = PushNotification(
+        **notification.dict(exclude={'send_to_all'}),
+        sent_to=[]
+    )
+    await db.push_notifications.insert_one(push_notif.dict())
+    
+    return {
+        "message": "Push notifications sent",
+        "result": result
+    }
+
+
+@router.get("/admin/notifications/history")
+async def admin_get_notification_history(username: str = Depends(get_current_admin)):
+    """Get push notification history (protected)"""
+    notifications = await db.push_notifications.find({}, {"_id": 0}).sort("sent_at", -1).limit(50).to_list(50)
+    return notifications
+
+
+# Dashboard Stats (Admin)
+@router.get("/admin/stats")
+async def admin_get_stats(username: str = Depends(get_current_admin), read_db=Depends(admin_reads)):
+    """Get dashboard statistics"""
+    loyalty_count = await read_db.loyalty_members.count_documents({})
+    contacts_count = await read_db.contact_forms.count_documents({"is_deleted": {"$ne": True}})
+    new_contacts_count = await read_db.contact_forms.count_documents({"status": "new", "is_deleted": {"$ne": True}})
+    menu_items_count = await read_db.menu_items.count_documents({})
+    notifications_count = await read_db.push_notifications.count_documents({})
+    specials_count = await read_db.specials.count_documents({"is_active": True})
+    
+    return {
+        "loyalty_members": loyalty_count,
+        "total_contacts": contacts_count,
+        "new_contacts": new_contacts_count,
+        "menu_items": menu_items_count,
+        "notifications_sent": notifications_count,
+        "active_specials": specials_count
+    }
+
+
+# Analytics rollups (Admin)
+@router.get("/admin/analytics/rollups")
+async def admin_get_rollups(
+    granularity: str = "daily",
+    days: int = 30,
+    location_slug: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    username: str = Depends(get_current_admin)
+):
+    """Get pre-aggregated daily/hourly buckets (check-ins, posts, tips, drinks, token flows)"""
+    if granularity not in ("daily", "hourly"):
+        raise HTTPException(status_code=400, detail="granularity must be 'daily' or 'hourly'")
+
+    # Hourly buckets are 24x denser - keep the window reasonable
+    max_days = 31 if granularity == "hourly" else 366
+    default_start, default_end = date_range(min(max(days, 1), max_days))
+    start_date = start_date or default_start
+    end_date = end_date or default_end
+
+    buckets = await rollups.get_buckets(
+        start_date, end_date,
+        location_slug=location_slug or ALL_LOCATIONS,
+        granularity=granularity
+    )
+
+    totals = {}
+    for bucket in buckets:
+        for metric, value in bucket["metrics"].items():
+            totals[metric] = totals.get(metric, 0) + value
+
+    return {
+        "granularity": granularity,
+        "location_slug": location_slug or ALL_LOCATIONS,
+        "start_date": start_date,
+        "end_date": end_date,
+        "buckets": buckets,
+        "totals": totals
+    }
+
+
+async def run_analytics_export(run_id: str, collections: List[str], full: bool, fmt: str):
+    """Background task: run an export and record the outcome on its export_runs entry"""
+    try:
+        result = await analytics_exporter.run(collections, full=full, fmt=fmt)
+        await db.export_runs.update_one(
+            {"id": run_id},
+            {"$set": {"status": "completed", "result": result, "finished_at": datetime.now(timezone.utc)}}
+        )
+    except Exception as e:
+        logging.error(f"Analytics export {run_id} failed: {e}")
+        await db.export_runs.update_one(
+            {"id": run_id},
+            {"$set": {"status": "failed", "error": str(e), "finished_at": datetime.now(timezone.utc)}}
+        )
+
+
+@router.post("/admin/analytics/export")
+async def admin_start_analytics_export(
+    background_tasks: BackgroundTasks,
+    collections: Optional[str] = None,
+    full: bool = False,
+    format: str = "parquet",
+    username: str = Depends(get_current_admin)
+):
+    """Start a partitioned Parquet/Arrow export (incremental unless full=true)"""
+    selected = [c.strip() for c in collections.split(",") if c.strip()] if collections else list(EXPORT_COLLECTIONS)
+    unknown = [c for c in selected if c not in EXPORT_COLLECTIONS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown collections: {', '.join(unknown)}")
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+    if analytics_exporter.running:
+        raise HTTPException(status_code=409, detail="An export is already running")
+
+    run = {
+        "id": str(uuid.uuid4()),
+        "collections": selected,
+        "full": full,
+        "format": format,
+        "status": "running",
+        "started_by": username,
+        "started_at": datetime.now(timezone.utc),
+        "finished_at": None
+    }
+    await db.export_runs.insert_one(run)
+    background_tasks.add_task(run_analytics_export, run["id"], selected, full, format)
+
+    run.pop("_id", None)
+    return run
+
+
+@router.get("/admin/analytics/export/state")
+async def admin_get_analytics_export_state(username: str = Depends(get_current_admin)):
+    """Get the high-water mark of each exported collection"""
+    return await analytics_exporter.get_state()
+
+
+@router.get("/admin/analytics/export/{run_id}")
+async def admin_get_analytics_export_run(run_id: str, username: str = Depends(get_current_admin)):
+    """Get the status of an export run"""
+    run = await db.export_runs.find_one({"id": run_id}, {"_id": 0})
+    if not run:
+        raise HTTPException(status_code=404, detail="Export run not found")
+    return run
+
+
+@router.get("/admin/analytics/checkin-heatmap")
+async def admin_get_checkin_heatmap(
+    days: int = 90,
+    location_slug: Optional[str] = None,
+    refresh: bool = False,
+    username: str = Depends(get_current_admin)
+):
+    """Get busiest-hour heatmaps (weekday x hour check-ins) per location"""
+    return await get_analytics_service().checkin_heatmap(min(max(days, 1), 366), location_slug, refresh)
+
+
+@router.get("/admin/analytics/dj-tips")
+async def admin_get_dj_tip_revenue(days: int = 90, refresh: bool = False, username: str = Depends(get_current_admin)):
+    """Get tip revenue per DJ, attributing tips to scheduled DJ sets"""
+    return await get_analytics_service().dj_tip_revenue(min(max(days, 1), 366), refresh)
+
+
+@router.get("/admin/analytics/token-velocity")
+async def admin_get_token_velocity(days: int = 30, refresh: bool = False, username: str = Depends(get_current_admin)):
+    """Get daily token transfer volume and velocity"""
+    return await get_analytics_service().token_velocity(min(max(days, 1), 366), refresh)
+
+
+# Admin: Get all user profiles
+@router.get("/admin/users")
+async def admin_get_users(username: str = Depends(get_current_admin), read_db=Depends(admin_reads)):
+    """Get all user profiles (admin only)"""
+    # The replica read keeps the repository's credential-free projection
+    users = await read_db.user_profiles.find({}, repos.user_profiles.projection).sort("created_at", -1).to_list(500)
+    return users
+
+
+# Admin/Management: Update user role
+@router.post("/admin/users/role")
+async def update_user_role(role_update: RoleUpdate, username: str = Depends(get_current_admin)):
+    """Update a user's role (admin only)"""
+    valid_roles = ["customer", "staff", "management"]
+    if role_update.new_role not in valid_roles:
+        raise HTTPException(status_code=400, detail=f"Invalid role. Must be one of: {valid_roles}")
+    
+    user = await repos.user_profiles.get(role_update.user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    update_data = {
+        "role": role_update.new_role,
+        "updated_at": datetime.now(timezone.utc)
+    }
+    
+    if role_update.staff_title and role_update.new_role == "staff":
+        update_data["staff_title"] = role_update.staff_title
+    
+    await repos.user_profiles.set_fields(role_update.user_id, update_data)
+    # Access tokens carry the role - make the user pick up a fresh one
+    await sessions.revoke_user(role_update.user_id)
+    
+    return {"message": f"User role updated to {role_update.new_role}", "user_id": role_update.user_id}
+
+
+# ============================================================================
+# GALLERY SUBMISSIONS ADMIN ENDPOINTS
+# ============================================================================
+
+@router.get("/admin/gallery-submissions")
+async def admin_get_gallery_submissions(username: str = Depends(get_current_admin)):
+    """Get all user gallery submissions for admin moderation"""
+    submissions = await db.user_gallery_submissions.find({}, {"_id": 0}).sort("created_at", -1).to_list(200)
+    return submissions
+
+
+@router.delete("/admin/gallery-submissions/{submission_id}")
+async def admin_delete_gallery_submission(submission_id: str, username: str = Depends(get_current_admin)):
+    """Delete a user gallery submission and its corresponding gallery item"""
+    # Delete from user submissions
+    result = await db.user_gallery_submissions.delete_one({"id": submission_id})
+    
+    # Also remove from main gallery if it was auto-added
+    await db.gallery_items.delete_one({"id": submission_id})
+    
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Submission not found")
+    
+    return {"success": True, "message": "Submission deleted"}
+
+
+# ============================================================================
+# ADMIN SOCIAL POSTS (COMMENTS) MANAGEMENT
+# ============================================================================
+
+@router.get("/admin/social-posts")
+async def admin_get_all_social_posts(username: str = Depends(get_current_admin), read_db=Depends(admin_reads)):
+    """Get all social posts across all locations for admin moderation"""
+    posts = await read_db.social_posts.find({}, {"_id": 0}).sort("created_at", -1).to_list(500)
+    return posts
+
+
+@router.delete("/admin/social-posts/{post_id}")
+async def admin_delete_social_post(post_id: str, username: str = Depends(get_current_admin)):
+    """Delete a social post (admin only)"""
+    result = await db.social_posts.delete_one({"id": post_id})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Post not found")
+    return {"success": True, "message": "Post deleted"}
+
+
+@router.delete("/admin/social-posts/cleanup/old")
+async def admin_cleanup_old_posts(username: str = Depends(get_current_admin)):
+    """Manually trigger cleanup of old posts without images"""
+    result = await retention.run(collections=["social_posts"])
+    if result.get("already_running"):
+        raise HTTPException(status_code=409, detail="Retention is already running")
+    deleted_count = result["removed"]
+    
+    return {
+        "success": True, 
+        "deleted_count": deleted_count,
+        "message": f"Deleted {deleted_count} old posts without images"
+    }
+
+
+# ============================================================================
+# ADMIN USER MANAGEMENT
+# ============================================================================
+
+@router.delete("/admin/users/{user_id}")
+async def admin_delete_user(user_id: str, username: str = Depends(get_current_admin)):
+    """Delete a user and all their associated data"""
+    # Check if user exists
+    profile = await repos.user_profiles.get(user_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    # Don't allow deleting admin users
+    if profile.get("role") == "admin":
+        raise HTTPException(status_code=403, detail="Cannot delete admin users")
+    
+    # Delete user's data from various collections
+    await repos.user_profiles.delete({"id": user_id})
+    await sessions.end_all_sessions(user_id)
+    await db.checkins.delete_many({"$or": [{"user_id": user_id}, {"id": user_id}]})
+    await db.social_posts.delete_many({"author_id": user_id})
+    await db.direct_messages.delete_many({"$or": [{"from_id": user_id}, {"to_id": user_id}]})
+    tips = await db.dj_tips.find(
+        {"from_id": user_id}, {"_id": 0, "location_slug": 1, "amount": 1, "created_at": 1}
+    ).to_list(None)
+    await db.dj_tips.delete_many({"from_id": user_id})
+    # The DJ's tip totals are read from rollups, so take these tips back out
+    await rollups.record_removed("dj_tips", tips)
+    await db.drink_orders.delete_many({"$or": [{"from_id": user_id}, {"to_id": user_id}]})
+    await db.token_purchases.delete_many({"user_id": user_id})
+    await db.user_gallery_submissions.delete_many({"user_id": user_id})
+    # Check-ins and drinks may have gone - let venue snapshots rebuild
+    await venue_state.invalidate()
+    
+    return {"success": True, "message": f"User {profile.get('name', 'Unknown')} and all their data deleted"}
+
+
+# ============================================================================
+# SCHEDULED CLEANUP ENDPOINT (can be called by cron/scheduler)
+# ============================================================================
+
+@router.post("/system/cleanup-old-posts")
+async def system_cleanup_old_posts(api_key: str = None):
+    """
+    System endpoint to apply the data retention policies (old posts,
+    check-ins, messages, requests, drinks and tips).
+    Should be called by a scheduler at 4am EST daily.
+    Requires system API key for security.
+    """
+    # Simple security check - in production, use a proper API key
+    system_key = os.environ.get("SYSTEM_API_KEY", "ff-system-cleanup-2026")
+    if api_key != system_key:
+        raise HTTPException(status_code=401, detail="Invalid API key")
+    
+    result = await retention.run()
+    if result.get("already_running"):
+        raise HTTPException(status_code=409, detail="Retention is already running")
+    deleted_posts = next((p["removed"] for p in result["policies"] if p["collection"] == "social_posts"), 0)
+    
+    return {
+        "success": True,
+        "deleted_count": deleted_posts,
+        "retention": result,
+        "cleanup_time": datetime.now(timezone.utc).isoformat()
+    }
+
+
+@router.get("/admin/retention")
+async def admin_get_retention(username: str = Depends(get_current_admin)):
+    """Retention policies and a dry run of what the next run would remove"""
+    return {
+        "policies": retention.describe(),
+        "preview": await retention.run(dry_run=True)
+    }
+
+
+@router.post("/admin/retention/run")
+async def admin_run_retention(dry_run: bool = True, collection: Optional[str] = None,
+                              username: str = Depends(get_current_admin)):
+    """Apply the retention policies now (dry run unless dry_run=false)"""
+    if collection and collection not in {policy["collection"] for policy in retention.policies}:
+        raise HTTPException(status_code=404, detail="No retention policy for that collection")
+    result = await retention.run(dry_run=dry_run, collections=[collection] if collection else None)
+    if result.get("already_running"):
+        raise HTTPException(status_code=409, detail="Retention is already running")
+    return result
+
+
+@router.get("/admin/system/jobs")
+async def admin_get_job_runs(job_id: Optional[str] = None, limit: int = 50, username: str = Depends(get_current_admin)):
+    """Current scheduler lease holder and the most recent periodic job runs"""
+    return {
+        "leader": await scheduler_lease.get_state(),
+        "runs": await job_runner.recent_runs(job_id, min(max(limit, 1), 200))
+    }
+
+
+@router.get("/admin/system/repositories")
+async def admin_get_repositories(username: str = Depends(get_current_admin)):
+    """Collections behind the repository layer: indexes, projections and query timings"""
+    return repos.describe()
+
+
+@router.get("/admin/system/migrations")
+async def admin_get_migrations(username: str = Depends(get_current_admin)):
+    """Schema versions per collection and how many documents are still below them"""
+    await schema_migrator.check()
+    return {"migrations": schema_migrator.describe()}
+
+
+@router.get("/admin/system/presence")
+async def admin_get_presence(username: str = Depends(get_current_admin)):
+    """People here now per location, as this worker last merged them"""
+    return presence.stats()
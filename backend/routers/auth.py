@@ -0,0 +1,580 @@
+import uuid
+import logging
+from datetime import datetime, timezone, timedelta
+
+import aiohttp
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import JSONResponse
+
+from models import UserLogin, Token, UserResponse
+from core import db, repos, sessions, get_current_admin, ADMIN_USERNAME, admin_password_hash
+from auth import verify_password, get_password_hash, create_access_token
+from sessions import request_session_token
+from migrations import VERSION_FIELD, upgrade
+from repositories import new_user_profile
+
+router = APIRouter(tags=["auth"])
+
+
+# ==================== AUTH ENDPOINTS ====================
+
+@router.post("/auth/login", response_model=Token)
+async def login(credentials: UserLogin):
+    """Admin login endpoint - supports both legacy username and email login"""
+    
+    # First check if there are any admin users in the database
+    admin_user = None
+    
+    # Try to find admin by email or username
+    if "@" in credentials.username:
+        # Looks like an email
+        admin_user = await db.admin_users.find_one({"email": credentials.username.lower()})
+    else:
+        # Try username
+        admin_user = await db.admin_users.find_one({"username": credentials.username.lower()})
+    
+    if admin_user:
+        # Database admin user found
+        if not admin_user.get("is_active", True):
+            raise HTTPException(status_code=401, detail="Account is disabled")
+
+        if verify_password(credentials.password, admin_user.get("password_hash", "")):
+            access_token = create_access_token(data={"sub": admin_user["username"], "admin_id": admin_user["id"]})
+            return Token(access_token=access_token, token_type="bearer")
+
+        # Allow legacy admin passcode to re-sync password hash
+        if credentials.username.lower() == ADMIN_USERNAME and verify_password(credentials.password, admin_password_hash()):
+            await db.admin_users.update_one(
+                {"id": admin_user["id"]},
+                {"$set": {"password_hash": admin_password_hash(), "updated_at": datetime.now(timezone.utc)}}
+            )
+            access_token = create_access_token(data={"sub": admin_user["username"], "admin_id": admin_user["id"]})
+            return Token(access_token=access_token, token_type="bearer")
+
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    
+    # Fallback to legacy hardcoded admin
+    if credentials.username.lower() != ADMIN_USERNAME:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    
+    if not verify_password(credentials.password, admin_password_hash()):
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    
+    access_token = create_access_token(data={"sub": credentials.username})
+    return Token(access_token=access_token, token_type="bearer")
+
+
+@router.get("/auth/me", response_model=UserResponse)
+async def get_current_user(username: str = Depends(get_current_admin)):
+    """Get current authenticated admin info"""
+    # Try to get from database first
+    admin_user = await db.admin_users.find_one({"username": username}, {"_id": 0})
+    
+    if admin_user:
+        return UserResponse(
+            id=admin_user["id"],
+            username=admin_user["username"],
+            email=admin_user.get("email", ""),
+            is_admin=True,
+            is_active=admin_user.get("is_active", True),
+            created_at=admin_user.get("created_at", datetime.now(timezone.utc))
+        )
+    
+    # Fallback for legacy admin
+    return UserResponse(
+        id="admin-001",
+        username=username,
+        email="admin@finandfeathers.com",
+        is_admin=True,
+        is_active=True,
+        created_at=datetime.now(timezone.utc)
+    )
+
+
+# ==================== GOOGLE OAUTH ENDPOINTS ====================
+
+
+def isoformat_datetimes(doc: dict, exclude=()) -> dict:
+    """Copy of a Mongo document with datetimes as ISO strings, minus `exclude` keys"""
+    return {
+        k: v.isoformat() if isinstance(v, datetime) else v
+        for k, v in doc.items()
+        if k not in exclude
+    }
+
+
+@router.post("/auth/google/session")
+async def process_google_session(request: Request):
+    """
+    Process Google OAuth session_id and create user session.
+    Frontend calls this after receiving session_id from Emergent Auth.
+    """
+    try:
+        body = await request.json()
+        session_id = body.get("session_id")
+        
+        if not session_id:
+            raise HTTPException(status_code=400, detail="session_id is required")
+        
+        # Call Emergent Auth to get user data
+        async with aiohttp.ClientSession() as session:
+            async with session.get(
+                "https://demobackend.emergentagent.com/auth/v1/env/oauth/session-data",
+                headers={"X-Session-ID": session_id}
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logging.error(f"Emergent Auth error: {error_text}")
+                    raise HTTPException(status_code=401, detail="Invalid session")
+                
+                auth_data = await response.json()
+        
+        email = auth_data.get("email")
+        name = auth_data.get("name")
+        picture = auth_data.get("picture")
+        session_token = auth_data.get("session_token")
+        
+        if not email or not session_token:
+            raise HTTPException(status_code=400, detail="Invalid auth data received")
+        
+        # Check if user already exists by email in user_profiles
+        existing_profile = await db.user_profiles.find_one({"email": email}, {"_id": 0})
+        
+        if existing_profile:
+            user_id = existing_profile["id"]
+            # Update profile with latest Google info if needed
+            await db.user_profiles.update_one(
+                {"id": user_id},
+                {"$set": {
+                    "google_picture": picture,
+                    "updated_at": datetime.now(timezone.utc)
+                }}
+            )
+        else:
+            # Create new user profile
+            user_id = f"user_{uuid.uuid4().hex[:12]}"
+            await repos.user_profiles.insert(new_user_profile(
+                user_id,
+                name or email.split("@")[0],
+                email=email,
+                google_picture=picture,
+                profile_photo_url=picture,  # Use Google picture as default
+                auth_provider="google"
+            ))
+        
+        # Fetch the complete user profile
+        user_profile_doc = await db.user_profiles.find_one({"id": user_id}, {"_id": 0})
+        
+        # Store session in database and mint a signed access token
+        tokens = await sessions.create_session(user_id, user_profile_doc.get("role", "customer"), session_token=session_token)
+        sessions.invalidate_profile(user_id)
+        
+        # Convert datetime fields to ISO strings for JSON serialization
+        user_profile = isoformat_datetimes(
+            upgrade("user_profiles", user_profile_doc), exclude=("password_hash", VERSION_FIELD)
+        )
+        
+        # Create response with httpOnly cookies
+        response = JSONResponse(content={
+            "success": True,
+            "user": user_profile,
+            "access_token": tokens["access_token"]
+        })
+        sessions.set_cookies(response, tokens["session_token"], tokens["access_token"])
+        
+        return response
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logging.error(f"Google session processing error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to process authentication")
+
+
+@router.get("/auth/user/me")
+async def get_current_google_user(request: Request):
+    """
+    Get current authenticated user info from the signed access token, falling
+    back to the session token cookie (or Authorization header).
+    This is for regular users (not admin).
+    """
+    # Signed access token - no database lookup to learn who the user is
+    claims = await sessions.authenticate(request)
+    if claims:
+        user_profile = await sessions.get_profile(claims["sub"])
+        if not user_profile:
+            raise HTTPException(status_code=404, detail="User not found")
+        return user_profile
+    
+    # Access token missing or expired - rotate the session token
+    session_token = request_session_token(request)
+    if not session_token:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    
+    refreshed = await sessions.refresh(session_token)
+    if not refreshed:
+        raise HTTPException(status_code=401, detail="Invalid session")
+    
+    response = JSONResponse(content=refreshed["profile"])
+    sessions.set_cookies(response, refreshed["session_token"], refreshed["access_token"])
+    return response
+
+
+@router.post("/auth/user/refresh")
+async def refresh_user_session(request: Request):
+    """Rotate the session token and issue a new short-lived access token"""
+    session_token = request_session_token(request)
+    if not session_token:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    
+    refreshed = await sessions.refresh(session_token)
+    if not refreshed:
+        raise HTTPException(status_code=401, detail="Invalid session")
+    
+    response = JSONResponse(content={
+        "success": True,
+        "access_token": refreshed["access_token"],
+        "user": refreshed["profile"]
+    })
+    sessions.set_cookies(response, refreshed["session_token"], refreshed["access_token"])
+    return response
+
+
+@router.post("/auth/user/logout")
+async def logout_user(request: Request):
+    """Logout user and clear session"""
+    session_token = request_session_token(request)
+    claims = await sessions.authenticate(request)
+    
+    # Delete session from database and revoke outstanding access tokens
+    await sessions.end_session(session_token, claims["sub"] if claims else None)
+    
+    # Create response and clear cookies
+    response = JSONResponse(content={"success": True, "message": "Logged out"})
+    sessions.clear_cookies(response)
+    
+    return response
+
+
+# ==================== PASSWORD-BASED LOGIN ====================
+
+@router.post("/auth/user/register")
+async def register_user_with_password(request: Request):
+    """
+    Register a new user with username, email and password.
+    """
+    try:
+        body = await request.json()
+        email = body.get("email", "").strip().lower()
+        password = body.get("password", "")
+        name = body.get("name", "").strip()
+        username = body.get("username", "").strip().lower()
+        
+        if not username:
+            raise HTTPException(status_code=400, detail="Username is required")
+        
+        if len(username) < 3:
+            raise HTTPException(status_code=400, detail="Username must be at least 3 characters")
+        
+        # Validate username format (alphanumeric and underscores only)
+        import re
+        if not re.match(r'^[a-z0-9_]+$', username):
+            raise HTTPException(status_code=400, detail="Username can only contain letters, numbers, and underscores")
+        
+        if not email or not password:
+            raise HTTPException(status_code=400, detail="Email and password are required")
+        
+        if len(password) < 6:
+            raise HTTPException(status_code=400, detail="Password must be at least 6 characters")
+        
+        # Check if username already exists
+        existing_username = await db.user_profiles.find_one({"username": username}, {"_id": 0})
+        if existing_username:
+            raise HTTPException(status_code=400, detail="Username already taken")
+        
+        # Check if email already exists
+        existing_email = await db.user_profiles.find_one({"email": email}, {"_id": 0})
+        if existing_email:
+            raise HTTPException(status_code=400, detail="Email already registered")
+        
+        # Hash the password
+        password_hash = get_password_hash(password)
+        
+        # Create new user profile
+        user_id = f"user_{uuid.uuid4().hex[:12]}"
+        new_profile = await repos.user_profiles.insert(new_user_profile(
+            user_id,
+            name or username,
+            username=username,
+            email=email,
+            password_hash=password_hash,
+            google_picture=None,
+            auth_provider="email"
+        ))
+        
+        # Create session
+        tokens = await sessions.create_session(user_id, "customer")
+        
+        # Return user without password_hash and convert datetime to string
+        user_response = isoformat_datetimes(new_profile, exclude=("password_hash", "_id", VERSION_FIELD))
+        
+        response = JSONResponse(content={
+            "success": True,
+            "user": user_response,
+            "access_token": tokens["access_token"]
+        })
+        sessions.set_cookies(response, tokens["session_token"], tokens["access_token"])
+        
+        return response
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logging.error(f"Registration error: {e}")
+        raise HTTPException(status_code=500, detail="Registration failed")
+
+
+@router.post("/auth/user/login")
+async def login_user_with_password(request: Request):
+    """
+    Login user with username or email and password.
+    """
+    try:
+        body = await request.json()
+        identifier = body.get("identifier", "").strip().lower()  # Can be username or email
+        # Also support 'email' field for backwards compatibility
+        if not identifier:
+            identifier = body.get("email", "").strip().lower()
+        password = body.get("password", "")
+        
+        if not identifier or not password:
+            raise HTTPException(status_code=400, detail="Username/email and password are required")
+        
+        # Find user by email or username
+        if "@" in identifier:
+            # Looks like an email
+            user_profile = await db.user_profiles.find_one({"email": identifier})
+        else:
+            # Try username first, then email
+            user_profile = await db.user_profiles.find_one({"username": identifier})
+            if not user_profile:
+                # Fallback to email search
+                user_profile = await db.user_profiles.find_one({"email": identifier})
+        
+        if not user_profile:
+            raise HTTPException(status_code=401, detail="Invalid username/email or password")
+        
+        # Check if user has password (might be Google-only user)
+        password_hash = user_profile.get("password_hash")
+        if not password_hash:
+            raise HTTPException(status_code=400, detail="This account uses Google login. Please sign in with Google.")
+        
+        # Verify password
+        if not verify_password(password, password_hash):
+            raise HTTPException(status_code=401, detail="Invalid username/email or password")
+        
+        user_id = user_profile["id"]
+        
+        # Create or update session
+        tokens = await sessions.create_session(user_id, user_profile.get("role", "customer"))
+        
+        # Return user without password_hash and _id, convert datetime to string
+        user_response = isoformat_datetimes(
+            upgrade("user_profiles", user_profile), exclude=("password_hash", "_id", VERSION_FIELD)
+        )
+        # Google-only accounts have no username
+        user_response.setdefault("username", None)
+        
+        response = JSONResponse(content={
+            "success": True,
+            "user": user_response,
+            "access_token": tokens["access_token"]
+        })
+        sessions.set_cookies(response, tokens["session_token"], tokens["access_token"])
+        
+        return response
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logging.error(f"Login error: {e}")
+        raise HTTPException(status_code=500, detail="Login failed")
+
+
+# ==================== FORGOT PASSWORD ====================
+
+@router.post("/auth/user/forgot-password")
+async def forgot_password(request: Request):
+    """
+    Request a password reset. Generates a reset token.
+    In production, this would send an email. For now, returns the token for testing.
+    """
+    try:
+        body = await request.json()
+        identifier = body.get("identifier", "").strip().lower()
+        
+        if not identifier:
+            raise HTTPException(status_code=400, detail="Email or username is required")
+        
+        # Find user by email or username
+        if "@" in identifier:
+            user = await db.user_profiles.find_one({"email": identifier}, {"_id": 0})
+        else:
+            user = await db.user_profiles.find_one({"username": identifier}, {"_id": 0})
+            if not user:
+                user = await db.user_profiles.find_one({"email": identifier}, {"_id": 0})
+        
+        if not user:
+            # Don't reveal if user exists - return success anyway
+            return {"success": True, "message": "If an account exists, a reset link has been sent"}
+        
+        # Check if user has password (Google-only users can't reset)
+        if not user.get("password_hash"):
+            return {"success": True, "message": "If an account exists, a reset link has been sent"}
+        
+        # Generate reset token
+        reset_token = str(uuid.uuid4())
+        reset_expires = datetime.now(timezone.utc) + timedelta(hours=1)
+        
+        # Store reset token
+        await db.password_resets.update_one(
+            {"user_id": user["id"]},
+            {
+                "$set": {
+                    "user_id": user["id"],
+                    "token": reset_token,
+                    "expires_at": reset_expires,
+                    "created_at": datetime.now(timezone.utc),
+                    "used": False
+                }
+            },
+            upsert=True
+        )
+        
+        # In production, send email here
+        # For now, return the reset link for testing
+        reset_url = f"/reset-password?token={reset_token}"
+        
+        return {
+            "success": True,
+            "message": "If an account exists, a reset link has been sent",
+            # Remove this in production - only for testing
+            "_debug_reset_url": reset_url,
+            "_debug_token": reset_token
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logging.error(f"Forgot password error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to process request")
+
+
+@router.post("/auth/user/reset-password")
+async def reset_password(request: Request):
+    """
+    Reset password using a valid reset token.
+    """
+    try:
+        body = await request.json()
+        token = body.get("token", "").strip()
+        new_password = body.get("password", "")
+        
+        if not token:
+            raise HTTPException(status_code=400, detail="Reset token is required")
+        
+        if not new_password or len(new_password) < 6:
+            raise HTTPException(status_code=400, detail="Password must be at least 6 characters")
+        
+        # Find reset token
+        reset_doc = await db.password_resets.find_one({"token": token}, {"_id": 0})
+        
+        if not reset_doc:
+            raise HTTPException(status_code=400, detail="Invalid or expired reset link")
+        
+        # Check if token is expired
+        expires_at = reset_doc.get("expires_at")
+        if isinstance(expires_at, str):
+            expires_at = datetime.fromisoformat(expires_at)
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        
+        if expires_at < datetime.now(timezone.utc):
+            raise HTTPException(status_code=400, detail="Reset link has expired. Please request a new one.")
+        
+        # Check if already used
+        if reset_doc.get("used"):
+            raise HTTPException(status_code=400, detail="This reset link has already been used")
+        
+        # Get user
+        user_id = reset_doc.get("user_id")
+        user = await db.user_profiles.find_one({"id": user_id}, {"_id": 0})
+        
+        if not user:
+            raise HTTPException(status_code=400, detail="User not found")
+        
+        # Hash new password
+        new_password_hash = get_password_hash(new_password)
+        
+        # Update password
+        await db.user_profiles.update_one(
+            {"id": user_id},
+            {"$set": {
+                "password_hash": new_password_hash,
+                "updated_at": datetime.now(timezone.utc)
+            }}
+        )
+        
+        # Mark token as used
+        await db.password_resets.update_one(
+            {"token": token},
+            {"$set": {"used": True}}
+        )
+        
+        # Clear any existing sessions (and their access tokens) for security
+        await sessions.end_all_sessions(user_id)
+        
+        return {
+            "success": True,
+            "message": "Password has been reset successfully. Please log in with your new password."
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logging.error(f"Reset password error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to reset password")
+
+
+@router.get("/auth/user/verify-reset-token")
+async def verify_reset_token(token: str):
+    """
+    Verify if a reset token is valid (not expired, not used).
+    """
+    try:
+        if not token:
+            return {"valid": False, "message": "Token is required"}
+        
+        reset_doc = await db.password_resets.find_one({"token": token}, {"_id": 0})
+        
+        if not reset_doc:
+            return {"valid": False, "message": "Invalid reset link"}
+        
+        # Check expiry
+        expires_at = reset_doc.get("expires_at")
+        if isinstance(expires_at, str):
+            expires_at = datetime.fromisoformat(expires_at)
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        
+        if expires_at < datetime.now(timezone.utc):
+            return {"valid": False, "message": "Reset link has expired"}
+        
+        if reset_doc.get("used"):
+            return {"valid": False, "message": "Reset link has already been used"}
+        
+        return {"valid": True, "message": "Token is valid"}
+        
+    except Exception as e:
+        logging.error(f"Verify token error: {e}")
+        return {"valid": False, "message": "Error verifying token"}
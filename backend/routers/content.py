@@ -0,0 +1,1446 @@
+import uuid
+from typing import List, Optional
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, HTTPException, Depends, Request
+from pydantic import BaseModel
+
+from models import (
+    PushNotification, ContactForm, ContactFormCreate, PageContentUpdate, DailySpecialUpdate,
+    MenuItemCreate, MenuItemUpdate, SpecialCreate, SpecialUpdate, SocialLinkCreate,
+    SocialLinkUpdate, InstagramPostCreate, InstagramPostUpdate, GalleryItemCreate,
+    GalleryItemUpdate, HomepageContentUpdate, Location, LocationCreate, LocationUpdate, PromoVideo,
+    PromoVideoCreate, PromoVideoUpdate, EventCreate, EventUpdate
+)
+from batch_loader import BatchLoader
+from core import db, push_service, content_versions, public_cache, get_current_admin
+from routers.media import download_image_to_uploads
+
+router = APIRouter(tags=["content"])
+
+
+# Health check
+@router.get("/")
+async def root():
+    return {"message": "Fin & Feathers API is running"}
+
+
+# App Settings Endpoints
+@router.get("/settings")
+async def get_app_settings():
+    """Get public app settings"""
+    settings = await db.app_settings.find_one({"_id": "global"}, {"_id": 0})
+    if not settings:
+        # Return default settings
+        settings = {
+            "token_program_enabled": True,
+            "loyalty_program_enabled": True,
+            "buy_drink_enabled": True
+        }
+    return settings
+
+
+@router.get("/admin/settings")
+async def get_admin_settings(admin: str = Depends(get_current_admin)):
+    """Get all app settings for admin"""
+    settings = await db.app_settings.find_one({"_id": "global"})
+    if not settings:
+        settings = {
+            "_id": "global",
+            "token_program_enabled": True,
+            "loyalty_program_enabled": True,
+            "buy_drink_enabled": True
+        }
+        await db.app_settings.insert_one(settings)
+    return {k: v for k, v in settings.items() if k != "_id"}
+
+
+@router.put("/admin/settings")
+async def update_admin_settings(settings: dict, admin: str = Depends(get_current_admin)):
+    """Update app settings"""
+    allowed_keys = ["token_program_enabled", "loyalty_program_enabled", "buy_drink_enabled"]
+    update_data = {k: v for k, v in settings.items() if k in allowed_keys}
+    
+    await db.app_settings.update_one(
+        {"_id": "global"},
+        {"$set": update_data},
+        upsert=True
+    )
+    await content_versions.bump("app_settings")
+    return {"message": "Settings updated successfully"}
+
+
+# Public Menu Endpoints (no auth required)
+@router.get("/menu/items")
+async def get_public_menu_items(request: Request):
+    """Get all menu items for public display"""
+    async def load_menu_items():
+        return await db.menu_items.find({}, {"_id": 0}).to_list(1000)
+    return await public_cache.respond(
+        request, "menu/items", load_menu_items, source_version=await content_versions.get("menu_items")
+    )
+
+
+@router.get("/menu/categories")
+async def get_menu_categories():
+    """Get unique menu categories"""
+    categories = await db.menu_items.distinct("category")
+    return categories
+
+
+# Homepage Content Endpoints
+@router.get("/homepage/content")
+async def get_homepage_content():
+    """Get homepage content for public display"""
+    content = await db.homepage_content.find_one({"id": "homepage"}, {"_id": 0})
+    if not content:
+        # Return default content
+        return {
+            "id": "homepage",
+            "tagline": "Elevated dining meets Southern soul",
+            "logo_url": "https://customer-assets.emergentagent.com/job_57379523-4651-4150-aa1e-60b8df6a4f7c/artifacts/zzljit87_Untitled%20design.png",
+            "contact_phone": "(404) 855-5524",
+            "contact_email": "info@finandfeathersrestaurants.com",
+            "contact_address": "Multiple Locations across Georgia & Las Vegas",
+            "social_feed_images": [
+                {"url": "https://finandfeathersrestaurants.com/wp-content/uploads/2022/10/DSC6608.jpg", "caption": "F&F Signature Wings"},
+                {"url": "https://finandfeathersrestaurants.com/wp-content/uploads/2024/07/FIN_AND_FEATHER-Shrimp-Grits-scaled.jpg", "caption": "Shrimp & Grits"},
+                {"url": "https://finandfeathersrestaurants.com/wp-content/uploads/2024/07/FIN_AND_FEATHER-Malibu-Ribeye-scaled.jpg", "caption": "Malibu Ribeye"},
+                {"url": "https://finandfeathersrestaurants.com/wp-content/uploads/2022/10/a3e08521f140462cbedf10dedd32f879.jpeg", "caption": "Chicken & Waffle"}
+            ]
+        }
+    return content
+
+
+@router.put("/admin/homepage/content")
+async def update_homepage_content(update: HomepageContentUpdate, username: str = Depends(get_current_admin)):
+    """Update homepage content (admin only)"""
+    update_dict = {k: v for k, v in update.dict().items() if v is not None}
+    if not update_dict:
+        raise HTTPException(status_code=400, detail="No fields to update")
+    
+    update_dict["updated_at"] = datetime.now(timezone.utc)
+    
+    await db.homepage_content.update_one(
+        {"id": "homepage"},
+        {"$set": update_dict},
+        upsert=True
+    )
+    await content_versions.bump("homepage_content")
+    
+    return {"message": "Homepage content updated"}
+
+
+@router.get("/admin/homepage/content")
+async def admin_get_homepage_content(username: str = Depends(get_current_admin)):
+    """Get homepage content (admin)"""
+    content = await db.homepage_content.find_one({"id": "homepage"}, {"_id": 0})
+    if not content:
+        # Return default content for editing
+        return {
+            "id": "homepage",
+            "tagline": "Elevated dining meets Southern soul",
+            "logo_url": "https://customer-assets.emergentagent.com/job_57379523-4651-4150-aa1e-60b8df6a4f7c/artifacts/zzljit87_Untitled%20design.png",
+            "contact_phone": "(404) 855-5524",
+            "contact_email": "info@finandfeathersrestaurants.com",
+            "contact_address": "Multiple Locations across Georgia & Las Vegas",
+            "social_feed_images": [
+                {"url": "https://finandfeathersrestaurants.com/wp-content/uploads/2022/10/DSC6608.jpg", "caption": "F&F Signature Wings"},
+                {"url": "https://finandfeathersrestaurants.com/wp-content/uploads/2024/07/FIN_AND_FEATHER-Shrimp-Grits-scaled.jpg", "caption": "Shrimp & Grits"},
+                {"url": "https://finandfeathersrestaurants.com/wp-content/uploads/2024/07/FIN_AND_FEATHER-Malibu-Ribeye-scaled.jpg", "caption": "Malibu Ribeye"},
+                {"url": "https://finandfeathersrestaurants.com/wp-content/uploads/2022/10/a3e08521f140462cbedf10dedd32f879.jpeg", "caption": "Chicken & Waffle"}
+            ]
+        }
+    return content
+
+
+# Contact Form Endpoint
+@router.post("/contact", response_model=ContactForm)
+async def submit_contact_form(form: ContactFormCreate):
+    """Submit contact form"""
+    contact = ContactForm(**form.dict())
+    await db.contact_forms.insert_one(contact.dict())
+    return contact
+
+
+# Page Content (Public)
+@router.get("/page-content/{page_key}")
+async def get_page_content(page_key: str):
+    content = await db.page_content.find({"page_key": page_key}, {"_id": 0}).to_list(100)
+    return content
+
+
+# Page Content (Admin)
+@router.put("/admin/page-content/{page_key}/{section_key}")
+async def update_page_content(page_key: str, section_key: str, update: PageContentUpdate, username: str = Depends(get_current_admin)):
+    update_doc = {
+        "page_key": page_key,
+        "section_key": section_key,
+        "html": update.html,
+        "updated_at": datetime.now(timezone.utc)
+    }
+    await db.page_content.update_one(
+        {"page_key": page_key, "section_key": section_key},
+        {"$set": update_doc, "$setOnInsert": {"id": str(uuid.uuid4()), "created_at": datetime.now(timezone.utc)}},
+        upsert=True
+    )
+    await content_versions.bump("page_content")
+    return {"success": True}
+
+
+# Daily Specials (Public)
+@router.get("/daily-specials")
+async def get_daily_specials():
+    specials = await db.daily_specials.find({}, {"_id": 0}).to_list(20)
+    return specials
+
+
+# Daily Specials (Admin)
+@router.get("/admin/daily-specials")
+async def admin_get_daily_specials(username: str = Depends(get_current_admin)):
+    specials = await db.daily_specials.find({}, {"_id": 0}).to_list(20)
+    return specials
+
+
+@router.put("/admin/daily-specials")
+async def admin_update_daily_specials(request: Request, username: str = Depends(get_current_admin)):
+    body = await request.json()
+    if not isinstance(body, list):
+        raise HTTPException(status_code=400, detail="Expected a list of daily specials")
+
+    updated = 0
+    for item in body:
+        try:
+            update = DailySpecialUpdate(**item)
+        except Exception:
+            continue
+        update_doc = {
+            "day_index": update.day_index,
+            "name": update.name,
+            "description": update.description,
+            "hours": update.hours,
+            "emoji": update.emoji,
+            "specials": item.get("specials", []),  # Support multiple specials per day
+            "updated_at": datetime.now(timezone.utc)
+        }
+        await db.daily_specials.update_one(
+            {"day_index": update.day_index},
+            {"$set": update_doc, "$setOnInsert": {"id": str(uuid.uuid4()), "created_at": datetime.now(timezone.utc)}},
+            upsert=True
+        )
+        updated += 1
+
+    await content_versions.bump("daily_specials")
+    return {"updated": updated}
+
+
+# Menu Category Display Settings
+@router.get("/menu-category-styles")
+async def get_menu_category_styles():
+    """Get display style settings for each menu category"""
+    settings = await db.menu_settings.find_one({"type": "category_styles"}, {"_id": 0})
+    if settings:
+        return settings.get("styles", {})
+    return {}
+
+
+@router.get("/admin/menu-category-styles")
+async def admin_get_menu_category_styles(username: str = Depends(get_current_admin)):
+    """Admin: Get display style settings for each menu category"""
+    settings = await db.menu_settings.find_one({"type": "category_styles"}, {"_id": 0})
+    if settings:
+        return settings.get("styles", {})
+    return {}
+
+
+@router.put("/admin/menu-category-styles")
+async def admin_update_menu_category_styles(request: Request, username: str = Depends(get_current_admin)):
+    """Admin: Update display style for menu categories"""
+    body = await request.json()
+    if not isinstance(body, dict):
+        raise HTTPException(status_code=400, detail="Expected a dictionary of category styles")
+    
+    await db.menu_settings.update_one(
+        {"type": "category_styles"},
+        {
+            "$set": {
+                "type": "category_styles",
+                "styles": body,
+                "updated_at": datetime.now(timezone.utc)
+            },
+            "$setOnInsert": {"created_at": datetime.now(timezone.utc)}
+        },
+        upsert=True
+    )
+    await content_versions.bump("menu_settings")
+    return {"success": True, "styles": body}
+
+
+# Menu Items (Admin)
+@router.get("/admin/menu-items")
+async def admin_get_menu_items(username: str = Depends(get_current_admin)):
+    """Get all menu items for admin"""
+    items = await db.menu_items.find({}, {"_id": 0}).to_list(1000)
+    return items
+
+
+@router.post("/admin/menu-items")
+async def admin_create_menu_item(item: MenuItemCreate, username: str = Depends(get_current_admin)):
+    """Create a new menu item"""
+    item_dict = item.dict()
+    item_dict["id"] = str(uuid.uuid4())
+    await db.menu_items.insert_one(item_dict)
+    await content_versions.bump("menu_items")
+    # Remove MongoDB's _id before returning
+    item_dict.pop("_id", None)
+    return {**item_dict}
+
+
+@router.put("/admin/menu-items/{item_id}")
+async def admin_update_menu_item(item_id: str, update: MenuItemUpdate, username: str = Depends(get_current_admin)):
+    """Update a menu item"""
+    update_dict = {k: v for k, v in update.dict().items() if v is not None}
+    if not update_dict:
+        raise HTTPException(status_code=400, detail="No fields to update")
+    
+    result = await db.menu_items.update_one(
+        {"id": item_id},
+        {"$set": update_dict}
+    )
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Menu item not found")
+    await content_versions.bump("menu_items")
+    return {"message": "Menu item updated successfully"}
+
+
+@router.delete("/admin/menu-items/{item_id}")
+async def admin_delete_menu_item(item_id: str, username: str = Depends(get_current_admin)):
+    """Delete a menu item"""
+    result = await db.menu_items.delete_one({"id": item_id})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Menu item not found")
+    await content_versions.bump("menu_items")
+    return {"message": "Menu item deleted successfully"}
+
+
+@router.post("/admin/menu-items/bulk-update-images")
+async def admin_bulk_update_menu_images(request: Request, username: str = Depends(get_current_admin)):
+    """Bulk update menu item images by category or individual items"""
+    updates = await request.json()
+    updated_count = 0
+    for update in updates:
+        if "category" in update and "image_url" in update:
+            # Update all items in a category
+            result = await db.menu_items.update_many(
+                {"category": update["category"]},
+                {"$set": {"image_url": update["image_url"]}}
+            )
+            updated_count += result.modified_count
+        elif "id" in update and "image_url" in update:
+            # Update specific item
+            result = await db.menu_items.update_one(
+                {"id": update["id"]},
+                {"$set": {"image_url": update["image_url"]}}
+            )
+            updated_count += result.modified_count
+        elif "name" in update and "image_url" in update:
+            # Update by name (partial match)
+            result = await db.menu_items.update_one(
+                {"name": {"$regex": update["name"], "$options": "i"}},
+                {"$set": {"image_url": update["image_url"]}}
+            )
+            updated_count += result.modified_count
+    await content_versions.bump("menu_items")
+    return {"message": f"Updated {updated_count} menu items"}
+
+
+@router.post("/admin/menu-items/store-images")
+async def admin_store_menu_images(request: Request, username: str = Depends(get_current_admin)):
+    """Download external menu item images and store them locally"""
+    body = await request.json() if request else {}
+    categories = body.get("categories") if isinstance(body, dict) else None
+
+    query = {}
+    if categories:
+        query["category"] = {"$in": categories}
+
+    items = await db.menu_items.find(query, {"_id": 0}).to_list(1000)
+    updated = 0
+    skipped = 0
+
+    for item in items:
+        image_url = item.get("image") or item.get("image_url")
+        if not image_url or not isinstance(image_url, str):
+            skipped += 1
+            continue
+
+        if image_url.startswith("/api/uploads/"):
+            skipped += 1
+            continue
+
+        if not image_url.startswith("http"):
+            skipped += 1
+            continue
+
+        stored_url = await download_image_to_uploads(image_url)
+        if stored_url:
+            await db.menu_items.update_one(
+                {"id": item["id"]},
+                {"$set": {"image": stored_url, "image_url": stored_url}}
+            )
+            updated += 1
+
+    await content_versions.bump("menu_items")
+    return {"updated": updated, "skipped": skipped}
+
+
+# ==================== SPECIALS ENDPOINTS ====================
+
+# Public endpoint to get active specials
+@router.get("/specials")
+async def get_public_specials():
+    """Get all active specials for public display"""
+    now = datetime.now(timezone.utc)
+    specials = await db.specials.find(
+        {
+            "is_active": True,
+            "$or": [
+                {"valid_until": None},
+                {"valid_until": {"$gte": now}}
+            ]
+        },
+        {"_id": 0}
+    ).sort("created_at", -1).to_list(100)
+    return specials
+
+
+# Admin: Get all specials
+@router.get("/admin/specials")
+async def admin_get_specials(username: str = Depends(get_current_admin)):
+    """Get all specials (including inactive)"""
+    specials = await db.specials.find({}, {"_id": 0}).sort("created_at", -1).to_list(100)
+    return specials
+
+
+# Admin: Create and post a special (with auto push notification)
+@router.post("/admin/specials")
+async def admin_create_special(special: SpecialCreate, username: str = Depends(get_current_admin)):
+    """Create a new special and optionally send push notification"""
+    special_dict = special.dict()
+    special_dict["id"] = str(uuid.uuid4())
+    special_dict["is_active"] = True
+    special_dict["created_at"] = datetime.now(timezone.utc)
+    special_dict["notification_sent"] = False
+    special_dict["notification_sent_at"] = None
+    
+    # Remove the send_notification flag before storing
+    send_notification = special_dict.pop("send_notification", True)
+    
+    # Save the special
+    await db.specials.insert_one(special_dict)
+    
+    notification_result = None
+    
+    # Send push notification if requested
+    if send_notification:
+        notification_data = {
+            "title": f"🎉 {special.title}",
+            "body": special.description[:100] + ("..." if len(special.description) > 100 else ""),
+            "icon": "/logo192.png",
+            "image": special.image,
+            "url": "/"
+        }
+        
+        notification_result = await push_service.send_to_all_subscribers(notification_data)
+        
+        # Update special with notification info
+        await db.specials.update_one(
+            {"id": special_dict["id"]},
+            {
+                "$set": {
+                    "notification_sent": True,
+                    "notification_sent_at": datetime.now(timezone.utc)
+                }
+            }
+        )
+        special_dict["notification_sent"] = True
+        special_dict["notification_sent_at"] = datetime.now(timezone.utc)
+        
+        # Also save to push notifications history
+        push_notif = PushNotification(
+            title=notification_data["title"],
+            body=notification_data["body"],
+            icon=notification_data["icon"],
+            image=notification_data.get("image"),
+            url=notification_data["url"],
+            sent_to=[]
+        )
+        await db.push_notifications.insert_one(push_notif.dict())
+    
+    # Remove MongoDB _id if present
+    special_dict.pop("_id", None)
+    
+    return {
+        "special": special_dict,
+        "notification_result": notification_result
+    }
+
+
+# Admin: Update a special
+@router.put("/admin/specials/{special_id}")
+async def admin_update_special(special_id: str, update: SpecialUpdate, username: str = Depends(get_current_admin)):
+    """Update a special"""
+    update_dict = {k: v for k, v in update.dict().items() if v is not None}
+    if not update_dict:
+        raise HTTPException(status_code=400, detail="No fields to update")
+    
+    result = await db.specials.update_one(
+        {"id": special_id},
+        {"$set": update_dict}
+    )
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Special not found")
+    return {"message": "Special updated successfully"}
+
+
+# Admin: Delete a special
+@router.delete("/admin/specials/{special_id}")
+async def admin_delete_special(special_id: str, username: str = Depends(get_current_admin)):
+    """Delete a special"""
+    result = await db.specials.delete_one({"id": special_id})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Special not found")
+    return {"message": "Special deleted successfully"}
+
+
+# Admin: Resend notification for a special
+@router.post("/admin/specials/{special_id}/notify")
+async def admin_resend_special_notification(special_id: str, username: str = Depends(get_current_admin)):
+    """Resend push notification for a special"""
+    special = await db.specials.find_one({"id": special_id}, {"_id": 0})
+    if not special:
+        raise HTTPException(status_code=404, detail="Special not found")
+    
+    notification_data = {
+        "title": f"🎉 {special['title']}",
+        "body": special['description'][:100] + ("..." if len(special['description']) > 100 else ""),
+        "icon": "/logo192.png",
+        "image": special.get("image"),
+        "url": "/"
+    }
+    
+    result = await push_service.send_to_all_subscribers(notification_data)
+    
+    # Update notification timestamp
+    await db.specials.update_one(
+        {"id": special_id},
+        {
+            "$set": {
+                "notification_sent": True,
+                "notification_sent_at": datetime.now(timezone.utc)
+            }
+        }
+    )
+    
+    return {
+        "message": "Notification sent",
+        "result": result
+    }
+
+
+# ==================== SOCIAL LINKS ENDPOINTS ====================
+
+# Public: Get active social links
+@router.get("/social-links")
+async def get_public_social_links():
+    """Get all active social links"""
+    links = await db.social_links.find(
+        {"is_active": True}, 
+        {"_id": 0}
+    ).sort("display_order", 1).to_list(100)
+    return links
+
+
+# Admin: Get all social links
+@router.get("/admin/social-links")
+async def admin_get_social_links(username: str = Depends(get_current_admin)):
+    """Get all social links"""
+    links = await db.social_links.find({}, {"_id": 0}).sort("display_order", 1).to_list(100)
+    return links
+
+
+# Admin: Create social link
+@router.post("/admin/social-links")
+async def admin_create_social_link(link: SocialLinkCreate, username: str = Depends(get_current_admin)):
+    """Create a new social link"""
+    link_dict = link.dict()
+    link_dict["id"] = str(uuid.uuid4())
+    link_dict["is_active"] = True
+    link_dict["created_at"] = datetime.now(timezone.utc)
+    await db.social_links.insert_one(link_dict)
+    await content_versions.bump("social_links")
+    link_dict.pop("_id", None)
+    return link_dict
+
+
+# Admin: Update social link
+@router.put("/admin/social-links/{link_id}")
+async def admin_update_social_link(link_id: str, update: SocialLinkUpdate, username: str = Depends(get_current_admin)):
+    """Update a social link"""
+    update_dict = {k: v for k, v in update.dict().items() if v is not None}
+    if not update_dict:
+        raise HTTPException(status_code=400, detail="No fields to update")
+    
+    result = await db.social_links.update_one({"id": link_id}, {"$set": update_dict})
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Social link not found")
+    await content_versions.bump("social_links")
+    return {"message": "Social link updated"}
+
+
+# Admin: Delete social link
+@router.delete("/admin/social-links/{link_id}")
+async def admin_delete_social_link(link_id: str, username: str = Depends(get_current_admin)):
+    """Delete a social link"""
+    result = await db.social_links.delete_one({"id": link_id})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Social link not found")
+    await content_versions.bump("social_links")
+    return {"message": "Social link deleted"}
+
+
+# ==================== INSTAGRAM FEED ENDPOINTS ====================
+
+# Public: Get active Instagram posts
+@router.get("/instagram-feed")
+async def get_public_instagram_feed():
+    """Get Instagram posts for public display"""
+    posts = await db.instagram_posts.find(
+        {"is_active": True},
+        {"_id": 0}
+    ).sort("display_order", 1).to_list(20)
+    return posts
+
+
+# Admin: Get all Instagram posts
+@router.get("/admin/instagram-posts")
+async def admin_get_instagram_posts(username: str = Depends(get_current_admin)):
+    """Get all Instagram posts"""
+    posts = await db.instagram_posts.find({}, {"_id": 0}).sort("display_order", 1).to_list(100)
+    return posts
+
+
+# Admin: Create Instagram post
+@router.post("/admin/instagram-posts")
+async def admin_create_instagram_post(post: InstagramPostCreate, username: str = Depends(get_current_admin)):
+    """Add an Instagram post to the feed"""
+    post_dict = post.dict()
+    post_dict["id"] = str(uuid.uuid4())
+    post_dict["is_active"] = True
+    post_dict["created_at"] = datetime.now(timezone.utc)
+    await db.instagram_posts.insert_one(post_dict)
+    post_dict.pop("_id", None)
+    return post_dict
+
+
+# Admin: Update Instagram post
+@router.put("/admin/instagram-posts/{post_id}")
+async def admin_update_instagram_post(post_id: str, update: InstagramPostUpdate, username: str = Depends(get_current_admin)):
+    """Update an Instagram post"""
+    update_dict = {k: v for k, v in update.dict().items() if v is not None}
+    if not update_dict:
+        raise HTTPException(status_code=400, detail="No fields to update")
+    
+    result = await db.instagram_posts.update_one({"id": post_id}, {"$set": update_dict})
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Instagram post not found")
+    return {"message": "Instagram post updated"}
+
+
+# Admin: Delete Instagram post
+@router.delete("/admin/instagram-posts/{post_id}")
+async def admin_delete_instagram_post(post_id: str, username: str = Depends(get_current_admin)):
+    """Delete an Instagram post"""
+    result = await db.instagram_posts.delete_one({"id": post_id})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Instagram post not found")
+    return {"message": "Instagram post deleted"}
+
+
+# =====================================================
+# GALLERY ENDPOINTS
+# =====================================================
+
+# Public: Get active gallery items
+@router.get("/gallery")
+async def get_public_gallery():
+    """Get all active gallery items for public display"""
+    items = await db.gallery_items.find(
+        {"is_active": True},
+        {"_id": 0}
+    ).sort("display_order", 1).to_list(100)
+    return items
+
+
+# Admin: Get all gallery items
+@router.get("/admin/gallery")
+async def admin_get_gallery(username: str = Depends(get_current_admin)):
+    """Get all gallery items (including inactive)"""
+    items = await db.gallery_items.find({}, {"_id": 0}).sort("display_order", 1).to_list(100)
+    return items
+
+
+# Admin: Create gallery item
+@router.post("/admin/gallery")
+async def admin_create_gallery_item(item: GalleryItemCreate, username: str = Depends(get_current_admin)):
+    """Add a new gallery item"""
+    item_dict = item.dict()
+    item_dict["id"] = str(uuid.uuid4())
+    item_dict["is_active"] = True
+    item_dict["created_at"] = datetime.now(timezone.utc)
+    await db.gallery_items.insert_one(item_dict)
+    item_dict.pop("_id", None)
+    return item_dict
+
+
+# Admin: Update gallery item
+@router.put("/admin/gallery/{item_id}")
+async def admin_update_gallery_item(item_id: str, update: GalleryItemUpdate, username: str = Depends(get_current_admin)):
+    """Update a gallery item"""
+    update_dict = {k: v for k, v in update.dict().items() if v is not None}
+    if not update_dict:
+        raise HTTPException(status_code=400, detail="No fields to update")
+    
+    result = await db.gallery_items.update_one({"id": item_id}, {"$set": update_dict})
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Gallery item not found")
+    return {"message": "Gallery item updated"}
+
+
+# Admin: Delete gallery item
+@router.delete("/admin/gallery/{item_id}")
+async def admin_delete_gallery_item(item_id: str, username: str = Depends(get_current_admin)):
+    """Delete a gallery item"""
+    result = await db.gallery_items.delete_one({"id": item_id})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Gallery item not found")
+    return {"message": "Gallery item deleted"}
+
+
+# =====================================================
+# LOCATION ENDPOINTS (Public & Admin)
+# =====================================================
+
+@router.get("/locations")
+async def get_public_locations(request: Request):
+    """Get all active locations for public display"""
+    async def load_locations():
+        locations = await db.locations.find(
+            {"is_active": True},
+            {"_id": 0}
+        ).sort("display_order", 1).to_list(100)
+        return [normalize_location_response(loc) for loc in locations]
+    return await public_cache.respond(
+        request, "locations", load_locations, source_version=await content_versions.get("locations")
+    )
+
+
+@router.get("/locations/{slug}")
+async def get_location_by_slug(slug: str):
+    """Get a single location by slug"""
+    location = await db.locations.find_one(
+        {"slug": slug},
+        {"_id": 0}
+    )
+    if not location:
+        raise HTTPException(status_code=404, detail="Location not found")
+    location = normalize_location_response(location)
+    return location
+
+
+# Admin Location Endpoints
+def ensure_suite_placeholder(address: str):
+    return address
+
+
+def normalize_location_response(location: dict):
+    if not location:
+        return location
+    address = location.get("address")
+    if address:
+        location["address"] = ensure_suite_placeholder(address)
+    return location
+
+
+# Admin Location Endpoints
+@router.get("/admin/locations")
+async def get_all_locations(admin: str = Depends(get_current_admin)):
+    """Get all locations (including inactive) for admin"""
+    locations = await db.locations.find({}, {"_id": 0}).sort("display_order", 1).to_list(100)
+    locations = [normalize_location_response(loc) for loc in locations]
+    return locations
+
+
+@router.post("/admin/locations")
+async def create_location(location: LocationCreate, admin: str = Depends(get_current_admin)):
+    """Create a new location"""
+    # Check for duplicate slug
+    existing = await db.locations.find_one({"slug": location.slug})
+    if existing:
+        raise HTTPException(status_code=400, detail="A location with this slug already exists")
+    
+    location_data = Location(
+        slug=location.slug,
+        name=location.name,
+        address=location.address,
+        phone=location.phone,
+        reservation_phone=location.reservation_phone,
+        coordinates=location.coordinates,
+        image=location.image,
+        hours=location.hours,
+        online_ordering=location.online_ordering,
+        reservations=location.reservations,
+        delivery=location.delivery,
+        social_media=location.social_media,
+        weekly_specials=location.weekly_specials,
+        display_order=location.display_order
+    )
+    
+    await db.locations.insert_one(location_data.model_dump())
+    await content_versions.bump("locations")
+    return {"id": location_data.id, "message": "Location created successfully"}
+
+
+@router.put("/admin/locations/{location_id}")
+async def update_location(location_id: str, location: LocationUpdate, admin: str = Depends(get_current_admin)):
+    """Update a location"""
+    existing = await db.locations.find_one({"id": location_id})
+    if not existing:
+        raise HTTPException(status_code=404, detail="Location not found")
+    
+    # If slug is being changed, check for duplicates
+    if location.slug and location.slug != existing.get("slug"):
+        slug_exists = await db.locations.find_one({"slug": location.slug, "id": {"$ne": location_id}})
+        if slug_exists:
+            raise HTTPException(status_code=400, detail="A location with this slug already exists")
+    
+    update_data = {k: v for k, v in location.model_dump().items() if v is not None}
+    
+    # Handle nested objects properly
+    if "coordinates" in update_data and update_data["coordinates"]:
+        update_data["coordinates"] = update_data["coordinates"].model_dump() if hasattr(update_data["coordinates"], 'model_dump') else update_data["coordinates"]
+    if "hours" in update_data and update_data["hours"]:
+        update_data["hours"] = update_data["hours"].model_dump() if hasattr(update_data["hours"], 'model_dump') else update_data["hours"]
+    if "social_media" in update_data and update_data["social_media"]:
+        update_data["social_media"] = update_data["social_media"].model_dump() if hasattr(update_data["social_media"], 'model_dump') else update_data["social_media"]
+    if "weekly_specials" in update_data:
+        update_data["weekly_specials"] = [
+            ws.model_dump() if hasattr(ws, 'model_dump') else ws 
+            for ws in update_data["weekly_specials"]
+        ]
+    
+    update_data["updated_at"] = datetime.now(timezone.utc)
+    
+    await db.locations.update_one({"id": location_id}, {"$set": update_data})
+    await content_versions.bump("locations")
+    return {"message": "Location updated successfully"}
+
+
+@router.delete("/admin/locations/{location_id}")
+async def delete_location(location_id: str, admin: str = Depends(get_current_admin)):
+    """Delete a location"""
+    result = await db.locations.delete_one({"id": location_id})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Location not found")
+    await content_versions.bump("locations")
+    return {"message": "Location deleted successfully"}
+
+
+@router.post("/admin/locations/reorder")
+async def reorder_locations(order: List[dict], admin: str = Depends(get_current_admin)):
+    """Reorder locations via drag-and-drop - expects [{id, display_order}]"""
+    for item in order:
+        await db.locations.update_one(
+            {"id": item["id"]},
+            {"$set": {"display_order": item["display_order"], "updated_at": datetime.now(timezone.utc)}}
+        )
+    await content_versions.bump("locations")
+    return {"message": "Locations reordered successfully"}
+
+
+@router.post("/admin/locations/seed")
+async def seed_locations(admin: str = Depends(get_current_admin)):
+    """Seed the database with initial location data (run once)"""
+    existing_count = await db.locations.count_documents({})
+    if existing_count > 0:
+        return {"message": f"Database already has {existing_count} locations. Skipping seed."}
+    
+    # Initial location data from mockData.js
+    initial_locations = [
+        {
+            "id": str(uuid.uuid4()),
+            "slug": "edgewood-atlanta",
+            "name": "Fin & Feathers - Edgewood (Atlanta)",
+            "address": "345 Edgewood Ave SE, Atlanta, GA 30312",
+            "phone": "(404) 855-5524",
+            "reservation_phone": "(404) 692-1252",
+            "coordinates": {"lat": 33.7547, "lng": -84.3733},
+            "image": "https://finandfeathersrestaurants.com/wp-content/uploads/2022/10/DSC6657.jpg",
+            "hours": {
+                "monday": "11am-1am", "tuesday": "11am-1am", "wednesday": "11am-1am",
+                "thursday": "11am-1am", "friday": "11am-3am", "saturday": "10am-3am", "sunday": "10am-12am"
+            },
+            "online_ordering": "https://order.toasttab.com/online/fin-feathers-edgewood-2nd-location-345-edgewood-ave-se",
+            "reservations": "sms:14046921252?&body=Include%20Full%20Name,%20Number%20in%20Party,%20Date%20and%20Time%20Requested",
+            "delivery": "https://order.toasttab.com/online/fin-feathers-edgewood-2nd-location-345-edgewood-ave-se",
+            "social_media": {"instagram": "https://instagram.com/finandfeathers_edgewood", "facebook": "https://facebook.com/finandfeathers", "twitter": "https://twitter.com/finandfeathers"},
+            "weekly_specials": [
+                {"day": "Monday", "special": "$5 Wings & $5 Margaritas"},
+                {"day": "Tuesday", "special": "Taco Tuesday - $2 Tacos"},
+                {"day": "Wednesday", "special": "Wine Down Wednesday - Half Price Wine"},
+                {"day": "Thursday", "special": "Thirsty Thursday - $10 Long Islands"},
+                {"day": "Friday", "special": "Fresh Fish Friday - Market Price"},
+                {"day": "Saturday", "special": "Brunch & Bottomless Mimosas"},
+                {"day": "Sunday", "special": "Sunday Funday - Kids Eat Free"}
+            ],
+            "is_active": True, "display_order": 0, "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)
+        },
+        {
+            "id": str(uuid.uuid4()),
+            "slug": "midtown-atlanta",
+            "name": "Fin & Feathers - Midtown (Atlanta)",
+            "address": "1136 Crescent Ave NE, Atlanta, GA 30309",
+            "phone": "(404) 549-7555",
+            "reservation_phone": "(678) 421-4083",
+            "coordinates": {"lat": 33.7812, "lng": -84.3838},
+            "image": "https://finandfeathersrestaurants.com/wp-content/uploads/2022/10/DSC6656.jpg",
+            "hours": {
+                "monday": "11am-10pm", "tuesday": "11am-10pm", "wednesday": "11am-10pm",
+                "thursday": "11am-11pm", "friday": "11am-12am", "saturday": "10am-12am", "sunday": "10am-10pm"
+            },
+            "online_ordering": "https://www.toasttab.com/local/order/fin-feathers-midtown-1136-crescent-ave-ne/r-94f8c8b0-51bd-4f67-a787-68f7f39f0eb9",
+            "reservations": "sms:16784214083?&body=Include%20Full%20Name,%20Number%20in%20Party,%20Date%20and%20Time%20Requested",
+            "delivery": "https://www.toasttab.com/local/order/fin-feathers-midtown-1136-crescent-ave-ne/r-94f8c8b0-51bd-4f67-a787-68f7f39f0eb9",
+            "social_media": {"instagram": "https://instagram.com/finandfeathers_midtown", "facebook": "https://facebook.com/finandfeathers", "twitter": "https://twitter.com/finandfeathers"},
+            "weekly_specials": [
+                {"day": "Monday", "special": "Margarita Madness - $7 Margaritas"},
+                {"day": "Tuesday", "special": "$1 Oysters All Day"},
+                {"day": "Wednesday", "special": "Wings & Things - $6 Wings"},
+                {"day": "Thursday", "special": "Steak Night - $25 Ribeye"},
+                {"day": "Friday", "special": "Lobster Special - Market Price"},
+                {"day": "Saturday", "special": "Weekend Brunch 10am-3pm"},
+                {"day": "Sunday", "special": "Live Music & Happy Hour"}
+            ],
+            "is_active": True, "display_order": 1, "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)
+        },
+        {
+            "id": str(uuid.uuid4()),
+            "slug": "douglasville",
+            "name": "Fin & Feathers - Douglasville",
+            "address": "7430 Douglas Blvd, Douglasville, GA 30135",
+            "phone": "(678) 653-9577",
+            "reservation_phone": "(404) 458-1958",
+            "coordinates": {"lat": 33.7515, "lng": -84.7477},
+            "image": "https://finandfeathersrestaurants.com/wp-content/uploads/2022/10/fin_and_feathers_shrimp_and_grits_2-e1666107985403.jpg",
+            "hours": {
+                "monday": "12pm-10pm", "tuesday": "12pm-10pm", "wednesday": "12pm-10pm",
+                "thursday": "12pm-11pm", "friday": "12pm-12am", "saturday": "11am-12am", "sunday": "11am-9pm"
+            },
+            "online_ordering": "https://order.toasttab.com/online/fins-feathers-douglasville-7430-douglas-blvd-zmrgr",
+            "reservations": "sms:14044581958?&body=Include%20Full%20Name,%20Number%20in%20Party,%20Date%20and%20Time%20Requested",
+            "delivery": "https://order.toasttab.com/online/fins-feathers-douglasville-7430-douglas-blvd-zmrgr",
+            "social_media": {"instagram": "https://instagram.com/finandfeathers_douglasville", "facebook": "https://facebook.com/finandfeathers", "twitter": "https://twitter.com/finandfeathers"},
+            "weekly_specials": [
+                {"day": "Monday", "special": "Family Night - Kids Eat Free"},
+                {"day": "Tuesday", "special": "Taco & Tequila Tuesday"},
+                {"day": "Wednesday", "special": "Wine & Dine - 50% Off Bottles"},
+                {"day": "Thursday", "special": "Craft Beer Night"},
+                {"day": "Friday", "special": "Seafood Boil Special"},
+                {"day": "Saturday", "special": "Brunch Party 11am-3pm"},
+                {"day": "Sunday", "special": "Sunday Roast Special"}
+            ],
+            "is_active": True, "display_order": 2, "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)
+        },
+        {
+            "id": str(uuid.uuid4()),
+            "slug": "riverdale",
+            "name": "Fin & Feathers - Riverdale",
+            "address": "6340 Hwy 85, Riverdale, GA 30274",
+            "phone": "(770) 703-2282",
+            "reservation_phone": "(678) 304-8191",
+            "coordinates": {"lat": 33.5726, "lng": -84.4132},
+            "image": "https://finandfeathersrestaurants.com/wp-content/uploads/2022/10/augies_cafe_smb_parent__atlanta__new_business__86_hero-e1666179925108.jpg",
+            "hours": {
+                "monday": "11am-10pm", "tuesday": "11am-10pm", "wednesday": "11am-10pm",
+                "thursday": "11am-11pm", "friday": "11am-12am", "saturday": "10am-12am", "sunday": "10am-10pm"
+            },
+            "online_ordering": "https://www.toasttab.com/local/order/fin-feathers-riverdale-6340-ga-85",
+            "reservations": "sms:16783048191?&body=Include%20Full%20Name,%20Number%20in%20Party,%20Date%20and%20Time%20Requested",
+            "delivery": "https://www.toasttab.com/local/order/fin-feathers-riverdale-6340-ga-85",
+            "social_media": {"instagram": "https://instagram.com/finandfeathers_riverdale", "facebook": "https://facebook.com/finandfeathers", "twitter": "https://twitter.com/finandfeathers"},
+            "weekly_specials": [
+                {"day": "Monday", "special": "$5 Daily Specials All Day"},
+                {"day": "Tuesday", "special": "Two for Tuesday - BOGO Entrees"},
+                {"day": "Wednesday", "special": "Wine Wednesday - $5 Glasses"},
+                {"day": "Thursday", "special": "Throwback Thursday - Classic Menu"},
+                {"day": "Friday", "special": "Fried Fish Friday"},
+                {"day": "Saturday", "special": "All Day Brunch & Cocktails"},
+                {"day": "Sunday", "special": "Southern Sunday Dinner"}
+            ],
+            "is_active": True, "display_order": 3, "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)
+        },
+        {
+            "id": str(uuid.uuid4()),
+            "slug": "valdosta",
+            "name": "Fin & Feathers - Valdosta",
+            "address": "1700 Norman Dr, Valdosta, GA 31601",
+            "phone": "(229) 474-4049",
+            "reservation_phone": "(229) 231-4653",
+            "coordinates": {"lat": 30.8327, "lng": -83.2785},
+            "image": "https://finandfeathersrestaurants.com/wp-content/uploads/2024/07/FIN_AND_FEATHER-Catfish-Grits-scaled.jpg",
+            "hours": {
+                "monday": "12pm-9pm", "tuesday": "12pm-9pm", "wednesday": "12pm-9pm",
+                "thursday": "12pm-10pm", "friday": "12pm-11pm", "saturday": "11am-11pm", "sunday": "11am-9pm"
+            },
+            "online_ordering": "https://www.toasttab.com/local/order/fin-feathers-valdosta-1700-norman-drive/r-2f4566e8-677d-42d2-93d3-9aa6d2687fcd",
+            "reservations": "sms:2292314653?&body=Include%20Full%20Name,%20Number%20in%20Party,%20Date%20and%20Time%20Requested",
+            "delivery": "https://www.toasttab.com/local/order/fin-feathers-valdosta-1700-norman-drive/r-2f4566e8-677d-42d2-93d3-9aa6d2687fcd",
+            "social_media": {"instagram": "https://instagram.com/finandfeathers_valdosta", "facebook": "https://facebook.com/finandfeathers", "twitter": "https://twitter.com/finandfeathers"},
+            "weekly_specials": [
+                {"day": "Monday", "special": "Manic Monday - $8 Burgers"},
+                {"day": "Tuesday", "special": "Taco Tuesday Fiesta"},
+                {"day": "Wednesday", "special": "Wine Down Wednesday"},
+                {"day": "Thursday", "special": "Thirsty Thursday - $3 Drafts"},
+                {"day": "Friday", "special": "Fresh Catch Friday"},
+                {"day": "Saturday", "special": "Brunch & Bubbles"},
+                {"day": "Sunday", "special": "Family Sunday Feast"}
+            ],
+            "is_active": True, "display_order": 4, "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)
+        },
+        {
+            "id": str(uuid.uuid4()),
+            "slug": "albany",
+            "name": "Fin & Feathers - Albany",
+            "address": "2800 Old Dawson Rd Unit 5, Albany, GA 31707",
+            "phone": "(229) 231-2101",
+            "reservation_phone": "(229) 231-2101",
+            "coordinates": {"lat": 31.5785, "lng": -84.1558},
+            "image": "https://finandfeathersrestaurants.com/wp-content/uploads/2022/10/1ddbe3ac887b406aa6277a86d551faae-1024x1024.jpeg",
+            "hours": {
+                "monday": "11am-9pm", "tuesday": "11am-9pm", "wednesday": "11am-9pm",
+                "thursday": "11am-10pm", "friday": "11am-11pm", "saturday": "10am-11pm", "sunday": "10am-9pm"
+            },
+            "online_ordering": "https://www.toasttab.com/local/order/fin-and-feathers-albany-llc",
+            "reservations": "sms:12292312101?&body=Include%20Full%20Name,%20Number%20in%20Party,%20Date%20and%20Time%20Requested",
+            "delivery": "https://www.toasttab.com/local/order/fin-and-feathers-albany-llc",
+            "social_media": {"instagram": "https://instagram.com/finandfeathers_albany", "facebook": "https://facebook.com/finandfeathers", "twitter": "https://twitter.com/finandfeathers"},
+            "weekly_specials": [
+                {"day": "Monday", "special": "Monday Blues Buster - Live Music"},
+                {"day": "Tuesday", "special": "$2 Taco & $2 Tecate"},
+                {"day": "Wednesday", "special": "Wing Wednesday - 50¢ Wings"},
+                {"day": "Thursday", "special": "Thirsty Thursday Cocktails"},
+                {"day": "Friday", "special": "Fish Fry Friday"},
+                {"day": "Saturday", "special": "Weekend Brunch Extravaganza"},
+                {"day": "Sunday", "special": "Sunday Funday - All Day Happy Hour"}
+            ],
+            "is_active": True, "display_order": 5, "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)
+        },
+        {
+            "id": str(uuid.uuid4()),
+            "slug": "stone-mountain",
+            "name": "Fin & Feathers - Stone Mountain",
+            "address": "5370 Stone Mountain Hwy, Stone Mountain, GA 30087",
+            "phone": "(470) 334-8255",
+            "reservation_phone": "(470) 334-8255",
+            "coordinates": {"lat": 33.8081, "lng": -84.1458},
+            "image": "https://finandfeathersrestaurants.com/wp-content/uploads/2022/10/DSC06011_edited.jpg",
+            "hours": {
+                "monday": "11am-10pm", "tuesday": "11am-10pm", "wednesday": "11am-10pm",
+                "thursday": "11am-11pm", "friday": "11am-12am", "saturday": "10am-12am", "sunday": "10am-10pm"
+            },
+            "online_ordering": "https://www.toasttab.com/local/order/fin-feathers-stone-mountain-5469-memorial-drive",
+            "reservations": "sms:14703348255?&body=Include%20Full%20Name,%20Number%20in%20Party,%20Date%20and%20Time%20Requested",
+            "delivery": "https://www.toasttab.com/local/order/fin-feathers-stone-mountain-5469-memorial-drive",
+            "social_media": {"instagram": "https://instagram.com/finandfeathers_stonemountain", "facebook": "https://facebook.com/finandfeathers", "twitter": "https://twitter.com/finandfeathers"},
+            "weekly_specials": [
+                {"day": "Monday", "special": "$5 Wings & $5 Margaritas"},
+                {"day": "Tuesday", "special": "Taco Tuesday - $2 Tacos"},
+                {"day": "Wednesday", "special": "Wine Down Wednesday - Half Price Wine"},
+                {"day": "Thursday", "special": "Thirsty Thursday - $10 Long Islands"},
+                {"day": "Friday", "special": "Fresh Fish Friday - Market Price"},
+                {"day": "Saturday", "special": "Brunch & Bottomless Mimosas"},
+                {"day": "Sunday", "special": "Sunday Funday - Kids Eat Free"}
+            ],
+            "is_active": True, "display_order": 6, "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)
+        },
+        {
+            "id": str(uuid.uuid4()),
+            "slug": "las-vegas",
+            "name": "Fin & Feathers - Las Vegas",
+            "address": "1229 S. Casino Center Blvd, Las Vegas, NV 89104",
+            "phone": "(725) 204-9655",
+            "reservation_phone": "(702) 546-6394",
+            "coordinates": {"lat": 36.1622, "lng": -115.1505},
+            "image": "https://finandfeathersrestaurants.com/wp-content/uploads/2024/07/FIN_AND_FEATHER-Malibu-Ribeye-scaled.jpg",
+            "hours": {
+                "monday": "11am-12am", "tuesday": "11am-12am", "wednesday": "11am-12am",
+                "thursday": "11am-12am", "friday": "11am-2am", "saturday": "10am-2am", "sunday": "10am-12am"
+            },
+            "online_ordering": "https://www.toasttab.com/local/order/fin-feathers-las-vegas-1229-s-casino-center-blvd",
+            "reservations": "sms:17025466394?&body=Include%20Full%20Name,%20Number%20in%20Party,%20Date%20and%20Time%20Requested",
+            "delivery": "https://www.toasttab.com/local/order/fin-feathers-las-vegas-1229-s-casino-center-blvd",
+            "social_media": {"instagram": "https://instagram.com/finandfeathersrestaurants", "facebook": "https://facebook.com/finandfeathersrestaurants", "twitter": "https://twitter.com/finandfeathers"},
+            "weekly_specials": [
+                {"day": "Monday", "special": "Monday Night Madness - $20 All You Can Eat Wings"},
+                {"day": "Tuesday", "special": "Taco Tuesday Vegas Style"},
+                {"day": "Wednesday", "special": "Wine & Dine - Premium Bottles $30"},
+                {"day": "Thursday", "special": "Vegas Thursday - Champagne Brunch"},
+                {"day": "Friday", "special": "High Roller Friday - Lobster & Steak"},
+                {"day": "Saturday", "special": "Saturday Night Party - DJ & Specials"},
+                {"day": "Sunday", "special": "Recovery Sunday - Hangover Brunch"}
+            ],
+            "is_active": True, "display_order": 7, "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)
+        }
+    ]
+    
+    await db.locations.insert_many(initial_locations)
+    await content_versions.bump("locations")
+    return {"message": f"Successfully seeded {len(initial_locations)} locations"}
+
+
+# =====================================================
+# PROMO VIDEO ENDPOINTS
+# =====================================================
+
+@router.get("/promo-videos")
+async def get_promo_videos():
+    """Get all active promo videos for the carousel"""
+    videos = await db.promo_videos.find(
+        {"is_active": True},
+        {"_id": 0}
+    ).sort("display_order", 1).to_list(100)
+    return videos
+
+
+@router.get("/promo-videos/by-day/{day_of_week}")
+async def get_promo_videos_by_day(day_of_week: int):
+    """Get videos for a specific day (0=Sunday to 6=Saturday)"""
+    # Get day-specific videos first, then common videos
+    day_videos = await db.promo_videos.find(
+        {"is_active": True, "day_of_week": day_of_week, "is_common": False},
+        {"_id": 0}
+    ).sort("display_order", 1).to_list(50)
+    
+    common_videos = await db.promo_videos.find(
+        {"is_active": True, "is_common": True},
+        {"_id": 0}
+    ).sort("display_order", 1).to_list(50)
+    
+    return day_videos + common_videos
+
+
+@router.get("/admin/promo-videos")
+async def admin_get_promo_videos(admin: str = Depends(get_current_admin)):
+    """Get all promo videos for admin"""
+    videos = await db.promo_videos.find({}, {"_id": 0}).sort("display_order", 1).to_list(100)
+    return videos
+
+
+@router.post("/admin/promo-videos")
+async def admin_create_promo_video(video: PromoVideoCreate, admin: str = Depends(get_current_admin)):
+    """Create a new promo video"""
+    video_data = PromoVideo(
+        title=video.title,
+        url=video.url,
+        day_of_week=video.day_of_week,
+        is_common=video.is_common,
+        display_order=video.display_order
+    )
+    await db.promo_videos.insert_one(video_data.model_dump())
+    await content_versions.bump("promo_videos")
+    return {"id": video_data.id, "message": "Promo video created successfully"}
+
+
+@router.put("/admin/promo-videos/{video_id}")
+async def admin_update_promo_video(video_id: str, video: PromoVideoUpdate, admin: str = Depends(get_current_admin)):
+    """Update a promo video"""
+    existing = await db.promo_videos.find_one({"id": video_id})
+    if not existing:
+        raise HTTPException(status_code=404, detail="Promo video not found")
+    
+    update_data = {k: v for k, v in video.model_dump().items() if v is not None}
+    update_data["updated_at"] = datetime.now(timezone.utc)
+    
+    await db.promo_videos.update_one({"id": video_id}, {"$set": update_data})
+    await content_versions.bump("promo_videos")
+    return {"message": "Promo video updated successfully"}
+
+
+@router.delete("/admin/promo-videos/{video_id}")
+async def admin_delete_promo_video(video_id: str, admin: str = Depends(get_current_admin)):
+    """Delete a promo video"""
+    result = await db.promo_videos.delete_one({"id": video_id})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Promo video not found")
+    await content_versions.bump("promo_videos")
+    return {"message": "Promo video deleted successfully"}
+
+
+@router.post("/admin/promo-videos/seed")
+async def seed_promo_videos(admin: str = Depends(get_current_admin)):
+    """Seed the database with initial promo videos"""
+    existing_count = await db.promo_videos.count_documents({})
+    if existing_count > 0:
+        return {"message": f"Database already has {existing_count} promo videos. Skipping seed."}
+    
+    initial_videos = [
+        # Common videos (show on all days)
+        {"id": str(uuid.uuid4()), "title": "M-F $5 Specials", "url": "https://customer-assets.emergentagent.com/job_9c5c0528-00b8-4337-8ece-7b08da83da67/artifacts/gguqbaki_m-f%205%20specials.mp4", "day_of_week": -1, "is_common": True, "display_order": 100, "is_active": True, "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)},
+        {"id": str(uuid.uuid4()), "title": "Hookah Lounge", "url": "https://customer-assets.emergentagent.com/job_9c5c0528-00b8-4337-8ece-7b08da83da67/artifacts/5lk2zci7_Hookah.mp4", "day_of_week": -1, "is_common": True, "display_order": 101, "is_active": True, "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)},
+        # Day-specific videos
+        {"id": str(uuid.uuid4()), "title": "Monday Special", "url": "https://customer-assets.emergentagent.com/job_9c5c0528-00b8-4337-8ece-7b08da83da67/artifacts/72qd1ab8_Monday.mp4", "day_of_week": 1, "is_common": False, "display_order": 0, "is_active": True, "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)},
+        {"id": str(uuid.uuid4()), "title": "Tuesday Special", "url": "https://customer-assets.emergentagent.com/job_9c5c0528-00b8-4337-8ece-7b08da83da67/artifacts/wvi3jxji_Tuesday.mp4", "day_of_week": 2, "is_common": False, "display_order": 0, "is_active": True, "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)},
+        {"id": str(uuid.uuid4()), "title": "Wednesday Special", "url": "https://customer-assets.emergentagent.com/job_9c5c0528-00b8-4337-8ece-7b08da83da67/artifacts/d6juf8fz_Wednesday.mp4", "day_of_week": 3, "is_common": False, "display_order": 0, "is_active": True, "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)},
+        {"id": str(uuid.uuid4()), "title": "Wednesday Special 2", "url": "https://customer-assets.emergentagent.com/job_9c5c0528-00b8-4337-8ece-7b08da83da67/artifacts/jzr5vp5d_Wednesday%20%282%29.mp4", "day_of_week": 3, "is_common": False, "display_order": 1, "is_active": True, "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)},
+        {"id": str(uuid.uuid4()), "title": "Thursday Special", "url": "https://customer-assets.emergentagent.com/job_9c5c0528-00b8-4337-8ece-7b08da83da67/artifacts/w9nk5dsp_Thursday.mp4", "day_of_week": 4, "is_common": False, "display_order": 0, "is_active": True, "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)},
+        {"id": str(uuid.uuid4()), "title": "Friday Special", "url": "https://customer-assets.emergentagent.com/job_9c5c0528-00b8-4337-8ece-7b08da83da67/artifacts/s5myd3mu_Friday.mp4", "day_of_week": 5, "is_common": False, "display_order": 0, "is_active": True, "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)},
+        {"id": str(uuid.uuid4()), "title": "Saturday Special", "url": "https://customer-assets.emergentagent.com/job_9c5c0528-00b8-4337-8ece-7b08da83da67/artifacts/lrdt4s1h_Saturday.mp4", "day_of_week": 6, "is_common": False, "display_order": 0, "is_active": True, "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)},
+    ]
+    
+    await db.promo_videos.insert_many(initial_videos)
+    await content_versions.bump("promo_videos")
+    return {"message": f"Successfully seeded {len(initial_videos)} promo videos"}
+
+
+# ============================================================================
+# EVENTS CRUD ENDPOINTS
+# ============================================================================
+
+# Default events if none in database
+DEFAULT_EVENTS = [
+    {
+        "id": "friday-night-live",
+        "name": "Friday Night Live",
+        "description": "Live DJ, dancing, and signature cocktails every Friday night! Experience the best nightlife in Atlanta.",
+        "date": "Every Friday",
+        "time": "9PM - 2AM",
+        "location": "Edgewood (Atlanta)",
+        "location_slug": "edgewood-atlanta",
+        "image": "https://finandfeathersrestaurants.com/wp-content/uploads/2022/10/DSC6657.jpg",
+        "featured": True,
+        "packages": ["general", "vip", "table"],
+        "package_prices": {"general": 25.00, "vip": 75.00, "table": 200.00},
+        "is_active": True,
+        "display_order": 0
+    },
+    {
+        "id": "brunch-beats",
+        "name": "Brunch & Beats",
+        "description": "Sunday brunch with a twist! Live DJ spinning feel-good music while you enjoy our famous chicken & waffles.",
+        "date": "Every Sunday",
+        "time": "11AM - 4PM",
+        "location": "All Locations",
+        "location_slug": None,
+        "image": "https://finandfeathersrestaurants.com/wp-content/uploads/2022/10/a3e08521f140462cbedf10dedd32f879.jpeg",
+        "featured": False,
+        "packages": ["general", "vip"],
+        "package_prices": {"general": 25.00, "vip": 75.00},
+        "is_active": True,
+        "display_order": 1
+    },
+    {
+        "id": "wine-wednesday",
+        "name": "Wine Down Wednesday",
+        "description": "Half-price bottles of wine paired with live acoustic performances. The perfect midweek escape.",
+        "date": "Every Wednesday",
+        "time": "6PM - 10PM",
+        "location": "Midtown (Atlanta)",
+        "location_slug": "midtown-atlanta",
+        "image": "https://finandfeathersrestaurants.com/wp-content/uploads/2022/10/DSC6656.jpg",
+        "featured": False,
+        "packages": ["general"],
+        "package_prices": {"general": 25.00},
+        "is_active": True,
+        "display_order": 2
+    }
+]
+
+class FreeEventReservationRequest(BaseModel):
+    event_id: str
+    package_id: str
+    quantity: int = 1
+    email: Optional[str] = None
+    phone: Optional[str] = None
+
+async def fetch_event_by_id(event_id: str):
+    event = await db.events.find_one({"id": event_id}, {"_id": 0})
+    if event:
+        return event
+    for default_event in DEFAULT_EVENTS:
+        if default_event["id"] == event_id:
+            return default_event
+    return None
+
+RESERVATION_LOCATION_PROJECTION = {"_id": 0, "name": 1, "slug": 1, "reservations": 1}
+
+async def resolve_event_reservation_link(event: dict, loader: Optional[BatchLoader] = None):
+    # The slug lookup and the name fallback share one query of the locations
+    loader = loader or BatchLoader(db)
+
+    location_slug = event.get("location_slug")
+    if location_slug:
+        for location in await loader.find("locations", {}, RESERVATION_LOCATION_PROJECTION):
+            if location.get("slug") == location_slug and location.get("reservations"):
+                return location.get("reservations"), location
+
+    event_location = (event.get("location") or "").strip().lower()
+    if not event_location:
+        return None, None
+
+    if "all locations" in event_location:
+        return "/locations", None
+
+    for location in await loader.find("locations", {}, RESERVATION_LOCATION_PROJECTION):
+        name = (location.get("name") or "").lower()
+        if event_location in name or name in event_location:
+            if location.get("reservations"):
+                return location.get("reservations"), location
+
+    return None, None
+
+
+@router.get("/events")
+async def get_public_events(request: Request):
+    """Get all active events for public display"""
+    async def load_events():
+        events = await db.events.find({"is_active": True}, {"_id": 0}).sort("display_order", 1).to_list(100)
+        return events or DEFAULT_EVENTS
+    return await public_cache.respond(
+        request, "events", load_events, source_version=await content_versions.get("events")
+    )
+
+
+@router.post("/events/free-reserve")
+async def free_reserve_event(reservation: FreeEventReservationRequest):
+    event = await fetch_event_by_id(reservation.event_id)
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    if reservation.package_id not in EVENT_PACKAGES:
+        raise HTTPException(status_code=400, detail="Invalid event package")
+
+    package_prices = event.get("package_prices") or {}
+    package_amount = float(package_prices.get(reservation.package_id, EVENT_PACKAGES[reservation.package_id]["amount"]))
+
+    if package_amount > 0:
+        raise HTTPException(status_code=400, detail="Selected package requires payment")
+
+    quantity = max(1, reservation.quantity)
+    reservation_id = f"free_evt_{uuid.uuid4().hex[:12]}"
+
+    record = {
+        "id": reservation_id,
+        "event_id": reservation.event_id,
+        "event_name": event.get("name"),
+        "event_date": event.get("date"),
+        "event_time": event.get("time"),
+        "event_location": event.get("location"),
+        "package_id": reservation.package_id,
+        "quantity": quantity,
+        "amount": 0.0,
+        "email": reservation.email,
+        "phone": reservation.phone,
+        "status": "reserved",
+        "created_at": datetime.now(timezone.utc)
+    }
+
+    await db.event_reservations.insert_one(record)
+
+    reservation_link, location = await resolve_event_reservation_link(event)
+    if not reservation_link:
+        reservation_link = "/locations"
+
+    receipt_status = "pending_setup" if reservation.email else "not_requested"
+
+    return {
+        "success": True,
+        "reservation_id": reservation_id,
+        "reservation_link": reservation_link,
+        "reservation_location": location.get("name") if location else None,
+        "receipt_status": receipt_status,
+        "message": "Reservation confirmed. Email receipts will send once Gmail is configured."
+    }
+
+
+@router.get("/admin/events")
+async def admin_get_events(username: str = Depends(get_current_admin)):
+    """Get all events including inactive (admin only)"""
+    events = await db.events.find({}, {"_id": 0}).sort("display_order", 1).to_list(100)
+    if not events:
+        # Seed default events if none exist
+        for event in DEFAULT_EVENTS:
+            event_copy = event.copy()
+            event_copy["created_at"] = datetime.now(timezone.utc)
+            event_copy["updated_at"] = datetime.now(timezone.utc)
+            await db.events.insert_one(event_copy)
+        await content_versions.bump("events")
+        # Fetch the newly seeded events without _id
+        events = await db.events.find({}, {"_id": 0}).sort("display_order", 1).to_list(100)
+    return events
+
+
+@router.post("/admin/events")
+async def admin_create_event(event: EventCreate, username: str = Depends(get_current_admin)):
+    """Create a new event"""
+    event_dict = event.dict()
+    event_dict["id"] = str(uuid.uuid4())
+    event_dict["is_active"] = True
+    event_dict["created_at"] = datetime.now(timezone.utc)
+    event_dict["updated_at"] = datetime.now(timezone.utc)
+    await db.events.insert_one(event_dict)
+    await content_versions.bump("events")
+    event_dict.pop("_id", None)
+    return event_dict
+
+
+@router.put("/admin/events/{event_id}")
+async def admin_update_event(event_id: str, update: EventUpdate, username: str = Depends(get_current_admin)):
+    """Update an existing event"""
+    update_data = {k: v for k, v in update.dict().items() if v is not None}
+    update_data["updated_at"] = datetime.now(timezone.utc)
+    
+    result = await db.events.update_one(
+        {"id": event_id},
+        {"$set": update_data}
+    )
+    
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Event not found")
+    await content_versions.bump("events")
+    
+    updated = await db.events.find_one({"id": event_id}, {"_id": 0})
+    return updated
+
+
+@router.delete("/admin/events/{event_id}")
+async def admin_delete_event(event_id: str, username: str = Depends(get_current_admin)):
+    """Delete an event"""
+    result = await db.events.delete_one({"id": event_id})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Event not found")
+    await content_versions.bump("events")
+    return {"success": True, "message": "Event deleted"}
+
+
+# Event ticket packages (predefined on backend for security)
+EVENT_PACKAGES = {
+    "general": {"amount": 25.00, "name": "General Admission", "description": "General admission ticket"},
+    "vip": {"amount": 75.00, "name": "VIP Experience", "description": "VIP admission with perks"},
+    "table": {"amount": 200.00, "name": "Table Reservation", "description": "Reserved table for 4"},
+}
+
+
+@router.get("/events/packages")
+async def get_event_packages():
+    """Get available event ticket packages"""
+    return EVENT_PACKAGES
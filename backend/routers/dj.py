@@ -0,0 +1,415 @@
+import uuid
+import asyncio
+from typing import Optional
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, HTTPException, Depends
+from pymongo import ReturnDocument
+
+from models import (
+    DJTipCreate, DJTipResponse, DJProfile, DJProfileCreate, DJProfileUpdate, DJProfileResponse,
+    DJSchedule, DJScheduleCreate, DJScheduleUpdate, DJScheduleResponse, SongRequestCreate,
+    SongRequestResponse
+)
+from batch_loader import BatchLoader
+from core import db, venue_state, rollups, singleflight, get_current_admin, get_batch_loader
+from fast_json import FastJSONResponse, RecordShape
+from migrations import stamp
+
+router = APIRouter(tags=["dj"])
+
+# Response layouts for the fast JSON path on hot list endpoints
+DJ_TIP_SHAPE = RecordShape(DJTipResponse)
+SONG_REQUEST_SHAPE = RecordShape(SongRequestResponse)
+
+
+# =====================================================
+# DJ TIPPING ENDPOINTS
+# =====================================================
+
+@router.post("/social/dj-tip", response_model=DJTipResponse)
+async def send_dj_tip(tip: DJTipCreate):
+    """Send a tip to the DJ"""
+    # Verify check-in exists
+    checkin = await db.checkins.find_one({"id": tip.checkin_id})
+    if not checkin:
+        raise HTTPException(status_code=400, detail="You must be checked in to tip the DJ")
+    
+    if tip.amount < 1:
+        raise HTTPException(status_code=400, detail="Minimum tip is $1")
+    
+    tip_dict = tip.dict()
+    tip_dict["id"] = str(uuid.uuid4())
+    tip_dict["created_at"] = datetime.now(timezone.utc)
+    
+    await db.dj_tips.insert_one(stamp("dj_tips", tip_dict))
+    await venue_state.record_tip(tip_dict["location_slug"], tip_dict["amount"])
+    await rollups.record({"tips_count": 1, "tips_sum": tip_dict["amount"]}, tip_dict["location_slug"], tip_dict["created_at"])
+    
+    return DJTipResponse.model_construct(
+        id=tip_dict["id"],
+        location_slug=tip_dict["location_slug"],
+        tipper_name=tip_dict["tipper_name"],
+        tipper_emoji=tip_dict["tipper_emoji"],
+        amount=tip_dict["amount"],
+        message=tip_dict.get("message"),
+        song_request=tip_dict.get("song_request"),
+        created_at=tip_dict["created_at"]
+    )
+
+
+@router.get("/social/dj-tips/{location_slug}")
+async def get_dj_tips(location_slug: str):
+    """Get recent DJ tips for a location (public display)"""
+    tips = await db.dj_tips.find(
+        {"location_slug": location_slug},
+        DJ_TIP_SHAPE.projection
+    ).sort("created_at", -1).limit(20).to_list(20)
+    
+    return FastJSONResponse(DJ_TIP_SHAPE.records(tips))
+
+
+@router.get("/social/dj-tips/{location_slug}/total")
+async def get_dj_tips_total(location_slug: str):
+    """Get total tips for the DJ at a location today"""
+    if await rollups.backfilled():
+        today = await rollups.get_day(location_slug)
+        return {"total": today["tips_sum"], "count": today["tips_count"]}
+    
+    # Until backfill_rollups.py has run, today's bucket misses tips made before deploy
+    today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    result = await db.dj_tips.aggregate([
+        {"$match": {"location_slug": location_slug, "created_at": {"$gte": today_start}}},
+        {"$group": {"_id": None, "total": {"$sum": "$amount"}, "count": {"$sum": 1}}}
+    ]).to_list(1)
+    if result:
+        return {"total": result[0]["total"], "count": result[0]["count"]}
+    return {"total": 0, "count": 0}
+
+
+# =====================================================
+# SONG REQUEST & KARAOKE ENDPOINTS
+# =====================================================
+
+@router.post("/social/song-request", response_model=SongRequestResponse)
+async def submit_song_request(request: SongRequestCreate):
+    """Submit a song request or karaoke sign up to the DJ"""
+    request_dict = request.dict()
+    request_dict["id"] = str(uuid.uuid4())
+    request_dict["status"] = "pending"
+    request_dict["created_at"] = datetime.now(timezone.utc)
+    
+    await db.song_requests.insert_one(request_dict)
+    await venue_state.adjust_pending_requests(request_dict["location_slug"], 1)
+    
+    return SongRequestResponse.model_construct(**request_dict)
+
+
+@router.get("/social/song-requests/{location_slug}")
+async def get_song_requests(location_slug: str, request_type: Optional[str] = None):
+    """Get song requests for a location (for DJ view)"""
+    query = {"location_slug": location_slug, "status": "pending"}
+    if request_type:
+        query["request_type"] = request_type
+    
+    requests = await db.song_requests.find(
+        query,
+        SONG_REQUEST_SHAPE.projection
+    ).sort("created_at", 1).to_list(50)
+    
+    return FastJSONResponse(SONG_REQUEST_SHAPE.records(requests))
+
+
+@router.put("/social/song-request/{request_id}/status")
+async def update_song_request_status(request_id: str, status: str):
+    """Update the status of a song request (played, skipped)"""
+    if status not in ["pending", "played", "skipped"]:
+        raise HTTPException(status_code=400, detail="Invalid status")
+    
+    previous = await db.song_requests.find_one_and_update(
+        {"id": request_id},
+        {"$set": {"status": status}},
+        projection={"_id": 0, "location_slug": 1, "status": 1},
+        return_document=ReturnDocument.BEFORE
+    )
+    
+    if not previous:
+        raise HTTPException(status_code=404, detail="Request not found")
+    
+    was_pending = previous.get("status") == "pending"
+    await venue_state.adjust_pending_requests(
+        previous["location_slug"],
+        int(status == "pending") - int(was_pending)
+    )
+    
+    return {"message": f"Request status updated to {status}"}
+
+
+# =====================================================
+# DJ PROFILE ENDPOINTS
+# =====================================================
+
+@router.post("/dj/register", response_model=DJProfileResponse)
+async def register_dj(profile: DJProfileCreate):
+    """Register a new DJ profile"""
+    profile_dict = profile.dict()
+    profile_dict["id"] = str(uuid.uuid4())
+    profile_dict["is_active"] = True
+    profile_dict["current_location"] = None
+    profile_dict["checked_in_at"] = None
+    profile_dict["created_at"] = datetime.now(timezone.utc)
+    
+    await db.dj_profiles.insert_one(profile_dict)
+    
+    return DJProfileResponse(**profile_dict)
+
+
+@router.get("/dj/profiles")
+async def get_all_dj_profiles():
+    """Get all DJ profiles"""
+    profiles = await db.dj_profiles.find({"is_active": True}, {"_id": 0}).to_list(100)
+    return [DJProfileResponse(**p) for p in profiles]
+
+
+@router.get("/dj/profile/{dj_id}", response_model=DJProfileResponse)
+async def get_dj_profile(dj_id: str):
+    """Get a specific DJ profile"""
+    profile = await db.dj_profiles.find_one({"id": dj_id}, {"_id": 0})
+    if not profile:
+        raise HTTPException(status_code=404, detail="DJ profile not found")
+    return DJProfileResponse(**profile)
+
+
+@router.put("/dj/profile/{dj_id}", response_model=DJProfileResponse)
+async def update_dj_profile(dj_id: str, update: DJProfileUpdate):
+    """Update a DJ profile"""
+    profile = await db.dj_profiles.find_one({"id": dj_id})
+    if not profile:
+        raise HTTPException(status_code=404, detail="DJ profile not found")
+    
+    update_dict = {k: v for k, v in update.dict().items() if v is not None}
+    if update_dict:
+        await db.dj_profiles.update_one({"id": dj_id}, {"$set": update_dict})
+    
+    updated = await db.dj_profiles.find_one({"id": dj_id}, {"_id": 0})
+    if profile.get("current_location"):
+        await venue_state.sync_dj(updated)
+    return DJProfileResponse(**updated)
+
+
+@router.post("/dj/checkin/{dj_id}")
+async def dj_checkin(dj_id: str, location_slug: str):
+    """DJ checks in at a location to start their set"""
+    profile = await db.dj_profiles.find_one({"id": dj_id})
+    if not profile:
+        raise HTTPException(status_code=404, detail="DJ profile not found")
+    
+    # Check out any other DJ at this location
+    await db.dj_profiles.update_many(
+        {"current_location": location_slug},
+        {"$set": {"current_location": None, "checked_in_at": None}}
+    )
+    
+    # Check in this DJ
+    checked_in = await db.dj_profiles.find_one_and_update(
+        {"id": dj_id},
+        {"$set": {
+            "current_location": location_slug,
+            "checked_in_at": datetime.now(timezone.utc)
+        }},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    singleflight.forget(("dj_at_location", location_slug))
+    await venue_state.sync_dj(checked_in)
+    
+    return {"message": f"DJ checked in at {location_slug}"}
+
+
+@router.post("/dj/checkout/{dj_id}")
+async def dj_checkout(dj_id: str):
+    """DJ checks out from their current location"""
+    await db.dj_profiles.update_one(
+        {"id": dj_id},
+        {"$set": {"current_location": None, "checked_in_at": None}}
+    )
+    await venue_state.clear_dj(dj_id)
+    return {"message": "DJ checked out"}
+
+
+@router.get("/dj/at-location/{location_slug}")
+async def get_dj_at_location(location_slug: str):
+    """Get the DJ currently playing at a location"""
+    async def load_profile():
+        return await db.dj_profiles.find_one(
+            {"current_location": location_slug, "is_active": True},
+            {"_id": 0}
+        )
+    
+    profile = await singleflight.do(("dj_at_location", location_slug), load_profile)
+    if not profile:
+        return None
+    return DJProfileResponse(**profile)
+
+
+# =====================================================
+# DJ SCHEDULE ENDPOINTS
+# =====================================================
+
+@router.get("/dj/schedules")
+async def get_all_dj_schedules():
+    """Get all upcoming DJ schedules (public)"""
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    schedules = await db.dj_schedules.find(
+        {
+            "is_active": True,
+            "$or": [
+                {"scheduled_date": {"$gte": today}},
+                {"is_recurring": True}
+            ]
+        },
+        {"_id": 0}
+    ).sort("scheduled_date", 1).to_list(100)
+    return [DJScheduleResponse(**s) for s in schedules]
+
+
+@router.get("/dj/schedules/location/{location_slug}")
+async def get_dj_schedules_for_location(location_slug: str):
+    """Get upcoming DJ schedules for a specific location"""
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    schedules = await db.dj_schedules.find(
+        {
+            "location_slug": location_slug,
+            "is_active": True,
+            "$or": [
+                {"scheduled_date": {"$gte": today}},
+                {"is_recurring": True}
+            ]
+        },
+        {"_id": 0}
+    ).sort("scheduled_date", 1).to_list(50)
+    return [DJScheduleResponse(**s) for s in schedules]
+
+
+@router.get("/admin/dj/schedules")
+async def admin_get_all_dj_schedules(username: str = Depends(get_current_admin)):
+    """Get all DJ schedules (admin)"""
+    schedules = await db.dj_schedules.find({}, {"_id": 0}).sort("scheduled_date", -1).to_list(200)
+    return [DJScheduleResponse(**s) for s in schedules]
+
+
+@router.get("/admin/dj/profiles")
+async def admin_get_all_dj_profiles(username: str = Depends(get_current_admin)):
+    """Get all DJ profiles (admin)"""
+    profiles = await db.dj_profiles.find({}, {"_id": 0}).to_list(100)
+    return [DJProfileResponse(**p) for p in profiles]
+
+
+@router.post("/admin/dj/profiles")
+async def admin_create_dj_profile(profile: DJProfileCreate, username: str = Depends(get_current_admin)):
+    """Create a new DJ profile (admin)"""
+    profile_dict = profile.dict()
+    dj_profile = DJProfile(**profile_dict)
+    profile_data = dj_profile.dict()
+    await db.dj_profiles.insert_one(profile_data)
+    return DJProfileResponse(**profile_data)
+
+
+@router.put("/admin/dj/profiles/{dj_id}")
+async def admin_update_dj_profile(dj_id: str, update: DJProfileUpdate, username: str = Depends(get_current_admin)):
+    """Update a DJ profile (admin)"""
+    profile = await db.dj_profiles.find_one({"id": dj_id})
+    if not profile:
+        raise HTTPException(status_code=404, detail="DJ profile not found")
+    
+    update_dict = {k: v for k, v in update.dict().items() if v is not None}
+    if update_dict:
+        await db.dj_profiles.update_one({"id": dj_id}, {"$set": update_dict})
+    
+    updated = await db.dj_profiles.find_one({"id": dj_id}, {"_id": 0})
+    if profile.get("current_location"):
+        await venue_state.sync_dj(updated)
+    return DJProfileResponse(**updated)
+
+
+@router.delete("/admin/dj/profiles/{dj_id}")
+async def admin_delete_dj_profile(dj_id: str, username: str = Depends(get_current_admin)):
+    """Delete a DJ profile (admin)"""
+    result = await db.dj_profiles.delete_one({"id": dj_id})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="DJ profile not found")
+    # Also delete their schedules
+    await db.dj_schedules.delete_many({"dj_id": dj_id})
+    await venue_state.clear_dj(dj_id)
+    return {"message": "DJ profile deleted"}
+
+
+@router.post("/admin/dj/schedules")
+async def admin_create_dj_schedule(schedule: DJScheduleCreate, username: str = Depends(get_current_admin),
+                                   loader: BatchLoader = Depends(get_batch_loader)):
+    """Create a new DJ schedule (admin)"""
+    # Get DJ and location info concurrently
+    dj, location = await asyncio.gather(
+        loader.load("dj_profiles", "id", schedule.dj_id, {"_id": 0}),
+        loader.load("locations", "slug", schedule.location_slug, {"_id": 0})
+    )
+    if not dj:
+        raise HTTPException(status_code=404, detail="DJ profile not found")
+    if not location:
+        raise HTTPException(status_code=404, detail="Location not found")
+    
+    schedule_dict = schedule.dict()
+    schedule_dict["dj_name"] = dj.get("name", "Unknown DJ")
+    schedule_dict["dj_stage_name"] = dj.get("stage_name")
+    schedule_dict["dj_photo_url"] = dj.get("photo_url")
+    schedule_dict["location_name"] = location.get("name", "Unknown Location")
+    
+    # Set day_of_week if recurring
+    if schedule.is_recurring and schedule.scheduled_date:
+        date_obj = datetime.strptime(schedule.scheduled_date, "%Y-%m-%d")
+        schedule_dict["day_of_week"] = date_obj.weekday()
+    
+    dj_schedule = DJSchedule(**schedule_dict)
+    schedule_data = dj_schedule.dict()
+    await db.dj_schedules.insert_one(schedule_data)
+    
+    return DJScheduleResponse(**schedule_data)
+
+
+@router.put("/admin/dj/schedules/{schedule_id}")
+async def admin_update_dj_schedule(schedule_id: str, update: DJScheduleUpdate, username: str = Depends(get_current_admin)):
+    """Update a DJ schedule (admin)"""
+    schedule = await db.dj_schedules.find_one({"id": schedule_id})
+    if not schedule:
+        raise HTTPException(status_code=404, detail="Schedule not found")
+    
+    update_dict = {k: v for k, v in update.dict().items() if v is not None}
+    
+    # If DJ changed, update DJ info
+    if "dj_id" in update_dict:
+        dj = await db.dj_profiles.find_one({"id": update_dict["dj_id"]}, {"_id": 0})
+        if dj:
+            update_dict["dj_name"] = dj.get("name", "Unknown DJ")
+            update_dict["dj_stage_name"] = dj.get("stage_name")
+            update_dict["dj_photo_url"] = dj.get("photo_url")
+    
+    # If location changed, update location info
+    if "location_slug" in update_dict:
+        location = await db.locations.find_one({"slug": update_dict["location_slug"]}, {"_id": 0})
+        if location:
+            update_dict["location_name"] = location.get("name", "Unknown Location")
+    
+    if update_dict:
+        await db.dj_schedules.update_one({"id": schedule_id}, {"$set": update_dict})
+    
+    updated = await db.dj_schedules.find_one({"id": schedule_id}, {"_id": 0})
+    return DJScheduleResponse(**updated)
+
+
+@router.delete("/admin/dj/schedules/{schedule_id}")
+async def admin_delete_dj_schedule(schedule_id: str, username: str = Depends(get_current_admin)):
+    """Delete a DJ schedule (admin)"""
+    result = await db.dj_schedules.delete_one({"id": schedule_id})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Schedule not found")
+    return {"message": "Schedule deleted"}
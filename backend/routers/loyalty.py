@@ -0,0 +1,89 @@
+from typing import List
+
+from fastapi import APIRouter, HTTPException, Depends
+
+from models import (
+    LoyaltyMember, LoyaltyMemberCreate, PushSubscription, PushNotification, PushNotificationCreate
+)
+from core import db, admin_reads, push_service
+
+router = APIRouter(tags=["loyalty"])
+
+
+# VAPID Public Key endpoint
+@router.get("/push/public-key")
+async def get_vapid_public_key():
+    return {"publicKey": push_service.get_public_key()}
+
+
+# Loyalty Program Endpoints
+@router.post("/loyalty/signup", response_model=LoyaltyMember)
+async def signup_loyalty(member: LoyaltyMemberCreate):
+    """Sign up for loyalty program"""
+    # Check if email already exists
+    existing = await db.loyalty_members.find_one({"email": member.email})
+    if existing:
+        raise HTTPException(status_code=400, detail="Email already registered")
+    
+    member_dict = member.dict()
+    loyalty_member = LoyaltyMember(**member_dict)
+    await db.loyalty_members.insert_one(loyalty_member.dict())
+    return loyalty_member
+
+
+@router.post("/loyalty/subscribe-push/{member_id}")
+async def subscribe_push(member_id: str, subscription: PushSubscription):
+    """Subscribe to push notifications"""
+    member = await db.loyalty_members.find_one({"id": member_id})
+    if not member:
+        raise HTTPException(status_code=404, detail="Member not found")
+    
+    await db.loyalty_members.update_one(
+        {"id": member_id},
+        {"$set": {"push_subscription": subscription.dict()}}
+    )
+    return {"message": "Push subscription saved successfully"}
+
+
+@router.get("/loyalty/members", response_model=List[LoyaltyMember])
+async def get_loyalty_members(read_db=Depends(admin_reads)):
+    """Get all loyalty members (admin only - add auth in production)"""
+    members = await read_db.loyalty_members.find().to_list(1000)
+    return [LoyaltyMember(**member) for member in members]
+
+
+# Push Notification Endpoints
+@router.post("/notifications/send")
+async def send_push_notification(notification: PushNotificationCreate):
+    """Send push notification to subscribers (admin only - add auth in production)"""
+    notification_data = {
+        "title": notification.title,
+        "body": notification.body,
+        "icon": notification.icon,
+        "image": notification.image,
+        "url": notification.url
+    }
+    
+    if notification.send_to_all:
+        result = await push_service.send_to_all_subscribers(notification_data)
+    else:
+        result = {"sent": 0, "failed": 0, "total_subscribers": 0}
+    
+    # Save notification record
+    push_notif = PushNotification(
+        **notification.dict(exclude={'send_to_all'}),
+        sent_to=[]
+    )
+    await db.push_notifications.insert_one(push_notif.dict())
+    
+    return {
+        "message": "Push notifications sent",
+        "result": result
+    }
+
+
+@router.get("/notifications/history", response_model=List[PushNotification])
+async def get_notification_history():
+    """Get push notification history (admin only - add auth in production)"""
+    notifications = await db.push_notifications.find().sort("sent_at", -1).limit(50).to_list(50)
+    return [PushNotification(**notif) for notif in notifications]
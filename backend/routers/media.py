@@ -0,0 +1,367 @@
+import os
+import uuid
+import logging
+import mimetypes
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import FileResponse, JSONResponse, Response
+
+from core import ROOT_DIR, db, admin_reads, media_store, resumable_uploads, get_current_admin
+from media_cache import media_file_ids
+from upload_index import UploadIndex
+from upload_stream import TUS_VERSION, receive_upload, parse_tus_metadata
+
+router = APIRouter(tags=["media"])
+
+UPLOAD_DIR = ROOT_DIR / "uploads"
+UPLOAD_DIR.mkdir(exist_ok=True)
+
+# Listing of UPLOAD_DIR, rescanned only when the directory changes
+upload_index = UploadIndex(UPLOAD_DIR)
+
+
+# Endpoint to serve uploaded media (bytes in MongoDB or object storage)
+@router.get("/media/{file_id}")
+async def get_media_file(file_id: str):
+    """Serve a media file - from the disk cache/MongoDB, or a presigned redirect/proxy for object storage"""
+    # Cache hits skip the media_files read entirely
+    cached = media_store.cached_response(file_id)
+    if cached:
+        return cached
+    
+    media = await media_store.find(file_id=file_id)
+    if not media:
+        raise HTTPException(status_code=404, detail="File not found")
+    
+    return await media_store.response(media)
+
+
+# Fallback endpoint for old /api/uploads/{filename} format
+@router.get("/uploads/{filename}")
+async def get_upload_file(filename: str):
+    """Serve uploaded files - checks local disk first, then media_files by filename"""
+    # Try local disk first (preview environment) - streamed from the file,
+    # never read into memory
+    local_file = upload_index.get(filename)
+    if local_file:
+        # The index may be a refresh behind a delete on another worker
+        try:
+            stat = os.stat(upload_index.path(filename))
+        except FileNotFoundError:
+            upload_index.discard(filename)
+        else:
+            return FileResponse(upload_index.path(filename), media_type=local_file["media_type"], stat_result=stat)
+    
+    # Media is stored as <file_id><ext>, so the disk cache may already have it
+    file_id = filename.split('.')[0] if '.' in filename else filename
+    cached = media_store.cached_response(file_id)
+    if cached:
+        return cached
+    
+    # Try media_files by filename
+    media = await media_store.find(filename=filename)
+    if media:
+        return await media_store.response(media)
+    
+    # Try media_files by file_id (filename might be the UUID part)
+    media = await media_store.find(file_id=file_id)
+    if media:
+        return await media_store.response(media)
+    
+    raise HTTPException(status_code=404, detail="File not found")
+
+
+# File Upload (Admin)
+ALLOWED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
+ALLOWED_VIDEO_EXTENSIONS = {'.mp4', '.mov', '.webm', '.avi'}
+MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+MAX_VIDEO_SIZE = 50 * 1024 * 1024  # 50MB
+
+async def download_image_to_uploads(image_url: str):
+    if not image_url:
+        return None
+
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(image_url) as response:
+                if response.status != 200:
+                    logging.warning(f"Image download failed {response.status} for {image_url}")
+                    return None
+                content = await response.read()
+                if len(content) > MAX_FILE_SIZE:
+                    logging.warning(f"Image too large for {image_url}")
+                    return None
+
+                parsed_path = urlparse(image_url).path
+                ext = Path(parsed_path).suffix.lower()
+                if ext not in ALLOWED_EXTENSIONS:
+                    content_type = response.headers.get("Content-Type", "").split(";")[0].strip()
+                    guessed_ext = mimetypes.guess_extension(content_type) if content_type else None
+                    if guessed_ext and guessed_ext.lower() in ALLOWED_EXTENSIONS:
+                        ext = guessed_ext.lower()
+                    else:
+                        ext = ".jpg"
+
+                file_id = str(uuid.uuid4())
+                filename = f"{file_id}{ext}"
+                await media_store.save(file_id, filename, content, mimetypes.guess_type(filename)[0] or "image/jpeg",
+                                       source_url=image_url)
+
+                return f"/api/media/{file_id}"
+    except Exception as e:
+        logging.error(f"Failed to store image {image_url}: {e}")
+        return None
+
+
+async def warm_media_cache():
+    """Decode the active promo videos, gallery and menu photos into the media cache"""
+    promo_videos = await db.promo_videos.find({"is_active": True}, {"_id": 0, "url": 1}).to_list(500)
+    gallery = await db.gallery_items.find({"is_active": True}, {"_id": 0, "image_url": 1}).to_list(500)
+    menu_items = await db.menu_items.find({}, {"_id": 0, "image": 1}).to_list(1000)
+    file_ids = media_file_ids(
+        [v.get("url") for v in promo_videos]
+        + [g.get("image_url") for g in gallery]
+        + [m.get("image") for m in menu_items]
+    )
+    warmed = await media_store.warm_cache(file_ids)
+    logging.info(f"Media cache warmed with {warmed} of {len(file_ids)} files")
+    return warmed
+
+
+async def stream_upload_to_media(request: Request, allowed_extensions: set, default_type: str, max_size: int,
+                                 too_large_detail: str, **metadata) -> Dict:
+    """Stream the request's multipart `file` into the media backend and record it in media_files"""
+    file_id = str(uuid.uuid4())
+
+    def open_writer(filename: str, content_type: Optional[str]):
+        file_ext = Path(filename).suffix.lower()
+        if file_ext not in allowed_extensions:
+            kind = "Video type" if default_type == "video" else "File type"
+            raise HTTPException(
+                status_code=400,
+                detail=f"{kind} not allowed. Allowed types: {', '.join(allowed_extensions)}"
+            )
+        return media_store.open_writer(f"{file_id}{file_ext}", content_type or f"{default_type}/{file_ext[1:]}")
+
+    upload = await receive_upload(request, open_writer, max_size, too_large_detail)
+    return await media_store.record(
+        file_id, upload["key"], upload["content_type"], upload["size"], upload["stored"],
+        sha256=upload["sha256"], **metadata
+    )
+
+
+def media_upload_response(media: Dict) -> Dict:
+    # The media URL works in both preview and production
+    return {
+        "filename": media["filename"],
+        "url": f"/api/media/{media['file_id']}",
+        "legacy_url": f"/api/uploads/{media['filename']}",  # For backward compatibility
+        "size": media["size"],
+        "sha256": media["sha256"]
+    }
+
+
+@router.post("/admin/upload")
+async def admin_upload_file(request: Request, username: str = Depends(get_current_admin)):
+    """Upload an image file (multipart `file`) - streamed into the media backend, 413 past 10MB"""
+    try:
+        media = await stream_upload_to_media(
+            request, ALLOWED_EXTENSIONS, "image", MAX_FILE_SIZE, "File too large. Maximum size is 10MB",
+            uploaded_by=username
+        )
+        return media_upload_response(media)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
+
+
+@router.post("/admin/upload/video")
+async def admin_upload_video(request: Request, username: str = Depends(get_current_admin)):
+    """Upload a promo carousel video (multipart `file`) - streamed into the media backend, 413 past 50MB.
+    Large videos should use the resumable endpoints below."""
+    try:
+        media = await stream_upload_to_media(
+            request, ALLOWED_VIDEO_EXTENSIONS, "video", MAX_VIDEO_SIZE, "Video too large. Maximum size is 50MB",
+            type="video", uploaded_by=username
+        )
+        return media_upload_response(media)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to save video: {str(e)}")
+
+
+# Resumable promo video uploads (tus 1.0: POST to create, HEAD for the
+# offset, PATCH to append, DELETE to cancel), so a dropped connection
+# carries on from the last stored chunk instead of starting over
+RESUMABLE_VIDEO_PATH = "/admin/upload/video/resumable"
+
+
+def tus_headers(session: Optional[Dict] = None) -> Dict[str, str]:
+    headers = {"Tus-Resumable": TUS_VERSION}
+    if session:
+        headers["Upload-Offset"] = str(session["offset"])
+        headers["Upload-Length"] = str(session["length"])
+    return headers
+
+
+def header_int(request: Request, name: str) -> int:
+    value = request.headers.get(name, "")
+    if not value.isdigit():
+        raise HTTPException(status_code=400, detail=f"{name} header is required")
+    return int(value)
+
+
+async def get_resumable_session(upload_id: str) -> Dict:
+    session = await resumable_uploads.get(upload_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return session
+
+
+@router.options(RESUMABLE_VIDEO_PATH)
+async def resumable_video_options():
+    """tus discovery"""
+    return Response(status_code=204, headers={
+        **tus_headers(),
+        "Tus-Version": TUS_VERSION,
+        "Tus-Extension": "creation,termination",
+        "Tus-Max-Size": str(MAX_VIDEO_SIZE)
+    })
+
+
+@router.post(RESUMABLE_VIDEO_PATH)
+async def create_resumable_video_upload(request: Request, username: str = Depends(get_current_admin)):
+    """Start a resumable video upload (Upload-Length, Upload-Metadata with filename/filetype)"""
+    length = header_int(request, "Upload-Length")
+    if length > MAX_VIDEO_SIZE:
+        raise HTTPException(status_code=413, detail="Video too large. Maximum size is 50MB")
+
+    metadata = parse_tus_metadata(request.headers.get("Upload-Metadata", ""))
+    filename = metadata.get("filename") or metadata.get("name") or ""
+    file_ext = Path(filename).suffix.lower()
+    if file_ext not in ALLOWED_VIDEO_EXTENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Video type not allowed. Allowed types: {', '.join(ALLOWED_VIDEO_EXTENSIONS)}"
+        )
+
+    session = await resumable_uploads.create(
+        length, filename, metadata.get("filetype") or f"video/{file_ext[1:]}", uploaded_by=username
+    )
+    return Response(status_code=201, headers={
+        **tus_headers(session),
+        "Location": f"/api{RESUMABLE_VIDEO_PATH}/{session['_id']}"
+    })
+
+
+@router.head(RESUMABLE_VIDEO_PATH + "/{upload_id}")
+async def get_resumable_video_offset(upload_id: str, username: str = Depends(get_current_admin)):
+    """How much of the upload the server has"""
+    session = await get_resumable_session(upload_id)
+    return Response(status_code=200, headers=tus_headers(session))
+
+
+@router.patch(RESUMABLE_VIDEO_PATH + "/{upload_id}")
+async def append_resumable_video(upload_id: str, request: Request, username: str = Depends(get_current_admin)):
+    """Append bytes at Upload-Offset. The PATCH that completes the upload stores the
+    video and answers with the same JSON as /admin/upload/video."""
+    if request.headers.get("content-type") != "application/offset+octet-stream":
+        raise HTTPException(status_code=415, detail="Content-Type must be application/offset+octet-stream")
+    offset = header_int(request, "Upload-Offset")
+    session = await get_resumable_session(upload_id)
+    if session["status"] == "completed":
+        # A retried final PATCH
+        return JSONResponse(session["result"], headers=tus_headers(session))
+
+    session["offset"] = await resumable_uploads.append(session, offset, request.stream())
+    if session["offset"] < session["length"]:
+        return Response(status_code=204, headers=tus_headers(session))
+
+    try:
+        upload = await resumable_uploads.complete(session)
+        media = await media_store.record(
+            session["file_id"], session["key"], session["content_type"], upload["size"], upload["stored"],
+            sha256=upload["sha256"], type="video", uploaded_by=session.get("uploaded_by")
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to save video: {str(e)}")
+
+    result = media_upload_response(media)
+    await resumable_uploads.mark_completed(upload_id, result)
+    return JSONResponse(result, headers=tus_headers(session))
+
+
+@router.delete(RESUMABLE_VIDEO_PATH + "/{upload_id}")
+async def cancel_resumable_video(upload_id: str, username: str = Depends(get_current_admin)):
+    """Cancel an upload and drop what was received"""
+    if not await resumable_uploads.discard(upload_id):
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return Response(status_code=204, headers=tus_headers())
+
+
+@router.get("/admin/uploads")
+async def admin_list_uploads(username: str = Depends(get_current_admin), read_db=Depends(admin_reads)):
+    """List all uploaded files from both local disk and media_files"""
+    files = []
+    
+    # Get files from MongoDB (production-ready)
+    db_files = await read_db.media_files.find({}, {"_id": 0, "data": 0}).to_list(500)
+    for f in db_files:
+        files.append({
+            "filename": f.get("filename", ""),
+            "url": f"/api/media/{f.get('file_id', '')}",
+            "size": f.get("size", 0),
+            "source": f.get("storage", "mongodb")
+        })
+    seen = {file["filename"] for file in files}
+    
+    # Also list the local uploads directory (for preview environment)
+    for f in upload_index.list():
+        if Path(f["filename"]).suffix.lower() in ALLOWED_EXTENSIONS and f["filename"] not in seen:
+            files.append({
+                "filename": f["filename"],
+                "url": f"/api/uploads/{f['filename']}",
+                "size": f["size"],
+                "source": "local"
+            })
+    
+    return files
+
+
+@router.get("/admin/media/cache")
+async def admin_media_cache_stats(username: str = Depends(get_current_admin)):
+    """This worker's view of the local media cache"""
+    return media_store.cache.stats() if media_store.cache is not None else {"enabled": False}
+
+
+@router.delete("/admin/uploads/{filename}")
+async def admin_delete_upload(filename: str, username: str = Depends(get_current_admin)):
+    """Delete an uploaded file from local disk, media_files and its storage backend"""
+    deleted = False
+    
+    # Try to delete from the media backend
+    file_id = filename.rsplit('.', 1)[0] if '.' in filename else filename
+    media = await media_store.find(filename=filename) or await media_store.find(file_id=file_id)
+    if media and await media_store.delete(media):
+        deleted = True
+    
+    # Also try to delete from local
+    try:
+        file_path = UPLOAD_DIR / filename
+        if file_path.exists():
+            file_path.unlink()
+            deleted = True
+        upload_index.discard(filename)
+    except Exception:
+        pass
+    
+    if not deleted:
+        raise HTTPException(status_code=404, detail="File not found")
+    
+    return {"message": "File deleted successfully"}
@@ -0,0 +1,694 @@
+import os
+import uuid
+import logging
+from typing import List, Optional
+from datetime import datetime, timezone
+
+import aiohttp
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel
+
+from core import db, repos, sessions, rollups, singleflight
+from woocommerce import create_woocommerce_order
+from routers.content import EVENT_PACKAGES, fetch_event_by_id
+from routers.tokens import TOKEN_PACKAGES
+
+router = APIRouter(tags=["payments"])
+
+
+# =====================================================
+# WOOCOMMERCE MERCHANDISE ENDPOINTS
+# =====================================================
+
+@router.get("/merchandise")
+async def get_merchandise():
+    """Fetch products from WooCommerce store"""
+    # Concurrent shoppers share one WooCommerce call
+    return await singleflight.do(("merchandise",), fetch_merchandise)
+
+
+async def fetch_merchandise() -> List[dict]:
+    woo_url = os.environ.get("WOOCOMMERCE_URL")
+    woo_key = os.environ.get("WOOCOMMERCE_KEY")
+    woo_secret = os.environ.get("WOOCOMMERCE_SECRET")
+    
+    if not all([woo_url, woo_key, woo_secret]):
+        raise HTTPException(status_code=500, detail="WooCommerce not configured")
+    
+    api_url = f"{woo_url}/wp-json/wc/v3/products"
+    params = {
+        "consumer_key": woo_key,
+        "consumer_secret": woo_secret,
+        "per_page": 50,
+        "status": "publish"
+    }
+    
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(api_url, params=params) as response:
+                if response.status != 200:
+                    raise HTTPException(status_code=response.status, detail="Failed to fetch products")
+                products = await response.json()
+                
+                # Transform to simplified format
+                simplified = []
+                for p in products:
+                    # Get the main image
+                    image = p.get("images", [{}])[0].get("src", "") if p.get("images") else ""
+                    
+                    simplified.append({
+                        "id": p.get("id"),
+                        "name": p.get("name"),
+                        "price": p.get("price"),
+                        "regular_price": p.get("regular_price"),
+                        "sale_price": p.get("sale_price"),
+                        "description": p.get("short_description") or p.get("description", "")[:200],
+                        "image": image,
+                        "permalink": p.get("permalink"),
+                        "in_stock": p.get("in_stock", True),
+                        "categories": [c.get("name") for c in p.get("categories", [])]
+                    })
+                
+                return simplified
+    except aiohttp.ClientError as e:
+        logging.error(f"WooCommerce API error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to connect to store")
+
+
+@router.get("/merchandise/{product_id}")
+async def get_merchandise_product(product_id: int):
+    """Fetch a single product from WooCommerce"""
+    woo_url = os.environ.get("WOOCOMMERCE_URL")
+    woo_key = os.environ.get("WOOCOMMERCE_KEY")
+    woo_secret = os.environ.get("WOOCOMMERCE_SECRET")
+    
+    if not all([woo_url, woo_key, woo_secret]):
+        raise HTTPException(status_code=500, detail="WooCommerce not configured")
+    
+    api_url = f"{woo_url}/wp-json/wc/v3/products/{product_id}"
+    params = {
+        "consumer_key": woo_key,
+        "consumer_secret": woo_secret
+    }
+    
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(api_url, params=params) as response:
+                if response.status == 404:
+                    raise HTTPException(status_code=404, detail="Product not found")
+                if response.status != 200:
+                    raise HTTPException(status_code=response.status, detail="Failed to fetch product")
+                p = await response.json()
+                
+                return {
+                    "id": p.get("id"),
+                    "name": p.get("name"),
+                    "price": p.get("price"),
+                    "regular_price": p.get("regular_price"),
+                    "sale_price": p.get("sale_price"),
+                    "description": p.get("description"),
+                    "short_description": p.get("short_description"),
+                    "images": [img.get("src") for img in p.get("images", [])],
+                    "permalink": p.get("permalink"),
+                    "in_stock": p.get("in_stock", True),
+                    "categories": [c.get("name") for c in p.get("categories", [])],
+                    "attributes": p.get("attributes", []),
+                    "variations": p.get("variations", [])
+                }
+    except aiohttp.ClientError as e:
+        logging.error(f"WooCommerce API error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to connect to store")
+
+
+# =====================================================
+# CART & MERCHANDISE CHECKOUT
+# =====================================================
+
+class CartItem(BaseModel):
+    product_id: int
+    name: str
+    price: float
+    quantity: int = 1
+    image: Optional[str] = None
+
+class CartCheckoutRequest(BaseModel):
+    items: List[CartItem]
+    customer_email: Optional[str] = None
+    customer_name: Optional[str] = None
+    shipping_address: Optional[dict] = None
+
+
+@router.post("/cart/checkout")
+async def cart_checkout(checkout: CartCheckoutRequest, origin_url: str = None):
+    """Create WooCommerce order for cart items"""
+    if not checkout.items:
+        raise HTTPException(status_code=400, detail="Cart is empty")
+    
+    # Create order record
+    order_id = str(uuid.uuid4())
+    total = sum(item.price * item.quantity for item in checkout.items)
+    
+    cart_order = {
+        "id": order_id,
+        "items": [item.model_dump() for item in checkout.items],
+        "total": total,
+        "customer_email": checkout.customer_email,
+        "customer_name": checkout.customer_name,
+        "status": "pending",
+        "woo_order_id": None,
+        "created_at": datetime.now(timezone.utc),
+        "updated_at": datetime.now(timezone.utc)
+    }
+    await db.cart_orders.insert_one(cart_order)
+    
+    # Build WooCommerce line items
+    line_items = []
+    for item in checkout.items:
+        line_items.append({
+            "product_id": item.product_id,
+            "quantity": item.quantity
+        })
+    
+    # Meta data for tracking
+    return_url = f"{origin_url}/merch?order=success&order_id={order_id}" if origin_url else None
+    meta_data = [
+        {"key": "ff_order_id", "value": order_id},
+        {"key": "ff_type", "value": "merchandise"},
+    ]
+    if return_url:
+        meta_data.append({"key": "ff_return_url", "value": return_url})
+    
+    try:
+        order = await create_woocommerce_order(
+            line_items=line_items,
+            customer_email=checkout.customer_email,
+            meta_data=meta_data
+        )
+        
+        woo_order_id = order.get("id")
+        checkout_url = order.get("payment_url") or f"{os.environ.get('WOOCOMMERCE_URL')}/checkout/order-pay/{woo_order_id}/?pay_for_order=true&key={order.get('order_key')}"
+        
+        # Update order with WooCommerce ID
+        await db.cart_orders.update_one(
+            {"id": order_id},
+            {"$set": {"woo_order_id": woo_order_id, "updated_at": datetime.now(timezone.utc)}}
+        )
+        
+        return {
+            "checkout_url": checkout_url,
+            "order_id": order_id,
+            "woo_order_id": woo_order_id,
+            "total": total
+        }
+    except Exception:
+        await db.cart_orders.delete_one({"id": order_id})
+        raise
+
+
+@router.get("/cart/order/{order_id}")
+async def get_cart_order_status(order_id: str):
+    """Get cart order status"""
+    cart_order = await db.cart_orders.find_one({"id": order_id}, {"_id": 0})
+    if not cart_order:
+        raise HTTPException(status_code=404, detail="Order not found")
+    
+    # Check WooCommerce status if we have an order ID
+    woo_order_id = cart_order.get("woo_order_id")
+    if woo_order_id and cart_order.get("status") == "pending":
+        woo_url = os.environ.get("WOOCOMMERCE_URL")
+        woo_key = os.environ.get("WOOCOMMERCE_KEY")
+        woo_secret = os.environ.get("WOOCOMMERCE_SECRET")
+        
+        try:
+            async with aiohttp.ClientSession() as session:
+                auth = aiohttp.BasicAuth(woo_key, woo_secret)
+                api_url = f"{woo_url}/wp-json/wc/v3/orders/{woo_order_id}"
+                async with session.get(api_url, auth=auth) as response:
+                    if response.status == 200:
+                        woo_order = await response.json()
+                        woo_status = woo_order.get("status")
+                        if woo_status in ["completed", "processing"]:
+                            await db.cart_orders.update_one(
+                                {"id": order_id},
+                                {"$set": {"status": "paid", "updated_at": datetime.now(timezone.utc)}}
+                            )
+                            cart_order["status"] = "paid"
+                        elif woo_status in ["cancelled", "failed"]:
+                            await db.cart_orders.update_one(
+                                {"id": order_id},
+                                {"$set": {"status": woo_status, "updated_at": datetime.now(timezone.utc)}}
+                            )
+                            cart_order["status"] = woo_status
+        except Exception as e:
+            logging.error(f"Error checking order status: {e}")
+    
+    return cart_order
+
+
+# ============================================================================
+# STRIPE PAYMENT ENDPOINTS
+# ============================================================================
+
+# StripeCheckout comes from emergentintegrations, which drags in litellm/openai/google;
+# it is imported inside each handler so it loads with the first payment, not at startup
+
+@router.post("/stripe/tokens/checkout")
+async def create_stripe_token_checkout(request: Request, package_id: str, user_id: str, origin_url: str):
+    """Create Stripe checkout session for token purchase"""
+    # Validate package
+    if package_id not in TOKEN_PACKAGES:
+        raise HTTPException(status_code=400, detail="Invalid package")
+    
+    # Validate user exists
+    profile = await repos.user_profiles.get(user_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="User profile not found")
+    
+    package = TOKEN_PACKAGES[package_id]
+    amount = float(package["amount"])
+    tokens = package["tokens"]
+    name = package["name"]
+    
+    # Create transaction record first
+    transaction_id = str(uuid.uuid4())
+    transaction = {
+        "id": transaction_id,
+        "type": "token_purchase",
+        "payment_provider": "stripe",
+        "user_id": user_id,
+        "amount": amount,
+        "currency": "usd",
+        "tokens": tokens,
+        "package_id": package_id,
+        "payment_status": "pending",
+        "stripe_session_id": None,
+        "created_at": datetime.now(timezone.utc),
+        "updated_at": datetime.now(timezone.utc)
+    }
+    await db.payment_transactions.insert_one(transaction)
+    
+    try:
+        # Initialize Stripe checkout
+        from emergentintegrations.payments.stripe.checkout import StripeCheckout, CheckoutSessionRequest
+        stripe_api_key = os.environ.get("STRIPE_API_KEY")
+        host_url = str(request.base_url).rstrip('/')
+        webhook_url = f"{host_url}/api/webhook/stripe"
+        stripe_checkout = StripeCheckout(api_key=stripe_api_key, webhook_url=webhook_url)
+        
+        # Create success and cancel URLs
+        success_url = f"{origin_url}/account?payment=success&session_id={{CHECKOUT_SESSION_ID}}&transaction_id={transaction_id}"
+        cancel_url = f"{origin_url}/account?payment=cancelled"
+        
+        # Create checkout session
+        checkout_request = CheckoutSessionRequest(
+            amount=amount,
+            currency="usd",
+            success_url=success_url,
+            cancel_url=cancel_url,
+            metadata={
+                "transaction_id": transaction_id,
+                "user_id": user_id,
+                "tokens": str(tokens),
+                "type": "token_purchase",
+                "package_name": name
+            }
+        )
+        
+        session = await stripe_checkout.create_checkout_session(checkout_request)
+        
+        # Update transaction with Stripe session ID
+        await db.payment_transactions.update_one(
+            {"id": transaction_id},
+            {"$set": {"stripe_session_id": session.session_id, "updated_at": datetime.now(timezone.utc)}}
+        )
+        
+        return {
+            "checkout_url": session.url,
+            "session_id": session.session_id,
+            "transaction_id": transaction_id
+        }
+    except Exception as e:
+        logging.error(f"Stripe checkout error: {e}")
+        await db.payment_transactions.delete_one({"id": transaction_id})
+        raise HTTPException(status_code=500, detail=f"Failed to create checkout session: {str(e)}")
+
+
+@router.post("/stripe/events/checkout")
+async def create_stripe_event_checkout(
+    request: Request,
+    package_id: str,
+    quantity: int = 1,
+    user_id: str = None,
+    origin_url: str = None,
+    event_id: str = None,
+    customer_email: str = None
+):
+    """Create Stripe checkout session for event tickets"""
+    if not event_id:
+        raise HTTPException(status_code=400, detail="event_id is required")
+
+    # Validate package
+    if package_id not in EVENT_PACKAGES:
+        raise HTTPException(status_code=400, detail="Invalid event package")
+
+    event = await fetch_event_by_id(event_id)
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    quantity = max(1, quantity)
+    package_prices = event.get("package_prices") or {}
+    package_amount = float(package_prices.get(package_id, EVENT_PACKAGES[package_id]["amount"]))
+
+    if package_amount <= 0:
+        raise HTTPException(status_code=400, detail="Free package should use the free reservation endpoint")
+
+    amount = package_amount * quantity
+    name = EVENT_PACKAGES[package_id]["name"]
+    event_name = event.get("name", "Event")
+
+    # Create transaction record
+    transaction_id = str(uuid.uuid4())
+    transaction = {
+        "id": transaction_id,
+        "type": "event_ticket",
+        "payment_provider": "stripe",
+        "user_id": user_id,
+        "event_id": event_id,
+        "event_name": event_name,
+        "amount": amount,
+        "currency": "usd",
+        "package_id": package_id,
+        "package_price": package_amount,
+        "quantity": quantity,
+        "customer_email": customer_email,
+        "payment_status": "pending",
+        "stripe_session_id": None,
+        "created_at": datetime.now(timezone.utc),
+        "updated_at": datetime.now(timezone.utc)
+    }
+    await db.payment_transactions.insert_one(transaction)
+
+    try:
+        # Initialize Stripe checkout
+        from emergentintegrations.payments.stripe.checkout import StripeCheckout, CheckoutSessionRequest
+        stripe_api_key = os.environ.get("STRIPE_API_KEY")
+        host_url = str(request.base_url).rstrip('/')
+        webhook_url = f"{host_url}/api/webhook/stripe"
+        stripe_checkout = StripeCheckout(api_key=stripe_api_key, webhook_url=webhook_url)
+
+        # Create success and cancel URLs
+        success_url = f"{origin_url}/?payment=success&session_id={{CHECKOUT_SESSION_ID}}&transaction_id={transaction_id}&type=event"
+        cancel_url = f"{origin_url}/?payment=cancelled"
+
+        # Create checkout session
+        checkout_request = CheckoutSessionRequest(
+            amount=amount,
+            currency="usd",
+            success_url=success_url,
+            cancel_url=cancel_url,
+            metadata={
+                "transaction_id": transaction_id,
+                "user_id": user_id or "guest",
+                "type": "event_ticket",
+                "package_id": package_id,
+                "quantity": str(quantity),
+                "package_name": name,
+                "event_id": event_id,
+                "event_name": event_name,
+                "customer_email": customer_email or ""
+            }
+        )
+
+        session = await stripe_checkout.create_checkout_session(checkout_request)
+
+        # Update transaction with Stripe session ID
+        await db.payment_transactions.update_one(
+            {"id": transaction_id},
+            {"$set": {"stripe_session_id": session.session_id, "updated_at": datetime.now(timezone.utc)}}
+        )
+
+        return {
+            "checkout_url": session.url,
+            "session_id": session.session_id,
+            "transaction_id": transaction_id
+        }
+    except Exception as e:
+        logging.error(f"Stripe event checkout error: {e}")
+        await db.payment_transactions.delete_one({"id": transaction_id})
+        raise HTTPException(status_code=500, detail=f"Failed to create checkout session: {str(e)}")
+
+
+@router.post("/stripe/merch/checkout")
+async def create_stripe_merch_checkout(request: Request, items: list, customer_email: str = None, origin_url: str = None):
+    """Create Stripe checkout session for merchandise purchase"""
+    if not items:
+        raise HTTPException(status_code=400, detail="No items in cart")
+    
+    # Calculate total (items should have product_id, name, price, quantity)
+    total = 0.0
+    item_details = []
+    for item in items:
+        item_total = float(item.get("price", 0)) * int(item.get("quantity", 1))
+        total += item_total
+        item_details.append({
+            "name": item.get("name"),
+            "price": item.get("price"),
+            "quantity": item.get("quantity", 1),
+            "product_id": item.get("product_id")
+        })
+    
+    if total <= 0:
+        raise HTTPException(status_code=400, detail="Invalid cart total")
+    
+    # Create order record
+    order_id = str(uuid.uuid4())
+    order = {
+        "id": order_id,
+        "type": "merchandise",
+        "payment_provider": "stripe",
+        "items": item_details,
+        "total": total,
+        "currency": "usd",
+        "customer_email": customer_email,
+        "payment_status": "pending",
+        "stripe_session_id": None,
+        "created_at": datetime.now(timezone.utc),
+        "updated_at": datetime.now(timezone.utc)
+    }
+    await db.payment_transactions.insert_one(order)
+    
+    try:
+        # Initialize Stripe checkout
+        from emergentintegrations.payments.stripe.checkout import StripeCheckout, CheckoutSessionRequest
+        stripe_api_key = os.environ.get("STRIPE_API_KEY")
+        host_url = str(request.base_url).rstrip('/')
+        webhook_url = f"{host_url}/api/webhook/stripe"
+        stripe_checkout = StripeCheckout(api_key=stripe_api_key, webhook_url=webhook_url)
+        
+        # Create success and cancel URLs
+        success_url = f"{origin_url}/merch?payment=success&session_id={{CHECKOUT_SESSION_ID}}&order_id={order_id}"
+        cancel_url = f"{origin_url}/merch?payment=cancelled"
+        
+        # Create checkout session
+        checkout_request = CheckoutSessionRequest(
+            amount=total,
+            currency="usd",
+            success_url=success_url,
+            cancel_url=cancel_url,
+            metadata={
+                "order_id": order_id,
+                "type": "merchandise",
+                "customer_email": customer_email or "guest",
+                "item_count": str(len(item_details))
+            }
+        )
+        
+        session = await stripe_checkout.create_checkout_session(checkout_request)
+        
+        # Update order with Stripe session ID
+        await db.payment_transactions.update_one(
+            {"id": order_id},
+            {"$set": {"stripe_session_id": session.session_id, "updated_at": datetime.now(timezone.utc)}}
+        )
+        
+        return {
+            "checkout_url": session.url,
+            "session_id": session.session_id,
+            "order_id": order_id,
+            "total": total
+        }
+    except Exception as e:
+        logging.error(f"Stripe merch checkout error: {e}")
+        await db.payment_transactions.delete_one({"id": order_id})
+        raise HTTPException(status_code=500, detail=f"Failed to create checkout session: {str(e)}")
+
+
+@router.get("/stripe/checkout/status/{session_id}")
+async def get_stripe_checkout_status(request: Request, session_id: str):
+    """Get the status of a Stripe checkout session"""
+    # Find transaction by session ID
+    transaction = await db.payment_transactions.find_one({"stripe_session_id": session_id})
+    if not transaction:
+        raise HTTPException(status_code=404, detail="Transaction not found")
+    
+    # If already marked as paid, return immediately
+    if transaction.get("payment_status") == "paid":
+        return {
+            "status": "complete",
+            "payment_status": "paid",
+            "transaction_id": transaction.get("id"),
+            "type": transaction.get("type")
+        }
+    
+    try:
+        # Initialize Stripe checkout
+        from emergentintegrations.payments.stripe.checkout import StripeCheckout
+        stripe_api_key = os.environ.get("STRIPE_API_KEY")
+        host_url = str(request.base_url).rstrip('/')
+        webhook_url = f"{host_url}/api/webhook/stripe"
+        stripe_checkout = StripeCheckout(api_key=stripe_api_key, webhook_url=webhook_url)
+        
+        # Get status from Stripe
+        status_response = await stripe_checkout.get_checkout_status(session_id)
+        
+        if status_response.payment_status == "paid":
+            # Update transaction status
+            await db.payment_transactions.update_one(
+                {"stripe_session_id": session_id},
+                {"$set": {"payment_status": "paid", "updated_at": datetime.now(timezone.utc)}}
+            )
+            
+            # Handle token credit if this is a token purchase
+            if transaction.get("type") == "token_purchase":
+                user_id = transaction.get("user_id")
+                tokens = transaction.get("tokens", 0)
+                if user_id and tokens > 0:
+                    # Check if tokens already credited (prevent double credit)
+                    existing = await db.token_credits.find_one({
+                        "transaction_id": transaction.get("id"),
+                        "credited": True
+                    })
+                    if not existing:
+                        # Add tokens to user profile
+                        await repos.user_profiles.set_fields(user_id, {}, inc={"ff_tokens": tokens})
+                        sessions.invalidate_profile(user_id)
+                        # Record the credit
+                        await db.token_credits.insert_one({
+                            "transaction_id": transaction.get("id"),
+                            "user_id": user_id,
+                            "tokens": tokens,
+                            "credited": True,
+                            "created_at": datetime.now(timezone.utc)
+                        })
+                        await rollups.record({"token_purchases": 1, "tokens_purchased": tokens})
+            
+            return {
+                "status": "complete",
+                "payment_status": "paid",
+                "transaction_id": transaction.get("id"),
+                "type": transaction.get("type")
+            }
+        elif status_response.status == "expired":
+            await db.payment_transactions.update_one(
+                {"stripe_session_id": session_id},
+                {"$set": {"payment_status": "expired", "updated_at": datetime.now(timezone.utc)}}
+            )
+            return {
+                "status": "expired",
+                "payment_status": "expired",
+                "transaction_id": transaction.get("id")
+            }
+        else:
+            return {
+                "status": "pending",
+                "payment_status": "pending",
+                "transaction_id": transaction.get("id")
+            }
+    except Exception as e:
+        logging.error(f"Error checking Stripe status: {e}")
+        return {
+            "status": "pending",
+            "payment_status": "pending",
+            "transaction_id": transaction.get("id")
+        }
+
+
+@router.post("/webhook/stripe")
+async def stripe_webhook(request: Request):
+    """Handle Stripe webhook events"""
+    try:
+        # Get raw body and signature
+        body = await request.body()
+        signature = request.headers.get("Stripe-Signature")
+        
+        # Initialize Stripe checkout
+        from emergentintegrations.payments.stripe.checkout import StripeCheckout
+        stripe_api_key = os.environ.get("STRIPE_API_KEY")
+        host_url = str(request.base_url).rstrip('/')
+        webhook_url = f"{host_url}/api/webhook/stripe"
+        stripe_checkout = StripeCheckout(api_key=stripe_api_key, webhook_url=webhook_url)
+        
+        # Handle webhook
+        webhook_response = await stripe_checkout.handle_webhook(body, signature)
+        
+        if webhook_response.payment_status == "paid":
+            session_id = webhook_response.session_id
+            metadata = webhook_response.metadata
+            
+            # Update transaction
+            await db.payment_transactions.update_one(
+                {"stripe_session_id": session_id},
+                {"$set": {"payment_status": "paid", "updated_at": datetime.now(timezone.utc)}}
+            )
+            
+            # Handle token credit if this is a token purchase
+            if metadata.get("type") == "token_purchase":
+                user_id = metadata.get("user_id")
+                tokens = int(metadata.get("tokens", 0))
+                transaction_id = metadata.get("transaction_id")
+                
+                if user_id and tokens > 0 and transaction_id:
+                    # Check if tokens already credited
+                    existing = await db.token_credits.find_one({
+                        "transaction_id": transaction_id,
+                        "credited": True
+                    })
+                    if not existing:
+                        await repos.user_profiles.set_fields(user_id, {}, inc={"ff_tokens": tokens})
+                        sessions.invalidate_profile(user_id)
+                        await db.token_credits.insert_one({
+                            "transaction_id": transaction_id,
+                            "user_id": user_id,
+                            "tokens": tokens,
+                            "credited": True,
+                            "created_at": datetime.now(timezone.utc)
+                        })
+                        await rollups.record({"token_purchases": 1, "tokens_purchased": tokens})
+        
+        return {"status": "received"}
+    except Exception as e:
+        logging.error(f"Stripe webhook error: {e}")
+        return {"status": "error", "message": str(e)}
+
+
+@router.get("/payment/methods")
+async def get_payment_methods():
+    """Get available payment methods"""
+    return {
+        "methods": [
+            {
+                "id": "stripe",
+                "name": "Credit/Debit Card (Stripe)",
+                "description": "Pay securely with your card",
+                "icon": "credit-card",
+                "enabled": True
+            },
+            {
+                "id": "woocommerce",
+                "name": "WooCommerce",
+                "description": "Pay via WooCommerce checkout",
+                "icon": "shopping-cart",
+                "enabled": True
+            }
+        ]
+    }
@@ -0,0 +1,404 @@
+import uuid
+from typing import List, Optional
+from datetime import datetime, timezone, timedelta
+
+from fastapi import APIRouter, HTTPException, Depends
+
+from models import (
+    CheckIn, CheckInCreate, CheckInResponse, SocialPostCreate, SocialPostResponse,
+    DirectMessageCreate, DirectMessageResponse, DrinkOrderCreate, DrinkOrderResponse
+)
+from batch_loader import BatchLoader
+from core import repos, venue_state, rollups, singleflight, presence, get_batch_loader
+from fast_json import FastJSONResponse, RecordShape
+from routers.dj import DJ_TIP_SHAPE, SONG_REQUEST_SHAPE
+from timeline import TIMELINE_MAX_PAGE_SIZE, TIMELINE_PAGE_SIZE, VenueTimeline
+
+router = APIRouter(tags=["social"])
+
+# Response layouts for the fast JSON path on hot list endpoints
+SOCIAL_POST_SHAPE = RecordShape(SocialPostResponse, computed=("likes_count", "liked_by_me"), extra=("likes",))
+DIRECT_MESSAGE_SHAPE = RecordShape(DirectMessageResponse)
+DRINK_ORDER_SHAPE = RecordShape(DrinkOrderResponse)
+
+# Drink orders shown on a location's public feeds
+VISIBLE_DRINK_STATUSES = ["pending", "accepted", "delivered"]
+
+# A location's activity merged across feeds (GET /venue/{slug}/timeline)
+VENUE_TIMELINE = VenueTimeline([
+    {"kind": "post", "repository": repos.social_posts, "projection": SOCIAL_POST_SHAPE.projection},
+    {"kind": "dj_tip", "repository": repos.dj_tips, "projection": DJ_TIP_SHAPE.projection},
+    {
+        "kind": "drink",
+        "repository": repos.drink_orders,
+        "projection": DRINK_ORDER_SHAPE.projection,
+        "filter": {"status": {"$in": VISIBLE_DRINK_STATUSES}}
+    },
+    {"kind": "song_request", "repository": repos.song_requests, "projection": SONG_REQUEST_SHAPE.projection},
+])
+TIMELINE_SHAPES = {"dj_tip": DJ_TIP_SHAPE, "drink": DRINK_ORDER_SHAPE, "song_request": SONG_REQUEST_SHAPE}
+
+# What group_conversations reads from each message
+CONVERSATION_PROJECTION = {
+    "_id": 0, "from_checkin_id": 1, "to_checkin_id": 1, "from_name": 1, "to_name": 1,
+    "from_emoji": 1, "to_emoji": 1, "message": 1, "created_at": 1
+}
+
+
+# =====================================================
+# LOCATION CHECK-IN ENDPOINTS
+# =====================================================
+
+@router.post("/checkin", response_model=CheckInResponse)
+async def check_in(checkin_data: CheckInCreate):
+    """Check in at a location"""
+    # Auto-expire after 4 hours
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=4)
+    
+    checkin = CheckIn(
+        id=str(uuid.uuid4()),
+        location_slug=checkin_data.location_slug,
+        display_name=checkin_data.display_name,
+        avatar_emoji=checkin_data.avatar_emoji,
+        mood=checkin_data.mood,
+        message=checkin_data.message,
+        selfie_url=checkin_data.selfie_url,
+        checked_in_at=datetime.now(timezone.utc),
+        expires_at=expires_at
+    )
+    
+    checkin_dict = checkin.model_dump()
+    await repos.checkins.insert(checkin_dict)
+    presence.join(checkin_dict)
+    await venue_state.record_checkin(checkin.location_slug, expires_at)
+    await rollups.record({"checkins": 1}, checkin.location_slug, checkin.checked_in_at)
+    
+    return CheckInResponse.model_construct(
+        id=checkin.id,
+        location_slug=checkin.location_slug,
+        display_name=checkin.display_name,
+        avatar_emoji=checkin.avatar_emoji,
+        mood=checkin.mood,
+        message=checkin.message,
+        selfie_url=checkin.selfie_url,
+        checked_in_at=checkin.checked_in_at
+    )
+
+@router.get("/checkin/{location_slug}", response_model=List[CheckInResponse])
+async def get_checked_in_users(location_slug: str):
+    """Get all users currently checked in at a location"""
+    # Current presence, kept up to date by heartbeats (no query)
+    return FastJSONResponse(presence.present(location_slug))
+
+@router.post("/checkin/{checkin_id}/heartbeat")
+async def checkin_heartbeat(checkin_id: str):
+    """Keep a check-in present; 404 once it has expired or been checked out"""
+    location_slug = await presence.heartbeat(checkin_id)
+    if location_slug is None:
+        raise HTTPException(status_code=404, detail="Check-in not found")
+    return {"location_slug": location_slug, "count": presence.count(location_slug)}
+
+@router.delete("/checkin/{checkin_id}")
+async def check_out(checkin_id: str):
+    """Check out from a location"""
+    checkin = await repos.checkins.check_out(checkin_id)
+    if not checkin:
+        raise HTTPException(status_code=404, detail="Check-in not found")
+    presence.leave(checkin_id, checkin["location_slug"])
+    await venue_state.record_checkout(checkin)
+    return {"message": "Checked out successfully"}
+
+@router.get("/checkin/count/{location_slug}")
+async def get_checkin_count(location_slug: str):
+    """Get the count of people checked in at a location"""
+    return {"location_slug": location_slug, "count": presence.count(location_slug)}
+
+
+# =====================================================
+# SOCIAL WALL ENDPOINTS
+# =====================================================
+
+@router.post("/social/posts", response_model=SocialPostResponse)
+async def create_social_post(post: SocialPostCreate):
+    """Create a post on the social wall for a location"""
+    # Verify the check-in exists and is active
+    checkin = await repos.checkins.get(post.checkin_id, {"_id": 0, "selfie_url": 1})
+    if not checkin:
+        raise HTTPException(status_code=400, detail="You must be checked in to post")
+    
+    post_dict = post.dict()
+    post_dict["id"] = str(uuid.uuid4())
+    post_dict["likes"] = []
+    post_dict["created_at"] = datetime.now(timezone.utc)
+    # Include author's selfie from check-in if available
+    post_dict["author_selfie"] = checkin.get("selfie_url") or post.author_selfie
+    
+    await repos.social_posts.insert(post_dict)
+    singleflight.forget(("social_posts", post_dict["location_slug"]))
+    await rollups.record({"posts": 1}, post_dict["location_slug"], post_dict["created_at"])
+    
+    return SocialPostResponse.model_construct(
+        id=post_dict["id"],
+        location_slug=post_dict["location_slug"],
+        checkin_id=post_dict["checkin_id"],
+        author_name=post_dict["author_name"],
+        author_emoji=post_dict["author_emoji"],
+        author_selfie=post_dict.get("author_selfie"),
+        message=post_dict["message"],
+        image_url=post_dict.get("image_url"),
+        likes_count=0,
+        liked_by_me=False,
+        created_at=post_dict["created_at"]
+    )
+
+
+def social_post_record(post: dict, my_checkin_id: Optional[str] = None) -> dict:
+    """A social wall record with like counts, from a post fetched with SOCIAL_POST_SHAPE.projection"""
+    likes = post.get("likes") or []
+    record = SOCIAL_POST_SHAPE.record(post)
+    record["likes_count"] = len(likes)
+    record["liked_by_me"] = my_checkin_id in likes if my_checkin_id else False
+    return record
+
+
+def build_social_wall(posts: List[dict], my_checkin_id: Optional[str] = None) -> List[dict]:
+    """Social wall records with like counts, from posts fetched with SOCIAL_POST_SHAPE.projection"""
+    return [social_post_record(post, my_checkin_id) for post in posts]
+
+
+@router.get("/social/posts/{location_slug}")
+async def get_social_posts(location_slug: str, my_checkin_id: Optional[str] = None):
+    """Get all posts for a location's social wall"""
+    async def load_posts():
+        return await repos.social_posts.wall(location_slug, SOCIAL_POST_SHAPE.projection)
+    
+    # Concurrent polls share the query; liked_by_me is filled in per request
+    posts = await singleflight.do(("social_posts", location_slug), load_posts)
+    return FastJSONResponse(build_social_wall(posts, my_checkin_id))
+
+
+def toggle_like(likes: List[str], checkin_id: str) -> str:
+    """Like or unlike in place; returns the action taken"""
+    if checkin_id in likes:
+        likes.remove(checkin_id)
+        return "unliked"
+    likes.append(checkin_id)
+    return "liked"
+
+
+@router.post("/social/posts/{post_id}/like")
+async def like_post(post_id: str, checkin_id: str):
+    """Like or unlike a post"""
+    post = await repos.social_posts.get(post_id, {"_id": 0, "location_slug": 1, "likes": 1})
+    if not post:
+        raise HTTPException(status_code=404, detail="Post not found")
+    
+    likes = post.get("likes", [])
+    action = toggle_like(likes, checkin_id)
+    
+    await repos.social_posts.set_likes(post_id, likes)
+    singleflight.forget(("social_posts", post["location_slug"]))
+    
+    return {"action": action, "likes_count": len(likes)}
+
+
+@router.delete("/social/posts/{post_id}")
+async def delete_social_post(post_id: str, checkin_id: str):
+    """Delete your own post"""
+    post = await repos.social_posts.get(post_id, {"_id": 0, "location_slug": 1, "checkin_id": 1})
+    if not post:
+        raise HTTPException(status_code=404, detail="Post not found")
+    
+    if post["checkin_id"] != checkin_id:
+        raise HTTPException(status_code=403, detail="You can only delete your own posts")
+    
+    await repos.social_posts.delete({"id": post_id})
+    singleflight.forget(("social_posts", post["location_slug"]))
+    return {"message": "Post deleted"}
+
+
+# =====================================================
+# DIRECT MESSAGES ENDPOINTS
+# =====================================================
+
+@router.post("/social/dm", response_model=DirectMessageResponse)
+async def send_direct_message(dm: DirectMessageCreate, loader: BatchLoader = Depends(get_batch_loader)):
+    """Send a direct message to another checked-in user"""
+    # Verify both check-ins exist (one query)
+    from_checkin, to_checkin = await loader.load_many(
+        "checkins", "id", [dm.from_checkin_id, dm.to_checkin_id], {"_id": 0, "id": 1}
+    )
+    
+    if not from_checkin:
+        raise HTTPException(status_code=400, detail="You must be checked in to send messages")
+    if not to_checkin:
+        raise HTTPException(status_code=400, detail="Recipient is no longer checked in")
+    
+    dm_dict = dm.dict()
+    dm_dict["id"] = str(uuid.uuid4())
+    dm_dict["read"] = False
+    dm_dict["created_at"] = datetime.now(timezone.utc)
+    
+    await repos.direct_messages.insert(dm_dict)
+    
+    return DirectMessageResponse.model_construct(**dm_dict)
+
+
+@router.get("/social/dm/{checkin_id}")
+async def get_my_messages(checkin_id: str):
+    """Get all DMs for a checked-in user (sent and received)"""
+    messages = await repos.direct_messages.for_checkin(checkin_id, DIRECT_MESSAGE_SHAPE.projection)
+    
+    return FastJSONResponse(DIRECT_MESSAGE_SHAPE.records(messages))
+
+
+def group_conversations(messages: List[dict], checkin_id: str) -> dict:
+    """Latest message per conversation partner, from messages sorted newest first"""
+    conversations = {}
+    for msg in messages:
+        if msg["from_checkin_id"] == checkin_id:
+            partner_id = msg["to_checkin_id"]
+            partner_name = msg["to_name"]
+            partner_emoji = msg["to_emoji"]
+        else:
+            partner_id = msg["from_checkin_id"]
+            partner_name = msg["from_name"]
+            partner_emoji = msg["from_emoji"]
+        
+        if partner_id not in conversations:
+            conversations[partner_id] = {
+                "partner_id": partner_id,
+                "partner_name": partner_name,
+                "partner_emoji": partner_emoji,
+                "last_message": msg["message"],
+                "last_message_at": msg["created_at"],
+                "unread_count": 0
+            }
+    return conversations
+
+
+@router.get("/social/dm/{checkin_id}/conversations")
+async def get_conversations(checkin_id: str):
+    """Get list of unique conversations for a user"""
+    messages = await repos.direct_messages.for_checkin(checkin_id, CONVERSATION_PROJECTION, limit=500)
+    
+    conversations = group_conversations(messages, checkin_id)
+    # One grouped count instead of a count per conversation
+    unread = await repos.direct_messages.unread_counts(checkin_id)
+    for partner_id, conversation in conversations.items():
+        conversation["unread_count"] = unread.get(partner_id, 0)
+    
+    return list(conversations.values())
+
+
+@router.get("/social/dm/{checkin_id}/thread/{partner_id}")
+async def get_dm_thread(checkin_id: str, partner_id: str):
+    """Get message thread between two users"""
+    messages = await repos.direct_messages.thread(checkin_id, partner_id, DIRECT_MESSAGE_SHAPE.projection)
+    
+    # Mark messages as read
+    await repos.direct_messages.mark_read(checkin_id, partner_id)
+    
+    return FastJSONResponse(DIRECT_MESSAGE_SHAPE.records(messages))
+
+
+@router.get("/social/dm/{checkin_id}/unread")
+async def get_unread_count(checkin_id: str):
+    """Get count of unread messages"""
+    count = await repos.direct_messages.unread_count(checkin_id)
+    return {"unread_count": count}
+
+
+# =====================================================
+# VENUE STATE ENDPOINTS
+# =====================================================
+
+@router.get("/venue/{location_slug}/state")
+async def get_venue_state(location_slug: str):
+    """Get the live venue snapshot (check-ins, DJ, tips, requests, drinks) in one read"""
+    state = await venue_state.get_state(location_slug)
+    # Who is actually here now, rather than unexpired check-in rows
+    state["checkin_count"] = presence.count(location_slug)
+    return state
+
+@router.get("/venue/{location_slug}/timeline")
+async def get_venue_timeline(location_slug: str, cursor: Optional[str] = None, limit: int = TIMELINE_PAGE_SIZE,
+                             my_checkin_id: Optional[str] = None):
+    """Get a location's posts, DJ tips, drinks and song requests merged newest first, a page at a time"""
+    try:
+        items, next_cursor = await VENUE_TIMELINE.page(
+            location_slug, cursor, min(max(limit, 1), TIMELINE_MAX_PAGE_SIZE)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    def timeline_record(kind: str, doc: dict) -> dict:
+        record = social_post_record(doc, my_checkin_id) if kind == "post" else TIMELINE_SHAPES[kind].record(doc)
+        return {"kind": kind, **record}
+    
+    return FastJSONResponse({
+        "items": [timeline_record(kind, doc) for kind, doc in items],
+        "next_cursor": next_cursor
+    })
+
+
+# =====================================================
+# SEND A DRINK ENDPOINTS
+# =====================================================
+
+@router.post("/social/drinks", response_model=DrinkOrderResponse)
+async def send_drink(order: DrinkOrderCreate, loader: BatchLoader = Depends(get_batch_loader)):
+    """Send a drink to another checked-in user"""
+    # Verify both check-ins exist (one query)
+    from_checkin, to_checkin = await loader.load_many(
+        "checkins", "id", [order.from_checkin_id, order.to_checkin_id], {"_id": 0, "id": 1}
+    )
+    
+    if not from_checkin:
+        raise HTTPException(status_code=400, detail="You must be checked in to send drinks")
+    if not to_checkin:
+        raise HTTPException(status_code=400, detail="Recipient is no longer checked in")
+    
+    order_dict = order.dict()
+    order_dict["id"] = str(uuid.uuid4())
+    order_dict["status"] = "pending"
+    order_dict["created_at"] = datetime.now(timezone.utc)
+    
+    await repos.drink_orders.insert(order_dict)
+    await venue_state.record_drink(order_dict)
+    await rollups.record({"drink_orders": 1}, order_dict["location_slug"], order_dict["created_at"])
+    
+    return DrinkOrderResponse.model_construct(**order_dict)
+
+
+@router.get("/social/drinks/{location_slug}")
+async def get_drinks_at_location(location_slug: str):
+    """Get recent drink orders at a location (public feed)"""
+    orders = await repos.drink_orders.recent_at(
+        location_slug, VISIBLE_DRINK_STATUSES, DRINK_ORDER_SHAPE.projection
+    )
+    
+    return FastJSONResponse(DRINK_ORDER_SHAPE.records(orders))
+
+
+@router.get("/social/drinks/for/{checkin_id}")
+async def get_drinks_for_user(checkin_id: str):
+    """Get drinks sent to or from a specific user"""
+    orders = await repos.drink_orders.for_checkin(checkin_id, DRINK_ORDER_SHAPE.projection)
+    
+    return FastJSONResponse(DRINK_ORDER_SHAPE.records(orders))
+
+
+@router.put("/social/drinks/{order_id}/status")
+async def update_drink_status(order_id: str, status: str):
+    """Update drink order status (pending, accepted, delivered)"""
+    if status not in ["pending", "accepted", "delivered", "cancelled"]:
+        raise HTTPException(status_code=400, detail="Invalid status")
+    
+    order = await repos.drink_orders.set_status(order_id, status)
+    
+    if not order:
+        raise HTTPException(status_code=404, detail="Drink order not found")
+    await venue_state.update_drink_status(order)
+    
+    return {"message": f"Drink status updated to {status}"}
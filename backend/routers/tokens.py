@@ -0,0 +1,615 @@
+import os
+import uuid
+import logging
+from datetime import datetime, timezone
+
+import aiohttp
+from fastapi import APIRouter, HTTPException, Depends, Request
+
+from models import TokenPurchaseCreate, TokenGiftCreate, TokenTransferCreate, CashoutRequestCreate
+from batch_loader import BatchLoader
+from core import db, admin_reads, repos, sessions, rollups, get_current_admin, get_batch_loader
+from woocommerce import create_woocommerce_order
+
+router = APIRouter(tags=["tokens"])
+
+
+# =====================================================
+# F&F TOKEN ENDPOINTS (with WooCommerce Payment)
+# =====================================================
+
+# Fixed token packages - amounts defined server-side for security
+TOKEN_PACKAGES = {
+    "10": {"amount": 1.00, "tokens": 10, "name": "10 F&F Tokens"},
+    "50": {"amount": 5.00, "tokens": 50, "name": "50 F&F Tokens"},
+    "100": {"amount": 10.00, "tokens": 100, "name": "100 F&F Tokens"},
+    "250": {"amount": 25.00, "tokens": 250, "name": "250 F&F Tokens"},
+    "500": {"amount": 50.00, "tokens": 500, "name": "500 F&F Tokens"},
+}
+
+
+@router.get("/tokens/packages")
+async def get_token_packages():
+    """Get available token packages for purchase"""
+    return TOKEN_PACKAGES
+
+
+@router.post("/tokens/checkout")
+async def create_token_checkout(request: Request, package_id: str, user_id: str, origin_url: str):
+    """Create WooCommerce order for token purchase"""
+    # Validate package
+    if package_id not in TOKEN_PACKAGES:
+        raise HTTPException(status_code=400, detail="Invalid package")
+    
+    # Validate user exists
+    profile = await repos.user_profiles.get(user_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="User profile not found")
+    
+    package = TOKEN_PACKAGES[package_id]
+    amount = package["amount"]
+    tokens = package["tokens"]
+    name = package["name"]
+    
+    # Create transaction record first
+    transaction_id = str(uuid.uuid4())
+    transaction = {
+        "id": transaction_id,
+        "type": "token_purchase",
+        "user_id": user_id,
+        "amount": amount,
+        "currency": "usd",
+        "tokens": tokens,
+        "package_id": package_id,
+        "payment_status": "pending",
+        "woo_order_id": None,
+        "created_at": datetime.now(timezone.utc),
+        "updated_at": datetime.now(timezone.utc)
+    }
+    await db.payment_transactions.insert_one(transaction)
+    
+    # Create WooCommerce order
+    line_items = [{
+        "name": name,
+        "quantity": 1,
+        "total": str(amount)
+    }]
+    
+    meta_data = [
+        {"key": "ff_transaction_id", "value": transaction_id},
+        {"key": "ff_user_id", "value": user_id},
+        {"key": "ff_tokens", "value": str(tokens)},
+        {"key": "ff_type", "value": "token_purchase"},
+        {"key": "ff_return_url", "value": f"{origin_url}/account?payment=success&transaction_id={transaction_id}"}
+    ]
+    
+    try:
+        order = await create_woocommerce_order(
+            line_items=line_items,
+            customer_email=profile.get("email"),
+            meta_data=meta_data
+        )
+        
+        woo_order_id = order.get("id")
+        checkout_url = order.get("payment_url") or f"{os.environ.get('WOOCOMMERCE_URL')}/checkout/order-pay/{woo_order_id}/?pay_for_order=true&key={order.get('order_key')}"
+        
+        # Update transaction with WooCommerce order ID
+        await db.payment_transactions.update_one(
+            {"id": transaction_id},
+            {"$set": {"woo_order_id": woo_order_id, "updated_at": datetime.now(timezone.utc)}}
+        )
+        
+        return {
+            "checkout_url": checkout_url,
+            "transaction_id": transaction_id,
+            "order_id": woo_order_id
+        }
+    except Exception:
+        # Clean up failed transaction
+        await db.payment_transactions.delete_one({"id": transaction_id})
+        raise
+
+
+@router.get("/tokens/checkout/status/{transaction_id}")
+async def get_checkout_status(transaction_id: str):
+    """Get the status of a token checkout"""
+    transaction = await db.payment_transactions.find_one({"id": transaction_id})
+    if not transaction:
+        raise HTTPException(status_code=404, detail="Transaction not found")
+    
+    # If already completed, return immediately
+    if transaction.get("payment_status") == "paid":
+        return {
+            "status": "complete",
+            "payment_status": "paid",
+            "tokens_credited": transaction.get("tokens", 0),
+            "already_processed": True
+        }
+    
+    # Check WooCommerce order status
+    woo_order_id = transaction.get("woo_order_id")
+    if not woo_order_id:
+        return {"status": "pending", "payment_status": "pending"}
+    
+    woo_url = os.environ.get("WOOCOMMERCE_URL")
+    woo_key = os.environ.get("WOOCOMMERCE_KEY")
+    woo_secret = os.environ.get("WOOCOMMERCE_SECRET")
+    
+    try:
+        async with aiohttp.ClientSession() as session:
+            auth = aiohttp.BasicAuth(woo_key, woo_secret)
+            api_url = f"{woo_url}/wp-json/wc/v3/orders/{woo_order_id}"
+            async with session.get(api_url, auth=auth) as response:
+                if response.status != 200:
+                    return {"status": "pending", "payment_status": "pending"}
+                
+                order = await response.json()
+                order_status = order.get("status")
+                
+                # WooCommerce completed/processing means payment received
+                if order_status in ["completed", "processing"]:
+                    # Credit tokens if not already done
+                    if transaction.get("payment_status") != "paid":
+                        await credit_tokens_from_transaction(transaction)
+                    
+                    return {
+                        "status": "complete",
+                        "payment_status": "paid",
+                        "tokens_credited": transaction.get("tokens", 0)
+                    }
+                elif order_status in ["cancelled", "failed", "refunded"]:
+                    await db.payment_transactions.update_one(
+                        {"id": transaction_id},
+                        {"$set": {"payment_status": order_status, "updated_at": datetime.now(timezone.utc)}}
+                    )
+                    return {"status": order_status, "payment_status": order_status}
+                else:
+                    return {"status": "pending", "payment_status": "pending"}
+    except Exception as e:
+        logging.error(f"Error checking order status: {e}")
+        return {"status": "pending", "payment_status": "pending"}
+
+
+async def credit_tokens_from_transaction(transaction: dict):
+    """Helper to credit tokens from a completed transaction"""
+    user_id = transaction.get("user_id")
+    tokens_to_add = transaction.get("tokens", 0)
+    transaction_id = transaction.get("id")
+    
+    profile = await repos.user_profiles.get(user_id)
+    if profile:
+        new_balance = profile.get("token_balance", 0) + tokens_to_add
+        await repos.user_profiles.set_fields(user_id, {"token_balance": new_balance, "updated_at": datetime.now(timezone.utc)})
+        sessions.invalidate_profile(user_id)
+        
+        # Create purchase record
+        purchase_record = {
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "amount_usd": transaction.get("amount"),
+            "tokens_purchased": tokens_to_add,
+            "payment_method": "woocommerce",
+            "woo_order_id": transaction.get("woo_order_id"),
+            "transaction_id": transaction_id,
+            "gifted_by": None,
+            "created_at": datetime.now(timezone.utc)
+        }
+        await db.token_purchases.insert_one(purchase_record)
+        await rollups.record({
+            "token_purchases": 1,
+            "tokens_purchased": tokens_to_add,
+            "token_purchase_usd": purchase_record["amount_usd"] or 0
+        }, at=purchase_record["created_at"])
+    
+    # Update transaction status
+    await db.payment_transactions.update_one(
+        {"id": transaction_id},
+        {"$set": {"payment_status": "paid", "updated_at": datetime.now(timezone.utc)}}
+    )
+
+
+@router.post("/webhook/woocommerce")
+async def woocommerce_webhook(request: Request):
+    """Handle WooCommerce webhook for order status updates"""
+    try:
+        body = await request.json()
+        
+        # Get order details
+        order_id = body.get("id")
+        order_status = body.get("status")
+        
+        if not order_id:
+            return {"status": "ok", "message": "No order ID"}
+        
+        # Find transaction by WooCommerce order ID
+        transaction = await db.payment_transactions.find_one({"woo_order_id": order_id})
+        
+        if not transaction:
+            # Could be a merchandise order
+            cart_order = await db.cart_orders.find_one({"woo_order_id": order_id})
+            if cart_order and order_status in ["completed", "processing"]:
+                await db.cart_orders.update_one(
+                    {"woo_order_id": order_id},
+                    {"$set": {"status": "paid", "updated_at": datetime.now(timezone.utc)}}
+                )
+            return {"status": "ok"}
+        
+        # Handle token purchase
+        if order_status in ["completed", "processing"] and transaction.get("payment_status") != "paid":
+            await credit_tokens_from_transaction(transaction)
+            logging.info(f"Credited {transaction.get('tokens')} tokens for order {order_id}")
+        elif order_status in ["cancelled", "failed", "refunded"]:
+            await db.payment_transactions.update_one(
+                {"id": transaction.get("id")},
+                {"$set": {"payment_status": order_status, "updated_at": datetime.now(timezone.utc)}}
+            )
+        
+        return {"status": "ok"}
+    except Exception as e:
+        logging.error(f"WooCommerce webhook error: {e}")
+        return {"status": "error", "message": str(e)}
+
+
+# Keep old endpoint for admin gifting
+@router.post("/user/tokens/purchase/{user_id}")
+async def purchase_tokens(user_id: str, purchase: TokenPurchaseCreate):
+    """Purchase F&F tokens - Used for admin gifting only"""
+    profile = await repos.user_profiles.get(user_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="User profile not found")
+    
+    if purchase.amount_usd < 1:
+        raise HTTPException(status_code=400, detail="Minimum purchase is $1")
+    
+    tokens_to_add = int(purchase.amount_usd * 10)
+    
+    purchase_record = {
+        "id": str(uuid.uuid4()),
+        "user_id": user_id,
+        "amount_usd": purchase.amount_usd,
+        "tokens_purchased": tokens_to_add,
+        "payment_method": "gift",
+        "gifted_by": None,
+        "created_at": datetime.now(timezone.utc)
+    }
+    await db.token_purchases.insert_one(purchase_record)
+    await rollups.record({
+        "token_purchases": 1,
+        "tokens_purchased": tokens_to_add,
+        "token_purchase_usd": purchase.amount_usd
+    }, at=purchase_record["created_at"])
+    
+    new_balance = profile.get("token_balance", 0) + tokens_to_add
+    await repos.user_profiles.set_fields(user_id, {"token_balance": new_balance, "updated_at": datetime.now(timezone.utc)})
+    sessions.invalidate_profile(user_id)
+    
+    purchase_record.pop("_id", None)
+    return {"purchase": purchase_record, "new_balance": new_balance}
+
+
+@router.get("/user/tokens/balance/{user_id}")
+async def get_token_balance(user_id: str):
+    """Get user's F&F token balance"""
+    profile = await repos.user_profiles.get(user_id, {"_id": 0, "token_balance": 1, "id": 1})
+    if not profile:
+        raise HTTPException(status_code=404, detail="User profile not found")
+    return {"user_id": user_id, "token_balance": profile.get("token_balance", 0)}
+
+
+@router.get("/user/tokens/history/{user_id}")
+async def get_token_history(user_id: str):
+    """Get user's token purchase/gift history"""
+    history = await db.token_purchases.find(
+        {"user_id": user_id},
+        {"_id": 0}
+    ).sort("created_at", -1).limit(50).to_list(50)
+    return history
+
+
+@router.post("/user/tokens/spend/{user_id}")
+async def spend_tokens(user_id: str, amount: int):
+    """Spend tokens (for tips and drinks)"""
+    profile = await repos.user_profiles.get(user_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="User profile not found")
+    
+    current_balance = profile.get("token_balance", 0)
+    if current_balance < amount:
+        raise HTTPException(status_code=400, detail="Insufficient token balance")
+    
+    new_balance = current_balance - amount
+    await repos.user_profiles.set_fields(user_id, {"token_balance": new_balance, "updated_at": datetime.now(timezone.utc)})
+    sessions.invalidate_profile(user_id)
+    
+    return {"user_id": user_id, "tokens_spent": amount, "new_balance": new_balance}
+
+
+# Admin: Gift tokens to a user
+@router.post("/admin/tokens/gift")
+async def admin_gift_tokens(gift: TokenGiftCreate, username: str = Depends(get_current_admin)):
+    """Admin: Gift F&F tokens to a user"""
+    profile = await repos.user_profiles.get(gift.user_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="User profile not found")
+    
+    if gift.tokens < 1:
+        raise HTTPException(status_code=400, detail="Must gift at least 1 token")
+    
+    # Create gift record
+    gift_record = {
+        "id": str(uuid.uuid4()),
+        "user_id": gift.user_id,
+        "amount_usd": gift.tokens / 10,  # Equivalent USD value
+        "tokens_purchased": gift.tokens,
+        "payment_method": "gift",
+        "gifted_by": username,
+        "message": gift.message,
+        "created_at": datetime.now(timezone.utc)
+    }
+    await db.token_purchases.insert_one(gift_record)
+    await rollups.record({
+        "token_purchases": 1,
+        "tokens_purchased": gift.tokens,
+        "token_purchase_usd": gift_record["amount_usd"]
+    }, at=gift_record["created_at"])
+    
+    # Update user balance
+    new_balance = profile.get("token_balance", 0) + gift.tokens
+    await repos.user_profiles.set_fields(gift.user_id, {"token_balance": new_balance, "updated_at": datetime.now(timezone.utc)})
+    sessions.invalidate_profile(gift.user_id)
+    
+    gift_record.pop("_id", None)
+    return {
+        "gift": gift_record,
+        "new_balance": new_balance,
+        "user_name": profile.get("name")
+    }
+
+
+# =====================================================
+# TOKEN TRANSFER ENDPOINTS
+# =====================================================
+
+@router.post("/user/tokens/transfer/{from_user_id}")
+async def transfer_tokens(from_user_id: str, transfer: TokenTransferCreate,
+                          loader: BatchLoader = Depends(get_batch_loader)):
+    """Transfer tokens from one user to another (tips, drinks, gifts)"""
+    # Get sender and receiver (one query)
+    sender, receiver = await loader.load_many(
+        "user_profiles", "id", [from_user_id, transfer.to_user_id], repos.user_profiles.projection
+    )
+    if not sender:
+        raise HTTPException(status_code=404, detail="Sender not found")
+    
+    if not receiver:
+        raise HTTPException(status_code=404, detail="Receiver not found")
+    
+    # Check sender balance
+    sender_balance = sender.get("token_balance", 0)
+    if sender_balance < transfer.amount:
+        raise HTTPException(status_code=400, detail="Insufficient token balance")
+    
+    if transfer.amount < 1:
+        raise HTTPException(status_code=400, detail="Must transfer at least 1 token")
+    
+    # Create transfer record
+    transfer_record = {
+        "id": str(uuid.uuid4()),
+        "from_user_id": from_user_id,
+        "to_user_id": transfer.to_user_id,
+        "amount": transfer.amount,
+        "transfer_type": transfer.transfer_type,
+        "message": transfer.message,
+        "created_at": datetime.now(timezone.utc)
+    }
+    await db.token_transfers.insert_one(transfer_record)
+    await rollups.record({"token_transfers": 1, "tokens_transferred": transfer_record["amount"]}, at=transfer_record["created_at"])
+    
+    # Update sender balance
+    new_sender_balance = sender_balance - transfer.amount
+    await repos.user_profiles.set_fields(from_user_id, {"token_balance": new_sender_balance, "updated_at": datetime.now(timezone.utc)})
+    sessions.invalidate_profile(from_user_id)
+    
+    # Update receiver - if staff, add to cashout_balance, else add to token_balance
+    receiver_role = receiver.get("role", "customer")
+    if receiver_role == "staff" and transfer.transfer_type == "tip":
+        # Staff receives tips in cashout_balance (USD value)
+        tip_usd_value = transfer.amount / 10  # 10 tokens = $1
+        new_cashout = receiver.get("cashout_balance", 0) + tip_usd_value
+        await repos.user_profiles.set_fields(transfer.to_user_id, {
+                "cashout_balance": new_cashout,
+                "updated_at": datetime.now(timezone.utc)
+            })
+        sessions.invalidate_profile(transfer.to_user_id)
+    else:
+        # Non-staff or non-tip transfers go to token_balance
+        new_receiver_balance = receiver.get("token_balance", 0) + transfer.amount
+        await repos.user_profiles.set_fields(transfer.to_user_id, {"token_balance": new_receiver_balance, "updated_at": datetime.now(timezone.utc)})
+        sessions.invalidate_profile(transfer.to_user_id)
+    
+    transfer_record.pop("_id", None)
+    return {
+        "transfer": transfer_record,
+        "sender_new_balance": new_sender_balance,
+        "receiver_name": receiver.get("name")
+    }
+
+
+@router.get("/user/tokens/transfers/{user_id}")
+async def get_user_transfers(user_id: str):
+    """Get user's token transfer history (sent and received)"""
+    transfers = await db.token_transfers.find(
+        {"$or": [{"from_user_id": user_id}, {"to_user_id": user_id}]},
+        {"_id": 0}
+    ).sort("created_at", -1).limit(100).to_list(100)
+    return transfers
+
+
+# =====================================================
+# STAFF CASHOUT ENDPOINTS
+# =====================================================
+
+@router.post("/staff/cashout/{user_id}")
+async def request_cashout(user_id: str, cashout: CashoutRequestCreate):
+    """Staff: Request to cash out accumulated tips (min $20, 80% rate)"""
+    user = await repos.user_profiles.get(user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    if user.get("role") != "staff":
+        raise HTTPException(status_code=403, detail="Only staff can request cashouts")
+    
+    cashout_balance = user.get("cashout_balance", 0)
+    
+    # Minimum $20 to cash out
+    if cashout_balance < 20:
+        raise HTTPException(status_code=400, detail=f"Minimum cashout is $20. Current balance: ${cashout_balance:.2f}")
+    
+    # Calculate tokens and USD (80% rate)
+    tokens_to_cashout = cashout.amount_tokens
+    usd_value = tokens_to_cashout / 10  # Token to USD
+    
+    if usd_value > cashout_balance:
+        raise HTTPException(status_code=400, detail=f"Requested amount exceeds balance. Max: ${cashout_balance:.2f}")
+    
+    payout_amount = usd_value * 0.8  # 80% payout rate
+    
+    # Create cashout request
+    cashout_record = {
+        "id": str(uuid.uuid4()),
+        "user_id": user_id,
+        "amount_tokens": tokens_to_cashout,
+        "amount_usd": payout_amount,
+        "status": "pending",
+        "payment_method": cashout.payment_method,
+        "payment_details": cashout.payment_details,
+        "created_at": datetime.now(timezone.utc),
+        "processed_at": None
+    }
+    await db.cashout_requests.insert_one(cashout_record)
+    await rollups.record({
+        "cashouts": 1,
+        "cashout_tokens": tokens_to_cashout,
+        "cashout_usd": payout_amount
+    }, at=cashout_record["created_at"])
+    
+    # Deduct from cashout balance
+    new_balance = cashout_balance - usd_value
+    total_earnings = user.get("total_earnings", 0) + payout_amount
+    
+    await repos.user_profiles.set_fields(user_id, {
+            "cashout_balance": new_balance,
+            "total_earnings": total_earnings,
+            "updated_at": datetime.now(timezone.utc)
+        })
+    sessions.invalidate_profile(user_id)
+    
+    cashout_record.pop("_id", None)
+    return {
+        "cashout": cashout_record,
+        "new_balance": new_balance,
+        "payout_amount": payout_amount
+    }
+
+
+@router.get("/staff/cashout/history/{user_id}")
+async def get_cashout_history(user_id: str):
+    """Get staff's cashout request history"""
+    history = await db.cashout_requests.find(
+        {"user_id": user_id},
+        {"_id": 0}
+    ).sort("created_at", -1).limit(50).to_list(50)
+    return history
+
+
+@router.post("/staff/transfer-to-personal/{user_id}")
+async def transfer_tips_to_personal(user_id: str, amount: float):
+    """Staff: Transfer cashout balance to personal token balance"""
+    user = await repos.user_profiles.get(user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    if user.get("role") != "staff":
+        raise HTTPException(status_code=403, detail="Only staff can transfer tips")
+    
+    cashout_balance = user.get("cashout_balance", 0)
+    
+    if amount > cashout_balance:
+        raise HTTPException(status_code=400, detail=f"Amount exceeds balance. Available: ${cashout_balance:.2f}")
+    
+    if amount < 1:
+        raise HTTPException(status_code=400, detail="Minimum transfer is $1")
+    
+    # Convert USD to tokens
+    tokens_to_add = int(amount * 10)  # $1 = 10 tokens
+    
+    # Update balances
+    new_cashout = cashout_balance - amount
+    new_token_balance = user.get("token_balance", 0) + tokens_to_add
+    
+    await repos.user_profiles.set_fields(user_id, {
+            "cashout_balance": new_cashout,
+            "token_balance": new_token_balance,
+            "updated_at": datetime.now(timezone.utc)
+        })
+    sessions.invalidate_profile(user_id)
+    
+    # Record the transfer
+    transfer_record = {
+        "id": str(uuid.uuid4()),
+        "from_user_id": user_id,
+        "to_user_id": user_id,
+        "amount": tokens_to_add,
+        "transfer_type": "tip_to_personal",
+        "message": f"Converted ${amount:.2f} tips to {tokens_to_add} tokens",
+        "created_at": datetime.now(timezone.utc)
+    }
+    await db.token_transfers.insert_one(transfer_record)
+    await rollups.record({"token_transfers": 1, "tokens_transferred": transfer_record["amount"]}, at=transfer_record["created_at"])
+    
+    return {
+        "new_cashout_balance": new_cashout,
+        "new_token_balance": new_token_balance,
+        "tokens_added": tokens_to_add
+    }
+
+
+# Admin: View all cashout requests
+@router.get("/admin/cashouts")
+async def admin_get_cashouts(username: str = Depends(get_current_admin), read_db=Depends(admin_reads)):
+    """Get all pending cashout requests (admin only)"""
+    requests = await read_db.cashout_requests.find(
+        {},
+        {"_id": 0}
+    ).sort("created_at", -1).to_list(100)
+    return requests
+
+
+# Admin: Process cashout request
+@router.put("/admin/cashouts/{cashout_id}")
+async def admin_process_cashout(cashout_id: str, status: str, username: str = Depends(get_current_admin)):
+    """Admin: Approve or reject a cashout request"""
+    if status not in ["approved", "paid", "rejected"]:
+        raise HTTPException(status_code=400, detail="Invalid status")
+    
+    result = await db.cashout_requests.update_one(
+        {"id": cashout_id},
+        {"$set": {"status": status, "processed_at": datetime.now(timezone.utc)}}
+    )
+    
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Cashout request not found")
+    
+    return {"message": f"Cashout request {status}", "cashout_id": cashout_id}
+
+
+# Get staff members (for tipping)
+@router.get("/staff/list")
+async def get_staff_list():
+    """Get list of all staff members (for customers to tip)"""
+    staff = await repos.user_profiles.find(
+        {"role": "staff"},
+        {"_id": 0, "id": 1, "name": 1, "staff_title": 1, "avatar_emoji": 1, "profile_photo_url": 1},
+        limit=100
+    )
+    return staff
@@ -0,0 +1,192 @@
+import uuid
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, HTTPException, Request
+
+from models import (
+    UserProfileCreate, UserProfileUpdate, UserProfileResponse, UserGallerySubmissionCreate,
+    UserGallerySubmissionResponse
+)
+from core import db, repos, sessions, media_store
+from migrations import upgrade
+from repositories import new_user_profile
+from upload_stream import receive_upload
+
+router = APIRouter(tags=["users"])
+
+
+# =====================================================
+# USER PROFILE ENDPOINTS
+# =====================================================
+
+@router.post("/user/profile", response_model=UserProfileResponse)
+async def create_user_profile(profile: UserProfileCreate):
+    """Create a new user profile"""
+    # Check if email already exists
+    if profile.email:
+        if await repos.user_profiles.email_taken(profile.email):
+            raise HTTPException(status_code=400, detail="Email already registered")
+    
+    profile_dict = new_user_profile(str(uuid.uuid4()), **profile.dict())
+    await repos.user_profiles.insert(profile_dict)
+    
+    return UserProfileResponse(**profile_dict)
+
+
+@router.get("/user/profile/{user_id}", response_model=UserProfileResponse)
+async def get_user_profile(user_id: str):
+    """Get a user profile by ID"""
+    profile = await repos.user_profiles.get(user_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="User profile not found")
+    # Profiles the schema backfill hasn't reached yet
+    return UserProfileResponse(**upgrade("user_profiles", profile))
+
+
+@router.get("/user/profile/by-email/{email}")
+async def get_user_profile_by_email(email: str):
+    """Get a user profile by email"""
+    profile = await repos.user_profiles.get_by_email(email)
+    if not profile:
+        return None
+    return UserProfileResponse(**upgrade("user_profiles", profile))
+
+
+@router.put("/user/profile/{user_id}", response_model=UserProfileResponse)
+async def update_user_profile(user_id: str, update: UserProfileUpdate):
+    """Update a user profile"""
+    if not await repos.user_profiles.has(user_id):
+        raise HTTPException(status_code=404, detail="User profile not found")
+    
+    update_dict = {k: v for k, v in update.dict().items() if v is not None}
+    if update_dict:
+        update_dict["updated_at"] = datetime.now(timezone.utc)
+        await repos.user_profiles.set_fields(user_id, update_dict)
+        sessions.invalidate_profile(user_id)
+    
+    updated = await repos.user_profiles.get(user_id)
+    return UserProfileResponse(**updated)
+
+
+@router.post("/user/profile/{user_id}/photo")
+async def upload_profile_photo(user_id: str, request: Request):
+    """Upload a profile photo/selfie (multipart `file`) - streamed into the media backend for production"""
+    if not await repos.user_profiles.has(user_id):
+        raise HTTPException(status_code=404, detail="User profile not found")
+    
+    # Generate unique file ID
+    file_id = f"profile_{user_id}_{uuid.uuid4().hex[:8]}"
+    
+    def open_writer(upload_filename: str, content_type: str):
+        # Validate file type before any bytes are stored
+        allowed_types = ["image/jpeg", "image/png", "image/gif", "image/webp"]
+        if content_type not in allowed_types:
+            raise HTTPException(status_code=400, detail="Invalid file type. Allowed: JPG, PNG, GIF, WebP")
+        ext = upload_filename.split('.')[-1] if '.' in upload_filename else 'jpg'
+        return media_store.open_writer(f"{file_id}.{ext}", content_type)
+    
+    # Max 10MB, refused with 413 as soon as the stream passes it
+    upload = await receive_upload(request, open_writer, 10 * 1024 * 1024, "File too large. Max 10MB")
+    filename = upload["key"]
+    await media_store.record(
+        file_id, filename, upload["content_type"], upload["size"], upload["stored"],
+        sha256=upload["sha256"], type="profile_photo", user_id=user_id
+    )
+    
+    # Use the media URL
+    photo_url = f"/api/media/{file_id}"
+    await repos.user_profiles.set_fields(
+        user_id, {"profile_photo_url": photo_url, "updated_at": datetime.now(timezone.utc)}
+    )
+    sessions.invalidate_profile(user_id)
+    
+    return {"url": photo_url, "filename": filename}
+
+
+# =====================================================
+# USER HISTORY ENDPOINTS
+# =====================================================
+
+@router.get("/user/history/visits/{user_id}")
+async def get_user_visits(user_id: str):
+    """Get user's check-in/visit history"""
+    # Get visits from the checkins collection, filtered by user
+    # We track visits by linking user_id to checkin records
+    visits = await db.user_visits.find(
+        {"user_id": user_id},
+        {"_id": 0}
+    ).sort("checked_in_at", -1).limit(50).to_list(50)
+    return visits
+
+
+@router.get("/user/history/posts/{user_id}")
+async def get_user_posts(user_id: str):
+    """Get user's social wall post history"""
+    # Find posts by checkin IDs associated with this user
+    return await repos.social_posts.by_author(user_id)
+
+
+@router.get("/user/history/drinks/{user_id}")
+async def get_user_drink_history(user_id: str):
+    """Get user's drink sending/receiving history"""
+    return await repos.drink_orders.for_user(user_id)
+
+
+@router.get("/user/history/tips/{user_id}")
+async def get_user_tip_history(user_id: str):
+    """Get user's DJ tip history"""
+    tips = await db.dj_tips.find(
+        {"tipper_user_id": user_id},
+        {"_id": 0}
+    ).sort("created_at", -1).limit(50).to_list(50)
+    return tips
+
+
+# =====================================================
+# USER GALLERY SUBMISSION ENDPOINTS
+# =====================================================
+
+@router.post("/user/gallery/submit/{user_id}", response_model=UserGallerySubmissionResponse)
+async def submit_gallery_photo(user_id: str, submission: UserGallerySubmissionCreate):
+    """Submit a photo to the gallery (auto-approved)"""
+    profile = await repos.user_profiles.get(user_id, {"_id": 0, "name": 1})
+    if not profile:
+        raise HTTPException(status_code=404, detail="User profile not found")
+    
+    submission_dict = submission.dict()
+    submission_dict["id"] = str(uuid.uuid4())
+    submission_dict["user_id"] = user_id
+    submission_dict["user_name"] = profile.get("name", "Anonymous")
+    submission_dict["created_at"] = datetime.now(timezone.utc)
+    
+    await db.user_gallery_submissions.insert_one(submission_dict)
+    
+    # Also add to the main gallery (auto-approved)
+    gallery_item = {
+        "id": str(uuid.uuid4()),
+        "title": submission.caption or f"Photo by {profile.get('name', 'Guest')}",
+        "image_url": submission.image_url,
+        "category": "community",
+        "is_active": True,
+        "display_order": 999,  # Show at end
+        "submitted_by_user": user_id,
+        "created_at": datetime.now(timezone.utc)
+    }
+    await db.gallery_items.insert_one(gallery_item)
+    
+    # Update user's photo count
+    await repos.user_profiles.set_fields(user_id, {"updated_at": datetime.now(timezone.utc)}, inc={"total_photos": 1})
+    sessions.invalidate_profile(user_id)
+    
+    submission_dict.pop("_id", None)
+    return UserGallerySubmissionResponse(**submission_dict)
+
+
+@router.get("/user/gallery/submissions/{user_id}")
+async def get_user_submissions(user_id: str):
+    """Get user's gallery submissions"""
+    submissions = await db.user_gallery_submissions.find(
+        {"user_id": user_id},
+        {"_id": 0}
+    ).sort("created_at", -1).limit(50).to_list(50)
+    return submissions
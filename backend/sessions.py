@@ -0,0 +1,311 @@
+import os
+import secrets
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from auth import create_access_token, decode_access_token
+from migrations import VERSION_FIELD, upgrade
+
+# Signed access tokens are short-lived; the long-lived session token in the
+# session_token cookie is only used to mint new ones (and is rotated then)
+ACCESS_TOKEN_MINUTES = int(os.environ.get("USER_ACCESS_TOKEN_MINUTES", "15"))
+SESSION_DAYS = 7
+
+# A rotated session token keeps working this long, so parallel tabs that
+# refresh at the same moment don't log each other out
+REFRESH_GRACE_SECONDS = 60
+
+# How often each worker pulls new revocations from Mongo
+REVOCATION_SYNC_SECONDS = 5
+
+PROFILE_CACHE_SIZE = 1024
+PROFILE_CACHE_TTL_SECONDS = int(os.environ.get("PROFILE_CACHE_TTL_SECONDS", "15"))
+
+ACCESS_COOKIE = "user_access"
+SESSION_COOKIE = "session_token"
+
+# Distinguishes user session tokens from admin tokens signed with the same key
+TOKEN_TYPE = "user_session"
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _as_utc(value) -> datetime:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def format_user_profile(profile_doc: Dict) -> Dict:
+    """User profile as returned by /auth/user/me (ISO dates, in the latest schema)"""
+    user_profile = {}
+    for k, v in upgrade("user_profiles", profile_doc).items():
+        if k in ("_id", "password_hash", VERSION_FIELD):
+            continue
+        user_profile[k] = v.isoformat() if isinstance(v, datetime) else v
+    return user_profile
+
+
+class ProfileCache:
+    """Small per-worker LRU of formatted profiles with a short TTL"""
+
+    def __init__(self, max_size: int = PROFILE_CACHE_SIZE, ttl: float = PROFILE_CACHE_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, user_id: str) -> Optional[Dict]:
+        entry = self._entries.get(user_id)
+        if not entry:
+            return None
+        stored_at, profile = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return profile
+
+    def put(self, user_id: str, profile: Dict):
+        self._entries[user_id] = (time.monotonic(), profile)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str):
+        self._entries.pop(user_id, None)
+
+
+class RevocationFilter:
+    """
+    user_id -> "tokens issued at or before this (ms) are revoked". Entries
+    only matter while a revoked access token could still be unexpired, so
+    both the Mongo documents (TTL index) and this map stay tiny.
+    """
+
+    def __init__(self):
+        self._revoked: Dict[str, tuple] = {}
+        self._last_sync: Optional[datetime] = None
+        self._last_sync_check = 0.0
+
+    def add(self, user_id: str, revoked_before_ms: int, expires_at: datetime):
+        current = self._revoked.get(user_id)
+        if not current or current[0] < revoked_before_ms:
+            self._revoked[user_id] = (revoked_before_ms, _as_utc(expires_at))
+
+    def is_revoked(self, user_id: str, issued_at_ms: int) -> bool:
+        entry = self._revoked.get(user_id)
+        return bool(entry) and issued_at_ms <= entry[0]
+
+    async def sync(self, collection, force: bool = False):
+        if not force and time.monotonic() - self._last_sync_check < REVOCATION_SYNC_SECONDS:
+            return
+        self._last_sync_check = time.monotonic()
+
+        now = datetime.now(timezone.utc)
+        query = {"expires_at": {"$gt": now}}
+        if self._last_sync:
+            # Small overlap so writes racing the previous sync aren't missed
+            query["created_at"] = {"$gte": self._last_sync - timedelta(seconds=REVOCATION_SYNC_SECONDS)}
+        async for entry in collection.find(query, {"_id": 0, "user_id": 1, "revoked_before_ms": 1, "expires_at": 1}):
+            self.add(entry["user_id"], entry["revoked_before_ms"], entry["expires_at"])
+        self._last_sync = now
+
+        self._revoked = {k: v for k, v in self._revoked.items() if v[1] > now}
+
+
+class SessionManager:
+    """
+    User sessions for the customer app.
+
+    Each login creates a `user_sessions` document holding an opaque session
+    token (session_token cookie) and hands out a signed access token
+    (user_access cookie / Bearer) carrying the user id and role. Requests
+    with a valid access token are authenticated without touching Mongo;
+    revocations (logout, password reset, role change) are synced into an
+    in-memory filter every few seconds. When the access token has expired
+    the session token is rotated and a new access token minted.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self.revocations = RevocationFilter()
+        self.profiles = ProfileCache()
+
+    async def ensure_indexes(self):
+        await self.db.user_sessions.create_index("session_token")
+        await self.db.user_sessions.create_index("previous_token", sparse=True)
+        await self.db.revoked_sessions.create_index("expires_at", expireAfterSeconds=0)
+
+    # ---- Tokens ----
+
+    def mint_access_token(self, user_id: str, role: str) -> str:
+        return create_access_token(
+            data={"sub": user_id, "role": role, "typ": TOKEN_TYPE, "iat_ms": _now_ms()},
+            expires_delta=timedelta(minutes=ACCESS_TOKEN_MINUTES)
+        )
+
+    async def create_session(self, user_id: str, role: str = "customer", session_token: Optional[str] = None) -> Dict:
+        """Start a session (replacing the user's previous one) and mint an access token"""
+        session_token = session_token or secrets.token_urlsafe(32)
+        now = datetime.now(timezone.utc)
+        await self.db.user_sessions.update_one(
+            {"user_id": user_id},
+            {
+                "$set": {
+                    "user_id": user_id,
+                    "session_token": session_token,
+                    "expires_at": now + timedelta(days=SESSION_DAYS),
+                    "created_at": now
+                },
+                "$unset": {"previous_token": "", "rotated_at": ""}
+            },
+            upsert=True
+        )
+        return {"session_token": session_token, "access_token": self.mint_access_token(user_id, role)}
+
+    async def refresh(self, session_token: str) -> Optional[Dict]:
+        """Rotate a session token and mint a new access token (None if invalid)"""
+        now = datetime.now(timezone.utc)
+        session = await self.db.user_sessions.find_one({"session_token": session_token})
+
+        if session:
+            if _as_utc(session["expires_at"]) < now:
+                return None
+            new_token = secrets.token_urlsafe(32)
+            result = await self.db.user_sessions.update_one(
+                {"_id": session["_id"], "session_token": session_token},
+                {"$set": {"session_token": new_token, "previous_token": session_token, "rotated_at": now}}
+            )
+            if result.modified_count:
+                session["session_token"] = new_token
+            else:
+                # Rotated by a parallel request - fall through to the grace path
+                session = None
+
+        if not session:
+            session = await self.db.user_sessions.find_one({"previous_token": session_token})
+            if not session or _as_utc(session["expires_at"]) < now:
+                return None
+            if (now - _as_utc(session["rotated_at"])).total_seconds() > REFRESH_GRACE_SECONDS:
+                return None
+
+        profile = await self.get_profile(session["user_id"])
+        if not profile:
+            return None
+        return {
+            "user_id": session["user_id"],
+            "session_token": session["session_token"],
+            "access_token": self.mint_access_token(session["user_id"], profile["role"]),
+            "profile": profile
+        }
+
+    async def authenticate(self, request: Request) -> Optional[Dict]:
+        """Claims of a valid, unrevoked access token on the request (no DB hit)"""
+        token = request.cookies.get(ACCESS_COOKIE)
+        if not token:
+            auth_header = request.headers.get("Authorization")
+            if auth_header and auth_header.startswith("Bearer "):
+                token = auth_header.split(" ")[1]
+        if not token:
+            return None
+
+        claims = decode_access_token(token)
+        if not claims or claims.get("typ") != TOKEN_TYPE:
+            return None
+
+        await self.revocations.sync(self.db.revoked_sessions)
+        if self.revocations.is_revoked(claims["sub"], claims.get("iat_ms", 0)):
+            return None
+        return claims
+
+    # ---- Revocation ----
+
+    async def revoke_user(self, user_id: str):
+        """Reject every access token issued to the user so far"""
+        now = datetime.now(timezone.utc)
+        entry = {
+            "user_id": user_id,
+            "revoked_before_ms": _now_ms(),
+            "created_at": now,
+            "expires_at": now + timedelta(minutes=ACCESS_TOKEN_MINUTES)
+        }
+        await self.db.revoked_sessions.insert_one(entry)
+        self.revocations.add(user_id, entry["revoked_before_ms"], entry["expires_at"])
+        self.profiles.invalidate(user_id)
+
+    async def end_session(self, session_token: Optional[str], user_id: Optional[str] = None):
+        if session_token:
+            session = await self.db.user_sessions.find_one_and_delete(
+                {"$or": [{"session_token": session_token}, {"previous_token": session_token}]},
+                {"user_id": 1}
+            )
+            user_id = user_id or (session or {}).get("user_id")
+        if user_id:
+            await self.revoke_user(user_id)
+
+    async def end_all_sessions(self, user_id: str):
+        await self.db.user_sessions.delete_many({"user_id": user_id})
+        await self.revoke_user(user_id)
+
+    # ---- Profiles ----
+
+    async def get_profile(self, user_id: str) -> Optional[Dict]:
+        profile = self.profiles.get(user_id)
+        if profile is None:
+            profile_doc = await self.db.user_profiles.find_one({"id": user_id}, {"_id": 0, "password_hash": 0})
+            if not profile_doc:
+                return None
+            profile = format_user_profile(profile_doc)
+            self.profiles.put(user_id, profile)
+        return profile
+
+    def invalidate_profile(self, user_id: str):
+        self.profiles.invalidate(user_id)
+
+    # ---- Cookies ----
+
+    def set_cookies(self, response: Response, session_token: Optional[str], access_token: str):
+        if session_token:
+            response.set_cookie(
+                key=SESSION_COOKIE,
+                value=session_token,
+                httponly=True,
+                secure=True,
+                samesite="none",
+                path="/",
+                max_age=SESSION_DAYS * 24 * 60 * 60
+            )
+        response.set_cookie(
+            key=ACCESS_COOKIE,
+            value=access_token,
+            httponly=True,
+            secure=True,
+            samesite="none",
+            path="/",
+            max_age=ACCESS_TOKEN_MINUTES * 60
+        )
+
+    def clear_cookies(self, response: Response):
+        response.delete_cookie(key=SESSION_COOKIE, path="/")
+        response.delete_cookie(key=ACCESS_COOKIE, path="/")
+
+
+def request_session_token(request: Request) -> Optional[str]:
+    """Opaque session token from the cookie, or a non-JWT Bearer token (legacy clients)"""
+    session_token = request.cookies.get(SESSION_COOKIE)
+    if not session_token:
+        auth_header = request.headers.get("Authorization")
+        if auth_header and auth_header.startswith("Bearer "):
+            token = auth_header.split(" ")[1]
+            if token.count(".") != 2:
+                session_token = token
+    return session_token
@@ -0,0 +1,89 @@
+import os
+import time
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+# Results of live reads are reused for this long after they complete, so
+# requests arriving just after a query finished (the 15s polling boundary)
+# share it too; 0 only coalesces calls that overlap
+SINGLEFLIGHT_TTL_MS = int(os.environ.get("SINGLEFLIGHT_TTL_MS", "250"))
+
+# Upper bound on remembered results; expired ones are pruned first
+MAX_RECENT_RESULTS = 2048
+
+
+class SingleFlight:
+    """
+    Request coalescing for identical concurrent reads. do(key, fn) runs fn()
+    once per key at a time: callers arriving while it is in flight await
+    the same result (or exception) instead of issuing their own query or
+    HTTP call. With a ttl the finished result is also handed to callers
+    for that many seconds afterwards.
+
+    fn() runs in its own task, so a caller that goes away doesn't cancel it
+    for the others. Shared results go to every waiter, so callers must
+    treat them as read-only. Per worker; forget(key) after a write makes
+    the next read in this worker go to the database.
+    """
+
+    def __init__(self, ttl: float = SINGLEFLIGHT_TTL_MS / 1000, max_recent: int = MAX_RECENT_RESULTS):
+        self.ttl = ttl
+        self.max_recent = max_recent
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._recent: Dict[Hashable, Tuple[float, Any]] = {}
+        self.calls = 0
+        self.executions = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable], ttl: Optional[float] = None) -> Any:
+        self.calls += 1
+        ttl = self.ttl if ttl is None else ttl
+        if ttl > 0:
+            recent = self._recent.get(key)
+            if recent is not None:
+                if recent[0] > time.monotonic():
+                    return recent[1]
+                del self._recent[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done, ttl))
+        # shield: cancelling one waiter must not cancel the shared call
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: asyncio.Task, ttl: float):
+        if self._inflight.get(key) is not task:
+            # forget() was called while it ran: the result may predate a write
+            return
+        del self._inflight[key]
+        if ttl <= 0 or task.cancelled() or task.exception() is not None:
+            return
+        if len(self._recent) >= self.max_recent:
+            self._prune()
+        self._recent[key] = (time.monotonic() + ttl, task.result())
+
+    def _prune(self):
+        now = time.monotonic()
+        for key in [key for key, (expires, _) in self._recent.items() if expires <= now]:
+            del self._recent[key]
+        while len(self._recent) >= self.max_recent:
+            del self._recent[next(iter(self._recent))]
+
+    def forget(self, key: Hashable):
+        """
+        Drop the remembered result. A call already in flight still answers
+        its waiters, but later callers start a new one.
+        """
+        self._recent.pop(key, None)
+        self._inflight.pop(key, None)
+
+    def stats(self) -> Dict:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "shared": self.calls - self.executions,
+            "in_flight": len(self._inflight),
+            "recent": len(self._recent)
+        }
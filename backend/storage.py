@@ -0,0 +1,330 @@
+import os
+import asyncio
+import base64
+import tempfile
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, Iterable, Optional
+
+from fastapi.responses import FileResponse, Response, RedirectResponse, StreamingResponse
+
+# Where new media bytes go: "mongodb" (Base64 on the media_files document,
+# the default) or "s3" (any S3-compatible store: AWS, MinIO, R2 - see
+# S3_BUCKET / S3_ENDPOINT_URL; credentials come from the usual AWS_* vars)
+MEDIA_STORAGE = os.environ.get("MEDIA_STORAGE", "mongodb")
+
+# How /api/media answers for files in object storage: "redirect" to a
+# presigned URL (bytes never touch the worker) or "proxy" them through the
+# worker in chunks, for buckets browsers can't reach
+MEDIA_DELIVERY = os.environ.get("MEDIA_DELIVERY", "redirect")
+PRESIGNED_URL_SECONDS = int(os.environ.get("PRESIGNED_URL_SECONDS", "3600"))
+
+PROXY_CHUNK_SIZE = 256 * 1024
+
+# Streamed uploads go to S3 in parts of this size (S3's minimum is 5 MB for
+# every part but the last), so that is what one upload holds in memory
+S3_PART_SIZE = 8 * 1024 * 1024
+
+# Backends that can only store whole files get streamed uploads spooled to
+# a temporary file; this much stays in memory before it rolls over to disk
+SPOOL_MEMORY_BYTES = 1024 * 1024
+
+# Every object is written once under a fresh file_id
+OBJECT_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class SpooledWriter:
+    """
+    Streaming writer for backends that store whole files: chunks go to a
+    temporary file and the backend's save() gets the bytes on commit. The
+    upload itself isn't held in memory, but commit() is: it reads the whole
+    file back (and MongoStorage Base64-encodes it).
+    """
+
+    def __init__(self, backend, key: str, content_type: str):
+        self.backend = backend
+        self.key = key
+        self.content_type = content_type
+        self._file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES)
+
+    async def write(self, chunk: bytes):
+        await asyncio.to_thread(self._file.write, chunk)
+
+    async def commit(self) -> Dict:
+        try:
+            self._file.seek(0)
+            data = await asyncio.to_thread(self._file.read)
+            return await self.backend.save(self.key, data, self.content_type)
+        finally:
+            self._file.close()
+
+    async def abort(self):
+        self._file.close()
+
+
+class S3MultipartWriter:
+    """
+    Streaming writer for S3: buffers up to S3_PART_SIZE and uploads each
+    full part straight away. Files smaller than one part are a single
+    put_object on commit.
+    """
+
+    def __init__(self, storage, key: str, content_type: str):
+        self.storage = storage
+        self.key = key
+        self.object_key = f"{storage.prefix}{key}"
+        self.content_type = content_type
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._parts = []
+
+    async def _upload_part(self, data: bytes):
+        client = self.storage.client
+        if self._upload_id is None:
+            created = await asyncio.to_thread(
+                client.create_multipart_upload,
+                Bucket=self.storage.bucket, Key=self.object_key,
+                ContentType=self.content_type, CacheControl=OBJECT_CACHE_CONTROL
+            )
+            self._upload_id = created["UploadId"]
+        part_number = len(self._parts) + 1
+        uploaded = await asyncio.to_thread(
+            client.upload_part,
+            Bucket=self.storage.bucket, Key=self.object_key, UploadId=self._upload_id,
+            PartNumber=part_number, Body=data
+        )
+        self._parts.append({"PartNumber": part_number, "ETag": uploaded["ETag"]})
+
+    async def write(self, chunk: bytes):
+        self._buffer += chunk
+        while len(self._buffer) >= S3_PART_SIZE:
+            part = bytes(self._buffer[:S3_PART_SIZE])
+            del self._buffer[:S3_PART_SIZE]
+            await self._upload_part(part)
+
+    async def commit(self) -> Dict:
+        if self._upload_id is None:
+            return await self.storage.save(self.key, bytes(self._buffer), self.content_type)
+        if self._buffer:
+            await self._upload_part(bytes(self._buffer))
+            self._buffer.clear()
+        await asyncio.to_thread(
+            self.storage.client.complete_multipart_upload,
+            Bucket=self.storage.bucket, Key=self.object_key, UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts}
+        )
+        return {"bucket": self.storage.bucket, "key": self.object_key}
+
+    async def abort(self):
+        self._buffer.clear()
+        if self._upload_id is not None:
+            await asyncio.to_thread(
+                self.storage.client.abort_multipart_upload,
+                Bucket=self.storage.bucket, Key=self.object_key, UploadId=self._upload_id
+            )
+
+
+class MongoStorage:
+    """Bytes kept Base64-encoded in the media_files document's `data` field"""
+
+    name = "mongodb"
+
+    async def save(self, key: str, data: bytes, content_type: str) -> Dict:
+        return {"data": base64.b64encode(data).decode("utf-8")}
+
+    async def load(self, media: Dict) -> bytes:
+        return base64.b64decode(media["data"])
+
+    async def delete(self, media: Dict):
+        # The bytes go with the media_files document
+        pass
+
+    async def presigned_url(self, media: Dict) -> Optional[str]:
+        return None
+
+    async def iter_chunks(self, media: Dict) -> AsyncIterator[bytes]:
+        yield await self.load(media)
+
+    def open_writer(self, key: str, content_type: str) -> SpooledWriter:
+        # The Base64 document needs the whole file at once
+        return SpooledWriter(self, key, content_type)
+
+
+class S3Storage:
+    """
+    Objects in an S3-compatible bucket under `prefix`. boto3 is blocking,
+    so every call runs in a worker thread; the client is created on first
+    use (boto3 is slow to import).
+    """
+
+    name = "s3"
+
+    def __init__(self, bucket: str, prefix: str = "media/", endpoint_url: Optional[str] = None,
+                 region: Optional[str] = None, client=None):
+        self.bucket = bucket
+        self.prefix = prefix
+        self.endpoint_url = endpoint_url
+        self.region = region
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            import boto3
+            self._client = boto3.client("s3", endpoint_url=self.endpoint_url, region_name=self.region)
+        return self._client
+
+    async def save(self, key: str, data: bytes, content_type: str) -> Dict:
+        object_key = f"{self.prefix}{key}"
+        await asyncio.to_thread(
+            self.client.put_object,
+            Bucket=self.bucket, Key=object_key, Body=data,
+            ContentType=content_type, CacheControl=OBJECT_CACHE_CONTROL
+        )
+        return {"bucket": self.bucket, "key": object_key}
+
+    async def load(self, media: Dict) -> bytes:
+        response = await asyncio.to_thread(self.client.get_object, Bucket=media["bucket"], Key=media["key"])
+        return await asyncio.to_thread(response["Body"].read)
+
+    async def delete(self, media: Dict):
+        await asyncio.to_thread(self.client.delete_object, Bucket=media["bucket"], Key=media["key"])
+
+    async def presigned_url(self, media: Dict) -> Optional[str]:
+        return await asyncio.to_thread(
+            self.client.generate_presigned_url,
+            "get_object",
+            Params={"Bucket": media["bucket"], "Key": media["key"]},
+            ExpiresIn=PRESIGNED_URL_SECONDS
+        )
+
+    def open_writer(self, key: str, content_type: str) -> S3MultipartWriter:
+        return S3MultipartWriter(self, key, content_type)
+
+    async def iter_chunks(self, media: Dict) -> AsyncIterator[bytes]:
+        response = await asyncio.to_thread(self.client.get_object, Bucket=media["bucket"], Key=media["key"])
+        body = response["Body"]
+        try:
+            while True:
+                chunk = await asyncio.to_thread(body.read, PROXY_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            body.close()
+
+
+def storage_backends_from_env() -> Dict:
+    backends = {"mongodb": MongoStorage()}
+    bucket = os.environ.get("S3_BUCKET")
+    if bucket:
+        backends["s3"] = S3Storage(
+            bucket,
+            prefix=os.environ.get("S3_PREFIX", "media/"),
+            endpoint_url=os.environ.get("S3_ENDPOINT_URL") or None,
+            region=os.environ.get("S3_REGION") or None
+        )
+    return backends
+
+
+class MediaStore:
+    """
+    media_files keeps one metadata document per file; its bytes live in the
+    backend named by the document's `storage` field. Documents written
+    before backends existed have no `storage` and are in MongoDB, so
+    switching MEDIA_STORAGE only changes where new files go.
+
+    With a `cache` (media_cache.MediaCache), MongoDB-stored files are
+    decoded once onto local disk and served from there.
+    """
+
+    def __init__(self, db, backends: Optional[Dict] = None, default: str = MEDIA_STORAGE,
+                 delivery: str = MEDIA_DELIVERY, cache=None):
+        self.db = db
+        self.cache = cache
+        self.backends = backends if backends is not None else storage_backends_from_env()
+        if default not in self.backends:
+            raise RuntimeError(f"MEDIA_STORAGE={default} is not configured (set S3_BUCKET for s3)")
+        self.default = self.backends[default]
+        self.delivery = delivery
+
+    def backend_for(self, media: Dict):
+        return self.backends[media.get("storage", "mongodb")]
+
+    async def save(self, file_id: str, filename: str, data: bytes, content_type: str, **metadata) -> Dict:
+        """Store the bytes in the default backend and record the media_files document"""
+        stored = await self.default.save(filename, data, content_type)
+        return await self.record(file_id, filename, content_type, len(data), stored, **metadata)
+
+    def open_writer(self, filename: str, content_type: str):
+        """Streaming writer into the default backend: write() chunks, then commit() or abort()"""
+        return self.default.open_writer(filename, content_type)
+
+    async def record(self, file_id: str, filename: str, content_type: str, size: int, stored: Dict,
+                     **metadata) -> Dict:
+        """Insert the media_files document for bytes already in the default backend"""
+        media = {
+            "file_id": file_id,
+            "filename": filename,
+            "content_type": content_type,
+            "size": size,
+            "storage": self.default.name,
+            **stored,
+            "uploaded_at": datetime.now(timezone.utc),
+            **metadata
+        }
+        await self.db.media_files.insert_one(media)
+        media.pop("_id", None)
+        return media
+
+    async def find(self, file_id: Optional[str] = None, filename: Optional[str] = None) -> Optional[Dict]:
+        query = {"file_id": file_id} if file_id is not None else {"filename": filename}
+        return await self.db.media_files.find_one(query, {"_id": 0})
+
+    async def read(self, media: Dict) -> bytes:
+        return await self.backend_for(media).load(media)
+
+    def cached_response(self, file_id: str) -> Optional[Response]:
+        """The file from the local cache, without reading media_files; None on a miss"""
+        entry = self.cache.get(file_id) if self.cache is not None else None
+        if entry is None:
+            return None
+        return FileResponse(entry["path"], media_type=entry["media_type"])
+
+    async def response(self, media: Dict) -> Response:
+        """The file as an HTTP response: cached/inline, presigned redirect or streamed proxy"""
+        backend = self.backend_for(media)
+        content_type = media.get("content_type") or "application/octet-stream"
+        if isinstance(backend, MongoStorage):
+            data = await backend.load(media)
+            if self.cache is not None and media.get("file_id"):
+                entry = await self.cache.put(media["file_id"], data, content_type)
+                if entry is not None:
+                    return FileResponse(entry["path"], media_type=content_type)
+            return Response(content=data, media_type=content_type)
+
+        if self.delivery == "redirect":
+            return RedirectResponse(await backend.presigned_url(media), status_code=307)
+        headers = {"Content-Length": str(media["size"])} if media.get("size") else None
+        return StreamingResponse(backend.iter_chunks(media), media_type=content_type, headers=headers)
+
+    async def warm_cache(self, file_ids: Iterable[str]) -> int:
+        """Decode MongoDB-stored files into the cache ahead of their first request; returns how many"""
+        if self.cache is None or not self.cache.enabled:
+            return 0
+        warmed = 0
+        # One at a time, so only one decoded file is in memory
+        for file_id in file_ids:
+            if file_id in self.cache:
+                continue
+            media = await self.find(file_id=file_id)
+            if media and isinstance(self.backend_for(media), MongoStorage):
+                if await self.cache.put(file_id, await self.read(media), media.get("content_type")):
+                    warmed += 1
+        return warmed
+
+    async def delete(self, media: Dict) -> bool:
+        if self.cache is not None:
+            self.cache.discard(media["file_id"])
+        await self.backend_for(media).delete(media)
+        result = await self.db.media_files.delete_one({"file_id": media["file_id"]})
+        return result.deleted_count > 0
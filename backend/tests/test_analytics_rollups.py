@@ -0,0 +1,146 @@
+"""
+Test suite for pre-aggregated analytics rollups
+- GET /api/admin/analytics/rollups reads daily/hourly buckets
+- DJ tip totals are served from the daily bucket
+- Deleted tips are taken back out of their buckets
+"""
+import asyncio
+import pytest
+import requests
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Admin credentials
+ADMIN_USERNAME = "admin"
+ADMIN_PASSWORD = "$outhcentral"
+
+
+@pytest.fixture(scope="module")
+def admin_token():
+    """Get admin authentication token"""
+    response = requests.post(
+        f"{BASE_URL}/api/auth/login",
+        json={"username": ADMIN_USERNAME, "password": ADMIN_PASSWORD}
+    )
+    assert response.status_code == 200, f"Admin login failed: {response.text}"
+    return response.json()["access_token"]
+
+
+@pytest.fixture
+def admin_headers(admin_token):
+    """Headers with admin authentication"""
+    return {"Authorization": f"Bearer {admin_token}"}
+
+
+class TestAdminRollupsEndpoint:
+    """Tests for /api/admin/analytics/rollups"""
+
+    def test_daily_rollups_shape(self, admin_headers):
+        """Test daily buckets and totals are returned"""
+        response = requests.get(f"{BASE_URL}/api/admin/analytics/rollups?days=7", headers=admin_headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+
+        data = response.json()
+        assert data["granularity"] == "daily"
+        assert data["location_slug"] == "all"
+        assert isinstance(data["buckets"], list)
+        assert len(data["buckets"]) <= 7, "Should return at most one bucket per day"
+        for bucket in data["buckets"]:
+            assert "date" in bucket and "metrics" in bucket
+            assert "tips_sum" in bucket["metrics"]
+        print(f"✓ Retrieved {len(data['buckets'])} daily buckets")
+
+    def test_invalid_granularity(self, admin_headers):
+        """Test unknown granularity is rejected"""
+        response = requests.get(f"{BASE_URL}/api/admin/analytics/rollups?granularity=weekly", headers=admin_headers)
+        assert response.status_code == 400, f"Expected 400, got {response.status_code}"
+        print("✓ Invalid granularity rejected")
+
+    def test_tip_updates_location_bucket(self, admin_headers):
+        """Test a DJ tip is counted in today's location bucket and the tips total"""
+        location_slug = f"test-rollup-{str(uuid.uuid4())[:8]}"
+        checkin = requests.post(f"{BASE_URL}/api/checkin", json={
+            "location_slug": location_slug,
+            "display_name": "TEST_Rollups"
+        }).json()
+
+        tip_response = requests.post(f"{BASE_URL}/api/social/dj-tip", json={
+            "location_slug": location_slug,
+            "checkin_id": checkin["id"],
+            "tipper_name": "TEST_Rollups",
+            "tipper_emoji": "🎉",
+            "amount": 5
+        })
+        assert tip_response.status_code == 200, f"Tip failed: {tip_response.text}"
+
+        total = requests.get(f"{BASE_URL}/api/social/dj-tips/{location_slug}/total").json()
+        assert total == {"total": 5, "count": 1}, f"Unexpected total: {total}"
+
+        response = requests.get(
+            f"{BASE_URL}/api/admin/analytics/rollups?days=1&location_slug={location_slug}",
+            headers=admin_headers
+        )
+        totals = response.json()["totals"]
+        assert totals["checkins"] == 1
+        assert totals["tips_count"] == 1
+        assert totals["tips_sum"] == 5
+        print("✓ Tip and check-in counted in location rollup")
+
+
+class TestRollupRemovals:
+    """Tests for RollupService.record_removed (in-memory Mongo)"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Service over an in-memory database"""
+        mongomock_motor = pytest.importorskip("mongomock_motor")
+        from rollups import RollupService
+
+        self.rollups = RollupService(mongomock_motor.AsyncMongoMockClient()["rollups_test"])
+
+    def test_removed_tips_leave_the_day_total(self):
+        """Test deleting an account's tips takes them out of the DJ's total for the day"""
+        now = datetime.now(timezone.utc).replace(hour=12, minute=30)
+        tips = [
+            {"location_slug": "downtown", "amount": 5, "created_at": now},
+            {"location_slug": "downtown", "amount": 10, "created_at": now - timedelta(minutes=1)}
+        ]
+
+        async def main():
+            for tip in tips:
+                await self.rollups.record({"tips_count": 1, "tips_sum": tip["amount"]}, "downtown", tip["created_at"])
+            await self.rollups.record({"tips_count": 1, "tips_sum": 20}, "downtown", now)
+            await self.rollups.record_removed("dj_tips", tips)
+            day = now.strftime("%Y-%m-%d")
+            return await self.rollups.get_day("downtown", day), await self.rollups.get_day("all", day)
+
+        downtown, everywhere = asyncio.run(main())
+        assert (downtown["tips_count"], downtown["tips_sum"]) == (1, 20)
+        assert (everywhere["tips_count"], everywhere["tips_sum"]) == (1, 20)
+        print("✓ Removed tips subtracted from location and all-locations buckets")
+
+
+class TestRollupBackfillState:
+    """Tests for RollupService.backfilled (in-memory Mongo)"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Two services over one in-memory database, like two workers"""
+        mongomock_motor = pytest.importorskip("mongomock_motor")
+        from rollups import RollupService
+
+        db = mongomock_motor.AsyncMongoMockClient()["rollups_state_test"]
+        self.a, self.b = RollupService(db), RollupService(db)
+
+    def test_backfill_recorded(self):
+        """Test buckets count as complete only once a backfill has finished, on every worker"""
+        async def main():
+            before = await self.b.backfilled()
+            await self.a.backfill()
+            return before, await self.a.backfilled(), await self.b.backfilled()
+
+        assert asyncio.run(main()) == (False, True, True)
+        print("✓ Backfill completion shared across workers")
@@ -0,0 +1,88 @@
+"""
+Tests for the per-request batch loader (batch_loader.py)
+- Lookups queued together become one $in query per collection
+- Results come back in order, None for missing documents
+- Repeated lookups and find() calls are served from the loader
+"""
+
+import asyncio
+
+import pytest
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+from batch_loader import BatchLoader  # noqa: E402
+
+
+class TestBatchLoader:
+    """Tests for BatchLoader"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """In-memory Mongo with a few check-ins and locations"""
+        self.db = mongomock_motor.AsyncMongoMockClient()["batch_loader_test"]
+
+        async def seed():
+            await self.db.checkins.insert_many([{"id": f"c{i}", "display_name": f"Guest {i}"} for i in range(5)])
+            await self.db.locations.insert_many([
+                {"slug": "downtown", "name": "Downtown"},
+                {"slug": "uptown", "name": "Uptown"}
+            ])
+
+        asyncio.run(seed())
+
+    def test_load_many_is_one_query(self):
+        """Test several ids of one collection are fetched together, in order"""
+        async def main():
+            loader = BatchLoader(self.db)
+            docs = await loader.load_many("checkins", "id", ["c3", "missing", "c1"], {"_id": 0})
+            return loader, docs
+
+        loader, docs = asyncio.run(main())
+        assert [doc and doc["id"] for doc in docs] == ["c3", None, "c1"]
+        assert loader.queries == 1
+        print("✓ load_many ran one $in query")
+
+    def test_gather_across_collections(self):
+        """Test lookups in one gather batch per collection and run concurrently"""
+        async def main():
+            loader = BatchLoader(self.db)
+            results = await asyncio.gather(
+                loader.load("checkins", "id", "c0"),
+                loader.load("locations", "slug", "uptown"),
+                loader.load("checkins", "id", "c4")
+            )
+            return loader, results
+
+        loader, (first, location, last) = asyncio.run(main())
+        assert first["display_name"] == "Guest 0"
+        assert location["name"] == "Uptown"
+        assert last["display_name"] == "Guest 4"
+        assert loader.queries == 2
+        print("✓ Two collections, two queries")
+
+    def test_repeat_lookups_memoized(self):
+        """Test the same lookup twice in a request queries once"""
+        async def main():
+            loader = BatchLoader(self.db)
+            a = await loader.load("checkins", "id", "c2")
+            b = await loader.load("checkins", "id", "c2")
+            names = await loader.find("locations", {}, {"_id": 0, "name": 1})
+            names_again = await loader.find("locations", {}, {"_id": 0, "name": 1})
+            return loader, a, b, names, names_again
+
+        loader, a, b, names, names_again = asyncio.run(main())
+        assert a is b
+        assert names is names_again and len(names) == 2
+        assert loader.queries == 2
+        print("✓ Repeat lookups served from the loader")
+
+    def test_inclusion_projection(self):
+        """Test an inclusion projection without the lookup field still matches"""
+        async def main():
+            loader = BatchLoader(self.db)
+            return await loader.load_many("checkins", "id", ["c0", "c1"], {"_id": 0, "display_name": 1})
+
+        docs = asyncio.run(main())
+        assert docs == [{"display_name": "Guest 0"}, {"display_name": "Guest 1"}]
+        print("✓ Inclusion projection honoured")
@@ -0,0 +1,97 @@
+"""
+Response Compression Tests
+Tests gzip/brotli negotiation on the public menu, locations and events
+payloads, and that admin edits show up in the cached copy
+"""
+import pytest
+import requests
+import os
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL')
+assert BASE_URL, "REACT_APP_BACKEND_URL environment variable must be set"
+BASE_URL = BASE_URL.rstrip('/')
+
+PUBLIC_ENDPOINTS = ["/api/menu/items", "/api/locations", "/api/events"]
+
+
+@pytest.fixture(scope="module")
+def admin_token():
+    response = requests.post(f"{BASE_URL}/api/admin/login", json={
+        "username": "admin",
+        "password": "$outhcentral"
+    })
+    if response.status_code != 200:
+        pytest.skip("Admin login failed")
+    return response.json()["access_token"]
+
+
+class TestCompressionNegotiation:
+    """Content-Encoding follows Accept-Encoding"""
+
+    @pytest.mark.parametrize("path", PUBLIC_ENDPOINTS)
+    def test_gzip(self, path):
+        """Public payloads are gzipped when the client asks for gzip"""
+        response = requests.get(f"{BASE_URL}{path}", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert "Accept-Encoding" in response.headers.get("Vary", "")
+        if len(response.content) >= 1024:
+            assert response.headers.get("Content-Encoding") == "gzip"
+        assert isinstance(response.json(), list)
+        print(f"✓ {path} gzip: {response.headers.get('Content-Encoding')}")
+
+    def test_brotli_preferred(self):
+        """br wins over gzip when the client accepts both"""
+        pytest.importorskip("brotli")
+        response = requests.get(f"{BASE_URL}/api/menu/items", headers={"Accept-Encoding": "gzip, br"})
+        assert response.status_code == 200
+        assert response.headers.get("Content-Encoding") == "br"
+        assert isinstance(response.json(), list)
+        print("✓ /api/menu/items served as br")
+
+    def test_identity(self):
+        """No Accept-Encoding means an uncompressed body"""
+        response = requests.get(f"{BASE_URL}/api/menu/items", headers={"Accept-Encoding": "identity"})
+        assert response.status_code == 200
+        assert "Content-Encoding" not in response.headers
+        assert isinstance(response.json(), list)
+        print("✓ /api/menu/items served uncompressed")
+
+    def test_small_response_not_compressed(self):
+        """Responses under the size threshold go out as-is"""
+        response = requests.get(f"{BASE_URL}/api/menu/categories", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        if len(response.content) < 1024:
+            assert "Content-Encoding" not in response.headers
+        print("✓ Small response not compressed")
+
+
+class TestCacheInvalidation:
+    """Admin writes replace the cached payload"""
+
+    def test_new_menu_item_visible(self, admin_token):
+        """A created menu item appears in /api/menu/items right away"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        requests.get(f"{BASE_URL}/api/menu/items", headers={"Accept-Encoding": "gzip"})
+
+        name = f"TEST_Compression_{uuid.uuid4().hex[:6]}"
+        response = requests.post(f"{BASE_URL}/api/admin/menu-items", headers=headers, json={
+            "name": name,
+            "description": "Compression cache test",
+            "price": 1.0,
+            "image": "https://example.com/test.jpg",
+            "category": "TEST"
+        })
+        assert response.status_code == 200
+        item_id = response.json()["id"]
+
+        try:
+            items = requests.get(f"{BASE_URL}/api/menu/items", headers={"Accept-Encoding": "gzip"}).json()
+            assert any(item.get("id") == item_id for item in items)
+            print("✓ New menu item visible in cached payload")
+        finally:
+            requests.delete(f"{BASE_URL}/api/admin/menu-items/{item_id}", headers=headers)
+
+        items = requests.get(f"{BASE_URL}/api/menu/items", headers={"Accept-Encoding": "gzip"}).json()
+        assert not any(item.get("id") == item_id for item in items)
+        print("✓ Deleted menu item gone from cached payload")
@@ -0,0 +1,84 @@
+"""
+Tests for read-preference routing (db_routing.py)
+- Admin/reporting reads get a secondaryPreferred handle when configured
+- Live routes keep the primary handle
+- Without ADMIN_READ_PREFERENCE admin reads get the primary handle unchanged
+"""
+
+import importlib
+
+import pytest
+
+motor_asyncio = pytest.importorskip("motor.motor_asyncio")
+
+from pymongo.read_preferences import Primary, SecondaryPreferred  # noqa: E402
+
+import db_routing  # noqa: E402
+
+
+@pytest.fixture
+def db():
+    """A database handle that never connects (handles are only inspected)"""
+    client = motor_asyncio.AsyncIOMotorClient("mongodb://127.0.0.1:9", connect=False)
+    yield client["routing_test"]
+    client.close()
+
+
+@pytest.fixture
+def reload_routing(monkeypatch):
+    """Re-read the ADMIN_* environment, restoring the module afterwards"""
+    def reload(**env):
+        for name in ("ADMIN_READ_PREFERENCE", "ADMIN_MAX_STALENESS"):
+            if name in env:
+                monkeypatch.setenv(name, env[name])
+            else:
+                monkeypatch.delenv(name, raising=False)
+        return importlib.reload(db_routing)
+
+    yield reload
+    monkeypatch.undo()
+    importlib.reload(db_routing)
+
+
+class TestReadRouter:
+    """Tests for ReadRouter handles"""
+
+    def test_admin_reads_secondary_preferred(self, db, reload_routing):
+        """Test admin/reporting reads go to secondaries when configured"""
+        routing = reload_routing(ADMIN_READ_PREFERENCE="secondaryPreferred", ADMIN_MAX_STALENESS="120")
+        router = routing.ReadRouter(db)
+
+        admin = router.admin()
+        assert admin is not db
+        assert admin.read_preference == SecondaryPreferred(max_staleness=120)
+        # The dependency hands out the same cached handle on every request
+        assert router.depends(routing.ADMIN_READ_PREFERENCE, routing.ADMIN_MAX_STALENESS)() is admin
+        print("✓ Admin reads on a secondaryPreferred handle")
+
+    def test_live_routes_stay_on_primary(self, db, reload_routing):
+        """Test live routes read the primary whatever the admin setting"""
+        routing = reload_routing(ADMIN_READ_PREFERENCE="secondaryPreferred")
+        router = routing.ReadRouter(db)
+        router.admin()
+
+        assert router.get() is db
+        assert router.get("primary", 120) is db
+        assert router.depends()() is db
+        assert db.read_preference == Primary()
+        print("✓ Live routes use the primary handle")
+
+    def test_unset_env_returns_primary_handle(self, db, reload_routing):
+        """Test admin reads get the primary handle unchanged without ADMIN_READ_PREFERENCE"""
+        routing = reload_routing()
+        assert routing.ADMIN_READ_PREFERENCE == "primary"
+        assert routing.ReadRouter(db).admin() is db
+        print("✓ No routing without configuration")
+
+    def test_invalid_settings_rejected(self, db):
+        """Test unknown modes and too-small staleness fail at declaration"""
+        router = db_routing.ReadRouter(db)
+        with pytest.raises(ValueError):
+            router.get("secondary")
+        with pytest.raises(ValueError):
+            router.depends("secondaryPreferred", 30)
+        print("✓ Invalid read preferences rejected")
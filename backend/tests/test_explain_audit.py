@@ -0,0 +1,100 @@
+"""
+Tests for the explain-plan audit (perf/explain_audit.py)
+- Query shapes ignore values, so calls that differ only in ids match
+- Bulk writes are explained one statement at a time
+- Plans with COLLSCAN, in-memory SORT or a high examined/returned ratio fail
+"""
+
+from perf.explain_audit import ShapeRecorder, command_shapes, plan_problems, shape_of
+
+
+def find_explain(stage_tree, examined, returned):
+    """A find explain result (classic engine)"""
+    return {
+        "queryPlanner": {"winningPlan": stage_tree},
+        "executionStats": {"nReturned": returned, "totalDocsExamined": examined, "executionStages": {}}
+    }
+
+
+INDEXED = {"stage": "LIMIT", "inputStage": {"stage": "FETCH", "inputStage": {"stage": "IXSCAN"}}}
+
+
+class TestQueryShapes:
+    """Tests for shape_of and ShapeRecorder"""
+
+    def test_values_do_not_change_shape(self):
+        """Test filters differing only in values share a shape"""
+        a = shape_of({"location_slug": "downtown", "status": {"$in": ["pending", "accepted"]}})
+        b = shape_of({"location_slug": "uptown", "status": {"$in": ["delivered"]}})
+        assert a == b == {"location_slug": "str", "status": {"$in": ["str"]}}
+        print("✓ Values stripped from shapes")
+
+    def test_recorder_deduplicates(self):
+        """Test repeated calls of a shape are counted once with their sources"""
+        recorder = ShapeRecorder("audit")
+        for checkin_id, source in (("c1", "wall_polling"), ("c2", "wall_polling"), ("c3", "GET /api/x")):
+            recorder.source = source
+            recorder.record("find", {
+                "find": "social_posts", "filter": {"checkin_id": checkin_id},
+                "sort": {"created_at": -1}, "limit": 50, "lsid": {"id": "session"}, "$db": "audit"
+            })
+        [shape] = recorder.shapes.values()
+        assert shape["calls"] == 3
+        assert shape["sources"] == ["wall_polling", "GET /api/x"]
+        assert "lsid" not in shape["command"] and "$db" not in shape["command"]
+        print("✓ One shape, three calls")
+
+    def test_bulk_update_split(self):
+        """Test each statement of an update command is its own explainable command"""
+        shapes = command_shapes("update", {
+            "update": "social_posts",
+            "updates": [
+                {"q": {"id": "p1"}, "u": {"$set": {"likes": []}}},
+                {"q": {"location_slug": "downtown"}, "u": {"$set": {"hidden": True}}, "multi": True}
+            ],
+            "ordered": True
+        })
+        assert len(shapes) == 2
+        assert all(len(entry["command"]["updates"]) == 1 and "ordered" not in entry["command"] for entry in shapes)
+        print("✓ Bulk update split per statement")
+
+
+class TestPlanProblems:
+    """Tests for plan_problems"""
+
+    def test_indexed_plan_passes(self):
+        """Test an index scan returning what it examines passes"""
+        command = {"find": "social_posts", "filter": {"location_slug": "downtown"}}
+        assert plan_problems("find", command, find_explain(INDEXED, 50, 50)) == []
+        print("✓ IXSCAN passes")
+
+    def test_collscan_and_sort_fail(self):
+        """Test a collection scan with an in-memory sort reports both"""
+        command = {"find": "direct_messages", "filter": {"to_checkin_id": "c1"}, "sort": {"created_at": -1}}
+        plan = {"stage": "SORT", "inputStage": {"stage": "COLLSCAN"}}
+        problems = plan_problems("find", command, find_explain(plan, 5000, 3))
+        assert "COLLSCAN" in problems
+        assert "in-memory SORT" in problems
+        assert any(problem.startswith("examined 5000") for problem in problems)
+        print("✓ COLLSCAN + SORT flagged")
+
+    def test_poor_index_selectivity_fails(self):
+        """Test an index that still examines far more documents than returned fails"""
+        command = {"find": "drink_orders", "filter": {"location_slug": "downtown", "status": "pending"}}
+        problems = plan_problems("find", command, find_explain(INDEXED, 800, 4))
+        assert problems == ["examined 800 docs for 4"]
+        print("✓ Examined/returned ratio flagged")
+
+    def test_scan_ok_and_reducing_aggregates(self):
+        """Test small content collections may scan and $group aggregates skip the ratio"""
+        command = {"find": "locations", "filter": {}}
+        plan = {"stage": "SORT", "inputStage": {"stage": "COLLSCAN"}}
+        assert plan_problems("find", command, find_explain(plan, 20, 20), scan_ok={"locations"}) == []
+
+        aggregate = {
+            "aggregate": "direct_messages",
+            "pipeline": [{"$match": {"to_checkin_id": "c1", "read": False}}, {"$group": {"_id": "$from_checkin_id"}}]
+        }
+        explain = {"stages": [{"$cursor": find_explain(INDEXED, 400, 3)}]}
+        assert plan_problems("aggregate", aggregate, explain) == []
+        print("✓ Content scans and grouped counts accepted")
@@ -0,0 +1,96 @@
+"""
+HTTP Caching Policy Tests
+Tests per-route Cache-Control, version-based ETags and 304 responses
+"""
+import pytest
+import requests
+import os
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL')
+assert BASE_URL, "REACT_APP_BACKEND_URL environment variable must be set"
+BASE_URL = BASE_URL.rstrip('/')
+
+
+@pytest.fixture(scope="module")
+def admin_token():
+    response = requests.post(f"{BASE_URL}/api/admin/login", json={
+        "username": "admin",
+        "password": "$outhcentral"
+    })
+    if response.status_code != 200:
+        pytest.skip("Admin login failed")
+    return response.json()["access_token"]
+
+
+class TestCacheControl:
+    """Cache-Control by route"""
+
+    @pytest.mark.parametrize("path", ["/api/menu/items", "/api/locations", "/api/events"])
+    def test_public_content(self, path):
+        """Public content is cacheable and carries a weak ETag"""
+        response = requests.get(f"{BASE_URL}{path}")
+        assert response.status_code == 200
+        cache_control = response.headers.get("Cache-Control", "")
+        assert "public" in cache_control
+        assert "max-age=60" in cache_control
+        assert "stale-while-revalidate" in cache_control
+        assert response.headers.get("ETag", "").startswith('W/"')
+        print(f"✓ {path}: {cache_control}, ETag {response.headers['ETag']}")
+
+    def test_user_data_private(self):
+        """User endpoints are never stored by shared caches"""
+        response = requests.get(f"{BASE_URL}/api/auth/user/me")
+        cache_control = response.headers.get("Cache-Control", "")
+        assert "public" not in cache_control
+        print(f"✓ /api/auth/user/me: {cache_control}")
+
+    def test_unlisted_route_no_store(self):
+        """Routes without a policy keep no-store"""
+        response = requests.get(f"{BASE_URL}/api/social/posts/edgewood-atlanta")
+        assert "no-store" in response.headers.get("Cache-Control", "")
+        print("✓ Social wall stays no-store")
+
+    def test_missing_location_no_store(self):
+        """Error responses on cacheable routes are not cached"""
+        response = requests.get(f"{BASE_URL}/api/locations/does-not-exist-{uuid.uuid4().hex[:6]}")
+        assert response.status_code == 404
+        assert "no-store" in response.headers.get("Cache-Control", "")
+        print("✓ 404 is no-store")
+
+
+class TestConditionalRequests:
+    """If-None-Match handling"""
+
+    def test_not_modified(self):
+        """Matching If-None-Match returns 304 with an empty body"""
+        etag = requests.get(f"{BASE_URL}/api/menu/items").headers["ETag"]
+        response = requests.get(f"{BASE_URL}/api/menu/items", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers.get("ETag") == etag
+        print(f"✓ 304 for {etag}")
+
+    def test_etag_changes_after_admin_write(self, admin_token):
+        """An admin edit bumps the version, so the old ETag gets a full response"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        etag = requests.get(f"{BASE_URL}/api/menu/items").headers["ETag"]
+
+        response = requests.post(f"{BASE_URL}/api/admin/menu-items", headers=headers, json={
+            "name": f"TEST_Etag_{uuid.uuid4().hex[:6]}",
+            "description": "ETag test",
+            "price": 1.0,
+            "image": "https://example.com/test.jpg",
+            "category": "TEST"
+        })
+        assert response.status_code == 200
+        item_id = response.json()["id"]
+
+        try:
+            response = requests.get(f"{BASE_URL}/api/menu/items", headers={"If-None-Match": etag})
+            assert response.status_code == 200
+            assert response.headers["ETag"] != etag
+            assert any(item.get("id") == item_id for item in response.json())
+            print(f"✓ ETag {etag} -> {response.headers['ETag']}")
+        finally:
+            requests.delete(f"{BASE_URL}/api/admin/menu-items/{item_id}", headers=headers)
@@ -0,0 +1,119 @@
+"""
+Tests for the local disk cache of MongoDB-stored media (media_cache.py)
+- Hits are served from disk without reading media_files
+- Eviction keeps the cache under its byte budget, least recently used first
+- The budget covers files every worker wrote to the shared directory
+- Entries survive a restart and half-written files are swept
+"""
+
+import asyncio
+import base64
+import os
+
+import pytest
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+from media_cache import MediaCache, TEMP_PREFIX, media_file_ids  # noqa: E402
+from storage import MediaStore, MongoStorage  # noqa: E402
+
+VIDEO_BYTES = b"\x00\x00\x00\x18ftypmp42" + b"\x01" * 4096
+
+
+class TestMediaCache:
+    """Tests for MediaCache and its use by MediaStore"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Fresh cache directory and in-memory Mongo per test"""
+        self.directory = tmp_path / "media-cache"
+        self.db = mongomock_motor.AsyncMongoMockClient()["media_cache_test"]
+        self.cache = MediaCache(str(self.directory), max_bytes=10 * 1024)
+        self.store = MediaStore(self.db, backends={"mongodb": MongoStorage()}, default="mongodb", cache=self.cache)
+
+    def insert(self, file_id: str, data: bytes = VIDEO_BYTES):
+        asyncio.run(self.db.media_files.insert_one({
+            "file_id": file_id,
+            "filename": f"{file_id}.mp4",
+            "content_type": "video/mp4",
+            "data": base64.b64encode(data).decode()
+        }))
+
+    def test_read_through(self):
+        """Test the first response fills the cache and later ones need no document"""
+        self.insert("promo")
+        media = asyncio.run(self.store.find(file_id="promo"))
+        response = asyncio.run(self.store.response(media))
+        assert str(response.path) == str(self.cache.get("promo")["path"])
+
+        asyncio.run(self.db.media_files.delete_many({}))
+        cached = self.store.cached_response("promo")
+        assert cached is not None
+        assert cached.media_type == "video/mp4"
+        with open(cached.path, "rb") as f:
+            assert f.read() == VIDEO_BYTES
+        print("✓ Cached media served from disk")
+
+    def test_eviction_by_bytes(self):
+        """Test the least recently used file goes when the budget is exceeded"""
+        asyncio.run(self.cache.put("a", b"a" * 4096, "image/jpeg"))
+        asyncio.run(self.cache.put("b", b"b" * 4096, "image/jpeg"))
+        assert self.cache.get("a") is not None  # "b" is now least recently used
+        asyncio.run(self.cache.put("c", b"c" * 4096, "image/jpeg"))
+
+        assert "a" in self.cache and "c" in self.cache
+        assert "b" not in self.cache
+        assert self.cache.total_bytes <= self.cache.max_bytes
+        assert len(os.listdir(self.directory)) == 2
+        print("✓ LRU eviction keeps the cache under budget")
+
+    def test_budget_shared_by_workers(self):
+        """Test files another worker wrote count against the budget and are evicted first"""
+        other = MediaCache(str(self.directory), max_bytes=10 * 1024)
+        asyncio.run(other.put("a", b"a" * 4096, "image/jpeg"))
+        asyncio.run(other.put("b", b"b" * 4096, "image/jpeg"))
+        asyncio.run(self.cache.put("c", b"c" * 4096, "image/jpeg"))
+
+        assert sum(os.path.getsize(self.directory / name) for name in os.listdir(self.directory)) <= 10 * 1024
+        assert "a" not in other and "b" in other and "c" in self.cache
+        assert self.cache.total_bytes == 8192
+        print("✓ Shared directory kept under one budget")
+
+    def test_too_large_not_cached(self):
+        """Test a file bigger than the whole cache is served but not kept"""
+        assert asyncio.run(self.cache.put("huge", b"x" * (20 * 1024), "video/mp4")) is None
+        assert os.listdir(self.directory) == []
+        print("✓ Oversized file not cached")
+
+    def test_survives_restart(self):
+        """Test a new cache picks up existing files and sweeps temp files"""
+        asyncio.run(self.cache.put("a", b"a" * 1024, "image/png"))
+        (self.directory / f"{TEMP_PREFIX}leftover").write_bytes(b"partial")
+
+        reloaded = MediaCache(str(self.directory), max_bytes=10 * 1024)
+        entry = reloaded.get("a")
+        assert entry is not None and entry["media_type"] == "image/png"
+        assert reloaded.total_bytes == 1024
+        assert not (self.directory / f"{TEMP_PREFIX}leftover").exists()
+        print("✓ Cache reloaded after restart")
+
+    def test_delete_discards(self):
+        """Test deleting the media drops the cached copy"""
+        self.insert("gone")
+        asyncio.run(self.store.warm_cache(["gone"]))
+        assert "gone" in self.cache
+        media = asyncio.run(self.store.find(file_id="gone"))
+        assert asyncio.run(self.store.delete(media)) is True
+        assert "gone" not in self.cache
+        assert self.store.cached_response("gone") is None
+        print("✓ Deleted media removed from the cache")
+
+    def test_warm_up_urls(self):
+        """Test warm-up picks file_ids out of /api/media URLs"""
+        assert media_file_ids([
+            "/api/media/abc", "https://example.com/api/media/def?v=2", None, "/api/uploads/x.png", "/api/media/abc"
+        ]) == ["abc", "def"]
+        self.insert("abc")
+        assert asyncio.run(self.store.warm_cache(["abc", "missing"])) == 1
+        assert asyncio.run(self.store.warm_cache(["abc"])) == 0
+        print("✓ Warm-up caches each file once")
@@ -0,0 +1,103 @@
+"""
+Tests for versioned document shapes (migrations.py)
+- upgrade() fills what an old document is missing and leaves current ones alone
+- The backfill upgrades every old document in batches and stamps its version
+- Values present on old documents (even null) are kept
+"""
+
+import asyncio
+
+import pytest
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+from migrations import (  # noqa: E402
+    MIGRATIONS, SCHEMA_VERSIONS, VERSION_FIELD, SchemaMigrator, stamp, upgrade, upgrade_fields
+)
+
+
+class TestUpgrade:
+    """Tests for the in-memory upgrade used on reads"""
+
+    def test_old_profile_filled(self):
+        """Test a pre-framework profile gets every default it lacks"""
+        profile = upgrade("user_profiles", {"id": "u1", "name": "Guest", "role": "staff", "staff_title": None})
+        assert profile["role"] == "staff"
+        assert profile["staff_title"] is None
+        assert profile["token_balance"] == 0
+        assert profile["special_dates"] == []
+        assert VERSION_FIELD not in profile
+        print("✓ Old profile upgraded in memory")
+
+    def test_current_document_untouched(self):
+        """Test a document at the latest version is returned as stored"""
+        doc = stamp("user_profiles", {"id": "u1", "name": "Guest"})
+        assert upgrade("user_profiles", doc) == {"id": "u1", "name": "Guest", VERSION_FIELD: SCHEMA_VERSIONS["user_profiles"]}
+        assert upgrade("locations", {"slug": "downtown"}) == {"slug": "downtown"}
+        print("✓ Current documents skipped")
+
+    def test_defaults_not_shared(self):
+        """Test mutable defaults are copied per document"""
+        a = upgrade_fields("user_profiles", {})
+        b = upgrade_fields("user_profiles", {})
+        a["special_dates"].append({"label": "Birthday"})
+        assert b["special_dates"] == []
+        print("✓ List defaults copied")
+
+    def test_versions_count_up(self):
+        """Test the registry rejects a gap in a collection's versions"""
+        assert all(SCHEMA_VERSIONS[step["collection"]] >= step["version"] for step in MIGRATIONS)
+        with pytest.raises(ValueError):
+            SchemaMigrator(None, migrations=[{"collection": "x", "version": 2, "description": "", "defaults": {}}])
+        print("✓ Version gaps rejected")
+
+
+class TestSchemaMigrator:
+    """Tests for the batched backfill"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """In-memory Mongo with old profiles and tips"""
+        self.db = mongomock_motor.AsyncMongoMockClient()["migrations_test"]
+        self.migrator = SchemaMigrator(self.db, batch_size=7, batch_pause=0)
+
+        async def seed():
+            await self.db.user_profiles.insert_many([{"id": f"u{i}", "name": f"Guest {i}"} for i in range(20)])
+            await self.db.user_profiles.insert_one({"id": "admin", "name": "Staff", "role": "admin", "phone": None})
+            await self.db.user_profiles.insert_one(stamp("user_profiles", {"id": "new", "name": "New"}))
+            await self.db.dj_tips.insert_many([
+                {"id": "t1", "amount": 5},
+                {"id": "t2", "amount": 10, "payment_method": "venmo"}
+            ])
+
+        asyncio.run(seed())
+
+    def test_check_and_backfill(self):
+        """Test old documents are counted, upgraded in batches, then nothing is behind"""
+        async def main():
+            await self.migrator.ensure_indexes()
+            behind = await self.migrator.check()
+            upgraded = await self.migrator.run()
+            return behind, upgraded
+
+        behind, upgraded = asyncio.run(main())
+        assert behind == {"user_profiles": 21, "dj_tips": 2}
+        assert upgraded == {"user_profiles": 21, "dj_tips": 2}
+        assert self.migrator.behind == {"user_profiles": 0, "dj_tips": 0}
+        print("✓ 23 documents backfilled in batches of 7")
+
+    def test_backfill_keeps_existing_values(self):
+        """Test the backfill only fills missing fields"""
+        async def main():
+            await self.migrator.run()
+            admin = await self.db.user_profiles.find_one({"id": "admin"}, {"_id": 0})
+            tips = await self.db.dj_tips.find({}, {"_id": 0}).sort("id", 1).to_list(None)
+            return admin, tips
+
+        admin, tips = asyncio.run(main())
+        assert admin["role"] == "admin"
+        assert admin["phone"] is None
+        assert admin["cashout_balance"] == 0.0
+        assert admin[VERSION_FIELD] == SCHEMA_VERSIONS["user_profiles"]
+        assert [tip["payment_method"] for tip in tips] == ["cash_app", "venmo"]
+        print("✓ Existing values kept, missing ones filled")
@@ -0,0 +1,131 @@
+"""
+Tests for heartbeat presence (presence.py)
+- Joins and heartbeats are visible on other workers after a sync
+- Check-outs on one worker remove the check-in everywhere
+- Heartbeats after a check-out elsewhere are refused, even from a cached record
+- Check-ins that stop heartbeating drop out after the timeout
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+from presence import PresenceService  # noqa: E402
+from repositories import Repositories  # noqa: E402
+
+
+def checkin(checkin_id, location_slug="downtown", minutes_ago=0, expires_in_hours=4):
+    now = datetime.now(timezone.utc)
+    return {
+        "id": checkin_id,
+        "location_slug": location_slug,
+        "display_name": f"Guest {checkin_id}",
+        "avatar_emoji": "🔥",
+        "mood": None,
+        "message": None,
+        "selfie_url": None,
+        "checked_in_at": now - timedelta(minutes=minutes_ago),
+        "expires_at": now + timedelta(hours=expires_in_hours)
+    }
+
+
+class TestPresence:
+    """Two workers sharing one database"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """In-memory Mongo and a presence service per worker"""
+        self.db = mongomock_motor.AsyncMongoMockClient()["presence_test"]
+        self.checkins = Repositories(self.db).checkins
+        self.a = PresenceService(self.db, self.checkins, timeout=60, sync_every=1, worker_id="a")
+        self.b = PresenceService(self.db, self.checkins, timeout=60, sync_every=1, worker_id="b")
+
+    def add(self, worker, *checkins):
+        async def main():
+            for doc in checkins:
+                await self.checkins.insert(dict(doc))
+                worker.join(doc)
+
+        asyncio.run(main())
+
+    def test_join_visible_after_sync(self):
+        """Test a check-in joined on one worker is counted and listed on the other"""
+        self.add(self.a, checkin("c1", minutes_ago=5), checkin("c2"), checkin("c3", location_slug="uptown"))
+        assert self.a.count("downtown") == 2
+        assert self.b.count("downtown") == 0
+
+        async def main():
+            await self.a.sync()
+            await self.b.sync()
+
+        asyncio.run(main())
+        assert self.b.count("downtown") == 2
+        assert self.b.count("uptown") == 1
+        present = self.b.present("downtown")
+        assert [record["id"] for record in present] == ["c2", "c1"]
+        assert "expires_at" not in present[0]
+        print("✓ Presence shared across workers, newest first")
+
+    def test_heartbeat_and_checkout(self):
+        """Test a heartbeat on one worker and a check-out on the other"""
+        self.add(self.a, checkin("c1"))
+
+        async def main():
+            assert await self.b.heartbeat("c1") == "downtown"
+            assert await self.b.heartbeat("missing") is None
+            await self.a.sync()
+            await self.b.sync()
+            counts = [self.a.count("downtown")]
+
+            await self.checkins.check_out("c1")
+            self.b.leave("c1", "downtown")
+            await self.b.sync()
+            await self.a.sync()
+            counts.append(self.a.count("downtown"))
+            counts.append(self.b.count("downtown"))
+            return counts
+
+        assert asyncio.run(main()) == [1, 0, 0]
+        print("✓ Check-out on one worker removes the check-in on both")
+
+    def test_timeout_and_expiry(self):
+        """Test silent check-ins drop out and expired ones can't heartbeat"""
+        self.add(self.a, checkin("c1"), checkin("old", expires_in_hours=-1))
+
+        async def main():
+            assert await self.a.heartbeat("old") is None
+            self.a._beats["downtown"]["c1"] = time.time() - 120
+            await self.a.sync()
+
+        asyncio.run(main())
+        assert self.a.count("downtown") == 0
+        assert self.a.present("downtown") == []
+        print("✓ Timed-out and expired check-ins dropped")
+
+    def test_heartbeat_after_checkout_elsewhere(self):
+        """Test a worker with the check-in cached refuses heartbeats once it's checked out on another"""
+        self.add(self.a, checkin("c1"), checkin("c2"))
+
+        async def main():
+            await self.a.sync()
+            await self.checkins.check_out("c1")
+            self.b.leave("c1", "downtown")
+            await self.b.sync()
+            # A heartbeat later than the check-out doesn't bring c1 back
+            assert await self.a.heartbeat("c1") == "downtown"
+            await self.a.sync()
+            refused = await self.a.heartbeat("c1")
+
+            # Without a recent sync the cached record isn't trusted
+            await self.checkins.check_out("c2")
+            self.a._last_sync = time.time() - 10
+            stale = await self.a.heartbeat("c2")
+            return refused, stale
+
+        assert asyncio.run(main()) == (None, None)
+        assert self.a.count("downtown") == 0
+        print("✓ Heartbeats after a check-out elsewhere refused")
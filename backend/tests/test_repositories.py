@@ -0,0 +1,104 @@
+"""
+Tests for the repository layer (repositories.py)
+- Default projections keep private fields out of reads
+- ensure_indexes() creates each repository's declared indexes
+- Unread counts for every conversation come from one aggregate
+- Calls are timed into the shared metrics
+- Routers other than auth only reach user_profiles through the repository
+"""
+
+import asyncio
+import re
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+import pytest
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+from repositories import Repositories  # noqa: E402
+
+
+class TestRepositories:
+    """Tests for Repositories"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """In-memory Mongo with a user, check-ins and messages"""
+        self.db = mongomock_motor.AsyncMongoMockClient()["repositories_test"]
+        self.repos = Repositories(self.db)
+        now = datetime.now(timezone.utc)
+
+        async def seed():
+            await self.db.user_profiles.insert_one({
+                "id": "u1", "email": "guest@example.com", "name": "Guest",
+                "password_hash": "secret", "reset_token": "token"
+            })
+            await self.db.checkins.insert_many([
+                {"id": "c1", "location_slug": "downtown", "checked_in_at": now, "expires_at": now + timedelta(hours=1)},
+                {"id": "c2", "location_slug": "downtown", "checked_in_at": now, "expires_at": now - timedelta(hours=1)}
+            ])
+            await self.db.direct_messages.insert_many([
+                {"id": "m1", "from_checkin_id": "a", "to_checkin_id": "me", "read": False, "created_at": now},
+                {"id": "m2", "from_checkin_id": "a", "to_checkin_id": "me", "read": False, "created_at": now},
+                {"id": "m3", "from_checkin_id": "b", "to_checkin_id": "me", "read": False, "created_at": now},
+                {"id": "m4", "from_checkin_id": "b", "to_checkin_id": "me", "read": True, "created_at": now},
+                {"id": "m5", "from_checkin_id": "me", "to_checkin_id": "a", "read": False, "created_at": now}
+            ])
+
+        asyncio.run(seed())
+
+    def test_profile_projection_hides_private_fields(self):
+        """Test profile reads never return password or reset fields"""
+        profile = asyncio.run(self.repos.user_profiles.get_by_email("guest@example.com"))
+        assert profile["name"] == "Guest"
+        for field in ("_id", "password_hash", "reset_token"):
+            assert field not in profile
+        print("✓ Private profile fields projected out")
+
+    def test_ensure_indexes(self):
+        """Test every declared index exists after ensure_indexes()"""
+        async def main():
+            await self.repos.ensure_indexes()
+            return {
+                repo.collection_name: await repo.collection.index_information()
+                for repo in self.repos.all()
+            }
+
+        info = asyncio.run(main())
+        for repo in self.repos.all():
+            created = [index["key"] for index in info[repo.collection_name].values()]
+            for keys, _ in repo.indexes:
+                assert keys in created, (repo.collection_name, keys)
+        print("✓ Declared indexes created")
+
+    def test_unread_counts_grouped_by_sender(self):
+        """Test unread counts for all partners come back in one call"""
+        counts = asyncio.run(self.repos.direct_messages.unread_counts("me"))
+        assert counts == {"a": 2, "b": 1}
+        assert asyncio.run(self.repos.direct_messages.unread_count("me")) == 3
+        print("✓ Unread counts grouped by sender")
+
+    def test_checkins_and_metrics(self):
+        """Test expired check-ins are purged and each call is recorded"""
+        async def main():
+            await self.repos.checkins.purge_expired(datetime.now(timezone.utc))
+            return await self.repos.checkins.active_at("downtown", {"_id": 0, "id": 1})
+
+        assert asyncio.run(main()) == [{"id": "c1"}]
+        ops = {(entry["collection"], entry["op"]): entry for entry in self.repos.metrics.snapshot()}
+        assert ops[("checkins", "delete")]["calls"] == 1
+        assert ops[("checkins", "find")]["calls"] == 1
+        assert self.repos.describe()["metrics"]
+        print("✓ Check-ins purged, calls recorded")
+
+
+def test_routers_read_profiles_through_repository():
+    """Test no router but auth (which checks passwords) queries user_profiles directly"""
+    routers = Path(__file__).resolve().parent.parent / "routers"
+    direct = [
+        path.name for path in sorted(routers.glob("*.py"))
+        if path.name != "auth.py" and re.search(r"\bdb\.user_profiles\.(find|update|delete)", path.read_text())
+    ]
+    assert direct == []
+    print("✓ Profile reads go through repos.user_profiles")
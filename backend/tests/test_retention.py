@@ -0,0 +1,166 @@
+"""
+Tests for the data retention policies
+- GET /api/admin/retention lists the policies with a dry-run preview
+- POST /api/admin/retention/run applies them (dry run by default)
+- The legacy cleanup endpoints still answer with deleted_count
+- Only one non-dry run applies the policies at a time
+- Re-archiving a batch left behind by a dead run doesn't duplicate it
+"""
+
+import asyncio
+import pytest
+import requests
+import os
+from datetime import datetime, timedelta, timezone
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+HOT_COLLECTIONS = ["social_posts", "checkins", "song_requests", "direct_messages", "drink_orders", "dj_tips"]
+
+
+class TestRetentionAPI:
+    """Tests for the retention admin endpoints"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Login as admin"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "$outhcentral"
+        })
+        assert response.status_code == 200
+        self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        yield
+
+    def test_get_policies_and_preview(self):
+        """Test every hot collection has a policy and the preview is a dry run"""
+        response = requests.get(f"{BASE_URL}/api/admin/retention", headers=self.headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+
+        data = response.json()
+        collections = [policy["collection"] for policy in data["policies"]]
+        for collection in HOT_COLLECTIONS:
+            assert collection in collections, f"No retention policy for {collection}"
+        assert data["preview"]["dry_run"] is True
+        assert all("eligible" in policy for policy in data["preview"]["policies"])
+        print(f"✓ {len(collections)} retention policies, preview removes nothing")
+
+    def test_run_defaults_to_dry_run(self):
+        """Test running without dry_run=false only counts"""
+        response = requests.post(f"{BASE_URL}/api/admin/retention/run", headers=self.headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["dry_run"] is True
+        assert data["removed"] == 0
+        print("✓ Retention run defaults to a dry run")
+
+    def test_run_single_collection(self):
+        """Test applying one collection's policy"""
+        response = requests.post(
+            f"{BASE_URL}/api/admin/retention/run",
+            params={"dry_run": "false", "collection": "song_requests"},
+            headers=self.headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [policy["collection"] for policy in data["policies"]] == ["song_requests"]
+        assert data["policies"][0]["remaining"] >= 0
+        print(f"✓ song_requests retention removed {data['removed']} documents")
+
+    def test_run_unknown_collection(self):
+        """Test a collection without a policy is rejected"""
+        response = requests.post(
+            f"{BASE_URL}/api/admin/retention/run",
+            params={"collection": "menu_items"},
+            headers=self.headers
+        )
+        assert response.status_code == 404
+        print("✓ Unknown collection returns 404")
+
+    def test_legacy_cleanup_endpoint(self):
+        """Test the old-post cleanup endpoint keeps its response shape"""
+        response = requests.delete(f"{BASE_URL}/api/admin/social-posts/cleanup/old", headers=self.headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert isinstance(data["deleted_count"], int)
+        print(f"✓ Legacy cleanup deleted {data['deleted_count']} posts")
+
+
+class TestRetentionRunLock:
+    """Overlapping runs from the cron script, the scheduler and the admin endpoints"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """In-memory Mongo with old song requests"""
+        mongomock_motor = pytest.importorskip("mongomock_motor")
+        from retention import RetentionEngine
+
+        self.db = mongomock_motor.AsyncMongoMockClient()["retention_test"]
+        self.engine = RetentionEngine(self.db, batch_pause=0)
+        old = datetime.now(timezone.utc) - timedelta(days=8)
+        asyncio.run(self.db.song_requests.insert_many([{"id": f"r{i}", "created_at": old} for i in range(3)]))
+
+    def test_second_run_skipped(self):
+        """Test a run while another holds the lock removes nothing, and runs once it is released"""
+        from leader import LeaderLease
+        from retention import RUN_LOCK_NAME
+
+        async def main():
+            other = LeaderLease(self.db, RUN_LOCK_NAME, holder_id="cron")
+            assert await other.acquire()
+            skipped = await self.engine.run(collections=["song_requests"])
+            preview = await self.engine.run(dry_run=True, collections=["song_requests"])
+            await other.release()
+            applied = await self.engine.run(collections=["song_requests"])
+            return skipped, preview, applied, await self.db.song_requests.count_documents({})
+
+        skipped, preview, applied, left = asyncio.run(main())
+        assert skipped["already_running"] is True and skipped["holder"] == "cron"
+        assert skipped["removed"] == 0
+        assert preview["policies"][0]["eligible"] == 3
+        assert applied["removed"] == 3 and "already_running" not in applied
+        assert left == 0
+        print("✓ Overlapping retention run skipped, next one applied")
+
+
+class TestRetentionRerun:
+    """A run that died between archiving a batch and deleting it"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """In-memory Mongo with old DJ tips"""
+        mongomock_motor = pytest.importorskip("mongomock_motor")
+        from retention import RetentionEngine
+
+        self.db = mongomock_motor.AsyncMongoMockClient()["retention_rerun_test"]
+        self.engine = RetentionEngine(self.db, batch_pause=0)
+        self.policy = next(policy for policy in self.engine.policies if policy["collection"] == "dj_tips")
+        old = datetime.now(timezone.utc) - timedelta(days=100)
+        asyncio.run(self.db.dj_tips.insert_many([{"id": f"t{i}", "amount": 5, "created_at": old} for i in range(4)]))
+
+    def test_archive_batch_once(self):
+        """Test the next run re-archives the same batch under the same id"""
+        async def main():
+            docs = await self.db.dj_tips.find({}).sort("created_at", 1).to_list(None)
+            await self.engine._archive(self.policy, docs)
+            result = await self.engine.run(collections=["dj_tips"])
+            return result, await self.db.dj_tips_archive.count_documents({}), await self.db.dj_tips.count_documents({})
+
+        result, archived, left = asyncio.run(main())
+        assert result["removed"] == 4
+        assert archived == 1
+        assert left == 0
+        print("✓ Batch archived once across two runs")
+
+    def test_stops_when_lock_lost(self):
+        """Test a run whose lock lapsed stops before its next batch"""
+        from leader import LeaderLease
+
+        async def main():
+            lost = LeaderLease(self.db, "retention_run")
+            return await self.engine._apply(self.policy, datetime.now(timezone.utc), False, lost)
+
+        result = asyncio.run(main())
+        assert result["batches"] == 0 and result["remaining"] == 4
+        print("✓ Run without its lock left every batch for the next run")
@@ -0,0 +1,51 @@
+"""
+Tests for the scheduler lease and job run history
+- GET /api/admin/system/jobs returns the current lease holder and recent runs
+"""
+
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+class TestSchedulerJobsAPI:
+    """Tests for the admin job run history"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Login as admin"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "$outhcentral"
+        })
+        assert response.status_code == 200
+        self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        yield
+
+    def test_get_job_runs(self):
+        """Test the scheduler lease is held and runs are listed newest first"""
+        response = requests.get(f"{BASE_URL}/api/admin/system/jobs", headers=self.headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+
+        data = response.json()
+        assert data["leader"] is not None, "A running server should hold the scheduler lease"
+        assert data["leader"]["holder"]
+        assert isinstance(data["runs"], list)
+        started = [run["started_at"] for run in data["runs"]]
+        assert started == sorted(started, reverse=True), "Runs should be newest first"
+        print(f"✓ Scheduler lease held by {data['leader']['holder']}, {len(data['runs'])} runs")
+
+    def test_filter_job_runs(self):
+        """Test filtering the history to one job"""
+        response = requests.get(
+            f"{BASE_URL}/api/admin/system/jobs",
+            params={"job_id": "retention", "limit": 5},
+            headers=self.headers
+        )
+        assert response.status_code == 200
+        runs = response.json()["runs"]
+        assert len(runs) <= 5
+        assert all(run["job_id"] == "retention" for run in runs)
+        print("✓ Job runs filtered by job_id")
@@ -0,0 +1,118 @@
+"""
+Tests for request coalescing (singleflight.py)
+- Concurrent calls with the same key share one execution
+- Exceptions reach every waiter; a cancelled waiter doesn't cancel the call
+- The micro-TTL reuses a finished result; forget() drops it
+"""
+
+import asyncio
+
+import pytest
+
+from singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight.do"""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test 50 identical concurrent reads run the query once"""
+        flight = SingleFlight(ttl=0)
+        runs = []
+
+        async def query():
+            runs.append(1)
+            await asyncio.sleep(0.01)
+            return ["post"]
+
+        async def main():
+            return await asyncio.gather(*[flight.do(("social_posts", "downtown"), query) for _ in range(50)])
+
+        results = asyncio.run(main())
+        assert len(runs) == 1
+        assert all(result == ["post"] for result in results)
+        assert flight.stats()["shared"] == 49
+        print("✓ 50 concurrent calls shared 1 execution")
+
+    def test_different_keys_run_separately(self):
+        """Test each key gets its own execution"""
+        flight = SingleFlight(ttl=0)
+
+        async def main():
+            return await asyncio.gather(*[
+                flight.do(("checkins", slug), lambda slug=slug: asyncio.sleep(0.01, result=slug))
+                for slug in ("a", "b", "a")
+            ])
+
+        assert asyncio.run(main()) == ["a", "b", "a"]
+        assert flight.executions == 2
+        print("✓ Keys coalesced independently")
+
+    def test_exception_shared(self):
+        """Test a failing call raises in every waiter and isn't remembered"""
+        flight = SingleFlight(ttl=1)
+        runs = []
+
+        async def failing():
+            runs.append(1)
+            await asyncio.sleep(0.01)
+            raise RuntimeError("store down")
+
+        async def main():
+            results = await asyncio.gather(*[flight.do("merchandise", failing) for _ in range(3)],
+                                           return_exceptions=True)
+            assert all(isinstance(r, RuntimeError) for r in results)
+            with pytest.raises(RuntimeError):
+                await flight.do("merchandise", failing)
+
+        asyncio.run(main())
+        assert len(runs) == 2
+        print("✓ Exceptions shared, not cached")
+
+    def test_cancelled_waiter_does_not_cancel_call(self):
+        """Test the call finishes for the others when its first caller goes away"""
+        flight = SingleFlight(ttl=0)
+
+        async def main():
+            first = asyncio.ensure_future(flight.do("k", lambda: asyncio.sleep(0.02, result="done")))
+            second = asyncio.ensure_future(flight.do("k", lambda: asyncio.sleep(0.02, result="other")))
+            await asyncio.sleep(0.005)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(main()) == "done"
+        print("✓ Cancelled waiter left the shared call running")
+
+    def test_micro_ttl_and_forget(self):
+        """Test a finished result is reused within the TTL until forgotten"""
+        flight = SingleFlight(ttl=0.2)
+        runs = []
+
+        async def query():
+            runs.append(1)
+            return len(runs)
+
+        async def main():
+            assert await flight.do("k", query) == 1
+            assert await flight.do("k", query) == 1
+            flight.forget("k")
+            assert await flight.do("k", query) == 2
+            await asyncio.sleep(0.25)
+            assert await flight.do("k", query) == 3
+
+        asyncio.run(main())
+        print("✓ Micro-TTL reuse and forget()")
+
+    def test_forget_while_in_flight(self):
+        """Test a result started before a write isn't remembered after forget()"""
+        flight = SingleFlight(ttl=1)
+
+        async def main():
+            stale = asyncio.ensure_future(flight.do("k", lambda: asyncio.sleep(0.02, result="before")))
+            await asyncio.sleep(0.005)
+            flight.forget("k")
+            assert await stale == "before"
+            assert await flight.do("k", lambda: asyncio.sleep(0, result="after")) == "after"
+
+        asyncio.run(main())
+        print("✓ In-flight result dropped by forget()")
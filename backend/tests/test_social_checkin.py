@@ -109,6 +109,29 @@ class TestCheckIn:
         response = requests.delete(f"{BASE_URL}/api/checkin/{fake_id}")
         assert response.status_code == 404
 
+    def test_heartbeat(self):
+        """Test heartbeating a check-in until it checks out"""
+        checkin_data = {
+            "location_slug": LOCATION_SLUG,
+            "display_name": f"{TEST_PREFIX}_Heartbeat_User",
+            "avatar_emoji": "💓",
+            "mood": "Celebrating"
+        }
+
+        create_response = requests.post(f"{BASE_URL}/api/checkin", json=checkin_data)
+        assert create_response.status_code == 200
+        checkin_id = create_response.json()["id"]
+
+        response = requests.post(f"{BASE_URL}/api/checkin/{checkin_id}/heartbeat")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["location_slug"] == LOCATION_SLUG
+        assert data["count"] >= 1
+
+        requests.delete(f"{BASE_URL}/api/checkin/{checkin_id}")
+        response = requests.post(f"{BASE_URL}/api/checkin/{checkin_id}/heartbeat")
+        assert response.status_code == 404
+
 
 class TestSocialPosts:
     """Social Wall post tests"""
@@ -0,0 +1,150 @@
+"""
+Tests for streamed and resumable uploads
+- POST /api/admin/upload streams into the media backend and reports sha256
+- Oversized uploads are refused with 413
+- Resumable (tus) video uploads: create, HEAD offset, PATCH in parts, complete
+"""
+
+import base64
+import hashlib
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 4096
+VIDEO_BYTES = bytes(range(256)) * 64
+
+
+def tus_metadata(**values) -> str:
+    return ",".join(f"{key} {base64.b64encode(value.encode()).decode()}" for key, value in values.items())
+
+
+class TestStreamingUploads:
+    """Tests for the streamed admin uploads"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Login as admin"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "$outhcentral"
+        })
+        assert response.status_code == 200
+        self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    def test_upload_reports_hash(self):
+        """Test an image upload is stored intact and hashed"""
+        response = requests.post(
+            f"{BASE_URL}/api/admin/upload",
+            files={"file": ("TEST_stream.png", PNG_BYTES, "image/png")},
+            headers=self.headers
+        )
+        assert response.status_code == 200, f"Upload failed: {response.text}"
+        data = response.json()
+        assert data["size"] == len(PNG_BYTES)
+        assert data["sha256"] == hashlib.sha256(PNG_BYTES).hexdigest()
+
+        media = requests.get(f"{BASE_URL}{data['url']}", allow_redirects=True)
+        assert media.status_code == 200
+        assert media.content == PNG_BYTES
+        requests.delete(f"{BASE_URL}/api/admin/uploads/{data['filename']}", headers=self.headers)
+        print(f"✓ {data['filename']} streamed ({data['size']} bytes)")
+
+    def test_oversized_upload_refused(self):
+        """Test an image over 10MB is refused with 413"""
+        response = requests.post(
+            f"{BASE_URL}/api/admin/upload",
+            files={"file": ("TEST_big.png", b"\x00" * (11 * 1024 * 1024), "image/png")},
+            headers=self.headers
+        )
+        assert response.status_code == 413
+        assert "10MB" in response.json()["detail"]
+        print("✓ Oversized upload refused with 413")
+
+    def test_disallowed_extension(self):
+        """Test the extension is still checked"""
+        response = requests.post(
+            f"{BASE_URL}/api/admin/upload",
+            files={"file": ("TEST_script.exe", b"MZ", "image/png")},
+            headers=self.headers
+        )
+        assert response.status_code == 400
+        print("✓ Disallowed extension rejected")
+
+
+class TestResumableVideoUploads:
+    """Tests for /api/admin/upload/video/resumable"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Login as admin and start a resumable upload"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "$outhcentral"
+        })
+        assert response.status_code == 200
+        self.headers = {"Authorization": f"Bearer {response.json()['access_token']}", "Tus-Resumable": "1.0.0"}
+
+        created = requests.post(f"{BASE_URL}/api/admin/upload/video/resumable", headers={
+            **self.headers,
+            "Upload-Length": str(len(VIDEO_BYTES)),
+            "Upload-Metadata": tus_metadata(filename="TEST_promo.mp4", filetype="video/mp4")
+        })
+        assert created.status_code == 201, f"Create failed: {created.text}"
+        assert created.headers["Upload-Offset"] == "0"
+        self.location = f"{BASE_URL}{created.headers['Location']}"
+        self.filename = None
+        yield
+        requests.delete(self.location, headers=self.headers)
+        if self.filename:
+            requests.delete(f"{BASE_URL}/api/admin/uploads/{self.filename}", headers=self.headers)
+
+    def patch(self, offset: int, body: bytes):
+        return requests.patch(self.location, data=body, headers={
+            **self.headers,
+            "Content-Type": "application/offset+octet-stream",
+            "Upload-Offset": str(offset)
+        })
+
+    def test_upload_in_parts(self):
+        """Test a video sent in two PATCHes resumes from the HEAD offset"""
+        half = len(VIDEO_BYTES) // 2
+        response = self.patch(0, VIDEO_BYTES[:half])
+        assert response.status_code == 204
+        assert response.headers["Upload-Offset"] == str(half)
+
+        head = requests.head(self.location, headers=self.headers)
+        assert head.status_code == 200
+        assert head.headers["Upload-Offset"] == str(half)
+        assert head.headers["Upload-Length"] == str(len(VIDEO_BYTES))
+
+        response = self.patch(half, VIDEO_BYTES[half:])
+        assert response.status_code == 200, f"Final PATCH failed: {response.text}"
+        data = response.json()
+        self.filename = data["filename"]
+        assert data["size"] == len(VIDEO_BYTES)
+        assert data["sha256"] == hashlib.sha256(VIDEO_BYTES).hexdigest()
+
+        media = requests.get(f"{BASE_URL}{data['url']}", allow_redirects=True)
+        assert media.content == VIDEO_BYTES
+        print(f"✓ Resumable upload completed as {self.filename}")
+
+    def test_offset_mismatch(self):
+        """Test a PATCH at the wrong offset gets 409"""
+        response = self.patch(0, VIDEO_BYTES[:100])
+        assert response.status_code == 204
+        response = self.patch(0, VIDEO_BYTES[:100])
+        assert response.status_code == 409
+        print("✓ Offset mismatch rejected with 409")
+
+    def test_wrong_content_type(self):
+        """Test PATCH bodies must be application/offset+octet-stream"""
+        response = requests.patch(self.location, data=VIDEO_BYTES, headers={
+            **self.headers,
+            "Content-Type": "application/octet-stream",
+            "Upload-Offset": "0"
+        })
+        assert response.status_code == 415
+        print("✓ Wrong PATCH content type rejected with 415")
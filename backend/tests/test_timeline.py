@@ -0,0 +1,90 @@
+"""
+Tests for the merged venue timeline (timeline.py)
+- Feeds are merged newest first with ties in source order, then by id
+- Keyset pages cover every item exactly once, even across tied timestamps
+- Source filters apply and malformed cursors are rejected
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+from repositories import Repositories  # noqa: E402
+from timeline import VenueTimeline, decode_cursor, encode_cursor  # noqa: E402
+
+START = datetime(2026, 10, 1, 20, 0)
+
+
+class TestVenueTimeline:
+    """Posts, tips and drinks at one location"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """In-memory Mongo with interleaved and tied items"""
+        db = mongomock_motor.AsyncMongoMockClient()["timeline_test"]
+        repos = Repositories(db)
+        self.timeline = VenueTimeline([
+            {"kind": "post", "repository": repos.social_posts, "projection": {"_id": 0}},
+            {"kind": "dj_tip", "repository": repos.dj_tips, "projection": {"_id": 0}},
+            {
+                "kind": "drink",
+                "repository": repos.drink_orders,
+                "projection": {"_id": 0},
+                "filter": {"status": {"$in": ["pending", "delivered"]}}
+            },
+        ])
+        tied = START + timedelta(minutes=5)
+
+        async def seed():
+            await repos.ensure_indexes()
+            await db.social_posts.insert_many([
+                {"id": f"p{i}", "location_slug": "downtown", "created_at": START + timedelta(minutes=i)} for i in range(8)
+            ])
+            await db.social_posts.insert_one({"id": "elsewhere", "location_slug": "uptown", "created_at": tied})
+            await db.dj_tips.insert_many([
+                {"id": f"t{i}", "location_slug": "downtown", "created_at": tied} for i in range(3)
+            ])
+            await db.drink_orders.insert_many([
+                {"id": "d0", "location_slug": "downtown", "status": "pending", "created_at": tied},
+                {"id": "d1", "location_slug": "downtown", "status": "declined", "created_at": tied},
+                {"id": "d2", "location_slug": "downtown", "status": "delivered", "created_at": START}
+            ])
+
+        asyncio.run(seed())
+
+    def pages(self, limit):
+        async def main():
+            pages, cursor = [], None
+            while True:
+                items, cursor = await self.timeline.page("downtown", cursor, limit)
+                pages.append([doc["id"] for _, doc in items])
+                if cursor is None:
+                    return pages
+
+        return asyncio.run(main())
+
+    def test_merge_order(self):
+        """Test one page holds every feed newest first, ties by source then id"""
+        [page] = self.pages(50)
+        assert page == ["p7", "p6", "p5", "t2", "t1", "t0", "d0", "p4", "p3", "p2", "p1", "p0", "d2"]
+        print("✓ Feeds merged newest first")
+
+    def test_keyset_pages(self):
+        """Test small pages split ties without repeating or dropping items"""
+        pages = self.pages(2)
+        assert [len(page) for page in pages] == [2, 2, 2, 2, 2, 2, 1]
+        assert sum(pages, []) == self.pages(50)[0]
+        print("✓ 13 items over 7 pages, each once")
+
+    def test_cursor_round_trip(self):
+        """Test cursors encode a position and garbage is rejected"""
+        cursor = encode_cursor("dj_tip", {"id": "t1", "created_at": START})
+        assert decode_cursor(cursor) == (START, "dj_tip", "t1")
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+        with pytest.raises(ValueError):
+            VenueTimeline([{"kind": "post"}, {"kind": "post"}])
+        print("✓ Cursor round trip")
@@ -0,0 +1,60 @@
+"""
+Tests for serving and listing the local uploads directory
+- GET /api/uploads/{filename} returns the file with its MIME type
+- GET /api/admin/uploads lists each file once
+"""
+
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 2048
+
+
+class TestUploadsServing:
+    """Tests for /api/uploads and the admin uploads listing"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Login as admin and upload a throwaway PNG"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "$outhcentral"
+        })
+        assert response.status_code == 200
+        self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        upload = requests.post(
+            f"{BASE_URL}/api/admin/upload",
+            files={"file": ("TEST_upload.png", PNG_BYTES, "image/png")},
+            headers=self.headers
+        )
+        assert upload.status_code == 200, f"Upload failed: {upload.text}"
+        self.filename = upload.json()["filename"]
+        yield
+        requests.delete(f"{BASE_URL}/api/admin/uploads/{self.filename}", headers=self.headers)
+
+    def test_serve_upload(self):
+        """Test the legacy uploads URL returns the bytes with the right type"""
+        response = requests.get(f"{BASE_URL}/api/uploads/{self.filename}")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
+        assert response.content == PNG_BYTES
+        print(f"✓ {self.filename} served as image/png")
+
+    def test_listing_has_no_duplicates(self):
+        """Test a file stored both locally and in MongoDB is listed once"""
+        response = requests.get(f"{BASE_URL}/api/admin/uploads", headers=self.headers)
+        assert response.status_code == 200
+        filenames = [f["filename"] for f in response.json()]
+        assert filenames.count(self.filename) == 1
+        assert len(filenames) == len(set(filenames)), "Listing contains duplicate filenames"
+        print(f"✓ Uploads listing has {len(filenames)} unique files")
+
+    def test_missing_upload(self):
+        """Test an unknown filename returns 404"""
+        response = requests.get(f"{BASE_URL}/api/uploads/does-not-exist.png")
+        assert response.status_code == 404
+        print("✓ Missing upload returns 404")
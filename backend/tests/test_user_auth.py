@@ -3,6 +3,7 @@ Test suite for User Authentication features:
 - Email/Password Registration (POST /api/auth/user/register)
 - Email/Password Login (POST /api/auth/user/login)
 - Session handling (/api/auth/user/me)
+- Signed access tokens and refresh rotation (/api/auth/user/refresh)
 - User Logout (/api/auth/user/logout)
 """
 import pytest
@@ -205,6 +206,69 @@ class TestSessionHandling:
         print("✓ User info correctly rejects invalid session")
 
 
+class TestSignedSessions:
+    """Tests for signed access tokens, refresh rotation and revocation"""
+    
+    @pytest.fixture
+    def registered(self):
+        """Register a user and return the registration response"""
+        suffix = uuid.uuid4().hex[:8]
+        response = requests.post(f"{BASE_URL}/api/auth/user/register", json={
+            "username": f"test_signed_{suffix}",
+            "email": f"TEST_signed_{suffix}@example.com",
+            "password": "testpass123",
+            "name": "Signed Session User"
+        })
+        assert response.status_code == 200, f"Registration failed: {response.text}"
+        return response
+    
+    def test_access_token_returned(self, registered):
+        """Test login responses include a signed access token"""
+        data = registered.json()
+        assert data.get("access_token"), "Response should contain access_token"
+        assert data["access_token"].count(".") == 2, "Access token should be a JWT"
+        print("✓ Signed access token issued on registration")
+    
+    def test_me_with_access_token(self, registered):
+        """Test /api/auth/user/me accepts the access token as a Bearer header"""
+        data = registered.json()
+        response = requests.get(
+            f"{BASE_URL}/api/auth/user/me",
+            headers={"Authorization": f"Bearer {data['access_token']}"}
+        )
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+        assert response.json()["id"] == data["user"]["id"]
+        assert "password_hash" not in response.json()
+        print("✓ /me resolved from the access token")
+    
+    def test_refresh_rotates_session_token(self, registered):
+        """Test refresh issues a new session token"""
+        old_token = registered.cookies.get("session_token")
+        assert old_token, "Registration should set the session_token cookie"
+        
+        session = requests.Session()
+        session.cookies.set("session_token", old_token)
+        response = session.post(f"{BASE_URL}/api/auth/user/refresh")
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+        assert response.json().get("access_token")
+        assert response.cookies.get("session_token") not in (None, old_token), "Session token should rotate"
+        print("✓ Session token rotated on refresh")
+    
+    def test_logout_revokes_access_token(self, registered):
+        """Test an access token stops working after logout"""
+        data = registered.json()
+        headers = {"Authorization": f"Bearer {data['access_token']}"}
+        
+        session = requests.Session()
+        session.cookies.set("session_token", registered.cookies.get("session_token"))
+        logout = session.post(f"{BASE_URL}/api/auth/user/logout", headers=headers)
+        assert logout.status_code == 200
+        
+        response = requests.get(f"{BASE_URL}/api/auth/user/me", headers=headers)
+        assert response.status_code == 401, f"Expected 401 after logout, got {response.status_code}"
+        print("✓ Access token revoked on logout")
+
+
 class TestLogout:
     """Tests for POST /api/auth/user/logout endpoint"""
     
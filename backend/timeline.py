@@ -0,0 +1,95 @@
+import asyncio
+import base64
+import heapq
+import json
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+# Items per timeline page, and the most a client may ask for
+TIMELINE_PAGE_SIZE = 30
+TIMELINE_MAX_PAGE_SIZE = 100
+
+# Newest first, ties broken by id (repositories.FEED_BY_LOCATION order)
+FEED_SORT = [("created_at", -1), ("id", -1)]
+
+
+def encode_cursor(kind: str, item: Dict) -> str:
+    """Opaque keyset cursor positioned just after `item`"""
+    position = {"t": item["created_at"].isoformat(), "k": kind, "i": item["id"]}
+    return base64.urlsafe_b64encode(json.dumps(position).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str, str]:
+    """(created_at, kind, id) of the last item seen; ValueError if the cursor is malformed"""
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(position["t"]), position["k"], position["i"]
+    except (TypeError, KeyError, UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid timeline cursor: {e}")
+
+
+class VenueTimeline:
+    """
+    One location's activity across several feeds, newest first, merged
+    server-side. `sources` are, in tie-break order:
+        kind        - tag returned with each item
+        repository  - a Repository whose BY_LOCATION is FEED_BY_LOCATION
+        projection  - fields to read
+        filter      - optional extra conditions (e.g. visible statuses)
+
+    A page runs one indexed range read per source, concurrently, each
+    limited to the page size, and k-way merges the sorted results with
+    heapq. The cursor is a single (created_at, kind, id) position in the
+    merged order, so every source resumes from its own index range without
+    skip/offset and items inserted meanwhile never shift a page.
+    """
+
+    def __init__(self, sources: List[Dict]):
+        self.sources = sources
+        self.ranks = {source["kind"]: rank for rank, source in enumerate(sources)}
+        if len(self.ranks) != len(sources):
+            raise ValueError("Timeline source kinds must be unique")
+
+    def _after(self, kind: str, position: Optional[Tuple[datetime, str, str]]) -> Dict:
+        """Conditions selecting a source's items that come after `position` in merged order"""
+        if position is None:
+            return {}
+        created_at, cursor_kind, cursor_id = position
+        rank, cursor_rank = self.ranks[kind], self.ranks.get(cursor_kind, -1)
+        if rank < cursor_rank:
+            # This source's items at created_at were merged before the cursor item
+            return {"created_at": {"$lt": created_at}}
+        if rank > cursor_rank:
+            return {"created_at": {"$lte": created_at}}
+        # The $lte bound keeps this a single index range; the $or only trims ties
+        return {
+            "created_at": {"$lte": created_at},
+            "$or": [{"created_at": {"$lt": created_at}}, {"id": {"$lt": cursor_id}}]
+        }
+
+    async def _read(self, source: Dict, location_slug: str, position, limit: int) -> List[Dict]:
+        repository = source["repository"]
+        query = {"location_slug": location_slug, **source.get("filter", {}), **self._after(source["kind"], position)}
+        return await repository.find(
+            query, source["projection"], sort=FEED_SORT, limit=limit, hint=repository.BY_LOCATION
+        )
+
+    async def page(self, location_slug: str, cursor: Optional[str] = None,
+                   limit: int = TIMELINE_PAGE_SIZE) -> Tuple[List[Tuple[str, Dict]], Optional[str]]:
+        """
+        Up to `limit` (kind, document) pairs after `cursor` (the first page
+        when None), and the cursor of the next page (None on the last page).
+        """
+        position = decode_cursor(cursor) if cursor else None
+        # One extra per source tells whether anything follows this page
+        results = await asyncio.gather(*[
+            self._read(source, location_slug, position, limit + 1) for source in self.sources
+        ])
+        streams = [
+            [(doc["created_at"], -self.ranks[source["kind"]], doc["id"], source["kind"], doc) for doc in docs]
+            for source, docs in zip(self.sources, results)
+        ]
+        merged = [(kind, doc) for *_, kind, doc in heapq.merge(*streams, key=lambda entry: entry[:3], reverse=True)]
+        items = merged[:limit]
+        next_cursor = encode_cursor(*items[-1]) if len(merged) > limit else None
+        return items, next_cursor
@@ -0,0 +1,81 @@
+import os
+import time
+import mimetypes
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Not in every platform's mime.types
+mimetypes.add_type("image/webp", ".webp")
+mimetypes.add_type("video/webm", ".webm")
+mimetypes.add_type("video/x-msvideo", ".avi")
+
+# How often a lookup may stat the directory to see whether it changed
+REFRESH_SECONDS = 2.0
+
+
+def guess_media_type(filename: str) -> str:
+    return mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+
+class UploadIndex:
+    """
+    In-memory listing of a local uploads directory: filename -> size,
+    modified time and media type. The directory is only rescanned when its
+    own mtime has changed (a file was added, removed or renamed), and that
+    is checked at most every `refresh_seconds`, so lookups and listings
+    don't stat every file per request.
+
+    discard() drops a file this worker deleted straight away; other workers
+    see the change on their next refresh, so an entry can name a file that
+    is already gone.
+    """
+
+    def __init__(self, directory: Path, refresh_seconds: float = REFRESH_SECONDS):
+        self.directory = Path(directory)
+        self.refresh_seconds = refresh_seconds
+        self._entries: Dict[str, Dict] = {}
+        self._directory_mtime_ns: Optional[int] = None
+        self._checked_at = float("-inf")
+
+    def _refresh(self):
+        now = time.monotonic()
+        if now - self._checked_at < self.refresh_seconds:
+            return
+        self._checked_at = now
+
+        try:
+            # Taken before the scan: a file added mid-scan changes the mtime
+            # again and triggers another scan next time
+            mtime_ns = os.stat(self.directory).st_mtime_ns
+        except FileNotFoundError:
+            self._entries, self._directory_mtime_ns = {}, None
+            return
+        if mtime_ns == self._directory_mtime_ns:
+            return
+
+        entries = {}
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.is_file():
+                    stat = entry.stat()
+                    entries[entry.name] = self._entry(entry.name, stat.st_size, stat.st_mtime)
+        self._entries, self._directory_mtime_ns = entries, mtime_ns
+
+    @staticmethod
+    def _entry(filename: str, size: int, modified: float) -> Dict:
+        return {"size": size, "modified": modified, "media_type": guess_media_type(filename)}
+
+    def get(self, filename: str) -> Optional[Dict]:
+        """Index entry for a file directly in the directory, or None"""
+        self._refresh()
+        return self._entries.get(filename)
+
+    def path(self, filename: str) -> Path:
+        return self.directory / filename
+
+    def list(self) -> List[Dict]:
+        self._refresh()
+        return [{"filename": name, **entry} for name, entry in self._entries.items()]
+
+    def discard(self, filename: str):
+        self._entries.pop(filename, None)
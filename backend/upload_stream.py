@@ -0,0 +1,463 @@
+import os
+import uuid
+import base64
+import hashlib
+import logging
+import asyncio
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, Optional
+
+from bson import Binary
+from fastapi import HTTPException, Request
+from pymongo.errors import DuplicateKeyError
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+from starlette.requests import ClientDisconnect
+
+from storage import OBJECT_CACHE_CONTROL, S3_PART_SIZE
+
+# Content-Length may exceed the file size limit by this much (boundaries,
+# part headers, other form fields) before we refuse without reading
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+# Resumable uploads follow the tus 1.0 core protocol (plus the creation and
+# termination extensions), so tus-js-client and friends can drive them
+TUS_VERSION = "1.0.0"
+
+# Resumable upload bytes are staged in documents of up to this size
+RESUMABLE_CHUNK_BYTES = 1024 * 1024
+
+# Unfinished resumable uploads are dropped (TTL) after this long
+RESUMABLE_EXPIRY_HOURS = 24
+
+# With S3 storage, the tail of an upload that is short of a whole part is
+# kept as an object under this prefix (in the media bucket) between PATCHes.
+# Give the bucket a lifecycle rule expiring this prefix and aborting
+# incomplete multipart uploads after RESUMABLE_EXPIRY_HOURS, since the
+# session TTL can't clean up S3
+RESUMABLE_STAGING_PREFIX = os.environ.get("RESUMABLE_STAGING_PREFIX", "resumable/")
+
+# A PATCH claims its S3-staged upload for this long, so a second request
+# can't upload the same part number; a crashed PATCH's claim runs out
+RESUMABLE_WRITER_SECONDS = 300
+
+
+async def receive_upload(request: Request, open_writer: Callable, max_size: int, too_large_detail: str,
+                         field_name: str = "file") -> Dict:
+    """
+    Stream the `field_name` file of a multipart/form-data request into the
+    writer returned by open_writer(filename, content_type) (see
+    MediaStore.open_writer), counting and hashing as the chunks arrive.
+    Answers 413 as soon as the file passes max_size - or up front when
+    Content-Length already does - and aborts the writer on any failure, so
+    the request body is never held in memory.
+
+    Returns the client's filename, the writer's content type and key, the
+    size, sha256 and whatever commit() stored.
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    boundary = params.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise HTTPException(status_code=400, detail="Expected a multipart/form-data upload")
+
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_size + MULTIPART_OVERHEAD_BYTES:
+        raise HTTPException(status_code=413, detail=too_large_detail)
+
+    # The parser is synchronous: its callbacks queue events, which are
+    # handled (and awaited) after each request chunk is fed in
+    events = []
+    header_field, header_value, headers = bytearray(), bytearray(), {}
+
+    def on_header_end():
+        headers[bytes(header_field).lower()] = bytes(header_value)
+        header_field.clear()
+        header_value.clear()
+
+    def on_headers_finished():
+        events.append(("part", dict(headers)))
+        headers.clear()
+
+    parser = MultipartParser(boundary, {
+        "on_header_field": lambda data, start, end: header_field.extend(data[start:end]),
+        "on_header_value": lambda data, start, end: header_value.extend(data[start:end]),
+        "on_header_end": on_header_end,
+        "on_headers_finished": on_headers_finished,
+        "on_part_data": lambda data, start, end: events.append(("data", data[start:end])),
+        "on_part_end": lambda: events.append(("end", None)),
+    })
+
+    writer = None
+    writing = False
+    filename = part_type = None
+    size = 0
+    sha256 = hashlib.sha256()
+    try:
+        async for chunk in request.stream():
+            try:
+                parser.write(chunk)
+            except MultipartParseError:
+                raise HTTPException(status_code=400, detail="Malformed multipart upload")
+
+            for event, value in events:
+                if event == "part":
+                    _, disposition = parse_options_header(value.get(b"content-disposition", b""))
+                    writing = (
+                        writer is None
+                        and disposition.get(b"name") == field_name.encode()
+                        and b"filename" in disposition
+                    )
+                    if writing:
+                        filename = disposition[b"filename"].decode("utf-8", "replace")
+                        part_type = value.get(b"content-type", b"").decode("latin-1") or None
+                        writer = open_writer(filename, part_type)
+                elif event == "data" and writing:
+                    size += len(value)
+                    if size > max_size:
+                        raise HTTPException(status_code=413, detail=too_large_detail)
+                    sha256.update(value)
+                    await writer.write(value)
+                elif event == "end":
+                    writing = False
+            events.clear()
+
+        parser.finalize()
+        if writer is None:
+            raise HTTPException(status_code=400, detail="No file uploaded")
+        stored = await writer.commit()
+    except BaseException:
+        if writer is not None:
+            try:
+                await writer.abort()
+            except Exception as e:
+                logging.error(f"Failed to abort upload of {filename}: {e}")
+        raise
+
+    return {
+        "filename": filename,
+        "content_type": writer.content_type,
+        "size": size,
+        "sha256": sha256.hexdigest(),
+        "key": writer.key,
+        "stored": stored
+    }
+
+
+def parse_tus_metadata(header: str) -> Dict[str, str]:
+    """Upload-Metadata: comma-separated `key base64(value)` pairs"""
+    metadata = {}
+    for pair in header.split(","):
+        if not pair.strip():
+            continue
+        key, _, value = pair.strip().partition(" ")
+        try:
+            metadata[key] = base64.b64decode(value).decode("utf-8") if value else ""
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid Upload-Metadata value for {key}")
+    return metadata
+
+
+def resumable_uploads_for(db, media_store) -> "ResumableUploads":
+    """Staging that matches where finished uploads go (MediaStore's default backend)"""
+    if media_store.default.name == "s3":
+        return S3ResumableUploads(db, media_store)
+    return ResumableUploads(db, media_store)
+
+
+class ResumableUploads:
+    """
+    tus-style uploads staged in MongoDB, so any worker can take the next
+    PATCH. upload_sessions holds the declared length, the offset received
+    so far, the metadata and the key the finished file will be stored
+    under; upload_chunks holds the bytes in documents of up to
+    RESUMABLE_CHUNK_BYTES keyed by byte offset.
+
+    A PATCH stores each full chunk as it arrives and the partial one when
+    the client disconnects, so after a dropped connection the offset (HEAD)
+    is exactly what was kept and the client carries on from there.
+    complete() streams the chunks in order into a media writer.
+
+    This is the mongodb backend's staging. Its media writer spools the file
+    and Base64-encodes it whole on commit (storage.SpooledWriter), so
+    completing an upload holds about 2.3x the file in memory - some 120 MB
+    for a 50 MB video. Only S3ResumableUploads keeps memory to one part.
+    """
+
+    def __init__(self, db, media_store):
+        self.db = db
+        self.media_store = media_store
+        self.sessions = db.upload_sessions
+        self.chunks = db.upload_chunks
+
+    async def ensure_indexes(self):
+        await self.sessions.create_index("expires_at", expireAfterSeconds=0)
+        await self.chunks.create_index([("upload_id", 1), ("offset", 1)])
+        await self.chunks.create_index("expires_at", expireAfterSeconds=0)
+
+    async def create(self, length: int, filename: str, content_type: str, **metadata) -> Dict:
+        now = datetime.now(timezone.utc)
+        file_id = str(uuid.uuid4())
+        session = {
+            "_id": uuid.uuid4().hex,
+            "length": length,
+            "offset": 0,
+            "filename": filename,
+            "content_type": content_type,
+            "file_id": file_id,
+            "key": f"{file_id}{Path(filename).suffix.lower()}",
+            "status": "uploading",
+            "created_at": now,
+            "expires_at": now + timedelta(hours=RESUMABLE_EXPIRY_HOURS),
+            **metadata
+        }
+        await self._start(session)
+        await self.sessions.insert_one(session)
+        return session
+
+    async def _start(self, session: Dict):
+        """Backend setup before the session is recorded"""
+
+    async def get(self, upload_id: str) -> Optional[Dict]:
+        session = await self.sessions.find_one({"_id": upload_id})
+        if session and "key" not in session:
+            # Started before sessions carried their key
+            session["file_id"] = str(uuid.uuid4())
+            session["key"] = f"{session['file_id']}{Path(session['filename']).suffix.lower()}"
+        return session
+    async def append(self, session: Dict, offset: int, stream: AsyncIterator[bytes]) -> int:
+        """Store a PATCH body that starts at `offset`; returns the new offset"""
+        if offset != session["offset"]:
+            raise HTTPException(status_code=409, detail=f"Upload-Offset should be {session['offset']}")
+
+        # Chunks at or past the offset belong to a PATCH that died before
+        # it could move the offset on
+        await self.chunks.delete_many({"upload_id": session["_id"], "offset": {"$gte": offset}})
+
+        buffer = bytearray()
+        try:
+            async for chunk in stream:
+                if offset + len(buffer) + len(chunk) > session["length"]:
+                    raise HTTPException(status_code=413, detail="Upload is longer than its Upload-Length")
+                buffer += chunk
+                while len(buffer) >= RESUMABLE_CHUNK_BYTES:
+                    offset = await self._store_chunk(session, offset, bytes(buffer[:RESUMABLE_CHUNK_BYTES]))
+                    del buffer[:RESUMABLE_CHUNK_BYTES]
+        except ClientDisconnect:
+            # Keep what arrived; the client resumes from the stored offset
+            pass
+        if buffer:
+            offset = await self._store_chunk(session, offset, bytes(buffer))
+        return offset
+
+    async def _store_chunk(self, session: Dict, offset: int, data: bytes) -> int:
+        upload_id = session["_id"]
+        try:
+            await self.chunks.insert_one({
+                "_id": f"{upload_id}:{offset:012d}",
+                "upload_id": upload_id,
+                "offset": offset,
+                "data": Binary(data),
+                "expires_at": session["expires_at"]
+            })
+        except DuplicateKeyError:
+            raise HTTPException(status_code=409, detail="Another request is writing this upload")
+
+        result = await self.sessions.update_one(
+            {"_id": upload_id, "offset": offset},
+            {"$set": {"offset": offset + len(data), "updated_at": datetime.now(timezone.utc)}}
+        )
+        if not result.modified_count:
+            await self.chunks.delete_one({"_id": f"{upload_id}:{offset:012d}"})
+            raise HTTPException(status_code=409, detail="Another request is writing this upload")
+        return offset + len(data)
+
+    async def complete(self, session: Dict) -> Dict:
+        """Stream the staged chunks into a media writer and commit it; returns size, sha256 and what was stored"""
+        writer = self.media_store.open_writer(session["key"], session["content_type"])
+        sha256 = hashlib.sha256()
+        size = 0
+        try:
+            # Small batches: only a couple of chunks are in memory at a time
+            async for chunk in self.chunks.find({"upload_id": session["_id"]}).sort("offset", 1).batch_size(2):
+                if chunk["offset"] != size:
+                    raise RuntimeError(f"Upload {session['_id']} is missing bytes at offset {size}")
+                data = bytes(chunk["data"])
+                sha256.update(data)
+                await writer.write(data)
+                size += len(data)
+            if size != session["length"]:
+                raise RuntimeError(f"Upload {session['_id']} has {size} of {session['length']} bytes")
+            stored = await writer.commit()
+        except BaseException:
+            await writer.abort()
+            raise
+        return {"size": size, "sha256": sha256.hexdigest(), "stored": stored}
+
+    async def mark_completed(self, upload_id: str, result: Dict):
+        """Keep the result (until the session expires) for retried final PATCHes and drop the chunks"""
+        await self.sessions.update_one({"_id": upload_id}, {"$set": {"status": "completed", "result": result}})
+        await self.chunks.delete_many({"upload_id": upload_id})
+
+    async def discard(self, upload_id: str) -> bool:
+        result = await self.sessions.delete_one({"_id": upload_id})
+        await self.chunks.delete_many({"upload_id": upload_id})
+        return result.deleted_count > 0
+
+
+class S3ResumableUploads(ResumableUploads):
+    """
+    tus-style uploads staged in S3 itself when MEDIA_STORAGE=s3, so video
+    bytes never pass through MongoDB. Each session starts an S3 multipart
+    upload of the final object; upload_sessions keeps only the offsets and
+    the uploaded parts' numbers and ETags.
+
+    Parts are S3_PART_SIZE (S3 refuses smaller parts except the last), so a
+    PATCH uploads every full part as it arrives and leaves what is short of
+    one - at most a part - as a staging object under
+    RESUMABLE_STAGING_PREFIX, which the next PATCH reads back first. One
+    PATCH holds at most a part in memory. complete() finishes the multipart
+    upload and hashes the object by reading it back in chunks.
+    """
+
+    def __init__(self, db, media_store):
+        super().__init__(db, media_store)
+        self.storage = media_store.default
+
+    def _staging_key(self, session: Dict) -> str:
+        return f"{RESUMABLE_STAGING_PREFIX}{session['_id']}.tail"
+
+    async def _start(self, session: Dict):
+        object_key = f"{self.storage.prefix}{session['key']}"
+        created = await asyncio.to_thread(
+            self.storage.client.create_multipart_upload,
+            Bucket=self.storage.bucket, Key=object_key,
+            ContentType=session["content_type"], CacheControl=OBJECT_CACHE_CONTROL
+        )
+        session.update({"object_key": object_key, "s3_upload_id": created["UploadId"], "parts": [], "part_offset": 0})
+
+    async def append(self, session: Dict, offset: int, stream: AsyncIterator[bytes]) -> int:
+        """Store a PATCH body that starts at `offset`; returns the new offset"""
+        if offset != session["offset"]:
+            raise HTTPException(status_code=409, detail=f"Upload-Offset should be {session['offset']}")
+
+        now = datetime.now(timezone.utc)
+        token = uuid.uuid4().hex
+        claimed = await self.sessions.update_one(
+            {"_id": session["_id"], "offset": offset, "$or": [{"writer": None}, {"writer_expires": {"$lte": now}}]},
+            {"$set": {"writer": token, "writer_expires": now + timedelta(seconds=RESUMABLE_WRITER_SECONDS)}}
+        )
+        if not claimed.modified_count:
+            raise HTTPException(status_code=409, detail="Another request is writing this upload")
+
+        try:
+            buffer = bytearray(await self._read_staged(session))
+            try:
+                async for chunk in stream:
+                    if session["part_offset"] + len(buffer) + len(chunk) > session["length"]:
+                        raise HTTPException(status_code=413, detail="Upload is longer than its Upload-Length")
+                    buffer += chunk
+                    while len(buffer) >= S3_PART_SIZE:
+                        await self._store_part(session, token, bytes(buffer[:S3_PART_SIZE]))
+                        del buffer[:S3_PART_SIZE]
+            except ClientDisconnect:
+                # Keep what arrived; the client resumes from the stored offset
+                pass
+
+            if buffer and session["part_offset"] + len(buffer) == session["length"]:
+                # The last part may be any size
+                await self._store_part(session, token, bytes(buffer))
+            elif len(buffer) != session["offset"] - session["part_offset"]:
+                await self._stage(session, token, bytes(buffer))
+        finally:
+            await self.sessions.update_one(
+                {"_id": session["_id"], "writer": token}, {"$unset": {"writer": "", "writer_expires": ""}}
+            )
+        return session["offset"]
+
+    async def _read_staged(self, session: Dict) -> bytes:
+        expected = session["offset"] - session["part_offset"]
+        if not expected:
+            return b""
+        response = await asyncio.to_thread(
+            self.storage.client.get_object, Bucket=self.storage.bucket, Key=self._staging_key(session)
+        )
+        data = await asyncio.to_thread(response["Body"].read)
+        if len(data) != expected:
+            raise RuntimeError(f"Upload {session['_id']} has {len(data)} staged bytes, expected {expected}")
+        return data
+
+    async def _store_part(self, session: Dict, token: str, data: bytes):
+        part = {"PartNumber": len(session["parts"]) + 1}
+        uploaded = await asyncio.to_thread(
+            self.storage.client.upload_part,
+            Bucket=self.storage.bucket, Key=session["object_key"], UploadId=session["s3_upload_id"],
+            PartNumber=part["PartNumber"], Body=data
+        )
+        part["ETag"] = uploaded["ETag"]
+        part_offset = session["part_offset"] + len(data)
+        await self._advance(session, token, {"offset": part_offset, "part_offset": part_offset}, {"parts": part})
+        session["parts"].append(part)
+
+    async def _stage(self, session: Dict, token: str, data: bytes):
+        await asyncio.to_thread(
+            self.storage.client.put_object,
+            Bucket=self.storage.bucket, Key=self._staging_key(session), Body=data
+        )
+        await self._advance(session, token, {"offset": session["part_offset"] + len(data)})
+
+    async def _advance(self, session: Dict, token: str, fields: Dict, push: Optional[Dict] = None):
+        update = {"$set": {**fields, "updated_at": datetime.now(timezone.utc)}}
+        if push:
+            update["$push"] = push
+        result = await self.sessions.update_one({"_id": session["_id"], "writer": token}, update)
+        if not result.modified_count:
+            raise HTTPException(status_code=409, detail="Another request is writing this upload")
+        session.update(fields)
+
+    async def complete(self, session: Dict) -> Dict:
+        """Finish the multipart upload; returns size, sha256 and what was stored"""
+        if session["part_offset"] != session["length"]:
+            raise RuntimeError(f"Upload {session['_id']} has {session['part_offset']} of {session['length']} bytes")
+        client = self.storage.client
+        if session["parts"]:
+            await asyncio.to_thread(
+                client.complete_multipart_upload,
+                Bucket=self.storage.bucket, Key=session["object_key"], UploadId=session["s3_upload_id"],
+                MultipartUpload={"Parts": session["parts"]}
+            )
+            stored = {"bucket": self.storage.bucket, "key": session["object_key"]}
+        else:
+            # An empty file: S3 can't complete a multipart upload without parts
+            await self._abort(session)
+            stored = await self.storage.save(session["key"], b"", session["content_type"])
+
+        sha256 = hashlib.sha256()
+        async for chunk in self.storage.iter_chunks(stored):
+            sha256.update(chunk)
+        return {"size": session["length"], "sha256": sha256.hexdigest(), "stored": stored}
+
+    async def _abort(self, session: Dict):
+        client = self.storage.client
+        try:
+            await asyncio.to_thread(
+                client.abort_multipart_upload,
+                Bucket=self.storage.bucket, Key=session["object_key"], UploadId=session["s3_upload_id"]
+            )
+        except client.exceptions.NoSuchUpload:
+            pass
+
+    async def mark_completed(self, upload_id: str, result: Dict):
+        await super().mark_completed(upload_id, result)
+        await asyncio.to_thread(
+            self.storage.client.delete_object, Bucket=self.storage.bucket, Key=f"{RESUMABLE_STAGING_PREFIX}{upload_id}.tail"
+        )
+
+    async def discard(self, upload_id: str) -> bool:
+        session = await self.get(upload_id)
+        if session and session["status"] != "completed":
+            await self._abort(session)
+        await asyncio.to_thread(
+            self.storage.client.delete_object, Bucket=self.storage.bucket, Key=f"{RESUMABLE_STAGING_PREFIX}{upload_id}.tail"
+        )
+        return await super().discard(upload_id)
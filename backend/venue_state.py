@@ -0,0 +1,230 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+# Number of recent drink orders kept on each venue snapshot
+LATEST_DRINKS_LIMIT = 20
+
+# Drink statuses shown on the public venue feed
+VISIBLE_DRINK_STATUSES = ["pending", "accepted", "delivered"]
+
+# DJ profile fields copied onto the snapshot (matches DJProfileResponse)
+DJ_SNAPSHOT_FIELDS = [
+    "id", "name", "stage_name", "avatar_emoji", "cash_app_username",
+    "venmo_username", "apple_pay_phone", "bio", "photo_url", "is_active",
+    "current_location", "checked_in_at"
+]
+
+# Collections a snapshot is built from
+SOURCE_COLLECTIONS = {"checkins", "dj_profiles", "dj_tips", "song_requests", "drink_orders"}
+
+DRINK_SNAPSHOT_PROJECTION = {
+    "_id": 0, "id": 1, "location_slug": 1, "from_checkin_id": 1, "from_name": 1,
+    "from_emoji": 1, "to_checkin_id": 1, "to_name": 1, "to_emoji": 1,
+    "drink_name": 1, "drink_emoji": 1, "message": 1, "status": 1, "created_at": 1
+}
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Mongo hands back naive datetimes - treat them as UTC"""
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _today() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+def _dj_snapshot(profile: Dict) -> Dict:
+    return {field: profile.get(field) for field in DJ_SNAPSHOT_FIELDS}
+
+
+class VenueStateService:
+    """
+    Keeps one `venue_state` document per location (keyed by location slug) that
+    write handlers update incrementally, so venue screens get check-in count,
+    current DJ, today's tips, the pending request queue and latest drinks from
+    a single _id lookup instead of six queries.
+
+    Incremental updates never upsert: a missing or stale document is rebuilt
+    from the source collections on the next read.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self.collection = db.venue_state
+
+    async def get_state(self, location_slug: str) -> Dict:
+        """Get the live snapshot for a location, rebuilding it when needed"""
+        now = datetime.now(timezone.utc)
+        state = await self.collection.find_one({"_id": location_slug})
+
+        # Check-ins expire on their own, so the count is only trusted until
+        # the earliest known expiry passes
+        next_expiry = _as_utc(state.get("next_checkin_expiry")) if state else None
+        if not state or (next_expiry is not None and next_expiry <= now):
+            state = await self.rebuild(location_slug)
+
+        tips_today = state.get("tips_date") == _today()
+        return {
+            "location_slug": location_slug,
+            "checkin_count": max(state.get("checkin_count", 0), 0),
+            "dj": state.get("current_dj"),
+            "tips_today": {
+                "total": state.get("tips_total", 0) if tips_today else 0,
+                "count": state.get("tips_count", 0) if tips_today else 0
+            },
+            "pending_requests": max(state.get("pending_requests", 0), 0),
+            "latest_drinks": state.get("latest_drinks", []),
+            "updated_at": state.get("updated_at")
+        }
+
+    async def rebuild(self, location_slug: str) -> Dict:
+        """Recompute a location snapshot from the source collections"""
+        now = datetime.now(timezone.utc)
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        active_checkins = {"location_slug": location_slug, "expires_at": {"$gt": now}}
+
+        checkin_count, next_checkin, dj, tips, pending_requests, drinks = await asyncio.gather(
+            self.db.checkins.count_documents(active_checkins),
+            self.db.checkins.find_one(
+                active_checkins,
+                {"_id": 0, "expires_at": 1},
+                sort=[("expires_at", 1)]
+            ),
+            self.db.dj_profiles.find_one(
+                {"current_location": location_slug, "is_active": True},
+                {"_id": 0}
+            ),
+            self.db.dj_tips.aggregate([
+                {"$match": {"location_slug": location_slug, "created_at": {"$gte": today_start}}},
+                {"$group": {"_id": None, "total": {"$sum": "$amount"}, "count": {"$sum": 1}}}
+            ]).to_list(1),
+            self.db.song_requests.count_documents({"location_slug": location_slug, "status": "pending"}),
+            self.db.drink_orders.find(
+                {"location_slug": location_slug, "status": {"$in": VISIBLE_DRINK_STATUSES}},
+                DRINK_SNAPSHOT_PROJECTION
+            ).sort("created_at", -1).limit(LATEST_DRINKS_LIMIT).to_list(LATEST_DRINKS_LIMIT)
+        )
+
+        state = {
+            "_id": location_slug,
+            "checkin_count": checkin_count,
+            "next_checkin_expiry": next_checkin["expires_at"] if next_checkin else None,
+            "current_dj": _dj_snapshot(dj) if dj else None,
+            "tips_date": today_start.strftime("%Y-%m-%d"),
+            "tips_total": tips[0]["total"] if tips else 0,
+            "tips_count": tips[0]["count"] if tips else 0,
+            "pending_requests": pending_requests,
+            "latest_drinks": drinks,
+            "updated_at": now
+        }
+        await self.collection.replace_one({"_id": location_slug}, state, upsert=True)
+        return state
+
+    async def invalidate(self, location_slug: Optional[str] = None):
+        """Drop snapshots so they are rebuilt on the next read"""
+        if location_slug:
+            await self.collection.delete_one({"_id": location_slug})
+        else:
+            await self.collection.delete_many({})
+
+    async def source_pruned(self, collection: str):
+        """Bulk removals (retention) bypass the incremental updates - rebuild everything"""
+        if collection in SOURCE_COLLECTIONS:
+            await self.invalidate()
+
+    async def _update(self, location_slug: str, update: Dict):
+        update.setdefault("$set", {})["updated_at"] = datetime.now(timezone.utc)
+        return await self.collection.update_one({"_id": location_slug}, update)
+
+    # ---- Check-ins ----
+
+    async def record_checkin(self, location_slug: str, expires_at: datetime):
+        # An empty venue's snapshot has next_checkin_expiry null, which sorts
+        # below every date so $min would keep it; without an expiry the count
+        # is never rebuilt as this check-in ages out
+        await self.collection.update_one(
+            {"_id": location_slug, "next_checkin_expiry": None},
+            {"$set": {"next_checkin_expiry": expires_at}}
+        )
+        await self._update(location_slug, {
+            "$inc": {"checkin_count": 1},
+            "$min": {"next_checkin_expiry": expires_at}
+        })
+
+    async def record_checkout(self, checkin: Dict):
+        """Decrement the count for a removed check-in that had not yet expired"""
+        expires_at = _as_utc(checkin.get("expires_at"))
+        if expires_at is not None and expires_at <= datetime.now(timezone.utc):
+            return
+        await self._update(checkin["location_slug"], {"$inc": {"checkin_count": -1}})
+
+    # ---- DJ ----
+
+    async def sync_dj(self, profile: Dict):
+        """Move a DJ's snapshot to wherever their profile says they are playing"""
+        await self.clear_dj(profile["id"])
+        location_slug = profile.get("current_location")
+        if location_slug and profile.get("is_active", True):
+            await self._update(location_slug, {"$set": {"current_dj": _dj_snapshot(profile)}})
+
+    async def clear_dj(self, dj_id: str):
+        await self.collection.update_many(
+            {"current_dj.id": dj_id},
+            {"$set": {"current_dj": None, "updated_at": datetime.now(timezone.utc)}}
+        )
+
+    # ---- Tips ----
+
+    async def record_tip(self, location_slug: str, amount: float):
+        today = _today()
+        result = await self.collection.update_one(
+            {"_id": location_slug, "tips_date": today},
+            {"$inc": {"tips_total": amount, "tips_count": 1}, "$set": {"updated_at": datetime.now(timezone.utc)}}
+        )
+        if result.matched_count:
+            return
+
+        # First tip of the day - start a fresh running total
+        result = await self.collection.update_one(
+            {"_id": location_slug, "tips_date": {"$ne": today}},
+            {"$set": {"tips_date": today, "tips_total": amount, "tips_count": 1, "updated_at": datetime.now(timezone.utc)}}
+        )
+        if not result.matched_count:
+            # Another request rolled the day over first
+            await self.collection.update_one(
+                {"_id": location_slug, "tips_date": today},
+                {"$inc": {"tips_total": amount, "tips_count": 1}}
+            )
+
+    # ---- Song requests ----
+
+    async def adjust_pending_requests(self, location_slug: str, delta: int):
+        if delta:
+            await self._update(location_slug, {"$inc": {"pending_requests": delta}})
+
+    # ---- Drinks ----
+
+    async def record_drink(self, order: Dict):
+        drink = {k: order.get(k) for k in DRINK_SNAPSHOT_PROJECTION if k != "_id"}
+        await self._update(order["location_slug"], {
+            "$push": {
+                "latest_drinks": {
+                    "$each": [drink],
+                    "$sort": {"created_at": -1},
+                    "$slice": LATEST_DRINKS_LIMIT
+                }
+            }
+        })
+
+    async def update_drink_status(self, order: Dict):
+        location_slug = order["location_slug"]
+        if order.get("status") in VISIBLE_DRINK_STATUSES:
+            await self.collection.update_one(
+                {"_id": location_slug, "latest_drinks.id": order["id"]},
+                {"$set": {"latest_drinks.$.status": order["status"], "updated_at": datetime.now(timezone.utc)}}
+            )
+        else:
+            await self._update(location_slug, {"$pull": {"latest_drinks": {"id": order["id"]}}})
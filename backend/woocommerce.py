@@ -0,0 +1,42 @@
+import os
+import logging
+
+import aiohttp
+from fastapi import HTTPException
+
+
+async def create_woocommerce_order(line_items: list, customer_email: str = None, meta_data: list = None):
+    """Helper function to create WooCommerce order"""
+    woo_url = os.environ.get("WOOCOMMERCE_URL")
+    woo_key = os.environ.get("WOOCOMMERCE_KEY")
+    woo_secret = os.environ.get("WOOCOMMERCE_SECRET")
+    
+    if not all([woo_url, woo_key, woo_secret]):
+        raise HTTPException(status_code=500, detail="WooCommerce not configured")
+    
+    api_url = f"{woo_url}/wp-json/wc/v3/orders"
+    
+    order_data = {
+        "payment_method": "woocommerce_payments",
+        "payment_method_title": "Credit Card",
+        "set_paid": False,
+        "status": "pending",
+        "line_items": line_items,
+        "meta_data": meta_data or []
+    }
+    
+    if customer_email:
+        order_data["billing"] = {"email": customer_email}
+    
+    try:
+        async with aiohttp.ClientSession() as session:
+            auth = aiohttp.BasicAuth(woo_key, woo_secret)
+            async with session.post(api_url, json=order_data, auth=auth) as response:
+                if response.status not in [200, 201]:
+                    error_text = await response.text()
+                    logging.error(f"WooCommerce order error: {error_text}")
+                    raise HTTPException(status_code=response.status, detail="Failed to create order")
+                return await response.json()
+    except aiohttp.ClientError as e:
+        logging.error(f"WooCommerce connection error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to connect to payment system")
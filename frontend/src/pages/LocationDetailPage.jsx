@@ -8,7 +8,7 @@ import { Textarea } from '../components/ui/textarea';
 import HibachiMenu from '../components/HibachiMenu';
 import { getLocationBySlug, verifyAdminToken, adminUpdateLocation, uploadImage, getStaffList, transferTokens, getTokenBalance, getDJSchedulesForLocation, getAppSettings, submitSongRequest } from '../services/api';
 import { 
-  checkInAtLocation, getCheckedInUsers, checkOut,
+  checkInAtLocation, getCheckedInUsers, checkOut, sendCheckInHeartbeat,
   createSocialPost, getSocialPosts, likePost, deleteSocialPost,
   sendDirectMessage, getConversations, getDMThread, getUnreadCount,
   sendDJTip, getDJTips, getDJTipsTotal, getDJAtLocation,
@@ -223,6 +223,26 @@ const LocationDetailPage = () => {
     return () => clearInterval(interval);
   }, [slug, myCheckIn]);
 
+  // Heartbeat while checked in so we stay in the "here now" list
+  useEffect(() => {
+    if (!myCheckIn) return;
+    const sendHeartbeat = async () => {
+      try {
+        const result = await sendCheckInHeartbeat(myCheckIn.id);
+        if (result === null) {
+          // Expired or checked out elsewhere
+          localStorage.removeItem(`checkin_${slug}`);
+          setMyCheckIn(null);
+        }
+      } catch (error) {
+        // Offline for a moment; the next beat retries
+      }
+    };
+    sendHeartbeat();
+    const interval = setInterval(sendHeartbeat, 30000); // Every 30 seconds
+    return () => clearInterval(interval);
+  }, [slug, myCheckIn]);
+
   const loadCheckedInUsers = async () => {
     const users = await getCheckedInUsers(slug);
     setCheckedInUsers(users);
@@ -1270,6 +1270,16 @@ export async function checkOut(checkInId) {
   return await response.json();
 }
 
+// Keep a check-in present at its location (returns null once it has expired or been checked out)
+export async function sendCheckInHeartbeat(checkInId) {
+  const response = await fetch(`${API_URL}/checkin/${checkInId}/heartbeat`, {
+    method: 'POST'
+  });
+  if (response.status === 404) return null;
+  if (!response.ok) throw new Error('Failed to send heartbeat');
+  return await response.json();
+}
+
 // Get check-in count for a location
 export async function getCheckInCount(locationSlug) {
   try {
@@ -1645,6 +1655,19 @@ export async function getDrinksForUser(checkinId) {
   return await response.json();
 }
 
+// Get a location's posts, DJ tips, drinks and song requests merged newest first.
+// Returns { items, next_cursor }; pass next_cursor back to load the following page.
+export async function getVenueTimeline(locationSlug, { cursor = null, limit = null, myCheckinId = null } = {}) {
+  const params = new URLSearchParams();
+  if (cursor) params.append('cursor', cursor);
+  if (limit) params.append('limit', limit);
+  if (myCheckinId) params.append('my_checkin_id', myCheckinId);
+  const query = params.toString();
+  const response = await fetch(`${API_URL}/venue/${locationSlug}/timeline${query ? `?${query}` : ''}`);
+  if (!response.ok) throw new Error('Failed to fetch timeline');
+  return await response.json();
+}
+
 // Update drink order status
 
 